@@ -0,0 +1,157 @@
+import json
+import os
+import time
+from collections import defaultdict
+from pathlib import PurePath
+
+from ansible.plugins.callback import CallbackBase
+
+DOCUMENTATION = """
+name: task_profile
+type: aggregate
+short_description: Profile the wall time of tasks, task files and roles
+description:
+  - Records the wall time of every task, from its start until the next task
+    starts, so the time spent on includes and handlers is not lost.
+  - Tasks run repeatedly, e.g. by the dynamic C(include_tasks) iterations of
+    the install_module role, are rolled up by their location in the task file,
+    with the number of runs and the longest run.
+  - Times are also summed per task file and per role.
+  - At the end of the playbook, writes a JSON profile, and displays the tasks,
+    task files and roles that took the longest.
+requirements:
+  - Enable in the C(callbacks_enabled) setting, or with
+    C(ANSIBLE_CALLBACKS_ENABLED=nsls2.ioc_deploy.task_profile).
+options:
+  output_path:
+    description: Path to write the JSON profile to. If empty, none is written.
+    type: path
+    default: ""
+    env:
+      - name: NSLS2_IOC_DEPLOY_PROFILE_PATH
+    ini:
+      - section: callback_task_profile
+        key: output_path
+  top:
+    description: Number of tasks, task files and roles to display.
+    type: int
+    default: 20
+    env:
+      - name: NSLS2_IOC_DEPLOY_PROFILE_TOP
+    ini:
+      - section: callback_task_profile
+        key: top
+"""
+
+
+def role_of(task_file):
+    """Return the name of the role a task file belongs to, from its path."""
+    parts = PurePath(task_file).parts
+    if "roles" not in parts:
+        return "(playbook)"
+    roles_index = len(parts) - 1 - parts[::-1].index("roles")
+    for i in range(roles_index + 1, len(parts)):
+        if parts[i] in ("tasks", "handlers"):
+            return parts[i - 1]
+    return "(playbook)"
+
+
+class CallbackModule(CallbackBase):
+    CALLBACK_VERSION = 2.0
+    CALLBACK_TYPE = "aggregate"
+    CALLBACK_NAME = "nsls2.ioc_deploy.task_profile"
+    CALLBACK_NEEDS_ENABLED = True
+
+    def __init__(self):
+        super().__init__()
+        self._start = time.monotonic()
+        # Task currently running, and when it started
+        self._current = None
+        self._current_start = None
+        self._tasks = {}
+
+    def _finish_current(self):
+        if self._current is None:
+            return
+        elapsed = time.monotonic() - self._current_start
+        entry = self._tasks[self._current]
+        entry["count"] += 1
+        entry["total"] += elapsed
+        entry["max"] = max(entry["max"], elapsed)
+        self._current = None
+
+    def _start_task(self, task):
+        self._finish_current()
+        path = task.get_path() or f"(no path):{task.get_name()}"
+        if path not in self._tasks:
+            task_file = path.rsplit(":", 1)[0]
+            self._tasks[path] = {
+                "name": task.get_name(),
+                "path": path,
+                "file": task_file,
+                "role": role_of(task_file),
+                "action": task.action,
+                "count": 0,
+                "total": 0.0,
+                "max": 0.0,
+            }
+        self._current = path
+        self._current_start = time.monotonic()
+
+    def v2_playbook_on_task_start(self, task, is_conditional):
+        self._start_task(task)
+
+    def v2_playbook_on_handler_task_start(self, task):
+        self._start_task(task)
+
+    def v2_playbook_on_play_start(self, play):
+        self._finish_current()
+
+    def _rollup(self, key):
+        totals = defaultdict(lambda: {"count": 0, "total": 0.0})
+        for entry in self._tasks.values():
+            totals[entry[key]]["count"] += entry["count"]
+            totals[entry[key]]["total"] += entry["total"]
+        return sorted(
+            ({key: name, **values} for name, values in totals.items()),
+            key=lambda entry: entry["total"],
+            reverse=True,
+        )
+
+    def _display_top(self, title, entries, label, top):
+        self._display.banner(title)
+        for entry in entries[:top]:
+            runs = f" ({entry['count']} task runs)" if entry["count"] > 1 else ""
+            self._display.display(f"{entry['total']:9.2f}s  {label(entry)}{runs}")
+
+    def v2_playbook_on_stats(self, stats):
+        self._finish_current()
+        tasks = sorted(
+            (entry for entry in self._tasks.values() if entry["count"]),
+            key=lambda entry: entry["total"],
+            reverse=True,
+        )
+        profile = {
+            "total": time.monotonic() - self._start,
+            "tasks": tasks,
+            "files": self._rollup("file"),
+            "roles": self._rollup("role"),
+        }
+
+        top = self.get_option("top")
+        self._display_top(
+            "TASK PROFILE", tasks, lambda e: f"{e['role']} : {e['name']}", top
+        )
+        self._display_top(
+            "TASK FILE PROFILE",
+            profile["files"],
+            lambda e: os.path.relpath(e["file"]),
+            top,
+        )
+        self._display_top("ROLE PROFILE", profile["roles"], lambda e: e["role"], top)
+
+        output_path = self.get_option("output_path")
+        if output_path:
+            with open(output_path, "w") as fp:
+                json.dump(profile, fp, indent=2)
+            self._display.display(f"Task profile written to {output_path}")
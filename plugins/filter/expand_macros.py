@@ -0,0 +1,85 @@
+import re
+
+from ansible.errors import AnsibleFilterError
+
+DOCUMENTATION = """
+name: expand_macros
+short_description: Expand EPICS style $(MACRO) references in an environment dict
+description:
+  - Resolves every C($(NAME)) reference in the values of an environment
+    dictionary against the other entries of the same dictionary.
+  - Each variable is resolved once, in dependency order, and the result is
+    memoized, so the whole environment is expanded in a single pass.
+  - Values that do not reference any macros (including non-string values)
+    are returned unchanged.
+options:
+  _input:
+    description: Dictionary mapping environment variable names to values.
+    type: dict
+    required: true
+"""
+
+EXAMPLES = """
+- name: Expand all macros in merged environment
+  ansible.builtin.set_fact:
+    deploy_ioc_merged_env:
+      "{{ deploy_ioc_merged_env | nsls2.ioc_deploy.expand_macros }}"
+"""
+
+RETURN = """
+_value:
+  description: Copy of the input dictionary with all macro references expanded.
+  type: dict
+"""
+
+MACRO_REGEX = re.compile(r"\$\(([A-Za-z_][A-Za-z0-9_]*)\)")
+
+
+def expand_macros(env: dict) -> dict:
+    """Expand all $(MACRO) references in the values of env.
+
+    Raises AnsibleFilterError if a value references an undefined variable, or
+    if variables reference each other in a cycle.
+    """
+    if not isinstance(env, dict):
+        raise AnsibleFilterError(
+            f"expand_macros expects a dictionary, got {type(env).__name__}"
+        )
+
+    resolved: dict = {}
+
+    def _resolve(name: str, chain: list[str]):
+        if name in resolved:
+            return resolved[name]
+        if name in chain:
+            cycle = chain[chain.index(name) :] + [name]
+            raise AnsibleFilterError(
+                f"Cyclic macro reference in environment: {' -> '.join(cycle)}"
+            )
+
+        value = env[name]
+        if not isinstance(value, str) or "$(" not in value:
+            resolved[name] = value
+            return value
+
+        chain.append(name)
+
+        def _substitute(match: re.Match) -> str:
+            macro = match.group(1)
+            if macro not in env:
+                raise AnsibleFilterError(
+                    f"Environment variable {name} references undefined macro $({macro})"
+                )
+            return str(_resolve(macro, chain))
+
+        resolved[name] = MACRO_REGEX.sub(_substitute, value)
+        chain.pop()
+        return resolved[name]
+
+    # Preserve the original ordering, since the rendered epicsEnv.cmd follows it
+    return {name: _resolve(name, []) for name in env}
+
+
+class FilterModule:
+    def filters(self):
+        return {"expand_macros": expand_macros}
@@ -0,0 +1,87 @@
+from ansible.errors import AnsibleFilterError
+
+DOCUMENTATION = """
+name: module_build_levels
+short_description: Group the dependency graph of a module into build levels
+description:
+  - Resolves the full C(module_deps) graph of a module up front, from the
+    configurations of all modules known to the install_module role.
+  - Returns the modules to build as a list of levels, in topological order.
+    Every module only depends on modules in earlier levels, so all modules
+    within a level can be cloned and compiled at the same time.
+  - Within a level, modules are ordered as a depth first walk of the graph
+    would install them.
+options:
+  _input:
+    description: Dict mapping module names to their install_module configuration.
+    type: dict
+    required: true
+  module:
+    description: Name of the module to build, including all its dependencies.
+    type: str
+    required: true
+"""
+
+EXAMPLES = """
+- name: Resolve module dependency graph
+  ansible.builtin.set_fact:
+    install_module_build_levels:
+      "{{ install_module_configs
+          | nsls2.ioc_deploy.module_build_levels(install_module_name) }}"
+"""
+
+RETURN = """
+_value:
+  description: List of levels, each a list of module names.
+  type: list
+  elements: list
+"""
+
+
+def module_build_levels(configs: dict, module: str) -> list[list[str]]:
+    """Return the modules required to build module, grouped into build levels.
+
+    Raises AnsibleFilterError if a module has no configuration, or if modules
+    depend on each other in a cycle.
+    """
+    if not isinstance(configs, dict):
+        raise AnsibleFilterError(
+            f"module_build_levels expects a dictionary, got {type(configs).__name__}"
+        )
+
+    levels: dict[str, int] = {}
+    # Order in which a depth first walk finishes each module
+    install_order: list[str] = []
+
+    def _visit(name: str, chain: list[str]) -> int:
+        if name in levels:
+            return levels[name]
+        if name in chain:
+            cycle = chain[chain.index(name) :] + [name]
+            raise AnsibleFilterError(f"Cyclic module dependency: {' -> '.join(cycle)}")
+        if name not in configs:
+            required_by = f" (required by {chain[-1]})" if chain else ""
+            raise AnsibleFilterError(
+                f"No install_module configuration for {name}{required_by}"
+            )
+
+        chain.append(name)
+        deps = configs[name].get("module_deps") or []
+        level = max((_visit(dep, chain) + 1 for dep in deps), default=0)
+        chain.pop()
+
+        levels[name] = level
+        install_order.append(name)
+        return level
+
+    _visit(module, [])
+
+    build_levels: list[list[str]] = [[] for _ in range(levels[module] + 1)]
+    for name in install_order:
+        build_levels[levels[name]].append(name)
+    return build_levels
+
+
+class FilterModule:
+    def filters(self):
+        return {"module_build_levels": module_build_levels}
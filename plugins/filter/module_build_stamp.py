@@ -0,0 +1,90 @@
+import hashlib
+import json
+
+from ansible.errors import AnsibleFilterError
+
+DOCUMENTATION = """
+name: module_build_stamp
+short_description: Compute the build stamp of a module
+description:
+  - Hashes everything that goes into compiling a module, so that compilation
+    can be skipped if the stamp matches the one written after the last
+    successful compilation.
+  - The inputs are the C(version) of the module, the commit checked out, the
+    compilation command, the stamps of all modules in C(module_deps), and
+    the configure files of the module, if any.
+  - Since the stamps of all module deps are included, recompiling a
+    dependency changes the stamps of all modules built on top of it.
+options:
+  _input:
+    description: install_module configuration of the module.
+    type: dict
+    required: true
+  commit:
+    description: Commit checked out in the module directory.
+    type: str
+    required: true
+  compilation_command:
+    description: Command the module is compiled with.
+    type: str
+    required: true
+  build_stamps:
+    description:
+      - Dict mapping module names to their build stamps. Must include all
+        modules in C(module_deps).
+    type: dict
+    required: true
+  configure_files:
+    description:
+      - The merged C(CONFIG_SITE) configuration dict as C(config), and the
+        rendered C(RELEASE) and C(CONFIG_SITE) files as C(release) and
+        C(config_site). Empty for modules without configure files.
+    type: dict
+    default: {}
+"""
+
+EXAMPLES = """
+- name: Compute build stamp
+  ansible.builtin.set_fact:
+    install_module_build_stamp: >-
+      {{ install_module_config | nsls2.ioc_deploy.module_build_stamp(
+           install_module_git_result.after, install_module_compilation_command,
+           install_module_build_stamps) }}
+"""
+
+RETURN = """
+_value:
+  description: SHA-256 hex digest of the inputs of the module build.
+  type: str
+"""
+
+
+def module_build_stamp(
+    config: dict,
+    commit: str,
+    compilation_command: str,
+    build_stamps: dict,
+    configure_files: dict | None = None,
+) -> str:
+    """Return the build stamp of a module.
+
+    Raises AnsibleFilterError if a module it depends on has no build stamp.
+    """
+    module_deps = config.get("module_deps") or []
+    missing = [dep for dep in module_deps if dep not in build_stamps]
+    if missing:
+        raise AnsibleFilterError(f"No build stamp for module deps {missing}")
+
+    inputs = {
+        "version": config["version"],
+        "commit": commit,
+        "compilation_command": compilation_command,
+        "module_deps": [build_stamps[dep] for dep in module_deps],
+        **(configure_files or {}),
+    }
+    return hashlib.sha256(json.dumps(inputs, sort_keys=True).encode()).hexdigest()
+
+
+class FilterModule:
+    def filters(self):
+        return {"module_build_stamp": module_build_stamp}
@@ -0,0 +1,68 @@
+import hashlib
+import os
+
+from ansible.plugins.lookup import LookupBase
+
+DOCUMENTATION = """
+name: content_digest
+short_description: Hash the contents of files and directories on the controller
+description:
+  - Returns a single SHA-256 digest of the given files, and of all files in the
+    given directories, recursively.
+  - The digest covers the path of every file relative to the term it was found
+    under, and its contents, so it changes whenever a file is added, removed,
+    renamed or edited, but not when the tree is moved elsewhere.
+  - Terms that do not exist are part of the digest as missing, so creating
+    them changes it too.
+options:
+  _terms:
+    description: Files or directories to hash, in order.
+    type: list
+    elements: path
+    required: true
+"""
+
+EXAMPLES = """
+- name: Hash the templates and tasks of a role
+  ansible.builtin.set_fact:
+    role_digest: >-
+      {{ lookup('nsls2.ioc_deploy.content_digest',
+                role_path ~ '/templates', role_path ~ '/tasks') }}
+"""
+
+RETURN = """
+_raw:
+  description: Hex encoded SHA-256 digest of all terms.
+  type: list
+  elements: str
+"""
+
+
+def term_files(term):
+    """Yield the files under a term, with their paths relative to it, sorted."""
+    if os.path.isfile(term):
+        yield os.path.basename(term), term
+        return
+    for root, dirs, files in os.walk(term):
+        dirs.sort()
+        for name in sorted(files):
+            path = os.path.join(root, name)
+            yield os.path.relpath(path, term), path
+
+
+def content_digest(terms):
+    digest = hashlib.sha256()
+    for index, term in enumerate(terms):
+        if not os.path.exists(term):
+            digest.update(f"{index}:missing\0".encode())
+            continue
+        for relative_path, path in term_files(term):
+            digest.update(f"{index}:{relative_path}\0".encode())
+            with open(path, "rb") as fp:
+                digest.update(hashlib.sha256(fp.read()).digest())
+    return digest.hexdigest()
+
+
+class LookupModule(LookupBase):
+    def run(self, terms, variables=None, **kwargs):
+        return [content_digest(terms)]
@@ -0,0 +1,281 @@
+#!/usr/bin/python
+
+import os
+import re
+import subprocess
+import threading
+import time
+
+from ansible.module_utils.basic import AnsibleModule
+
+DOCUMENTATION = """
+module: build_modules
+short_description: Compile EPICS modules concurrently under one make jobserver
+description:
+  - Runs the compilation command of each module in its directory, with all
+    builds sharing a single GNU make jobserver token pool.
+  - The size of the pool is derived from the number of usable cores and the
+    memory currently available on the host, so that builds neither run the
+    host out of memory nor leave cores idle.
+  - Each running build holds as many tokens as its O(builds[].memory_weight),
+    and any further parallel jobs of its make draw from the shared pool.
+  - Compilation commands must not pass C(-j) to make themselves, since an
+    explicit C(-j) makes it ignore the jobserver. Use C(-j1) to force a
+    module to build serially.
+  - Reports the wall time and peak RSS of every build. Peak RSS is that of
+    the largest single process of the build, usually a compiler.
+options:
+  builds:
+    description: Modules to compile.
+    type: list
+    elements: dict
+    required: true
+    suboptions:
+      name:
+        description: Name of the module.
+        type: str
+        required: true
+      dir:
+        description: Directory to run the compilation command in.
+        type: path
+        required: true
+      compilation_command:
+        description: Shell command that compiles the module.
+        type: str
+        required: true
+      memory_weight:
+        description: Number of jobserver tokens held while the module builds.
+        type: int
+        default: 1
+  jobs:
+    description:
+      - Number of jobserver tokens. If 0, it is the lower of the number of
+        usable cores, and the available memory divided by O(memory_per_job).
+    type: int
+    default: 0
+  memory_per_job:
+    description: Memory in MiB to budget for each parallel job.
+    type: int
+    default: 1024
+  log_name:
+    description: Name of the file in each module directory the output is saved to.
+    type: str
+    default: .build.log
+"""
+
+EXAMPLES = """
+- name: Compile modules
+  nsls2.ioc_deploy.build_modules:
+    builds:
+      - name: adsupport_fe23754
+        dir: /epics/modules/adsupport_fe23754
+        compilation_command: make -s
+        memory_weight: 2
+      - name: motorsim_d1d0eb8
+        dir: /epics/modules/motorsim_d1d0eb8
+        compilation_command: make -s
+  register: build_result
+"""
+
+RETURN = """
+jobs:
+  description: Number of jobserver tokens builds shared.
+  type: int
+  returned: always
+builds:
+  description: Result of each build, in the order they were given.
+  type: list
+  elements: dict
+  returned: always
+  contains:
+    name:
+      description: Name of the module.
+      type: str
+    rc:
+      description: Exit code of the compilation command.
+      type: int
+    wall_time:
+      description: Time taken by the build, in seconds.
+      type: float
+    peak_rss_mb:
+      description: Peak RSS of the largest process of the build, in MiB.
+      type: float
+    log:
+      description: Path of the file holding the output of the build.
+      type: str
+"""
+
+# An explicit -j option makes make ignore the jobserver
+MAKE_JOBS_REGEX = re.compile(r"\bmake\b[^;&|]*?\s-[a-zA-Z]*j(?!1\b)")
+
+
+def usable_cores():
+    try:
+        return len(os.sched_getaffinity(0))
+    except AttributeError:
+        return os.cpu_count() or 1
+
+
+def available_memory_mb():
+    """Return MemAvailable from /proc/meminfo in MiB, or None if unknown."""
+    try:
+        with open("/proc/meminfo") as fp:
+            for line in fp:
+                if line.startswith("MemAvailable:"):
+                    return int(line.split()[1]) // 1024
+    except OSError:
+        pass
+    return None
+
+
+def default_jobs(memory_per_job):
+    jobs = usable_cores()
+    memory = available_memory_mb()
+    if memory is not None:
+        jobs = min(jobs, memory // memory_per_job)
+    return max(jobs, 1)
+
+
+class JobServer:
+    """A GNU make jobserver pipe holding a fixed number of tokens."""
+
+    def __init__(self, jobs):
+        self.jobs = jobs
+        self.read_fd, self.write_fd = os.pipe()
+        os.write(self.write_fd, b"+" * jobs)
+        self.makeflags = (
+            f" -j --jobserver-fds={self.read_fd},{self.write_fd}"
+            f" --jobserver-auth={self.read_fd},{self.write_fd}"
+        )
+
+    def acquire(self, count):
+        acquired = b""
+        while len(acquired) < count:
+            acquired += os.read(self.read_fd, count - len(acquired))
+        return acquired
+
+    def release(self, tokens):
+        os.write(self.write_fd, tokens)
+
+    def close(self):
+        os.close(self.read_fd)
+        os.close(self.write_fd)
+
+
+def run_build(build, jobserver, tokens, log_name, result):
+    """Run a build holding tokens, filling in result, then release them."""
+    log_path = os.path.join(build["dir"], log_name)
+    env = dict(os.environ, MAKEFLAGS=jobserver.makeflags)
+    start = time.monotonic()
+    try:
+        with open(log_path, "w") as log_fp:
+            proc = subprocess.Popen(
+                build["compilation_command"],
+                shell=True,
+                cwd=build["dir"],
+                env=env,
+                stdin=subprocess.DEVNULL,
+                stdout=log_fp,
+                stderr=subprocess.STDOUT,
+                pass_fds=(jobserver.read_fd, jobserver.write_fd),
+            )
+            # wait4 also reports the peak RSS of the build's processes
+            _, status, rusage = os.wait4(proc.pid, 0)
+    except OSError as e:
+        result.update(rc=-1, log=log_path, msg=str(e))
+        return
+    finally:
+        jobserver.release(tokens)
+
+    result.update(
+        rc=os.WEXITSTATUS(status) if os.WIFEXITED(status) else -os.WTERMSIG(status),
+        wall_time=round(time.monotonic() - start, 1),
+        # ru_maxrss is in KiB on Linux
+        peak_rss_mb=round(rusage.ru_maxrss / 1024, 1),
+        log=log_path,
+    )
+
+
+def read_log_tail(path, lines=30):
+    try:
+        with open(path, errors="replace") as fp:
+            return "".join(fp.readlines()[-lines:])
+    except OSError:
+        return ""
+
+
+def run_module():
+    module = AnsibleModule(
+        argument_spec={
+            "builds": {
+                "type": "list",
+                "elements": "dict",
+                "required": True,
+                "options": {
+                    "name": {"type": "str", "required": True},
+                    "dir": {"type": "path", "required": True},
+                    "compilation_command": {"type": "str", "required": True},
+                    "memory_weight": {"type": "int", "default": 1},
+                },
+            },
+            "jobs": {"type": "int", "default": 0},
+            "memory_per_job": {"type": "int", "default": 1024},
+            "log_name": {"type": "str", "default": ".build.log"},
+        },
+        supports_check_mode=True,
+    )
+    builds = module.params["builds"]
+    jobs = module.params["jobs"] or default_jobs(module.params["memory_per_job"])
+
+    for build in builds:
+        if MAKE_JOBS_REGEX.search(build["compilation_command"]):
+            module.warn(
+                f"{build['name']} passes -j to make, so it does not share the "
+                "jobserver and may run more jobs than budgeted"
+            )
+
+    results = [{"name": build["name"]} for build in builds]
+    if module.check_mode or not builds:
+        module.exit_json(changed=bool(builds), jobs=jobs, builds=results)
+
+    jobserver = JobServer(jobs)
+    threads = []
+    try:
+        # Builds are started in order, each as soon as its tokens are free
+        for i, build in enumerate(builds):
+            tokens = jobserver.acquire(min(max(build["memory_weight"], 1), jobs))
+            thread = threading.Thread(
+                target=run_build,
+                args=(build, jobserver, tokens, module.params["log_name"], results[i]),
+                name=build["name"],
+            )
+            thread.start()
+            threads.append(thread)
+        for thread in threads:
+            thread.join()
+    finally:
+        jobserver.close()
+
+    failed = [result for result in results if result.get("rc") != 0]
+    if failed:
+        module.fail_json(
+            msg="Failed to compile "
+            + ", ".join(result["name"] for result in failed)
+            + "".join(
+                f"\n\n{result['name']} ({result['log']}):\n"
+                + (result.get("msg") or read_log_tail(result["log"]))
+                for result in failed
+            ),
+            jobs=jobs,
+            builds=results,
+        )
+
+    module.exit_json(changed=True, jobs=jobs, builds=results)
+
+
+def main():
+    run_module()
+
+
+if __name__ == "__main__":
+    main()
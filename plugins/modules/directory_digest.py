@@ -0,0 +1,109 @@
+#!/usr/bin/python
+
+import fnmatch
+import hashlib
+import os
+
+from ansible.module_utils.basic import AnsibleModule
+
+DOCUMENTATION = """
+module: directory_digest
+short_description: Hash the contents of a directory tree
+description:
+  - Returns a single SHA-256 digest of the paths, relative to O(path), and the
+    contents of all files in a directory tree, and the targets of all symlinks
+    in it, so that two digests of the same directory only differ if a file was
+    added, removed, renamed or edited in between.
+  - Ownership, permissions and timestamps are not part of the digest.
+  - Symlinks to directories are not followed.
+  - Only reads files, so it never reports a change.
+options:
+  path:
+    description: Directory to hash. If it does not exist, the digest is null.
+    type: path
+    required: true
+  excludes:
+    description:
+      - Shell patterns matched against the paths relative to O(path). Matching
+        files are not part of the digest, and matching directories are not
+        descended into.
+    type: list
+    elements: str
+    default: []
+"""
+
+EXAMPLES = """
+- name: Hash IOC directory, except for autosave files
+  nsls2.ioc_deploy.directory_digest:
+    path: /epics/iocs/cam-01
+    excludes:
+      - as/save
+  register: ioc_digest
+"""
+
+RETURN = """
+digest:
+  description: Hex encoded SHA-256 digest, or null if O(path) does not exist.
+  type: str
+  returned: always
+files:
+  description: Number of files and symlinks that are part of the digest.
+  type: int
+  returned: always
+"""
+
+
+def excluded(relative_root, name, excludes):
+    relative_path = os.path.normpath(os.path.join(relative_root, name))
+    return any(fnmatch.fnmatchcase(relative_path, pattern) for pattern in excludes)
+
+
+def directory_digest(path, excludes=()):
+    """Return the digest of a directory tree, and the number of files in it."""
+    if not os.path.isdir(path):
+        return None, 0
+
+    digest = hashlib.sha256()
+    count = 0
+    for root, dirs, files in os.walk(path):
+        relative_root = os.path.relpath(root, path)
+        # os.walk lists symlinks to directories with the directories
+        links = [name for name in dirs if os.path.islink(os.path.join(root, name))]
+        dirs[:] = sorted(
+            name
+            for name in dirs
+            if name not in links and not excluded(relative_root, name, excludes)
+        )
+        for name in sorted(files + links):
+            if excluded(relative_root, name, excludes):
+                continue
+            file_path = os.path.join(root, name)
+            relative_path = os.path.normpath(os.path.join(relative_root, name))
+            digest.update(f"{relative_path}\0".encode())
+            if os.path.islink(file_path):
+                digest.update(f"-> {os.readlink(file_path)}\0".encode())
+            else:
+                with open(file_path, "rb") as fp:
+                    digest.update(hashlib.sha256(fp.read()).digest())
+            count += 1
+    return digest.hexdigest(), count
+
+
+def run_module():
+    module = AnsibleModule(
+        argument_spec={
+            "path": {"type": "path", "required": True},
+            "excludes": {"type": "list", "elements": "str", "default": []},
+        },
+        supports_check_mode=True,
+    )
+    digest, count = directory_digest(module.params["path"], module.params["excludes"])
+    module.exit_json(changed=False, digest=digest, files=count)
+
+
+def main():
+    run_module()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,131 @@
+#!/usr/bin/python
+
+import fcntl
+import os
+import subprocess
+from contextlib import contextmanager
+
+from ansible.module_utils.basic import AnsibleModule
+
+DOCUMENTATION = """
+module: git_mirror
+short_description: Keep a bare git mirror of a repository with a given version
+description:
+  - Creates a bare mirror of O(repo) at O(dest) if it does not exist yet.
+  - Only fetches from O(repo) if the mirror does not contain O(version), so
+    repositories whose mirror already has the version are never contacted.
+  - All access to the mirror is serialized with an exclusive lock on
+    C(<dest>.lock), since several modules can share the same repository.
+  - Works with C(file://) URLs.
+options:
+  repo:
+    description: URL of the repository to mirror.
+    type: str
+    required: true
+  dest:
+    description: Path of the bare mirror.
+    type: path
+    required: true
+  version:
+    description: Branch, tag or commit the mirror must contain.
+    type: str
+    required: true
+"""
+
+EXAMPLES = """
+- name: Update git mirror of module repository
+  nsls2.ioc_deploy.git_mirror:
+    repo: https://github.com/epics-modules/asyn
+    dest: /epics/mirrors/asyn.git
+    version: R4-45
+"""
+
+RETURN = """
+created:
+  description: Whether the mirror was created.
+  type: bool
+  returned: always
+fetched:
+  description: Whether the mirror was missing the version and fetched.
+  type: bool
+  returned: always
+"""
+
+
+def git(*args):
+    """Run a git command, raising CalledProcessError if it fails."""
+    return subprocess.run(
+        ["git", *args],
+        check=True,
+        stdin=subprocess.DEVNULL,
+        capture_output=True,
+        text=True,
+    )
+
+
+def has_version(dest, version):
+    """Return whether the mirror at dest contains the commit of version."""
+    try:
+        git("-C", dest, "rev-parse", "--verify", "--quiet", f"{version}^{{commit}}")
+    except subprocess.CalledProcessError:
+        return False
+    return True
+
+
+@contextmanager
+def locked(dest):
+    """Hold an exclusive lock on the mirror at dest."""
+    with open(f"{dest}.lock", "a") as lock_fp:
+        fcntl.flock(lock_fp, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(lock_fp, fcntl.LOCK_UN)
+
+
+def update_mirror(repo, dest, version):
+    """Create the mirror if needed, and fetch if it doesn't contain version.
+
+    Returns whether the mirror was created, and whether it was fetched.
+    """
+    with locked(dest):
+        if not os.path.exists(os.path.join(dest, "HEAD")):
+            git("clone", "--mirror", repo, dest)
+            return True, False
+        if has_version(dest, version):
+            return False, False
+        git("-C", dest, "remote", "update", "--prune")
+        return False, True
+
+
+def run_module():
+    module = AnsibleModule(
+        argument_spec={
+            "repo": {"type": "str", "required": True},
+            "dest": {"type": "path", "required": True},
+            "version": {"type": "str", "required": True},
+        },
+    )
+    repo = module.params["repo"]
+    dest = module.params["dest"]
+    version = module.params["version"]
+
+    try:
+        created, fetched = update_mirror(repo, dest, version)
+    except subprocess.CalledProcessError as e:
+        module.fail_json(
+            msg=f"Failed to update git mirror of {repo}: {e.stderr.strip()}",
+            cmd=e.cmd,
+        )
+    if not has_version(dest, version):
+        module.fail_json(msg=f"Version {version} not found in {repo}")
+
+    module.exit_json(changed=created or fetched, created=created, fetched=fetched)
+
+
+def main():
+    run_module()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,161 @@
+#!/usr/bin/python
+
+import json
+import os
+
+from ansible.module_utils.basic import AnsibleModule
+
+DOCUMENTATION = """
+module: ioc_deploy_plan
+short_description: Plan which IOCs on a host need to be deployed again
+description:
+  - Compares the deployment stamp of every given IOC with the stamp written to
+    C(.deploy_stamp.json) in its directory by its last deployment, and
+    classifies the IOC by what a new deployment would have to do.
+  - A stamp holds digests of the IOC configuration, of the role files and
+    vars used to render the IOC, and of the configuration of its required
+    module and the modules that module depends on.
+  - C(new) IOCs have no directory yet. C(rebuild) IOCs require a module whose
+    configuration changed, or that is not built on the host, or were deployed
+    without a stamp. C(re-render) IOCs only have a changed configuration or
+    changed role files. C(unchanged) IOCs don't need to be deployed.
+  - Only reads files, so it never reports a change.
+options:
+  path:
+    description: Directory containing one sub-directory per IOC.
+    type: path
+    required: true
+  iocs:
+    description:
+      - Dict mapping the names of the IOCs to plan to their desired stamps.
+      - Each stamp is a dict with the C(config), C(roles) and C(modules)
+        digests, and the name of the required C(module), if any.
+    type: dict
+    required: true
+  modules_path:
+    description: Directory modules are installed to, one sub-directory each.
+    type: path
+    default: /epics/modules
+"""
+
+EXAMPLES = """
+- name: Plan deployment of IOCs
+  nsls2.ioc_deploy.ioc_deploy_plan:
+    path: /epics/iocs
+    iocs:
+      cam-01:
+        config: 1f0e...
+        roles: 9c3a...
+        module: adsimdetector_4b236f4
+        modules: 77d2...
+  register: plan
+"""
+
+RETURN = """
+plan:
+  description: Dict mapping the names of the IOCs to their action, and the reasons.
+  type: dict
+  returned: always
+  sample:
+    cam-01:
+      action: re-render
+      reasons: [config changed]
+deploy:
+  description: Names of the IOCs that need to be deployed, sorted.
+  type: list
+  elements: str
+  returned: always
+summary:
+  description: Number of IOCs per action.
+  type: dict
+  returned: always
+"""
+
+STAMP_FILE_NAME = ".deploy_stamp.json"
+BUILD_STAMP_FILE_NAME = ".build_stamp"
+ACTIONS = ("new", "rebuild", "re-render", "unchanged")
+
+
+def load_stamp(ioc_path):
+    try:
+        with open(os.path.join(ioc_path, STAMP_FILE_NAME)) as fp:
+            return json.load(fp)
+    except (OSError, ValueError):
+        return None
+
+
+def module_built(modules_path, module):
+    return os.path.isfile(os.path.join(modules_path, module, BUILD_STAMP_FILE_NAME))
+
+
+def classify(desired, deployed, deployed_exists, built=True):
+    """Return the action to deploy an IOC, and the reasons for it."""
+    if not deployed_exists:
+        return "new", ["not deployed"]
+    if deployed is None:
+        return "rebuild", ["deployed without a stamp"]
+
+    rebuild_reasons = []
+    if desired.get("module") != deployed.get("module"):
+        rebuild_reasons.append("required module changed")
+    elif desired.get("modules") != deployed.get("modules"):
+        rebuild_reasons.append("module configuration changed")
+    if desired.get("module") and not built:
+        rebuild_reasons.append("required module not built")
+    if rebuild_reasons:
+        return "rebuild", rebuild_reasons
+
+    render_reasons = [
+        f"{key} changed"
+        for key in ("config", "roles")
+        if desired.get(key) != deployed.get(key)
+    ]
+    if render_reasons:
+        return "re-render", render_reasons
+    return "unchanged", []
+
+
+def plan_iocs(path, iocs, modules_path):
+    plan = {}
+    for name, desired in sorted(iocs.items()):
+        ioc_path = os.path.join(path, name)
+        module = desired.get("module")
+        action, reasons = classify(
+            desired,
+            load_stamp(ioc_path),
+            os.path.isdir(ioc_path),
+            not module or module_built(modules_path, module),
+        )
+        plan[name] = {"action": action, "reasons": reasons}
+    return plan
+
+
+def run_module():
+    module = AnsibleModule(
+        argument_spec={
+            "path": {"type": "path", "required": True},
+            "iocs": {"type": "dict", "required": True},
+            "modules_path": {"type": "path", "default": "/epics/modules"},
+        },
+        supports_check_mode=True,
+    )
+    plan = plan_iocs(
+        module.params["path"], module.params["iocs"], module.params["modules_path"]
+    )
+    module.exit_json(
+        changed=False,
+        plan=plan,
+        deploy=[name for name, entry in plan.items() if entry["action"] != "unchanged"],
+        summary={
+            action: sum(entry["action"] == action for entry in plan.values())
+            for action in ACTIONS
+        },
+    )
+
+
+def main():
+    run_module()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,360 @@
+#!/usr/bin/python
+
+import fcntl
+import json
+import os
+import tempfile
+from contextlib import contextmanager
+
+from ansible.module_utils.basic import AnsibleModule
+
+DOCUMENTATION = """
+module: ioc_port
+short_description: Assign and check manage-iocs ports from a host-wide registry
+description:
+  - Keeps an index of the manage-iocs port assigned to every IOC in a
+    directory of IOCs, stored alongside them in C(.ioc_ports.json).
+  - Assigning or checking a port only requires reading the index, rather than
+    scanning the C(config) file of every IOC.
+  - All access to the index is serialized with an exclusive lock on
+    C(.ioc_ports.lock), so concurrent deployments never hand out the same port.
+  - If the index is missing (or O(rebuild=true)), it is rebuilt from the
+    C(NAME), C(PORT) and C(HOST) entries of the existing C(*/config) files.
+  - The index records the modification time and size of every C(*/config)
+    file. The C(config) files that were created or changed since, e.g. by
+    hand or by manage-iocs, are registered again whenever it is loaded, so
+    it never hands out or accepts a port taken by one of them.
+options:
+  path:
+    description: Directory containing one sub-directory per IOC.
+    type: path
+    required: true
+  name:
+    description: Name of the IOC.
+    type: str
+    required: true
+  host:
+    description:
+      - Short hostname the IOC runs on. Ports only need to be unique per host.
+    type: str
+    required: true
+  state:
+    description:
+      - C(present) returns the port of the IOC, assigning the next free port
+        on the host if it does not have one yet. If the IOC already has a
+        C(config) file, the port in it is kept.
+      - C(absent) releases the port of the IOC.
+      - C(query) returns the port of the IOC and any other IOCs on the host
+        configured with the same port, without assigning anything. The ports
+        in the C(config) files of the IOC and of those other IOCs are
+        registered first, in case the files were edited since.
+    type: str
+    choices: [present, absent, query]
+    default: present
+  start_port:
+    description: Lowest port to hand out on a host.
+    type: int
+    default: 4000
+  rebuild:
+    description: Rebuild the index from the IOC C(config) files first.
+    type: bool
+    default: false
+extends_documentation_fragment:
+  - ansible.builtin.files
+"""
+
+EXAMPLES = """
+- name: Reserve manage-iocs port for IOC
+  nsls2.ioc_deploy.ioc_port:
+    path: /epics/iocs
+    name: my-ioc
+    host: xf31id1-ioc1
+  register: my_ioc_port
+
+- name: Check no other IOC on the host uses the same port
+  nsls2.ioc_deploy.ioc_port:
+    path: /epics/iocs
+    name: my-ioc
+    host: xf31id1-ioc1
+    state: query
+  register: my_ioc_port
+  failed_when: my_ioc_port.conflicts | length > 0
+"""
+
+RETURN = """
+port:
+  description: Port of the IOC, or null if it has none.
+  type: int
+  returned: always
+conflicts:
+  description: Other IOCs on the same host configured with the same port.
+  type: list
+  elements: str
+  returned: always
+rebuilt:
+  description: Whether the index was rebuilt from the IOC config files.
+  type: bool
+  returned: always
+"""
+
+REGISTRY_FILE_NAME = ".ioc_ports.json"
+LOCK_FILE_NAME = ".ioc_ports.lock"
+
+
+def read_ioc_config(config_path):
+    """Parse the KEY=VALUE entries of a manage-iocs config file."""
+    entries = {}
+    with open(config_path) as fp:
+        for line in fp:
+            line = line.strip()
+            if line and not line.startswith("#") and "=" in line:
+                key, value = line.split("=", 1)
+                entries[key.strip()] = value.strip()
+    return entries
+
+
+def read_config_port(path, name):
+    """Return the PORT of an IOC's config file, if it exists and has one."""
+    try:
+        port = read_ioc_config(os.path.join(path, name, "config")).get("PORT")
+    except OSError:
+        return None
+    return int(port) if port and port.isdigit() else None
+
+
+def new_registry():
+    return {"version": 1, "iocs": {}, "hosts": {}, "configs": {}}
+
+
+def register_port(registry, name, host, port):
+    """Record the port of an IOC. Returns True if the registry changed."""
+    current = registry["iocs"].get(name)
+    if current == {"host": host, "port": port}:
+        return False
+    if current is not None:
+        release_port(registry, name)
+
+    registry["iocs"][name] = {"host": host, "port": port}
+    host_entry = registry["hosts"].setdefault(host, {"next_port": 0, "ports": {}})
+    host_entry["ports"].setdefault(str(port), []).append(name)
+    host_entry["next_port"] = max(host_entry["next_port"], port + 1)
+    return True
+
+
+def release_port(registry, name):
+    """Forget the port of an IOC. Returns True if the registry changed."""
+    current = registry["iocs"].pop(name, None)
+    if current is None:
+        return False
+    ports = registry["hosts"][current["host"]]["ports"]
+    users = ports[str(current["port"])]
+    users.remove(name)
+    if not users:
+        del ports[str(current["port"])]
+    return True
+
+
+def assign_port(registry, name, host, start_port):
+    """Return the port of an IOC, assigning the next free one if needed."""
+    current = registry["iocs"].get(name)
+    if current is not None and current["host"] == host:
+        return current["port"]
+
+    host_entry = registry["hosts"].get(host, {"next_port": 0, "ports": {}})
+    port = max(host_entry["next_port"], start_port)
+    while str(port) in host_entry["ports"]:
+        port += 1
+    register_port(registry, name, host, port)
+    return port
+
+
+def port_conflicts(registry, name):
+    """Return the other IOCs configured with the same port on the same host."""
+    current = registry["iocs"].get(name)
+    if current is None:
+        return []
+    users = registry["hosts"][current["host"]]["ports"][str(current["port"])]
+    return sorted(user for user in users if user != name)
+
+
+def sync_config_port(registry, path, name, host):
+    """Register the PORT of an IOC's config file, which is what manage-iocs uses.
+
+    Returns the port, or None if the IOC has no config file with a port, and
+    whether the registry changed.
+    """
+    port = read_config_port(path, name)
+    if port is None:
+        return None, False
+    return port, register_port(registry, name, host, port)
+
+
+def query_port(registry, path, name, host):
+    """Return the port of an IOC, and whether the registry changed.
+
+    The ports of the IOC and of the IOCs sharing it are synced with their
+    config files first, so that edits made since they were registered count.
+    """
+    port, changed = sync_config_port(registry, path, name, host)
+    if port is None:
+        port = registry["iocs"].get(name, {}).get("port")
+    # IOCs without a config file yet are still being deployed, so they are kept
+    for other in port_conflicts(registry, name):
+        other_host = registry["iocs"][other]["host"]
+        _, synced = sync_config_port(registry, path, other, other_host)
+        changed = synced or changed
+    return port, changed
+
+
+def config_signature(config_path):
+    """Return the modification time and size of a config file, or None."""
+    try:
+        stat = os.stat(config_path)
+    except OSError:
+        return None
+    return [stat.st_mtime_ns, stat.st_size]
+
+
+def sync_changed_configs(registry, path):
+    """Register the ports of the config files changed since they were last seen.
+
+    Only config files whose modification time or size differ from the ones
+    recorded in the registry are read. Returns True if the registry changed.
+    """
+    seen = registry.setdefault("configs", {})
+    current = {}
+    for entry in os.scandir(path):
+        if entry.is_dir():
+            signature = config_signature(os.path.join(entry.path, "config"))
+            if signature is not None:
+                current[entry.name] = signature
+
+    changed = False
+    for name in sorted(current):
+        if seen.get(name) == current[name]:
+            continue
+        seen[name] = current[name]
+        changed = True
+        try:
+            config = read_ioc_config(os.path.join(path, name, "config"))
+        except OSError:
+            continue
+        port = config.get("PORT", "")
+        if "HOST" in config and port.isdigit():
+            register_port(registry, name, config["HOST"], int(port))
+    # IOCs whose config file is gone keep their port until they are released
+    for name in sorted(set(seen) - set(current)):
+        del seen[name]
+        changed = True
+    return changed
+
+
+def rebuild_registry(path):
+    """Build a registry from the config files of all IOCs in path."""
+    registry = new_registry()
+    sync_changed_configs(registry, path)
+    return registry
+
+
+def load_registry(path):
+    try:
+        with open(os.path.join(path, REGISTRY_FILE_NAME)) as fp:
+            return json.load(fp)
+    except (OSError, ValueError):
+        return None
+
+
+def save_registry(path, registry):
+    """Atomically replace the registry file, and return its path."""
+    registry_path = os.path.join(path, REGISTRY_FILE_NAME)
+    fd, tmp_path = tempfile.mkstemp(dir=path, prefix=REGISTRY_FILE_NAME)
+    try:
+        with os.fdopen(fd, "w") as fp:
+            json.dump(registry, fp, indent=2, sort_keys=True)
+        os.chmod(tmp_path, 0o664)
+        os.replace(tmp_path, registry_path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+    return registry_path
+
+
+@contextmanager
+def locked(path):
+    """Hold an exclusive lock on the registry of path."""
+    with open(os.path.join(path, LOCK_FILE_NAME), "a") as lock_fp:
+        fcntl.flock(lock_fp, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(lock_fp, fcntl.LOCK_UN)
+
+
+def run_module():
+    module = AnsibleModule(
+        argument_spec={
+            "path": {"type": "path", "required": True},
+            "name": {"type": "str", "required": True},
+            "host": {"type": "str", "required": True},
+            "state": {
+                "type": "str",
+                "default": "present",
+                "choices": ["present", "absent", "query"],
+            },
+            "start_port": {"type": "int", "default": 4000},
+            "rebuild": {"type": "bool", "default": False},
+        },
+        add_file_common_args=True,
+        supports_check_mode=True,
+    )
+    path = module.params["path"]
+    name = module.params["name"]
+    host = module.params["host"]
+    state = module.params["state"]
+
+    if not os.path.isdir(path):
+        module.fail_json(msg=f"IOC directory {path} does not exist")
+
+    changed = False
+    with locked(path):
+        registry = None if module.params["rebuild"] else load_registry(path)
+        rebuilt = registry is None
+        if rebuilt:
+            registry = rebuild_registry(path)
+            changed = True
+        else:
+            changed = sync_changed_configs(registry, path)
+
+        if state == "absent":
+            changed = release_port(registry, name) or changed
+            port = None
+        elif state == "query":
+            port, synced = query_port(registry, path, name, host)
+            changed = synced or changed
+        else:
+            # The config file is what manage-iocs uses, so it takes precedence
+            port, synced = sync_config_port(registry, path, name, host)
+            changed = synced or changed
+            if port is None:
+                before = registry["iocs"].get(name)
+                port = assign_port(registry, name, host, module.params["start_port"])
+                changed = changed or registry["iocs"][name] != before
+
+        conflicts = port_conflicts(registry, name)
+
+        if changed and not module.check_mode:
+            registry_path = save_registry(path, registry)
+            file_args = module.load_file_common_arguments(
+                module.params, path=registry_path
+            )
+            module.set_fs_attributes_if_different(file_args, False)
+
+    module.exit_json(changed=changed, port=port, conflicts=conflicts, rebuilt=rebuilt)
+
+
+def main():
+    run_module()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,218 @@
+"""Validation of collection configuration files against their yamale schemas.
+
+Data is validated as already loaded Python objects, rather than being dumped
+back to YAML and parsed again by yamale. All custom validators used by the
+schemas of this collection are registered once in VALIDATORS, and every
+schema is compiled once.
+"""
+
+import functools
+import os
+import re
+from pathlib import Path
+from typing import Any
+
+import yamale
+
+COLLECTION_ROOT = Path(__file__).resolve().parent.parent
+DEVICE_ROLES_PATH = COLLECTION_ROOT / "roles" / "device_roles"
+INSTALL_MODULE_VARS_PATH = COLLECTION_ROOT / "roles" / "install_module" / "vars"
+BASE_IOC_SCHEMA_PATH = COLLECTION_ROOT / "roles" / "deploy_ioc" / "schema.yml"
+
+# Extensions of files next to an IOC config that are deployed along with it
+MANUAL_FILE_EXTENSIONS = {
+    ".template",
+    ".substitutions",
+    ".db",
+    ".cmd",
+    ".req",
+    ".xml",
+    ".json",
+    ".yaml",
+    ".toml",
+}
+
+
+@functools.cache
+def get_device_roles() -> frozenset[str]:
+    return frozenset(
+        role
+        for role in os.listdir(DEVICE_ROLES_PATH)
+        if (DEVICE_ROLES_PATH / role).is_dir()
+    )
+
+
+def get_example_configs(device_role: str) -> list[Path]:
+    """
+    Find all example config files for a device role.
+
+    Supports both:
+    - New structure: roles/device_roles/<role>/examples/<name>/config.yml
+    - Legacy structure: roles/device_roles/<role>/example.yml
+    """
+    role_path = DEVICE_ROLES_PATH / device_role
+    configs = []
+
+    # Check for new examples/ structure
+    examples_dir = role_path / "examples"
+    if examples_dir.is_dir():
+        for example_dir in sorted(examples_dir.iterdir()):
+            config_file = example_dir / "config.yml"
+            if config_file.is_file():
+                configs.append(config_file)
+
+    # Check for legacy example.yml
+    legacy_example = role_path / "example.yml"
+    if legacy_example.exists():
+        configs.append(legacy_example)
+
+    return configs
+
+
+def get_verify_files(device_role: str) -> list[Path]:
+    """Find all verify.yml files for a device role."""
+    examples_dir = DEVICE_ROLES_PATH / device_role / "examples"
+    if not examples_dir.is_dir():
+        return []
+    return [
+        example_dir / "verify.yml"
+        for example_dir in sorted(examples_dir.iterdir())
+        if (example_dir / "verify.yml").is_file()
+    ]
+
+
+def collect_manual_ioc_files(directory: Path) -> dict[str, str]:
+    """Collect manual IOC files from a directory based on extension."""
+    return {
+        f.name: f.read_text()
+        for f in sorted(directory.iterdir())
+        if f.is_file() and f.suffix in MANUAL_FILE_EXTENSIONS
+    }
+
+
+@functools.cache
+def get_install_modules() -> frozenset[str]:
+    return frozenset(
+        os.path.splitext(f)[0]
+        for f in os.listdir(INSTALL_MODULE_VARS_PATH)
+        if f.endswith(".yml")
+    )
+
+
+class ModuleNameValidator(yamale.validators.Validator):
+    tag = "module_name"
+
+    def _is_valid(self, value: str) -> bool:
+        return value in get_install_modules()
+
+
+class IOCTypeValidator(yamale.validators.Validator):
+    tag = "ioc_type"
+
+    def _is_valid(self, value):
+        return value in get_device_roles()
+
+
+class HostnameValidator(yamale.validators.Validator):
+    tag = "hostname"
+
+    def _is_valid(self, value):
+        if value[-1] == ".":
+            # strip exactly one dot from the right, if present
+            value = value[:-1]
+        if len(value) > 253:
+            return False
+
+        labels = value.split(".")
+
+        # the TLD must be not all-numeric
+        if re.match(r"[0-9]+$", labels[-1]):
+            return False
+
+        allowed = re.compile(r"(?!-)[a-z0-9-]{1,63}(?<!-)$", re.IGNORECASE)
+        return all(allowed.match(label) for label in labels)
+
+
+class URLValidator(yamale.validators.Validator):
+    tag = "url"
+
+    def _is_valid(self, value: str) -> bool:
+        return value.startswith("http://") or value.startswith("https://")
+
+
+class GitCommitHashValidator(yamale.validators.Validator):
+    """
+    A Git commit hash typically consists of 7 hexadecimal characters.
+    Git can extend this length for uniqueness, but 7 is the common default.
+    This regex checks for 7 to 40 hexadecimal characters.
+    """
+
+    tag = "git_commit_hash"
+
+    def _is_valid(self, value: str) -> bool:
+        return bool(re.fullmatch(r"^[0-9a-fA-F]{7,40}$", value))
+
+
+VALIDATORS = yamale.validators.DefaultValidators.copy()
+for _validator in (
+    ModuleNameValidator,
+    IOCTypeValidator,
+    HostnameValidator,
+    URLValidator,
+    GitCommitHashValidator,
+):
+    VALIDATORS[_validator.tag] = _validator
+
+
+@functools.cache
+def _make_schema(path: Path) -> yamale.schema.Schema:
+    return yamale.make_schema(str(path), validators=VALIDATORS)
+
+
+def make_schema(path: Path | str) -> yamale.schema.Schema:
+    """Return the compiled schema at path, compiling it only once."""
+    return _make_schema(Path(path).resolve())
+
+
+def validate(
+    schema: yamale.schema.Schema | Path | str,
+    data: Any,
+    path: Path | str = "<data>",
+    strict: bool = False,
+) -> None:
+    """Validate already loaded data against schema.
+
+    path is only used to identify the data in error messages. Raises
+    yamale.YamaleError if the data does not conform to the schema.
+    """
+    if not isinstance(schema, yamale.schema.Schema):
+        schema = make_schema(schema)
+    yamale.validate(schema, [(data, str(path))], strict=strict)
+
+
+def validation_errors(
+    schema: yamale.schema.Schema | Path | str,
+    data: Any,
+    path: Path | str = "<data>",
+    strict: bool = False,
+) -> list[str]:
+    """Return the errors of validating data against schema, if any."""
+    try:
+        validate(schema, data, path, strict=strict)
+    except yamale.YamaleError as e:
+        return [error for result in e.results for error in result.errors]
+    return []
+
+
+def validate_ioc_config(ioc_config: dict, path: Path | str = "<data>") -> list[str]:
+    """Return the errors of validating an IOC instance configuration.
+
+    The configuration is checked against both the base deploy_ioc schema, and
+    the schema of the device role named by its type.
+    """
+    errors = validation_errors(BASE_IOC_SCHEMA_PATH, ioc_config, path)
+    ioc_type = ioc_config.get("type") if isinstance(ioc_config, dict) else None
+    role_schema_path = DEVICE_ROLES_PATH / str(ioc_type) / "schema.yml"
+    if ioc_type in get_device_roles() and role_schema_path.exists():
+        errors += validation_errors(role_schema_path, ioc_config, path)
+    return errors
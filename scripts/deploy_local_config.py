@@ -1,6 +1,7 @@
 #!/usr/bin/env python3
 
 import argparse
+import atexit
 import importlib.util
 import json
 import logging
@@ -9,29 +10,23 @@ import shutil
 import subprocess
 import sys
 import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import contextmanager
 from dataclasses import dataclass, field
 from enum import Enum
 from pathlib import Path
+from typing import TextIO
 
 import questionary
 import yaml
+from config_validation import collect_manual_ioc_files, validate_ioc_config
+from trace_events import TRACER
 
 NSLS2NETWORK_PKG_AVAILABLE = importlib.util.find_spec("nsls2network") is not None
 
 BASE_CONTAINER_IMAGE = "ghcr.io/nsls2/epics-alma"
 
-MANUAL_FILE_EXTENSIONS = {
-    ".template",
-    ".substitutions",
-    ".db",
-    ".cmd",
-    ".req",
-    ".xml",
-    ".json",
-    ".yaml",
-    ".toml",
-}
-
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger("nsls2.ioc_deploy")
 
@@ -84,15 +79,36 @@ class ColorFormatter(logging.Formatter):
         return base
 
 
+class LaneFilter(logging.Filter):
+    """Tag records from worker threads with the thread name, e.g. the EL version."""
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.threadName == threading.main_thread().name:
+            record.lane = ""
+        else:
+            record.lane = f"[{record.threadName}] "
+        return True
+
+
 handler = logging.StreamHandler()
 use_color = sys.stderr.isatty()
-fmt = "%(asctime)s | %(levelname)-8s | %(name)s | %(message)s"
+fmt = "%(asctime)s | %(levelname)-8s | %(name)s | %(lane)s%(message)s"
 handler.setFormatter(ColorFormatter(fmt, use_color=use_color))
+handler.addFilter(LaneFilter())
 logger.addHandler(handler)
 logger.setLevel(logging.INFO)  # By default, hide debug/info messages
 logger.propagate = False
 
 
+def run_traced(cmd: list, **kwargs) -> subprocess.CompletedProcess:
+    """Run cmd with subprocess.run, recording it as a span of the trace."""
+    name = " ".join(
+        [os.path.basename(cmd[0]), *(arg for arg in cmd[1:2] if arg[0] != "-")]
+    )
+    with TRACER.span(name, cat="subprocess", cmd=" ".join(map(str, cmd))):
+        return subprocess.run(cmd, **kwargs)
+
+
 def get_all_examples_for_type(ioc_type: str, role_path: Path) -> dict[str, Path]:
     logger.info(f"Identifying examples for IOC type: {ioc_type}")
 
@@ -126,34 +142,58 @@ def get_all_examples_for_type(ioc_type: str, role_path: Path) -> dict[str, Path]
     return all_examples
 
 
-def collect_manual_ioc_files(directory: Path) -> dict[str, str]:
-    """Collect manual IOC files from a directory based on extension."""
-    manual_files = {}
-    for f in directory.iterdir():
-        if f.is_file() and f.suffix in MANUAL_FILE_EXTENSIONS:
-            logger.debug(f"Collected manual IOC file: {f.name}")
-            manual_files[f.name] = f.read_text()
-    return manual_files
-
-
-def ensure_container_running(container_name: str, el_version: int = 8):
+def ensure_container_running(
+    container_name: str,
+    el_version: int = 8,
+    log_fp: TextIO | None = None,
+    module_cache_dir: Path | None = None,
+):
     required_image = f"{BASE_CONTAINER_IMAGE}{el_version}:latest"
     logger.info(
         f"Ensuring container {container_name} with image {required_image} is running"
     )
+    cmd = [
+        f"{Path(__file__).parent.absolute()}/setup_container.sh",
+        container_name,
+        str(el_version),
+    ]
+    if module_cache_dir is not None:
+        cmd.append(str(module_cache_dir))
     try:
-        subprocess.run(
-            [
-                f"{Path(__file__).parent.absolute()}/setup_container.sh",
-                container_name,
-                str(el_version),
-            ],
+        run_traced(
+            cmd,
             check=True,
+            stdout=log_fp,
+            stderr=subprocess.STDOUT,
         )
     except subprocess.CalledProcessError as e:
         raise RuntimeError(f"Failed to ensure container is running: {e}") from e
 
 
+def save_module_cache(
+    container_name: str, module_cache_dir: Path, log_fp: TextIO | None = None
+):
+    """Copy the modules built in a container to seed the next container with."""
+    logger.info(f"Saving modules built in {container_name} to {module_cache_dir}")
+    module_cache_dir.parent.mkdir(parents=True, exist_ok=True)
+    partial_dir = module_cache_dir.with_name(f".{module_cache_dir.name}.partial")
+    shutil.rmtree(partial_dir, ignore_errors=True)
+    try:
+        run_traced(
+            ["docker", "cp", "-a", f"{container_name}:/epics/modules/.", partial_dir],
+            check=True,
+            stdout=log_fp,
+            stderr=subprocess.STDOUT,
+        )
+    except subprocess.CalledProcessError as e:
+        logger.warning(f"Failed to save modules built in {container_name}: {e}")
+        shutil.rmtree(partial_dir, ignore_errors=True)
+        return
+    # Only replace the previous cache once the new one is complete
+    shutil.rmtree(module_cache_dir, ignore_errors=True)
+    partial_dir.rename(module_cache_dir)
+
+
 def install_galaxy_collection(
     name: str, is_req_file: bool = False, force: bool = False
 ):
@@ -169,7 +209,7 @@ def install_galaxy_collection(
     cmd.extend(["-p", str(collections_path.absolute())])
     try:
         logger.info(f"Installing required ansible-galaxy collection(s): {name}")
-        subprocess.run(cmd, check=True)
+        run_traced(cmd, check=True)
     except subprocess.CalledProcessError as e:
         raise RuntimeError(f"Failed to install galaxy collection {name}: {e}") from e
 
@@ -231,277 +271,366 @@ class DeploymentOptions:
     dry_run: bool = False
     verbose: bool = False
     skip_compilation: bool = False
+    skip_unchanged: bool = False
     container: bool = False
     el_version: int = 8
     pixi_path: str = "pixi"
     manual_ioc_files: dict[str, dict[str, str]] = field(default_factory=dict)
+    jobs: int = 1
+    jobs_per_host: int | None = None
+    log_dir: Path | None = None
+    module_cache_dir: Path | None = None
+    profile_dir: Path | None = None
 
 
-def deploy_configs(options: DeploymentOptions):
-    deployment_summary: dict[str, tuple[Path, bool]] = {}
+_host_slots: dict[str, threading.BoundedSemaphore] = {}
+_host_slots_lock = threading.Lock()
 
-    if options.container:
-        ensure_container_running(options.hostname, el_version=options.el_version)
 
-    for ioc_name, path in options.configs.items():
-        logger.info(f"Deploying config: {ioc_name} from {path}")
+def get_host_slots(hostname: str, limit: int) -> threading.BoundedSemaphore:
+    """Return the semaphore bounding concurrent playbook runs against a host.
 
-        with open(path) as fp:
-            config_data = yaml.safe_load(fp)
+    The semaphore is shared by every caller targeting the same host, so that
+    the limit holds even if several deployments run against it at once.
+    """
+    with _host_slots_lock:
+        if hostname not in _host_slots:
+            _host_slots[hostname] = threading.BoundedSemaphore(limit)
+        return _host_slots[hostname]
 
-        if (
-            "deploy_ioc_supported_el_versions" in config_data
-            and options.el_version
-            not in config_data["deploy_ioc_supported_el_versions"]
-        ):
-            logger.warning(
-                f"Skipping {ioc_name} on el{options.el_version}, unsupported"
-            )
-            continue
 
-        example_skip_compilation = False
+@contextmanager
+def open_deployment_log(options: DeploymentOptions, ioc_name: str, mode: str = "w"):
+    """Yield a file object for the output of an IOC deployment.
 
-        playbook_cmd = [
-            "ansible-playbook",
-            "--diff",
-            "-i",
-            f"{options.hostname},",
-        ]
-        if options.container:
-            if ioc_name in options.verification_files:
-                with open(options.verification_files[ioc_name]) as fp:
-                    verification_data = yaml.safe_load(fp)
-                    if verification_data["skip_compilation"]:
-                        logger.info(
-                            "Skipping module compilation(s) per verification file"
-                        )
-                        example_skip_compilation = True
+    Yields None (i.e. inherit the terminal) if no log directory is configured.
+    """
+    if options.log_dir is None:
+        yield None
+        return
 
-            logger.info("Using a local container for the deployment")
-            playbook_cmd.extend(
-                [
-                    "-c",
-                    "docker",
-                    # Use 'su' instead of 'sudo' for become, since containers
-                    # don't have sudo/PAM configured.
-                    "--become-method=su",
-                    # Our containers come w/ softioc-tst accounts pre-made.
-                    "-e",
-                    "beamline_acronym=TST",
-                ]
-            )
+    log_path = options.log_dir / options.hostname / f"{ioc_name}.log"
+    log_path.parent.mkdir(parents=True, exist_ok=True)
+    logger.info(f"Writing output for {ioc_name} to {log_path}")
+    with open(log_path, mode) as log_fp:
+        yield log_fp
+
+
+def ioc_lane(options: DeploymentOptions, ioc_name: str) -> str:
+    """Return the trace lane of the deployment of an IOC."""
+    return f"{options.hostname}/{ioc_name}"
+
+
+def deploy_config(ioc_name: str, path: Path, options: DeploymentOptions) -> bool | None:
+    """Deploy a single IOC config.
+
+    Returns True on success, False on failure, or None if the IOC was skipped.
+    """
+    with (
+        TRACER.lane(ioc_lane(options, ioc_name)),
+        TRACER.span(f"deploy {ioc_name}", path=path),
+    ):
+        return _deploy_config(ioc_name, path, options)
+
+
+def _deploy_config(
+    ioc_name: str, path: Path, options: DeploymentOptions
+) -> bool | None:
+    logger.info(f"Deploying config: {ioc_name} from {path}")
+
+    with open(path) as fp:
+        config_data = yaml.safe_load(fp)
+
+    if (
+        "deploy_ioc_supported_el_versions" in config_data
+        and options.el_version not in config_data["deploy_ioc_supported_el_versions"]
+    ):
+        logger.warning(f"Skipping {ioc_name} on el{options.el_version}, unsupported")
+        return None
+
+    with TRACER.span("validate config"):
+        validation_errors = validate_ioc_config(config_data.get(ioc_name), path)
+    if validation_errors:
+        logger.error(
+            f"Config of {ioc_name} at {path} doesn't conform to its schemas:\n"
+            + "\n".join(f"  {error}" for error in validation_errors)
+        )
+        return False
+
+    example_skip_compilation = False
+
+    playbook_cmd = [
+        "ansible-playbook",
+        "--diff",
+        "-i",
+        f"{options.hostname},",
+    ]
+    if options.container:
+        if ioc_name in options.verification_files:
+            with open(options.verification_files[ioc_name]) as fp:
+                verification_data = yaml.safe_load(fp)
+                if verification_data["skip_compilation"]:
+                    logger.info("Skipping module compilation(s) per verification file")
+                    example_skip_compilation = True
+
+        logger.info("Using a local container for the deployment")
         playbook_cmd.extend(
             [
-                "-u",
-                "root",
-                "--limit",
-                options.hostname,
+                "-c",
+                "docker",
+                # Use 'su' instead of 'sudo' for become, since containers
+                # don't have sudo/PAM configured.
+                "--become-method=su",
+                # Our containers come w/ softioc-tst accounts pre-made.
                 "-e",
-                f"deploy_ioc_target={ioc_name}",
-                "-e",
-                f"deploy_ioc_local_config_path={path}",
-                "-e",
-                f"deploy_ioc_nsls2network_available={NSLS2NETWORK_PKG_AVAILABLE}",
-                "-e",
-                f"deploy_ioc_pixi_executable_path={options.pixi_path}",
+                "beamline_acronym=TST",
             ]
         )
-        if options.skip_compilation or (options.container and example_skip_compilation):
-            logger.info("Skipping any module compilations")
-            playbook_cmd.extend(["-e", "install_module_skip_compilation=true"])
+    playbook_cmd.extend(
+        [
+            "-u",
+            "root",
+            "--limit",
+            options.hostname,
+            "-e",
+            f"deploy_ioc_target={ioc_name}",
+            "-e",
+            f"deploy_ioc_local_config_path={path}",
+            "-e",
+            f"deploy_ioc_nsls2network_available={NSLS2NETWORK_PKG_AVAILABLE}",
+            "-e",
+            f"deploy_ioc_pixi_executable_path={options.pixi_path}",
+        ]
+    )
+    if options.skip_compilation or (options.container and example_skip_compilation):
+        logger.info("Skipping any module compilations")
+        playbook_cmd.extend(["-e", "install_module_skip_compilation=true"])
+    if options.skip_unchanged:
+        playbook_cmd.extend(["-e", "deploy_ioc_skip_unchanged=true"])
+
+    manual_files_tmpfile = None
+    if ioc_name in options.manual_ioc_files:
+        logger.info(
+            f"Passing {len(options.manual_ioc_files[ioc_name])} manual IOC "
+            f"file(s) for {ioc_name}"
+        )
+        manual_files_tmpfile = tempfile.NamedTemporaryFile(
+            mode="w", suffix=".json", delete=False
+        )
+        json.dump(
+            {"deploy_ioc_manual_ioc_files": options.manual_ioc_files[ioc_name]},
+            manual_files_tmpfile,
+        )
+        manual_files_tmpfile.close()
+        playbook_cmd.extend(["-e", f"@{manual_files_tmpfile.name}"])
+
+    if options.verbose:
+        logger.info("Enabling verbose output")
+        playbook_cmd.append("-vvv")
+    if options.dry_run:
+        logger.info("Performing dry run")
+        playbook_cmd.append("--check")
+
+    playbook_cmd.append(
+        f"{Path(__file__).parent.absolute() / 'deploy_local_ioc_config.yml'}"
+    )
 
-        manual_files_tmpfile = None
-        if ioc_name in options.manual_ioc_files:
-            logger.info(
-                f"Passing {len(options.manual_ioc_files[ioc_name])} manual IOC "
-                f"file(s) for {ioc_name}"
-            )
-            manual_files_tmpfile = tempfile.NamedTemporaryFile(
-                mode="w", suffix=".json", delete=False
-            )
-            json.dump(
-                {"deploy_ioc_manual_ioc_files": options.manual_ioc_files[ioc_name]},
-                manual_files_tmpfile,
-            )
-            manual_files_tmpfile.close()
-            playbook_cmd.extend(["-e", f"@{manual_files_tmpfile.name}"])
-
-        if options.verbose:
-            logger.info("Enabling verbose output")
-            playbook_cmd.append("-vvv")
-        if options.dry_run:
-            logger.info("Performing dry run")
-            playbook_cmd.append("--check")
-
-        playbook_cmd.append(
-            f"{Path(__file__).parent.absolute() / 'deploy_local_ioc_config.yml'}"
+    env = None
+    if options.profile_dir is not None:
+        profile_path = options.profile_dir / options.hostname / f"{ioc_name}.json"
+        profile_path.parent.mkdir(parents=True, exist_ok=True)
+        logger.info(f"Writing task profile of {ioc_name} to {profile_path}")
+        callbacks_enabled = os.environ.get("ANSIBLE_CALLBACKS_ENABLED")
+        env = dict(
+            os.environ,
+            ANSIBLE_CALLBACKS_ENABLED=",".join(
+                filter(None, [callbacks_enabled, "nsls2.ioc_deploy.task_profile"])
+            ),
+            NSLS2_IOC_DEPLOY_PROFILE_PATH=str(profile_path),
         )
 
-        logger.info(f"Executing command: {' '.join(playbook_cmd)}")
+    logger.info(f"Executing command: {' '.join(playbook_cmd)}")
 
+    with open_deployment_log(options, ioc_name) as log_fp:
         try:
-            subprocess.run(playbook_cmd, check=True)
+            run_traced(
+                playbook_cmd,
+                check=True,
+                stdout=log_fp,
+                stderr=subprocess.STDOUT,
+                env=env,
+            )
         except subprocess.CalledProcessError as e:
             logger.error(
                 f"Deployment of {ioc_name} failed; exit code {e.returncode}: {e.cmd}"
             )
-            deployment_summary[ioc_name] = (path, False)
-            continue
+            if log_fp is not None:
+                logger.error(f"See {log_fp.name} for the deployment output")
+            return False
         finally:
             if manual_files_tmpfile is not None:
                 os.unlink(manual_files_tmpfile.name)
 
-        # Only attempt verification if deployment succeeded and a verification file is
-        # configured for this IOC and deployment is running in a container
-        if ioc_name in options.verification_files and options.container:
-            logger.info(f"Verifying deployment of {ioc_name}")
-            try:
-                subprocess.run(
-                    [
-                        "docker",
-                        "cp",
-                        options.verification_files[ioc_name],
-                        f"{options.hostname}:verify.yml",
-                    ],
-                    check=True,
-                )
-                subprocess.run(
-                    [
-                        "docker",
-                        "exec",
-                        f"{options.hostname}",
-                        "pixi",
-                        "run",
-                        "verification",
-                        ioc_name,
-                    ],
-                    check=True,
-                )
-            except subprocess.CalledProcessError as e:
-                logger.error(
-                    f"Verification of {ioc_name} failed with exit code {e.returncode}"
-                )
-                deployment_summary[ioc_name] = (path, False)
-                continue
-
-        deployment_summary[ioc_name] = (path, True)
-
-    overall_success = all(success for _, success in deployment_summary.values())
-    return overall_success, deployment_summary
-
-
-def main():
-    parser = argparse.ArgumentParser(
-        description="Deploy specified local IOC configuration"
-    )
+    return True
+
+
+def verify_deployments(
+    ioc_names: list[str], options: DeploymentOptions
+) -> dict[str, bool]:
+    """Verify deployed IOCs in the container, returning whether each passed.
+
+    The verify.yml files of all IOCs, and a manifest pairing each with its IOC
+    directory, are copied into the container in one transfer, and verified by
+    a single run of the verification script.
+    """
+    logger.info(f"Verifying deployment of {len(ioc_names)} IOC(s)")
+    results = {}
+    with (
+        TRACER.span("verify deployments", iocs=len(ioc_names)),
+        tempfile.TemporaryDirectory(prefix="verify-") as verify_dir,
+        open_deployment_log(options, "verification") as log_fp,
+    ):
+        manifest = {}
+        for ioc_name in ioc_names:
+            shutil.copy(
+                options.verification_files[ioc_name],
+                Path(verify_dir) / f"{ioc_name}.yml",
+            )
+            manifest[ioc_name] = {
+                "verify_yml": f"{ioc_name}.yml",
+                "ioc_dir": f"/epics/iocs/{ioc_name}",
+            }
+        with open(Path(verify_dir) / "manifest.yml", "w") as fp:
+            yaml.safe_dump(manifest, fp)
 
-    deployment_target_group = parser.add_mutually_exclusive_group(required=True)
-    deployment_target_group.add_argument(
-        "-l", "--limit", help="Target hostname onto which to deploy the IOCs"
-    )
-    deployment_target_group.add_argument(
-        "--container",
-        action="store_true",
-        help="Use a local container for the deployment",
-    )
-    parser.add_argument(
-        "-c",
-        "--configs",
-        nargs="+",
-        help="Path to local IOC configuration files to deploy",
-    )
-    parser.add_argument("-e", "--examples", nargs="+", help="Which examples to deploy")
-    parser.add_argument(
-        "-v", "--verbose", action="store_true", help="Enable verbose output"
-    )
-    parser.add_argument(
-        "-d", "--dry-run", action="store_true", help="Perform a dry run"
-    )
-    parser.add_argument(
-        "--skip_compilation", action="store_true", help="Skip compilation step"
-    )
-    parser.add_argument(
-        "--pixi_path",
-        type=str,
-        default="pixi",
-        help="Path to the pixi executable (default: 'pixi' - i.e. must be in PATH)",
-    )
-    parser.add_argument(
-        "--not-reinstall-collections",
-        action="store_true",
-        help=(
-            "Skip reinstall/rebuild of the local nsls2.ioc_deploy collection before "
-            "deployment"
-        ),
-    )
+        container_dir = Path(verify_dir).name
+        try:
+            run_traced(
+                ["docker", "cp", verify_dir, f"{options.hostname}:{container_dir}"],
+                check=True,
+                stdout=log_fp,
+                stderr=subprocess.STDOUT,
+            )
+            # The script exits non-zero if any IOC fails, results are on stdout
+            verification = run_traced(
+                [
+                    "docker",
+                    "exec",
+                    options.hostname,
+                    "pixi",
+                    "run",
+                    "verify-all",
+                    f"{container_dir}/manifest.yml",
+                ],
+                stdout=subprocess.PIPE,
+                stderr=log_fp,
+                text=True,
+            )
+            results = json.loads(verification.stdout)
+        except (subprocess.CalledProcessError, ValueError) as e:
+            logger.error(f"Verification on {options.hostname} failed: {e}")
+
+    passed = {}
+    for ioc_name in ioc_names:
+        result = results.get(ioc_name, {"passed": False, "output": "No result\n"})
+        passed[ioc_name] = result["passed"]
+        with open_deployment_log(options, ioc_name, mode="a") as log_fp:
+            (log_fp or sys.stdout).write(result["output"])
+            if not result["passed"]:
+                logger.error(f"Verification of {ioc_name} failed")
+                if log_fp is not None:
+                    logger.error(f"See {log_fp.name} for the verification output")
+    return passed
 
-    example_source_group = parser.add_mutually_exclusive_group()
-    example_source_group.add_argument("-t", "--type", help="Type of IOC to deploy")
-    example_source_group.add_argument(
-        "--all", action="store_true", help="Deploy all available examples"
-    )
 
-    # TODO: Enable el10 support.
-    parser.add_argument(
-        "-m",
-        "--matrix",
-        nargs="+",
-        type=int,
-        choices=[8, 9],
-        default=[8],
-        help="Specify the EL matrix version(s)",
-    )
-    parser.add_argument(
-        "-i", "--interactive", action="store_true", help="Enable interactive mode"
-    )
+def deploy_configs(options: DeploymentOptions):
+    deployment_summary: dict[str, tuple[Path, bool]] = {}
 
-    args = parser.parse_args()
+    if options.container:
+        with (
+            TRACER.span("ensure_container_running"),
+            open_deployment_log(options, "setup_container") as log_fp,
+        ):
+            ensure_container_running(
+                options.hostname,
+                el_version=options.el_version,
+                log_fp=log_fp,
+                module_cache_dir=options.module_cache_dir,
+            )
 
-    top_path = Path(__file__).parent.parent.absolute()
+    if options.jobs <= 1:
+        for ioc_name, path in options.configs.items():
+            success = deploy_config(ioc_name, path, options)
+            if success is not None:
+                deployment_summary[ioc_name] = (path, success)
+    else:
+        host_slots = get_host_slots(
+            options.hostname, options.jobs_per_host or options.jobs
+        )
 
-    # Switch to the top level nsls2.ioc_deploy directory
-    os.chdir(top_path)
-    logger.debug(f"Changed working directory to {top_path}")
+        def _deploy_with_host_slot(ioc_name: str, path: Path) -> bool | None:
+            with TRACER.lane(ioc_lane(options, ioc_name)):
+                with TRACER.span("wait for host slot"):
+                    host_slots.acquire()
+            try:
+                return deploy_config(ioc_name, path, options)
+            finally:
+                host_slots.release()
 
-    # Add the collections path to the environment so that ansible-galaxy
-    # can find our locally installed collection(s)
-    os.environ["ANSIBLE_COLLECTIONS_PATH"] = str((top_path / "collections").absolute())
+        logger.info(
+            f"Deploying {len(options.configs)} config(s) to {options.hostname} "
+            f"with {options.jobs} job(s)"
+        )
+        results: dict[str, bool | None] = {}
+        with ThreadPoolExecutor(
+            max_workers=options.jobs, thread_name_prefix=options.hostname
+        ) as executor:
+            futures = {
+                executor.submit(_deploy_with_host_slot, ioc_name, path): ioc_name
+                for ioc_name, path in options.configs.items()
+            }
+            for future in as_completed(futures):
+                ioc_name = futures[future]
+                try:
+                    results[ioc_name] = future.result()
+                except Exception as e:
+                    logger.error(f"Deployment of {ioc_name} raised an error: {e}")
+                    results[ioc_name] = False
+
+        # Report results in the order the configs were given, not completion order
+        for ioc_name, path in options.configs.items():
+            if results.get(ioc_name) is not None:
+                deployment_summary[ioc_name] = (path, results[ioc_name])
+
+    # Only verify IOCs that deployed successfully and have a verification file
+    to_verify = [
+        ioc_name
+        for ioc_name, (_, success) in deployment_summary.items()
+        if success and ioc_name in options.verification_files
+    ]
+    if options.container and to_verify:
+        for ioc_name, passed in verify_deployments(to_verify, options).items():
+            deployment_summary[ioc_name] = (deployment_summary[ioc_name][0], passed)
+
+    if options.container and options.module_cache_dir and not options.dry_run:
+        with (
+            TRACER.span("save_module_cache"),
+            open_deployment_log(options, "module_cache") as log_fp,
+        ):
+            save_module_cache(options.hostname, options.module_cache_dir, log_fp)
 
-    logger.info("Executing deployment of local IOC configuration...")
-    logger.info("Arguments:")
-    for arg in vars(args):
-        logger.info(f"    {arg}: {getattr(args, arg)}")
+    overall_success = all(success for _, success in deployment_summary.values())
+    return overall_success, deployment_summary
 
-    if args.verbose:
-        logger.setLevel(logging.DEBUG)
 
+def load_configs(
+    args: argparse.Namespace, top_path: Path
+) -> tuple[dict[str, Path], dict[str, Path], dict[str, dict[str, str]]]:
+    """Find the IOC configs to deploy, with their verification and manual files."""
     configs_to_deploy: dict[str, Path] = {}
     verification_files: dict[str, Path] = {}
     manual_ioc_files: dict[str, dict[str, str]] = {}
 
-    logger.info("Checking if ansible galaxy collection requirements are installed...")
-
-    # TODO: This is a bit of a primitive check, but given that the
-    # nsls2.awx fork and nsls2.general don't have built versions,
-    # it's the best we can do for now to avoid unnecessary galaxy installs.
-    expected_collections = [
-        "ansible/posix",
-        "awx/awx",
-        "community/general",
-        "containers/podman",
-        "nsls2/general",
-    ]
-    for dir in expected_collections:
-        if not (top_path / f"collections/ansible_collections/{dir}").exists():
-            install_galaxy_collection(
-                str(Path("collections/requirements.yml").absolute()), is_req_file=True
-            )
-            break
-
-    install_local_collection(
-        top_path, reinstall_collection=not args.not_reinstall_collections
-    )
-
     if args.all:
         logger.info("Finding all examples for all IOC types")
         device_roles_path = top_path / "roles/device_roles"
@@ -605,6 +734,207 @@ def main():
             except Exception as e:
                 logger.warning(f"Failed to load config '{cfg}': {e}")
 
+    return configs_to_deploy, verification_files, manual_ioc_files
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Deploy specified local IOC configuration"
+    )
+
+    deployment_target_group = parser.add_mutually_exclusive_group(required=True)
+    deployment_target_group.add_argument(
+        "-l", "--limit", help="Target hostname onto which to deploy the IOCs"
+    )
+    deployment_target_group.add_argument(
+        "--container",
+        action="store_true",
+        help="Use a local container for the deployment",
+    )
+    parser.add_argument(
+        "-c",
+        "--configs",
+        nargs="+",
+        help="Path to local IOC configuration files to deploy",
+    )
+    parser.add_argument("-e", "--examples", nargs="+", help="Which examples to deploy")
+    parser.add_argument(
+        "-v", "--verbose", action="store_true", help="Enable verbose output"
+    )
+    parser.add_argument(
+        "-d", "--dry-run", action="store_true", help="Perform a dry run"
+    )
+    parser.add_argument(
+        "--skip_compilation", action="store_true", help="Skip compilation step"
+    )
+    parser.add_argument(
+        "--skip-unchanged",
+        action="store_true",
+        help=(
+            "Only deploy IOCs whose configuration, role files or required modules "
+            "changed since they were last deployed to the target"
+        ),
+    )
+    parser.add_argument(
+        "--pixi_path",
+        type=str,
+        default="pixi",
+        help="Path to the pixi executable (default: 'pixi' - i.e. must be in PATH)",
+    )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=1,
+        help="Number of IOC deployments to run concurrently (default: 1)",
+    )
+    parser.add_argument(
+        "--jobs-per-host",
+        type=int,
+        default=None,
+        help=(
+            "Maximum number of concurrent deployments against a single host "
+            "(default: same as --jobs)"
+        ),
+    )
+    parser.add_argument(
+        "--log-dir",
+        type=str,
+        default=None,
+        help=(
+            "Directory to write per-IOC deployment output to. Defaults to 'logs/' "
+            "when running with more than one job or EL version"
+        ),
+    )
+    parser.add_argument(
+        "--profile",
+        nargs="?",
+        const="profiles",
+        default=None,
+        metavar="DIR",
+        help=(
+            "Profile the playbook tasks of each deployment, writing JSON profiles "
+            "to DIR/<host>/<ioc>.json (default DIR: 'profiles/')"
+        ),
+    )
+    parser.add_argument(
+        "--trace",
+        type=str,
+        default=None,
+        metavar="FILE",
+        help=(
+            "Write a Chrome trace of the deployment phases and subprocesses to FILE, "
+            "for chrome://tracing or https://ui.perfetto.dev"
+        ),
+    )
+    parser.add_argument(
+        "--module-cache",
+        type=str,
+        default=None,
+        help=(
+            "Directory to save the modules built in each container to, and to seed "
+            "new containers with, so unchanged modules are not rebuilt"
+        ),
+    )
+    parser.add_argument(
+        "--not-reinstall-collections",
+        action="store_true",
+        help=(
+            "Skip reinstall/rebuild of the local nsls2.ioc_deploy collection before "
+            "deployment"
+        ),
+    )
+
+    example_source_group = parser.add_mutually_exclusive_group()
+    example_source_group.add_argument("-t", "--type", help="Type of IOC to deploy")
+    example_source_group.add_argument(
+        "--all", action="store_true", help="Deploy all available examples"
+    )
+
+    # TODO: Enable el10 support.
+    parser.add_argument(
+        "-m",
+        "--matrix",
+        nargs="+",
+        type=int,
+        choices=[8, 9],
+        default=[8],
+        help="Specify the EL matrix version(s)",
+    )
+    parser.add_argument(
+        "-i", "--interactive", action="store_true", help="Enable interactive mode"
+    )
+
+    args = parser.parse_args()
+
+    top_path = Path(__file__).parent.parent.absolute()
+
+    # Switch to the top level nsls2.ioc_deploy directory
+    os.chdir(top_path)
+    logger.debug(f"Changed working directory to {top_path}")
+
+    # Add the collections path to the environment so that ansible-galaxy
+    # can find our locally installed collection(s)
+    os.environ["ANSIBLE_COLLECTIONS_PATH"] = str((top_path / "collections").absolute())
+
+    logger.info("Executing deployment of local IOC configuration...")
+    logger.info("Arguments:")
+    for arg in vars(args):
+        logger.info(f"    {arg}: {getattr(args, arg)}")
+
+    if args.verbose:
+        logger.setLevel(logging.DEBUG)
+
+    if args.jobs < 1:
+        raise ValueError(f"--jobs must be at least 1, got {args.jobs}")
+    if args.jobs_per_host is not None and args.jobs_per_host < 1:
+        raise ValueError(
+            f"--jobs-per-host must be at least 1, got {args.jobs_per_host}"
+        )
+
+    profile_dir = Path(args.profile).absolute() if args.profile else None
+
+    log_dir = None
+    if args.log_dir:
+        log_dir = Path(args.log_dir).absolute()
+    elif args.jobs > 1 or (args.container and len(args.matrix) > 1):
+        log_dir = top_path / "logs"
+
+    if args.trace:
+        TRACER.enable()
+        atexit.register(TRACER.write, Path(args.trace).absolute())
+
+    logger.info("Checking if ansible galaxy collection requirements are installed...")
+
+    # TODO: This is a bit of a primitive check, but given that the
+    # nsls2.awx fork and nsls2.general don't have built versions,
+    # it's the best we can do for now to avoid unnecessary galaxy installs.
+    expected_collections = [
+        "ansible/posix",
+        "awx/awx",
+        "community/general",
+        "containers/podman",
+        "nsls2/general",
+    ]
+    with TRACER.span("check galaxy collections"):
+        for dir in expected_collections:
+            if not (top_path / f"collections/ansible_collections/{dir}").exists():
+                install_galaxy_collection(
+                    str(Path("collections/requirements.yml").absolute()),
+                    is_req_file=True,
+                )
+                break
+
+    with TRACER.span("install local collection"):
+        install_local_collection(
+            top_path, reinstall_collection=not args.not_reinstall_collections
+        )
+
+    with TRACER.span("load configs"):
+        configs_to_deploy, verification_files, manual_ioc_files = load_configs(
+            args, top_path
+        )
+
     running_deployment_summary: dict[int, dict[str, tuple[Path, bool]]] = {}
 
     overall_success = True
@@ -612,41 +942,79 @@ def main():
         logger.info(
             f"Executing {len(configs_to_deploy)} deployment(s) on EL{args.matrix}"
         )
-        for el_version in args.matrix:
+
+        def _deploy_el_version(el_version: int):
+            # Name the worker thread so that log records identify the EL version
+            threading.current_thread().name = f"el{el_version}"
             logger.info(f"Executing deployment for EL version: {el_version}")
-            el_version_success, deployment_summary = deploy_configs(
+            with (
+                TRACER.lane(f"el{el_version}"),
+                TRACER.span(f"deploy_configs el{el_version}"),
+            ):
+                return deploy_configs(
+                    DeploymentOptions(
+                        hostname=f"nsls2_ioc_deploy_el{el_version}",
+                        configs=configs_to_deploy,
+                        verification_files=verification_files,
+                        dry_run=args.dry_run,
+                        verbose=args.verbose,
+                        skip_compilation=args.skip_compilation,
+                        skip_unchanged=args.skip_unchanged,
+                        container=args.container,
+                        el_version=el_version,
+                        pixi_path=args.pixi_path,
+                        manual_ioc_files=manual_ioc_files,
+                        jobs=args.jobs,
+                        jobs_per_host=args.jobs_per_host,
+                        log_dir=log_dir,
+                        module_cache_dir=(
+                            Path(args.module_cache).absolute() / f"el{el_version}"
+                            if args.module_cache
+                            else None
+                        ),
+                        profile_dir=profile_dir,
+                    )
+                )
+
+        # Each EL version targets its own container, so run them side by side
+        with ThreadPoolExecutor(max_workers=len(args.matrix)) as executor:
+            el_version_futures = {
+                el_version: executor.submit(_deploy_el_version, el_version)
+                for el_version in args.matrix
+            }
+
+        for el_version, future in el_version_futures.items():
+            try:
+                el_version_success, deployment_summary = future.result()
+            except Exception as e:
+                # Only fail this EL version, the others are still summarized
+                logger.error(f"Deployment for EL version {el_version} failed: {e}")
+                el_version_success, deployment_summary = False, {}
+            overall_success = overall_success and el_version_success
+            running_deployment_summary[el_version] = deployment_summary
+    else:
+        logger.info(
+            f"Executing {len(configs_to_deploy)} deployment(s) onto {args.limit}"
+        )
+        with TRACER.span(f"deploy_configs {args.limit}"):
+            overall_success, running_deployment_summary = deploy_configs(
                 DeploymentOptions(
-                    hostname=f"nsls2_ioc_deploy_el{el_version}",
+                    hostname=args.limit,
                     configs=configs_to_deploy,
                     verification_files=verification_files,
                     dry_run=args.dry_run,
                     verbose=args.verbose,
                     skip_compilation=args.skip_compilation,
+                    skip_unchanged=args.skip_unchanged,
                     container=args.container,
-                    el_version=el_version,
                     pixi_path=args.pixi_path,
                     manual_ioc_files=manual_ioc_files,
+                    jobs=args.jobs,
+                    jobs_per_host=args.jobs_per_host,
+                    log_dir=log_dir,
+                    profile_dir=profile_dir,
                 )
             )
-            overall_success = overall_success and el_version_success
-            running_deployment_summary[el_version] = deployment_summary
-    else:
-        logger.info(
-            f"Executing {len(configs_to_deploy)} deployment(s) onto {args.limit}"
-        )
-        overall_success, running_deployment_summary = deploy_configs(
-            DeploymentOptions(
-                hostname=args.limit,
-                configs=configs_to_deploy,
-                verification_files=verification_files,
-                dry_run=args.dry_run,
-                verbose=args.verbose,
-                skip_compilation=args.skip_compilation,
-                container=args.container,
-                pixi_path=args.pixi_path,
-                manual_ioc_files=manual_ioc_files,
-            )
-        )
 
     print("\n\nDeployment Summary:\n=========================================\n")
 
@@ -1,9 +1,11 @@
 #!/usr/bin/env python3
 
+import functools
+import json
 import os
 import shutil
-import subprocess
 import sys
+from collections import defaultdict
 
 import questionary
 import tabulate
@@ -27,20 +29,127 @@ def write_yaml_config(path, data):
         )
 
 
+INSTALL_MODULE_VARS_DIR = os.path.join("roles", "install_module", "vars")
+DEPLOY_IOC_VARS_DIR = os.path.join("roles", "deploy_ioc", "vars")
+GRAPH_CACHE_PATH = ".manage_collection_cache.json"
+GRAPH_CACHE_VERSION = 1
+
+
+class DependencyGraph:
+    """Index of dependencies between modules, and from IOC types to modules.
+
+    Built in one pass over the install_module and deploy_ioc vars files, and
+    cached on disk with the mtime of each file, so only files that changed
+    since the last run are parsed again.
+    """
+
+    def __init__(self, files: dict[str, dict]):
+        self.files = files
+        # Forward and reverse edges between modules
+        self.module_deps: dict[str, list[str]] = {}
+        self.module_dependents: dict[str, list[str]] = defaultdict(list)
+        # Forward and reverse edges between IOC types and modules
+        self.ioc_type_module: dict[str, str | None] = {}
+        self.module_ioc_types: dict[str, list[str]] = defaultdict(list)
+        self._depths: dict[str, int] = {}
+
+        for path, entry in sorted(files.items()):
+            name = os.path.splitext(os.path.basename(path))[0]
+            if entry["kind"] == "module":
+                self.module_deps[name] = entry["module_deps"]
+                for dep in entry["module_deps"]:
+                    self.module_dependents[dep].append(name)
+            else:
+                self.ioc_type_module[name] = entry["required_module"]
+                if entry["required_module"] is not None:
+                    self.module_ioc_types[entry["required_module"]].append(name)
+
+    @staticmethod
+    def _parse(path: str, kind: str, mtime_ns: int) -> dict:
+        with open(path) as fp:
+            data = yaml.safe_load(fp) or {}
+        entry = {"kind": kind, "mtime_ns": mtime_ns}
+        if kind == "module":
+            config = next(iter(data.values()), None) or {}
+            entry["module_deps"] = list(config.get("module_deps") or [])
+        else:
+            entry["required_module"] = data.get("deploy_ioc_required_module")
+        return entry
+
+    @classmethod
+    def load(cls, cache_path: str = GRAPH_CACHE_PATH) -> "DependencyGraph":
+        """Return the graph, only re-parsing vars files changed since cached."""
+        try:
+            with open(cache_path) as fp:
+                cache = json.load(fp)
+            if cache.get("version") != GRAPH_CACHE_VERSION:
+                cache = {}
+        except (OSError, ValueError):
+            cache = {}
+        cached_files = cache.get("files", {})
+
+        files = {}
+        for vars_dir, kind in (
+            (INSTALL_MODULE_VARS_DIR, "module"),
+            (DEPLOY_IOC_VARS_DIR, "ioc_type"),
+        ):
+            for dir_entry in os.scandir(vars_dir):
+                if not dir_entry.name.endswith(".yml"):
+                    continue
+                mtime_ns = dir_entry.stat().st_mtime_ns
+                cached = cached_files.get(dir_entry.path)
+                if cached is not None and cached["mtime_ns"] == mtime_ns:
+                    files[dir_entry.path] = cached
+                else:
+                    files[dir_entry.path] = cls._parse(dir_entry.path, kind, mtime_ns)
+
+        if files != cached_files:
+            with open(cache_path, "w") as fp:
+                json.dump({"version": GRAPH_CACHE_VERSION, "files": files}, fp)
+        return cls(files)
+
+    def dependents(self, module: str) -> list[str]:
+        """Return all modules that depend on module, directly or indirectly."""
+        seen: list[str] = []
+        pending = list(self.module_dependents.get(module, []))
+        while pending:
+            dependent = pending.pop(0)
+            if dependent not in seen:
+                seen.append(dependent)
+                pending.extend(self.module_dependents.get(dependent, []))
+        return seen
+
+    def depth(self, module: str) -> int:
+        """Return the length of the longest chain of dependencies of module."""
+        if module not in self._depths:
+            # Guard against cycles while the depth is being computed
+            self._depths[module] = 0
+            self._depths[module] = max(
+                (self.depth(dep) + 1 for dep in self.module_deps.get(module, [])),
+                default=0,
+            )
+        return self._depths[module]
+
+    def files_referencing(self, module: str) -> list[str]:
+        """Return the vars files of the modules and IOC types requiring module."""
+        direct = set(self.module_dependents.get(module, []))
+        ioc_types = set(self.module_ioc_types.get(module, []))
+        return sorted(
+            path
+            for path, entry in self.files.items()
+            if os.path.splitext(os.path.basename(path))[0]
+            in (direct if entry["kind"] == "module" else ioc_types)
+        )
+
+
 def get_module_list():
     """Return a list of module names from the install_module vars directory."""
-    return [
-        os.path.splitext(f)[0]
-        for f in os.listdir(os.path.join("roles", "install_module", "vars"))
-    ]
+    return sorted(DependencyGraph.load().module_deps)
 
 
 def get_role_list():
     """Return a list of role names from the deploy_ioc vars directory."""
-    return [
-        os.path.splitext(f)[0]
-        for f in os.listdir(os.path.join("roles", "deploy_ioc", "vars"))
-    ]
+    return sorted(DependencyGraph.load().ioc_type_module)
 
 
 def parse_package_list(raw_input):
@@ -152,36 +261,16 @@ def update_module():
 
     write_yaml_config(new_module_config_path, new_module_config)
 
-    print(f"Updating {module_base_name} to {new_version} for all dependant modules...")
-    module_var_files = [
-        os.path.join("roles", "install_module", "vars", file)
-        for file in os.listdir(os.path.join("roles", "install_module", "vars"))
-        if file != f"{old_module_name_ver}.yml"
-    ]
-    subprocess.run(
-        [
-            "sed",
-            "-i",
-            f"s/{old_module_name_ver}/{new_module_name_ver}/g",
-            *module_var_files,
-        ]
-    )
-
     print(
-        f"Updating {module_base_name} to {new_version} for all dependant ioc types..."
-    )
-    ioc_vars_files = [
-        os.path.join("roles", "deploy_ioc", "vars", file)
-        for file in os.listdir(os.path.join("roles", "deploy_ioc", "vars"))
-    ]
-    subprocess.run(
-        [
-            "sed",
-            "-i",
-            f"s/{old_module_name_ver}/{new_module_name_ver}/g",
-            *ioc_vars_files,
-        ]
+        f"Updating {module_base_name} to {new_version} for all dependant modules "
+        "and ioc types..."
     )
+    for path in DependencyGraph.load().files_referencing(old_module_name_ver):
+        with open(path) as file:
+            contents = file.read()
+        with open(path, "w") as file:
+            file.write(contents.replace(old_module_name_ver, new_module_name_ver))
+        print(f" - {path}")
 
     delete_old_module_config = questionary.confirm(
         f"Delete old module config file {old_module_name_ver}.yml?", default=True
@@ -198,20 +287,9 @@ def delete_module():
         "Select a module to update:", choices=get_module_list()
     ).unsafe_ask()
 
-    dependant_modules = []
-    dependant_ioc_types = []
-    for file in os.listdir(os.path.join("roles", "install_module", "vars")):
-        with open(os.path.join("roles", "install_module", "vars", file)) as f:
-            module_config = yaml.safe_load(f)
-            module_name_ver = list(module_config.keys())[0]
-            if module in module_config[module_name_ver]["module_deps"]:
-                dependant_modules.append(os.path.splitext(file)[0])
-
-    for file in os.listdir(os.path.join("roles", "deploy_ioc", "vars")):
-        with open(os.path.join("roles", "deploy_ioc", "vars", file)) as f:
-            ioc_config = yaml.safe_load(f)
-            if ioc_config["deploy_ioc_required_module"] == module:
-                dependant_ioc_types.append(os.path.splitext(file)[0])
+    graph = DependencyGraph.load()
+    dependant_modules = graph.module_dependents.get(module, [])
+    dependant_ioc_types = graph.module_ioc_types.get(module, [])
     if dependant_modules or dependant_ioc_types:
         raise RuntimeError(
             f"Cannot delete {module} as it is required by the following modules: ",
@@ -360,8 +438,10 @@ def report():
     """Print a report of all modules and roles"""
 
     print("\nDeployable modules:\n")
+    module_list = get_module_list()
+    role_list = get_role_list()
     modules = {}
-    for module in get_module_list():
+    for module in module_list:
         module_name, ver = tuple(module.rsplit("_", 1))
         if module_name not in modules:
             modules[module_name] = []
@@ -376,22 +456,60 @@ def report():
     )
 
     print("\nDeployable IOC roles:\n")
-    for role in get_role_list():
+    for role in role_list:
         print(f" - {role}")
 
-    print("\nNumber of deployable modules:", len(get_module_list()))
-    print("Number of deployable IOC roles:", len(get_role_list()))
+    print("\nNumber of deployable modules:", len(module_list))
+    print("Number of deployable IOC roles:", len(role_list))
+
+
+def graph(module=None):
+    """Print the dependency depth and dependents of all modules, or of one module"""
+    index = DependencyGraph.load()
+
+    if module is None:
+        modules = sorted(index.module_deps, key=lambda m: (index.depth(m), m))
+    elif module in index.module_deps:
+        modules = [module]
+    else:
+        raise RuntimeError(f"Unknown module: {module}")
+
+    print(
+        tabulate.tabulate(
+            [
+                (
+                    m,
+                    index.depth(m),
+                    ", ".join(index.module_deps[m]),
+                    ", ".join(sorted(index.dependents(m))),
+                    ", ".join(
+                        sorted(
+                            ioc_type
+                            for dependent in [m] + index.dependents(m)
+                            for ioc_type in index.module_ioc_types.get(dependent, [])
+                        )
+                    ),
+                )
+                for m in modules
+            ],
+            headers=["Module", "Depth", "Depends on", "Dependents", "IOC types"],
+            tablefmt="simple",
+            maxcolwidths=[None, None, 40, 40, 40],
+        )
+    )
 
 
 if __name__ == "__main__":
     if len(sys.argv) not in [2, 3]:
         print("Usage: manage_collection.py <action> [target]")
-        print("Actions: add, delete, update, report")
-        print("Targets: role, module")
+        print("Actions: add, delete, update, report, graph")
+        print("Targets: role, module (or a module name for graph)")
         sys.exit(1)
     action = sys.argv[1]
     if action == "report":
         func = report
+    elif action == "graph":
+        func = functools.partial(graph, *sys.argv[2:])
     else:
         target = sys.argv[2]
         func = getattr(sys.modules[__name__], f"{action}_{target}")
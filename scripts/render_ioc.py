@@ -0,0 +1,752 @@
+#!/usr/bin/env python3
+"""Render the files deploy_ioc would write for an IOC, without running Ansible.
+
+Variables are resolved in the order of roles/deploy_ioc/tasks/set-facts.yml:
+the deploy_ioc defaults, the vars of the IOC type, the facts install_module
+sets for the required module, and then the IOC config itself. Templates are
+rendered with the Jinja settings and filters of Ansible's template module, and
+the template, copy, blockinfile and set_fact tasks of the device role are
+replayed. Tasks that need the target host, such as commands, are skipped.
+"""
+
+import argparse
+import ast
+import functools
+import importlib.util
+import logging
+import re
+import sys
+import time
+from collections.abc import Iterator, Mapping
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+import jinja2
+import yaml
+from ansible.plugins.filter import core as core_filters
+from ansible.plugins.filter import mathstuff as math_filters
+from ansible.plugins.test import core as core_tests
+from ansible.plugins.test import mathstuff as math_tests
+from config_validation import (
+    COLLECTION_ROOT,
+    DEVICE_ROLES_PATH,
+    INSTALL_MODULE_VARS_PATH,
+    collect_manual_ioc_files,
+    get_device_roles,
+    get_example_configs,
+)
+
+DEPLOY_IOC_PATH = COLLECTION_ROOT / "roles" / "deploy_ioc"
+INSTALL_MODULE_PATH = COLLECTION_ROOT / "roles" / "install_module"
+FILTER_PLUGINS_PATH = COLLECTION_ROOT / "plugins" / "filter"
+
+# Default of the ansible_managed variable and the DEFAULT_MANAGED_STR setting
+ANSIBLE_MANAGED = "Ansible managed"
+
+# Host configuration set by scripts/deploy_local_ioc_config.yml
+DEFAULT_HOST_CONFIG = {
+    "epics_interface": {"address": "127.0.0.1", "broadcast": "127.0.0.1"},
+    "softioc_user": "softioc",
+    "softioc_group": "softioc",
+}
+
+# Manual IOC files deployed by deploy-ioc.yml, and the directory each goes to
+MANUAL_IOC_FILE_REGEX = re.compile(
+    r"\.(cmd|req|db|template|substitutions|xml|json|yaml|toml)$"
+)
+
+# Keywords of a task that are not the name of its module
+TASK_KEYWORDS = {
+    "args",
+    "become",
+    "become_user",
+    "changed_when",
+    "check_mode",
+    "delegate_to",
+    "environment",
+    "failed_when",
+    "ignore_errors",
+    "loop",
+    "loop_control",
+    "name",
+    "no_log",
+    "notify",
+    "register",
+    "tags",
+    "vars",
+    "when",
+}
+
+logging.basicConfig(level=logging.INFO, format="%(message)s")
+logger = logging.getLogger("nsls2.ioc_deploy")
+
+SafeLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+class SkipTask(Exception):
+    """Raised when a task of a device role can't be replayed offline."""
+
+
+@dataclass
+class RenderedFile:
+    content: str
+    mode: str = "0664"
+
+
+@dataclass
+class RenderedIOC:
+    name: str
+    # Directory of the IOC on the host, which paths of files are relative to
+    directory: str
+    files: dict[str, RenderedFile] = field(default_factory=dict)
+    skipped_tasks: list[str] = field(default_factory=list)
+
+    def tree(self) -> dict[str, str]:
+        """Return the contents of all files, sorted by path."""
+        return {path: self.files[path].content for path in sorted(self.files)}
+
+
+@functools.cache
+def load_yaml(path: Path):
+    with open(path) as fp:
+        return yaml.load(fp, Loader=SafeLoader)
+
+
+@functools.cache
+def load_filter_plugins() -> dict:
+    """Return the filters of this collection, by fully qualified name."""
+    filters = {}
+    for path in sorted(FILTER_PLUGINS_PATH.glob("*.py")):
+        spec = importlib.util.spec_from_file_location(f"filter_{path.stem}", path)
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        for name, filter_func in module.FilterModule().filters().items():
+            filters[f"nsls2.ioc_deploy.{name}"] = filter_func
+    return filters
+
+
+@functools.cache
+def make_environment() -> jinja2.Environment:
+    """Return a Jinja environment set up like the one of Ansible templates."""
+    env = jinja2.Environment(
+        trim_blocks=True,
+        keep_trailing_newline=True,
+        undefined=jinja2.StrictUndefined,
+        extensions=["jinja2.ext.do", "jinja2.ext.loopcontrols"],
+    )
+    for plugin in (core_filters, math_filters):
+        for name, filter_func in plugin.FilterModule().filters().items():
+            env.filters[name] = env.filters[f"ansible.builtin.{name}"] = filter_func
+    for plugin in (core_tests, math_tests):
+        for name, test_func in plugin.TestModule().tests().items():
+            env.tests[name] = env.tests[f"ansible.builtin.{name}"] = test_func
+    env.filters.update(load_filter_plugins())
+    return env
+
+
+@functools.cache
+def compile_template(source: str) -> jinja2.Template:
+    return make_environment().from_string(source)
+
+
+@functools.cache
+def load_template(path: Path) -> jinja2.Template:
+    return compile_template(path.read_text())
+
+
+class TemplateVars(Mapping):
+    """Variables of a host, templated when they are looked up, as in Ansible.
+
+    Extra vars take precedence over task and loop variables, which take
+    precedence over facts and all other variables.
+    """
+
+    def __init__(
+        self,
+        variables: dict,
+        extra_vars: dict | None = None,
+        local_vars: dict | None = None,
+    ):
+        self.variables = variables
+        self.extra_vars = extra_vars or {}
+        self.local_vars = local_vars or {}
+
+    def __getitem__(self, key: str):
+        for layer in (self.extra_vars, self.local_vars, self.variables):
+            if key in layer:
+                return self.template(layer[key])
+        return make_environment().globals[key]
+
+    def __contains__(self, key) -> bool:
+        return any(
+            key in layer
+            for layer in (
+                self.extra_vars,
+                self.local_vars,
+                self.variables,
+                make_environment().globals,
+            )
+        )
+
+    def _keys(self) -> dict:
+        return {
+            **make_environment().globals,
+            **self.variables,
+            **self.local_vars,
+            **self.extra_vars,
+        }
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._keys())
+
+    def __len__(self) -> int:
+        return len(self._keys())
+
+    def with_vars(self, **local_vars) -> "TemplateVars":
+        """Return a view with task or loop variables added, sharing the facts."""
+        return TemplateVars(
+            self.variables, self.extra_vars, {**self.local_vars, **local_vars}
+        )
+
+    def set_fact(self, **facts):
+        """Set facts, templating their values now, like set_fact."""
+        for key, value in facts.items():
+            self.variables[key] = self.template(value)
+
+    def template(self, value):
+        if isinstance(value, str):
+            if "{{" not in value and "{%" not in value:
+                return value
+            return self.render_string(value)
+        if isinstance(value, dict):
+            return {key: self.template(item) for key, item in value.items()}
+        if isinstance(value, list):
+            return [self.template(item) for item in value]
+        return value
+
+    def render(self, template: jinja2.Template) -> str:
+        return "".join(template.root_render_func(template.new_context(self, True)))
+
+    def render_string(self, source: str):
+        result = self.render(compile_template(source))
+        # Ansible evaluates results that look like lists, dicts or booleans
+        if result.startswith(("{", "[")) or result in ("True", "False"):
+            try:
+                return ast.literal_eval(result)
+            except (ValueError, SyntaxError):
+                pass
+        return result
+
+    def evaluate(self, condition) -> bool:
+        """Evaluate a when condition, or a list of them that must all be true."""
+        conditions = condition if isinstance(condition, list) else [condition]
+        for condition in conditions:
+            if isinstance(condition, bool):
+                if not condition:
+                    return False
+                continue
+            source = f"{{% if {condition} %}}True{{% else %}}False{{% endif %}}"
+            if self.render(compile_template(source)) != "True":
+                return False
+        return True
+
+
+@functools.cache
+def load_module_configs() -> dict:
+    """Return the configs of all modules, as install_module loads them."""
+    configs = {}
+    for path in sorted(INSTALL_MODULE_VARS_PATH.glob("*.yml")):
+        configs.update(load_yaml(path) or {})
+    return configs
+
+
+def module_facts(module: str, install_dir: str, default_epics_deps: dict) -> dict:
+    """Return the facts install_module sets after installing module."""
+    configs = load_module_configs()
+    module_build_levels = load_filter_plugins()["nsls2.ioc_deploy.module_build_levels"]
+    build_levels = module_build_levels(configs, module)
+
+    # The module itself is the only one in the last build level
+    installed = {
+        configs[name]["name"].upper(): f"{install_dir}/{name}"
+        for build_level in build_levels[:-1]
+        for name in build_level
+    }
+    config = configs[module]
+    module_dir = f"{install_dir}/{module}"
+    epics_deps = default_epics_deps | (config.get("epics_deps") or {}) | installed
+    if not module.startswith("epics_base"):
+        epics_deps[config["name"].upper()] = module_dir
+    installed[config["name"].upper()] = module_dir
+
+    return {
+        "install_module_epics_deps": epics_deps,
+        "install_module_installed": installed,
+        "install_module_leaf_module_path": module_dir,
+        "install_module_leaf_executable": config.get("executable", ""),
+        "install_module_leaf_template_root_path": (
+            f"{module_dir}/{config['ioc_template_root_path']}"
+            if "ioc_template_root_path" in config
+            else ""
+        ),
+    }
+
+
+def ioc_variables(
+    ioc_name: str,
+    host_config: dict,
+    hostname: str = "localhost",
+    extra_vars: dict | None = None,
+) -> TemplateVars:
+    """Return the variables of an IOC once deploy_ioc has set its facts."""
+    ioc_type = host_config[ioc_name]["type"]
+    role_path = DEVICE_ROLES_PATH / ioc_type
+    variables: dict[str, Any] = {}
+    # Defaults and vars of the device role have the lowest precedence
+    for vars_path in (
+        role_path / "defaults" / "main.yml",
+        role_path / "vars" / "main.yml",
+    ):
+        if vars_path.exists():
+            variables.update(load_yaml(vars_path) or {})
+    variables.update(load_yaml(DEPLOY_IOC_PATH / "defaults" / "main.yml"))
+    variables.update(
+        {
+            "ansible_managed": ANSIBLE_MANAGED,
+            "inventory_hostname": hostname,
+            "host_config": host_config,
+            "deploy_ioc_ioc_name": ioc_name,
+        }
+    )
+    tvars = TemplateVars(variables, extra_vars)
+
+    tvars.set_fact(ioc=host_config[ioc_name])
+    ioc = tvars["ioc"]
+    type_vars = load_yaml(DEPLOY_IOC_PATH / "vars" / f"{ioc_type}.yml") or {}
+    variables.update(type_vars)
+
+    # The required module, executable and template root path are set for every
+    # IOC, from the IOC, the vars of its type or its required module, in order
+    required_module = ioc.get(
+        "required_module", type_vars.get("deploy_ioc_required_module", "")
+    )
+    tvars.set_fact(deploy_ioc_required_module=required_module)
+    facts: dict[str, Any] = {}
+    if required_module:
+        install_module_defaults = load_yaml(
+            INSTALL_MODULE_PATH / "defaults" / "main.yml"
+        )
+        facts = module_facts(
+            tvars.template(required_module),
+            install_module_defaults["install_module_install_dir"],
+            install_module_defaults["install_module_default_epics_deps"],
+        )
+        variables.update(facts)
+    tvars.set_fact(
+        deploy_ioc_required_module_path=facts.get("install_module_leaf_module_path", "")
+    )
+    tvars.set_fact(
+        deploy_ioc_executable=ioc.get(
+            "executable",
+            type_vars.get(
+                "deploy_ioc_executable",
+                facts.get("install_module_leaf_executable", ""),
+            ),
+        ),
+        deploy_ioc_template_root_path=ioc.get(
+            "ioc_template_root_path",
+            type_vars.get(
+                "deploy_ioc_template_root_path",
+                facts.get("install_module_leaf_template_root_path", ""),
+            ),
+        ),
+    )
+
+    merged_env = (
+        tvars["deploy_ioc_default_env"] | tvars["deploy_ioc_device_specific_env"]
+    )
+    if required_module:
+        merged_env |= (
+            tvars["install_module_epics_deps"] | tvars["install_module_installed"]
+        )
+    if "environment" in ioc:
+        merged_env |= ioc["environment"]
+    if "EPICS_DB_INCLUDE_PATH" not in merged_env:
+        module_keys = [
+            key
+            for key in tvars.get("install_module_installed", {})
+            if key != "EPICS_BASE" and key in merged_env
+        ]
+        merged_env["EPICS_DB_INCLUDE_PATH"] = ":".join(
+            ["$(TOP)/db", *(f"$({key})/db" for key in module_keys), "$(EPICS_BASE)/db"]
+        )
+    expand_macros = load_filter_plugins()["nsls2.ioc_deploy.expand_macros"]
+    variables["deploy_ioc_merged_env"] = expand_macros(merged_env)
+
+    variables["substitutions"] = ioc.get("substitutions", {})
+    variables["deploy_ioc_dbpf_list"] = type_vars.get(
+        "deploy_ioc_dbpf_list", []
+    ) + ioc.get("dbpf", [])
+    return tvars
+
+
+def find_role_file(role_path: Path, subdir: str, src: str) -> Path:
+    """Find a file a task of a role refers to, the way Ansible searches for it."""
+    for path in (Path(src), role_path / subdir / src, role_path / src):
+        if path.is_absolute() and path.is_file():
+            return path
+    raise SkipTask(f"{src} not found in {role_path.name}/{subdir}")
+
+
+def task_module(task: dict) -> tuple[str, Any]:
+    """Return the short name and arguments of the module a task runs."""
+    for key, value in task.items():
+        if key not in TASK_KEYWORDS and not key.startswith("with_"):
+            return key.rsplit(".", 1)[-1], value
+    raise SkipTask("task runs no module")
+
+
+class DeviceRoleReplay:
+    """Replay the tasks of a device role that write into the IOC directory."""
+
+    def __init__(self, role_path: Path, rendered: RenderedIOC):
+        self.role_path = role_path
+        self.rendered = rendered
+
+    def ioc_path(self, dest: str) -> str:
+        prefix = self.rendered.directory.rstrip("/") + "/"
+        if not dest.startswith(prefix):
+            raise SkipTask(f"writes {dest}, outside the IOC directory")
+        return dest.removeprefix(prefix)
+
+    def lookup(self, name: str, *terms: str, wantlist: bool = False):
+        """Implement the fileglob lookup, relative to the files of the role."""
+        if name not in ("fileglob", "ansible.builtin.fileglob"):
+            raise SkipTask(f"{name} lookup is not replayed offline")
+        paths = [
+            str(path)
+            for term in terms
+            for path in sorted(
+                (self.role_path / "files").glob(term.removeprefix("files/"))
+            )
+            if path.is_file()
+        ]
+        return paths if wantlist else ",".join(paths)
+
+    def task_items(self, task: dict, tvars: TemplateVars) -> list | None:
+        """Return the items a task loops over, or None if it doesn't loop."""
+        if "loop" in task:
+            return tvars.template(task["loop"])
+        if "with_items" in task:
+            items = tvars.template(task["with_items"])
+            items = items if isinstance(items, list) else [items]
+            return [
+                item
+                for entry in items
+                for item in (entry if isinstance(entry, list) else [entry])
+            ]
+        if "with_fileglob" in task:
+            patterns = tvars.template(task["with_fileglob"])
+            patterns = patterns if isinstance(patterns, list) else [patterns]
+            return self.lookup("fileglob", *patterns, wantlist=True)
+        for key in task:
+            if key.startswith("with_"):
+                raise SkipTask(f"{key} loops are not replayed offline")
+        return None
+
+    def run_tasks(self, tasks_path: Path, tvars: TemplateVars):
+        tvars = tvars.with_vars(lookup=self.lookup)
+        for task in load_yaml(tasks_path) or []:
+            self.run_task(task, tvars)
+
+    def run_task(self, task: dict, tvars: TemplateVars):
+        name = task.get("name", "(unnamed task)")
+        try:
+            if "vars" in task:
+                tvars = tvars.with_vars(**task["vars"])
+            if "block" in task:
+                if "when" not in task or tvars.evaluate(task["when"]):
+                    for block_task in task["block"]:
+                        self.run_task(block_task, tvars)
+                return
+
+            module, args = task_module(task)
+            handler = getattr(self, f"run_{module}", None)
+            if handler is None:
+                raise SkipTask(f"{module} is not replayed offline")
+            if module in ("include_tasks", "import_tasks") and isinstance(args, str):
+                args = {"file": args}
+            if not isinstance(args, dict):
+                raise SkipTask(f"{module} has free form arguments")
+
+            items = self.task_items(task, tvars)
+            loop_control = task.get("loop_control") or {}
+            loop_var = loop_control.get("loop_var", "item")
+            for index, item in enumerate([None] if items is None else items):
+                item_tvars = tvars
+                if items is not None:
+                    item_tvars = tvars.with_vars(**{loop_var: item})
+                    if "index_var" in loop_control:
+                        item_tvars = item_tvars.with_vars(
+                            **{loop_control["index_var"]: index}
+                        )
+                if "when" in task and not item_tvars.evaluate(task["when"]):
+                    continue
+                handler(args, item_tvars)
+        except SkipTask as e:
+            self.rendered.skipped_tasks.append(f"{name}: {e}")
+        except jinja2.TemplateError as e:
+            self.rendered.skipped_tasks.append(f"{name}: {type(e).__name__}: {e}")
+
+    def run_template(self, args: dict, tvars: TemplateVars):
+        src = find_role_file(self.role_path, "templates", tvars.template(args["src"]))
+        dest = self.ioc_path(tvars.template(args["dest"]))
+        self.rendered.files[dest] = RenderedFile(
+            tvars.render(load_template(src)),
+            str(tvars.template(args.get("mode", "0664"))),
+        )
+
+    def run_copy(self, args: dict, tvars: TemplateVars):
+        dest = self.ioc_path(tvars.template(args["dest"]))
+        if "content" in args:
+            content = str(tvars.template(args["content"]))
+        else:
+            src = find_role_file(self.role_path, "files", tvars.template(args["src"]))
+            content = src.read_text(errors="surrogateescape")
+            # Files copied to a directory keep their name
+            if args["dest"].endswith("/") or not Path(dest).suffix:
+                dest = f"{dest.rstrip('/')}/{src.name}"
+        self.rendered.files[dest] = RenderedFile(
+            content, str(tvars.template(args.get("mode", "0664")))
+        )
+
+    def run_blockinfile(self, args: dict, tvars: TemplateVars):
+        if args.get("insertafter", "EOF") != "EOF" or "insertbefore" in args:
+            raise SkipTask("only blocks inserted at the end of a file are replayed")
+        path = self.ioc_path(tvars.template(args.get("path", args.get("dest"))))
+        if path not in self.rendered.files:
+            raise SkipTask(f"{path} was not rendered")
+
+        marker = tvars.template(args.get("marker", "# {mark} ANSIBLE MANAGED BLOCK"))
+        begin = marker.replace("{mark}", args.get("marker_begin", "BEGIN"))
+        end = marker.replace("{mark}", args.get("marker_end", "END"))
+        lines = self.rendered.files[path].content.splitlines()
+        if begin in lines and end in lines:
+            del lines[lines.index(begin) : lines.index(end) + 1]
+        block = tvars.template(args.get("block", ""))
+        if block:
+            lines += [begin, *block.splitlines(), end]
+        self.rendered.files[path].content = "".join(f"{line}\n" for line in lines)
+
+    def run_set_fact(self, args: dict, tvars: TemplateVars):
+        tvars.set_fact(**{k: v for k, v in args.items() if k != "cacheable"})
+
+    def run_include_tasks(self, args: dict, tvars: TemplateVars):
+        self.run_tasks(
+            find_role_file(self.role_path, "tasks", tvars.template(args["file"])), tvars
+        )
+
+    run_import_tasks = run_include_tasks
+
+
+def render_ioc(
+    ioc_name: str,
+    host_config: dict,
+    hostname: str = "localhost",
+    port: int | None = None,
+    extra_vars: dict | None = None,
+    manual_ioc_files: dict[str, str] | None = None,
+) -> RenderedIOC:
+    """Render the files deploy-ioc.yml writes into the directory of an IOC.
+
+    host_config holds the IOC config under ioc_name, along with the
+    epics_interface, softioc_user and softioc_group of the host. The port of
+    the IOC defaults to deploy_ioc_nextport.
+    """
+    extra_vars = dict(extra_vars or {})
+    if manual_ioc_files:
+        extra_vars["deploy_ioc_manual_ioc_files"] = manual_ioc_files
+    tvars = ioc_variables(ioc_name, host_config, hostname, extra_vars)
+    ioc = tvars["ioc"]
+    rendered = RenderedIOC(ioc_name, tvars["deploy_ioc_ioc_directory"])
+    templates_path = DEPLOY_IOC_PATH / "templates"
+
+    if tvars["deploy_ioc_standard_st_cmd"]:
+        if tvars["deploy_ioc_load_as_substitutions"]:
+            render_substitutions = load_filter_plugins()[
+                "nsls2.ioc_deploy.render_substitutions"
+            ]
+            for name, content in render_substitutions(
+                ioc.get("substitutions", {}),
+                tvars["deploy_ioc_merged_env"],
+                ANSIBLE_MANAGED,
+            ).items():
+                rendered.files[f"db/{name}.substitutions"] = RenderedFile(content)
+
+        boot_files = ["epicsEnv.cmd", "postInit.cmd", "st.cmd"]
+        if tvars["deploy_ioc_use_common"]:
+            boot_files.insert(0, "common.cmd")
+        for name in boot_files:
+            rendered.files[f"iocBoot/{name}"] = RenderedFile(
+                tvars.render(load_template(templates_path / f"{name}.j2"))
+            )
+        rendered.files["iocBoot/st.cmd"].mode = "0775"
+        rendered.files["st.cmd"] = RenderedFile(
+            tvars.render(load_template(templates_path / "st_top.cmd.j2")), "0775"
+        )
+
+    as_dir_name = tvars["deploy_ioc_as_dir_name"]
+    for name, content in (manual_ioc_files or {}).items():
+        if not MANUAL_IOC_FILE_REGEX.search(name):
+            continue
+        if name.endswith(".cmd"):
+            rendered.files[f"iocBoot/{name}"] = RenderedFile(content)
+        elif name.endswith(".req"):
+            rendered.files[f"{as_dir_name}/req/{name}"] = RenderedFile(content)
+        else:
+            rendered.files[f"db/{name}"] = RenderedFile(content)
+
+    role_path = DEVICE_ROLES_PATH / ioc["type"]
+    DeviceRoleReplay(role_path, rendered).run_tasks(
+        role_path / "tasks" / "main.yml", tvars
+    )
+
+    rendered.files[f"{ioc_name}.yml"] = RenderedFile(
+        core_filters.to_nice_yaml({ioc_name: ioc}, sort_keys=False)
+    )
+    rendered.files["README.md"] = RenderedFile(
+        tvars.render(load_template(templates_path / "README.md.j2"))
+    )
+    tvars.set_fact(
+        deploy_ioc_port=tvars["deploy_ioc_nextport"] if port is None else port
+    )
+    rendered.files["config"] = RenderedFile(
+        tvars.render(load_template(templates_path / "config.j2"))
+    )
+    return rendered
+
+
+def render_config_file(
+    config_path: Path, host_config: dict | None = None, **kwargs
+) -> RenderedIOC:
+    """Render the IOC of a config file, with the manual files next to it.
+
+    As in deploy_local_config.py, the IOC is the first key of the file.
+    """
+    config = load_yaml(config_path)
+    return render_ioc(
+        next(iter(config)),
+        {**DEFAULT_HOST_CONFIG, **(host_config or {}), **config},
+        manual_ioc_files=collect_manual_ioc_files(config_path.parent),
+        **kwargs,
+    )
+
+
+def write_rendered(rendered: RenderedIOC, output_dir: Path):
+    for path, rendered_file in rendered.files.items():
+        file_path = output_dir / path
+        file_path.parent.mkdir(parents=True, exist_ok=True)
+        file_path.write_text(rendered_file.content, errors="surrogateescape")
+        if rendered_file.mode.isdigit():
+            file_path.chmod(int(rendered_file.mode, 8))
+
+
+def parse_extra_var(value: str) -> tuple[str, str]:
+    key, sep, var = value.partition("=")
+    if not sep:
+        raise argparse.ArgumentTypeError(f"Expected KEY=VALUE, got {value}")
+    return key, var
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Render the IOC directories deploy_ioc would write, offline"
+    )
+    parser.add_argument("configs", nargs="*", type=Path, help="IOC config files")
+    example_source_group = parser.add_mutually_exclusive_group()
+    example_source_group.add_argument(
+        "-t", "--type", help="Render all examples of this IOC type"
+    )
+    example_source_group.add_argument(
+        "--all", action="store_true", help="Render all examples"
+    )
+    parser.add_argument(
+        "-o",
+        "--output-dir",
+        type=Path,
+        help="Write each IOC to OUTPUT_DIR/<ioc name>, instead of printing it",
+    )
+    parser.add_argument(
+        "--hostname", default="localhost", help="Host to render the IOCs for"
+    )
+    parser.add_argument(
+        "--host-config",
+        type=Path,
+        help="YAML file overriding epics_interface, softioc_user and softioc_group",
+    )
+    parser.add_argument(
+        "--port", type=int, help="manage-iocs port (default: deploy_ioc_nextport)"
+    )
+    parser.add_argument(
+        "-e",
+        "--extra-vars",
+        type=parse_extra_var,
+        action="append",
+        default=[],
+        metavar="KEY=VALUE",
+        help="Extra variable, as passed to ansible-playbook",
+    )
+    parser.add_argument(
+        "-v", "--verbose", action="store_true", help="List skipped device role tasks"
+    )
+    args = parser.parse_args()
+
+    config_paths = list(args.configs)
+    if args.all or args.type:
+        for role in sorted(get_device_roles()) if args.all else [args.type]:
+            if role not in get_device_roles():
+                parser.error(f"Unknown IOC type: {role}")
+            config_paths += get_example_configs(role)
+    if not config_paths:
+        parser.error("No IOC configs given")
+
+    host_config = load_yaml(args.host_config) if args.host_config else {}
+    start = time.perf_counter()
+    failed = []
+    rendered_iocs: list[RenderedIOC] = []
+    for config_path in config_paths:
+        try:
+            rendered = render_config_file(
+                config_path,
+                host_config,
+                hostname=args.hostname,
+                port=args.port,
+                extra_vars=dict(args.extra_vars),
+            )
+            rendered_iocs.append(rendered)
+        except Exception as e:
+            logger.error(f"Failed to render {config_path}: {type(e).__name__}: {e}")
+            failed.append(config_path)
+    elapsed = time.perf_counter() - start
+
+    for rendered in rendered_iocs:
+        if args.output_dir:
+            write_rendered(rendered, args.output_dir / rendered.name)
+        else:
+            for path, content in rendered.tree().items():
+                print(f"==> {rendered.directory}/{path} <==\n{content}")
+        if args.verbose:
+            for skipped_task in rendered.skipped_tasks:
+                logger.info(f"{rendered.name}: skipped {skipped_task}")
+
+    logger.info(
+        f"Rendered {len(rendered_iocs)} IOC(s) in {elapsed * 1000:.0f} ms"
+        + (f" to {args.output_dir}" if args.output_dir else "")
+        + (f", {len(failed)} config(s) failed" if failed else "")
+    )
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
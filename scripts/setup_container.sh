@@ -2,20 +2,49 @@
 
 CONTAINER_NAME="$1"
 RHEL_VERSION="$2"
+# Optional directory of modules built by a previous run, to seed /epics/modules with
+MODULE_CACHE_DIR="$3"
 
 # Verify required arguments are provided
 if [ -z "$CONTAINER_NAME" ] || [ -z "$RHEL_VERSION" ]; then
     echo "Error: Missing required arguments"
-    echo "Usage: $0 <container_name> <rhel_version>"
+    echo "Usage: $0 <container_name> <rhel_version> [module_cache_dir]"
     exit 1
 fi
 
 REQUIRED_IMAGE="ghcr.io/nsls2/epics-alma$RHEL_VERSION:latest"
 SCRIPT_DIR=$( cd -- "$( dirname -- "${BASH_SOURCE[0]}" )" &> /dev/null && pwd )
 
+PACKAGES="python3-dnf wget epel-release"
+OPTIONAL_PACKAGES="seq"
+
+# Pixi (pinned version with checksum validation)
+PIXI_VERSION="v0.55.0"
+PIXI_SHA256="cb733205ae1a02986071bcbeff47c60460bfb92d1cd9565d40f4dea5448c86a5"
+
+# Containers are provisioned once per combination of base image, packages, pixi
+# version and pixi environment, and the result is kept as a local image.
+# Set SETUP_CONTAINER_REBUILD=1 to provision it again, e.g. after the base
+# image was updated.
+PROVISION_HASH=$(
+    {
+        echo "$REQUIRED_IMAGE"
+        echo "$PACKAGES $OPTIONAL_PACKAGES"
+        echo "$PIXI_VERSION $PIXI_SHA256"
+        cat "$SCRIPT_DIR/pixi.lock"
+    } | sha256sum | cut -c 1-12
+)
+PROVISIONED_IMAGE="nsls2_ioc_deploy_el$RHEL_VERSION:$PROVISION_HASH"
+
+if [ "$SETUP_CONTAINER_REBUILD" = "1" ] && docker image inspect "$PROVISIONED_IMAGE" > /dev/null 2>&1; then
+    echo "Removing provisioned image '$PROVISIONED_IMAGE' to rebuild it..."
+    docker image rm "$PROVISIONED_IMAGE"
+fi
+
 echo "Verifying that container '$CONTAINER_NAME' is running the required image '$REQUIRED_IMAGE'..."
 
 # Verify container is running
+NEW_CONTAINER=0
 if [ -z "$(docker ps -q -f name=$CONTAINER_NAME)" ]; then
     # Check if container exists but is not running
     if [ -n "$(docker ps -aq -f name=$CONTAINER_NAME)" ]; then
@@ -24,50 +53,93 @@ if [ -z "$(docker ps -q -f name=$CONTAINER_NAME)" ]; then
         exit 1
     fi
 
+    START_IMAGE=$REQUIRED_IMAGE
+    if docker image inspect "$PROVISIONED_IMAGE" > /dev/null 2>&1; then
+        echo "Using provisioned image '$PROVISIONED_IMAGE'."
+        START_IMAGE=$PROVISIONED_IMAGE
+    fi
+
     echo "Starting container '$CONTAINER_NAME'..."
-    docker run -dit --name $CONTAINER_NAME $REQUIRED_IMAGE
+    docker run -dit --name $CONTAINER_NAME $START_IMAGE
     if [ $? -ne 0 ]; then
-        echo "Error: Failed to start container '$CONTAINER_NAME' with image '$REQUIRED_IMAGE'."
+        echo "Error: Failed to start container '$CONTAINER_NAME' with image '$START_IMAGE'."
         exit 1
     fi
+    NEW_CONTAINER=1
 else
     echo "Container '$CONTAINER_NAME' is already running."
 fi
 
 
-# Verify container is running the required image
+# Verify container is running the required image, or the provisioned image derived from it
 CURRENT_IMAGE=$(docker inspect -f '{{.Config.Image}}' $CONTAINER_NAME)
-if [ "$CURRENT_IMAGE" != "$REQUIRED_IMAGE" ]; then
+if [ "$CURRENT_IMAGE" == "$PROVISIONED_IMAGE" ]; then
+    echo "Container '$CONTAINER_NAME' is already provisioned."
+elif [ "$CURRENT_IMAGE" == "$REQUIRED_IMAGE" ]; then
+    # Install required packages
+    # Note: root access required for package installation and system file modification
+    echo "Installing required packages..."
+    # A container missing any of them must not be saved as the provisioned image
+    for PACKAGE in $PACKAGES; do
+        DNF_OUTPUT=$(docker exec -u root $CONTAINER_NAME dnf install -y $PACKAGE 2>&1)
+        if [ $? -ne 0 ]; then
+            echo "$DNF_OUTPUT"
+            echo "Error: Failed to install required package '$PACKAGE' in container '$CONTAINER_NAME'."
+            exit 1
+        fi
+    done
+    for PACKAGE in $OPTIONAL_PACKAGES; do
+        docker exec -u root $CONTAINER_NAME dnf install -y $PACKAGE > /dev/null 2>&1 || true
+    done
+
+    echo "Installing Pixi ${PIXI_VERSION}..."
+    docker exec -u root $CONTAINER_NAME bash -c "
+        set -e
+        curl -fsSL -o /tmp/pixi.tar.gz https://github.com/prefix-dev/pixi/releases/download/$PIXI_VERSION/pixi-x86_64-unknown-linux-musl.tar.gz
+        echo '$PIXI_SHA256  /tmp/pixi.tar.gz' | sha256sum -c -
+        tar -xzf /tmp/pixi.tar.gz -C /tmp
+        chmod +x /tmp/pixi
+        mv /tmp/pixi /usr/local/bin/pixi
+        rm /tmp/pixi.tar.gz
+    "
+    if [ $? -ne 0 ]; then
+        echo "Error: Failed to install Pixi in container '$CONTAINER_NAME'."
+        exit 1
+    fi
+
+    echo "Installing Pixi environment in container..."
+    docker cp $SCRIPT_DIR/pixi.lock $CONTAINER_NAME:pixi.lock
+    docker cp $SCRIPT_DIR/pixi.toml $CONTAINER_NAME:pixi.toml
+    docker exec -u root $CONTAINER_NAME pixi install
+    if [ $? -ne 0 ]; then
+        echo "Error: Failed to install Pixi environment in container '$CONTAINER_NAME'."
+        exit 1
+    fi
+
+    echo "Saving provisioned container as image '$PROVISIONED_IMAGE'..."
+    docker commit $CONTAINER_NAME $PROVISIONED_IMAGE > /dev/null
+    if [ $? -ne 0 ]; then
+        echo "Error: Failed to save provisioned image '$PROVISIONED_IMAGE'."
+        exit 1
+    fi
+else
     echo "Error: Container '$CONTAINER_NAME' is running image '$CURRENT_IMAGE', but '$REQUIRED_IMAGE' is required."
     exit 1
 fi
 
-# Install required packages
-# Note: root access required for package installation and system file modification
-echo "Installing required packages..."
-docker exec -u root $CONTAINER_NAME dnf install -y python3-dnf wget > /dev/null 2>&1
-docker exec -u root $CONTAINER_NAME dnf install -y epel-release > /dev/null 2>&1
-docker exec -u root $CONTAINER_NAME dnf install -y seq > /dev/null 2>&1 || true
-
-# Install Pixi (pinned version with checksum validation)
-PIXI_VERSION="v0.55.0"
-PIXI_SHA256="cb733205ae1a02986071bcbeff47c60460bfb92d1cd9565d40f4dea5448c86a5"
-echo "Installing Pixi ${PIXI_VERSION}..."
-docker exec -u root $CONTAINER_NAME bash -c "
-    curl -fsSL -o /tmp/pixi.tar.gz https://github.com/prefix-dev/pixi/releases/download/$PIXI_VERSION/pixi-x86_64-unknown-linux-musl.tar.gz
-    echo '$PIXI_SHA256  /tmp/pixi.tar.gz' | sha256sum -c -
-    tar -xzf /tmp/pixi.tar.gz -C /tmp
-    chmod +x /tmp/pixi
-    mv /tmp/pixi /usr/local/bin/pixi
-    rm /tmp/pixi.tar.gz
-"
-
-# Copy over premade Pixi configuration files
+# Copy over premade Pixi configuration files. These are not part of the
+# provisioned image, since only the lock file determines the environment.
 echo "Copying Pixi configuration files and verification script..."
 docker cp $SCRIPT_DIR/pixi.lock $CONTAINER_NAME:pixi.lock
 docker cp $SCRIPT_DIR/pixi.toml $CONTAINER_NAME:pixi.toml
 docker cp $SCRIPT_DIR/verify_deployment.py $CONTAINER_NAME:verify_deployment.py
 
-echo "Installing Pixi environment in container..."
-docker exec -u root $CONTAINER_NAME pixi install
+# Seed a new container with the modules built by a previous run. Their build
+# stamps let install_module skip recompiling any that are unchanged.
+if [ "$NEW_CONTAINER" = "1" ] && [ -n "$MODULE_CACHE_DIR" ] && [ -d "$MODULE_CACHE_DIR" ]; then
+    echo "Seeding /epics/modules from '$MODULE_CACHE_DIR'..."
+    docker exec -u root $CONTAINER_NAME mkdir -p /epics/modules
+    docker cp -a "$MODULE_CACHE_DIR/." "$CONTAINER_NAME:/epics/modules"
+fi
+
 echo "Container setup complete."
@@ -0,0 +1,99 @@
+"""Chrome trace event recording for the controller side of local deployments.
+
+Spans are recorded as complete ("X") events, on lanes shown as threads by
+chrome://tracing and https://ui.perfetto.dev. The lane of a span is the
+innermost lane entered by the current thread, so code run for one IOC, or one
+EL version, lands on its own lane no matter which worker thread runs it.
+"""
+
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+
+
+class Tracer:
+    def __init__(self):
+        self.enabled = False
+        self._start = time.perf_counter()
+        self._events: list[dict] = []
+        self._lanes: dict[str, int] = {}
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    def enable(self):
+        self.enabled = True
+        self._start = time.perf_counter()
+
+    def _timestamp(self) -> float:
+        """Return microseconds since the tracer was enabled."""
+        return (time.perf_counter() - self._start) * 1e6
+
+    def _lane_id(self, lane: str) -> int:
+        with self._lock:
+            if lane not in self._lanes:
+                tid = len(self._lanes) + 1
+                self._lanes[lane] = tid
+                for name, args in (
+                    ("thread_name", {"name": lane}),
+                    ("thread_sort_index", {"sort_index": tid}),
+                ):
+                    self._events.append(
+                        {"name": name, "ph": "M", "pid": os.getpid(), "tid": tid}
+                        | {"args": args}
+                    )
+            return self._lanes[lane]
+
+    @property
+    def current_lane(self) -> str:
+        return getattr(self._local, "lane", "main")
+
+    @contextmanager
+    def lane(self, name: str):
+        """Record spans of the current thread on lane name, until exited."""
+        previous = self.current_lane
+        self._local.lane = name
+        try:
+            yield
+        finally:
+            self._local.lane = previous
+
+    @contextmanager
+    def span(self, name: str, cat: str = "phase", **args):
+        """Record the time spent in the with block as a span on the current lane."""
+        if not self.enabled:
+            yield
+            return
+
+        tid = self._lane_id(self.current_lane)
+        start = self._timestamp()
+        try:
+            yield
+        except BaseException as e:
+            args["error"] = f"{type(e).__name__}: {e}"
+            raise
+        finally:
+            event = {
+                "name": name,
+                "cat": cat,
+                "ph": "X",
+                "ts": round(start, 1),
+                "dur": round(self._timestamp() - start, 1),
+                "pid": os.getpid(),
+                "tid": tid,
+            }
+            if args:
+                event["args"] = {key: str(value) for key, value in args.items()}
+            with self._lock:
+                self._events.append(event)
+
+    def write(self, path: Path):
+        with self._lock:
+            events = list(self._events)
+        with open(path, "w") as fp:
+            json.dump({"traceEvents": events, "displayTimeUnit": "ms"}, fp)
+
+
+TRACER = Tracer()
@@ -0,0 +1,309 @@
+#!/usr/bin/env python3
+"""Validate the configuration files of the collection.
+
+Runs the same checks as the test suite on the device roles, the deploy_ioc
+vars files, and the install_module vars files, spread across a process pool,
+and reports the results as JSON.
+"""
+
+import argparse
+import json
+import logging
+import os
+import subprocess
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+
+import config_validation
+import yaml
+from config_validation import COLLECTION_ROOT
+from manage_collection import DependencyGraph
+
+DEPLOY_IOC_VARS_PATH = COLLECTION_ROOT / "roles" / "deploy_ioc" / "vars"
+INSTALL_MODULE_VARS_PATH = config_validation.INSTALL_MODULE_VARS_PATH
+SCHEMAS_PATH = COLLECTION_ROOT / "schemas"
+
+TARGET_KINDS = ("role", "deploy_ioc_vars", "module")
+
+# Changes to these files affect every target of the given kinds
+GLOBAL_DEPENDENCIES = {
+    "scripts/config_validation.py": TARGET_KINDS,
+    "scripts/validate_collection.py": TARGET_KINDS,
+    "roles/deploy_ioc/schema.yml": ("role",),
+    "schemas/verify.yml": ("role",),
+    "schemas/device_specific_vars.yml": ("deploy_ioc_vars",),
+    "schemas/install_module.yml": ("module",),
+    "schemas/install_module_latest.yml": ("module",),
+}
+
+logging.basicConfig(level=logging.INFO, format="%(message)s")
+logger = logging.getLogger("nsls2.ioc_deploy")
+
+SafeLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+@dataclass
+class TargetResult:
+    kind: str
+    name: str
+    errors: list[str] = field(default_factory=list)
+
+    @property
+    def passed(self) -> bool:
+        return not self.errors
+
+
+def load_yaml(path: Path):
+    with open(path) as fp:
+        return yaml.load(fp, Loader=SafeLoader)
+
+
+def relative(path: Path) -> str:
+    return str(path.relative_to(COLLECTION_ROOT))
+
+
+def check_role(role: str) -> list[str]:
+    errors = []
+    vars_path = DEPLOY_IOC_VARS_PATH / f"{role}.yml"
+    if not vars_path.exists():
+        errors.append(f"Vars file {relative(vars_path)} not found")
+
+    schema_path = config_validation.DEVICE_ROLES_PATH / role / "schema.yml"
+    if not schema_path.exists():
+        errors.append(f"Schema file is missing at {relative(schema_path)}")
+
+    configs = config_validation.get_example_configs(role)
+    if not configs:
+        errors.append(
+            "No example configuration found. "
+            "Expected examples/<name>/config.yml or example.yml"
+        )
+    for config_path in configs:
+        example_data = load_yaml(config_path)
+        ioc_config = example_data[next(iter(example_data))]
+        schemas = [config_validation.BASE_IOC_SCHEMA_PATH]
+        if schema_path.exists():
+            schemas.append(schema_path)
+        for schema in schemas:
+            errors += config_validation.validation_errors(
+                schema, ioc_config, relative(config_path)
+            )
+
+    for verify_path in config_validation.get_verify_files(role):
+        errors += config_validation.validation_errors(
+            SCHEMAS_PATH / "verify.yml", load_yaml(verify_path), relative(verify_path)
+        )
+    return errors
+
+
+def check_deploy_ioc_vars(name: str) -> list[str]:
+    errors = []
+    if not (config_validation.DEVICE_ROLES_PATH / name).exists():
+        errors.append(f"No device role matches roles/deploy_ioc/vars/{name}.yml")
+
+    data = load_yaml(DEPLOY_IOC_VARS_PATH / f"{name}.yml")
+    if not data:
+        return errors
+    errors += config_validation.validation_errors(
+        SCHEMAS_PATH / "device_specific_vars.yml",
+        data,
+        f"roles/deploy_ioc/vars/{name}.yml",
+        strict=True,
+    )
+    required_module = data.get("deploy_ioc_required_module")
+    if required_module and required_module not in (
+        config_validation.get_install_modules()
+    ):
+        errors.append(f"Required module {required_module} has no vars file")
+    return errors
+
+
+def check_module(name: str) -> list[str]:
+    data = load_yaml(INSTALL_MODULE_VARS_PATH / f"{name}.yml")
+    if list(data) != [name]:
+        return [f"Expected a single top level key {name}, got {list(data)}"]
+
+    config = data[name]
+    latest = name.endswith("_latest")
+    schema_name = "install_module_latest.yml" if latest else "install_module.yml"
+    errors = config_validation.validation_errors(
+        SCHEMAS_PATH / schema_name, config, f"roles/install_module/vars/{name}.yml"
+    )
+    for module_dep in config.get("module_deps") or []:
+        if module_dep not in config_validation.get_install_modules():
+            errors.append(f"Module dependency {module_dep} has no vars file")
+    if not latest and not name.endswith(str(config.get("version"))):
+        errors.append(f"Name is not suffixed with version {config.get('version')}")
+    return errors
+
+
+CHECKS = {
+    "role": check_role,
+    "deploy_ioc_vars": check_deploy_ioc_vars,
+    "module": check_module,
+}
+
+
+def all_targets() -> list[tuple[str, str]]:
+    return (
+        [("role", role) for role in sorted(config_validation.get_device_roles())]
+        + [
+            ("deploy_ioc_vars", path.stem)
+            for path in sorted(DEPLOY_IOC_VARS_PATH.glob("*.yml"))
+        ]
+        + [
+            ("module", module)
+            for module in sorted(config_validation.get_install_modules())
+        ]
+    )
+
+
+def changed_paths(ref: str) -> list[str]:
+    """Return the paths changed since ref, including uncommitted and new files.
+
+    Only local git history is used, so this works offline.
+    """
+
+    def git(*args: str) -> list[str]:
+        return subprocess.run(
+            ["git", *args],
+            cwd=COLLECTION_ROOT,
+            check=True,
+            capture_output=True,
+            text=True,
+        ).stdout.splitlines()
+
+    # --no-renames lists both the old and new path of moved files
+    return sorted(
+        set(git("diff", "--name-only", "--no-renames", ref, "--", "."))
+        | set(git("ls-files", "--others", "--exclude-standard", "--", "."))
+    )
+
+
+def affected_targets(
+    paths: list[str], graph: DependencyGraph, targets: list[tuple[str, str]]
+) -> list[tuple[str, str]]:
+    """Return the targets whose checks depend on any of the changed paths."""
+    affected: set[tuple[str, str]] = set()
+    kinds: set[str] = set()
+    for path in paths:
+        if path in GLOBAL_DEPENDENCIES:
+            kinds.update(GLOBAL_DEPENDENCIES[path])
+            continue
+
+        parts = Path(path).parts
+        name = Path(path).stem
+        if parts[:2] == ("roles", "device_roles") and len(parts) > 3:
+            affected.update({("role", parts[2]), ("deploy_ioc_vars", parts[2])})
+        elif parts[:3] == ("roles", "deploy_ioc", "vars") and len(parts) == 4:
+            affected.update({("role", name), ("deploy_ioc_vars", name)})
+        elif parts[:3] == ("roles", "install_module", "vars") and len(parts) == 4:
+            affected.add(("module", name))
+            # Direct dependents check that their module_deps exist
+            affected.update(
+                ("module", dependent)
+                for dependent in graph.module_dependents.get(name, [])
+            )
+            # IOC types requiring the module, directly or through their module
+            for module in [name, *graph.dependents(name)]:
+                for ioc_type in graph.module_ioc_types.get(module, []):
+                    affected.update({("role", ioc_type), ("deploy_ioc_vars", ioc_type)})
+
+    return [target for target in targets if target[0] in kinds or target in affected]
+
+
+def run_target(target: tuple[str, str]) -> TargetResult:
+    kind, name = target
+    try:
+        errors = CHECKS[kind](name)
+    except Exception as e:
+        errors = [f"{type(e).__name__}: {e}"]
+    return TargetResult(kind, name, errors)
+
+
+def validate_targets(targets: list[tuple[str, str]], jobs: int) -> list[TargetResult]:
+    if jobs <= 1 or len(targets) <= 1:
+        return [run_target(target) for target in targets]
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        chunksize = max(len(targets) // (jobs * 4), 1)
+        return list(executor.map(run_target, targets, chunksize=chunksize))
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Validate device roles, examples and module vars of the collection"
+    )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="Number of worker processes (default: number of CPUs)",
+    )
+    parser.add_argument(
+        "-k",
+        "--kind",
+        choices=TARGET_KINDS,
+        nargs="+",
+        default=list(TARGET_KINDS),
+        help="Kinds of targets to validate (default: all)",
+    )
+    parser.add_argument(
+        "--since",
+        metavar="REF",
+        help="Only validate targets affected by changes since this git ref",
+    )
+    parser.add_argument(
+        "-o", "--output", type=Path, help="Write the JSON results to this file"
+    )
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    targets = [target for target in all_targets() if target[0] in args.kind]
+    if args.since:
+        try:
+            paths = changed_paths(args.since)
+        except subprocess.CalledProcessError as e:
+            logger.error(f"Failed to list changes since {args.since}: {e.stderr}")
+            sys.exit(2)
+        # The dependency graph indexes vars files relative to the collection root
+        os.chdir(COLLECTION_ROOT)
+        targets = affected_targets(paths, DependencyGraph.load(), targets)
+        logger.info(
+            f"{len(paths)} paths changed since {args.since}, "
+            f"affecting {len(targets)} targets"
+        )
+    results = validate_targets(targets, args.jobs)
+    failed = [result for result in results if not result.passed]
+
+    report = {
+        "passed": not failed,
+        "since": args.since,
+        "targets": len(results),
+        "failed": len(failed),
+        "elapsed": round(time.perf_counter() - start, 3),
+        "results": [asdict(result) | {"passed": result.passed} for result in results],
+    }
+    if args.output:
+        with open(args.output, "w") as fp:
+            json.dump(report, fp, indent=2)
+    else:
+        json.dump(report, sys.stdout, indent=2)
+        sys.stdout.write("\n")
+
+    for result in failed:
+        logger.error(f"{result.kind} {result.name}:")
+        for error in result.errors:
+            logger.error(f"  {error}")
+    logger.info(
+        f"Validated {len(results)} targets in {report['elapsed']}s, "
+        f"{len(failed)} failed"
+    )
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -4,74 +4,300 @@ Verify IOC deployment against a declarative verify.yml schema.
 
 Usage:
     verify_deployment.py <verify_yml> <ioc_dir>
+    verify_deployment.py --manifest <manifest_yml> [--json]
 
 The script loads the verify.yml schema and validates the deployment
-by reading files directly from the filesystem.
+by reading files directly from the filesystem. Each file is stat'ed and
+read at most once, no matter how many checks refer to it.
+
+A manifest maps IOC names to the verify.yml and IOC directory of each, so
+that many deployments can be verified by one process, in parallel:
+
+    motorsim-01:
+      verify_yml: motorsim-01.yml
+      ioc_dir: /epics/iocs/motorsim-01
+
+Relative verify_yml paths are relative to the directory of the manifest.
 """
 
 import argparse
 import grp
+import io
+import json
+import mmap
+import os
 import pwd
+import re
 import stat
 import sys
+import time
+from collections.abc import Iterable
+from concurrent.futures import ProcessPoolExecutor
+from functools import cache
 from pathlib import Path
+from typing import TextIO
 
 import yaml
 
+# Number of patterns from which a single regex scan beats one find per pattern
+MULTI_PATTERN_SCAN_MIN_PATTERNS = 16
+
+# Size of the slices of a memory-mapped file newlines are counted in
+LINE_COUNT_CHUNK_SIZE = 1 << 20
+
+GLOB_CHARS = frozenset("*?[")
+
 
-def verify_files_exist(ioc_dir: Path, files: list[str]) -> list[str]:
-    """Check that all specified files exist."""
+class DeployedFiles:
+    """Memoized stat results and contents of the files of a deployed IOC.
+
+    File contents are memory-mapped, so large files are paged in by the
+    pattern scan as needed, rather than being copied into memory up front.
+    """
+
+    def __init__(self, ioc_dir: Path):
+        self.ioc_dir = ioc_dir
+        self._stats: dict[str, os.stat_result | OSError] = {}
+        self._contents: dict[str, mmap.mmap | bytes | OSError] = {}
+
+    def stat(self, name: str) -> os.stat_result:
+        if name not in self._stats:
+            try:
+                self._stats[name] = os.stat(self.ioc_dir / name)
+            except OSError as e:
+                self._stats[name] = e
+        result = self._stats[name]
+        if isinstance(result, OSError):
+            raise result
+        return result
+
+    def exists(self, name: str) -> bool:
+        try:
+            self.stat(name)
+        except OSError:
+            return False
+        return True
+
+    def content(self, name: str) -> mmap.mmap | bytes:
+        if name not in self._contents:
+            try:
+                with open(self.ioc_dir / name, "rb") as fp:
+                    size = os.fstat(fp.fileno()).st_size
+                    # Empty files can't be memory-mapped
+                    self._contents[name] = (
+                        mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ)
+                        if size
+                        else b""
+                    )
+            except OSError as e:
+                self._contents[name] = e
+        result = self._contents[name]
+        if isinstance(result, OSError):
+            raise result
+        return result
+
+    def close(self):
+        for content in self._contents.values():
+            if isinstance(content, mmap.mmap):
+                content.close()
+        self._contents.clear()
+
+
+def find_patterns(content: mmap.mmap | bytes, patterns: Iterable[str]) -> set[str]:
+    """Return the patterns that occur in content.
+
+    With few patterns, each is searched for with bytes.find, which is several
+    times faster per byte than a regex. Beyond that, all patterns are combined
+    into one regex, and content is scanned once: whenever a pattern matches,
+    it's dropped from the regex and the scan resumes where it matched.
+    """
+    patterns = set(patterns)
+    if len(patterns) < MULTI_PATTERN_SCAN_MIN_PATTERNS:
+        return {p for p in patterns if content.find(p.encode()) != -1}
+
+    found = set()
+    remaining = sorted(patterns, key=len, reverse=True)
+    pos = 0
+    while remaining:
+        regex = re.compile(b"|".join(re.escape(p.encode()) for p in remaining))
+        match = regex.search(content, pos)
+        if match is None:
+            break
+        pattern = match.group().decode()
+        found.add(pattern)
+        remaining.remove(pattern)
+        pos = match.start()
+    return found
+
+
+def count_newlines(content: mmap.mmap | bytes, end: int | None = None) -> int:
+    """Count the newlines in content[:end], one bounded slice at a time."""
+    end = len(content) if end is None else end
+    return sum(
+        content[start : min(start + LINE_COUNT_CHUNK_SIZE, end)].count(b"\n")
+        for start in range(0, end, LINE_COUNT_CHUNK_SIZE)
+    )
+
+
+def count_lines(content: mmap.mmap | bytes) -> int:
+    lines = count_newlines(content)
+    if len(content) and content[-1:] != b"\n":
+        lines += 1
+    return lines
+
+
+def compile_regex(filename: str, pattern: str) -> re.Pattern[bytes]:
+    """Compile a regex to match against the raw bytes of a file, line by line."""
+    try:
+        return re.compile(pattern.encode(), re.MULTILINE)
+    except re.error as e:
+        raise ValueError(f"{filename}: invalid regex '{pattern}': {e}") from e
+
+
+def verify_files_exist(files: DeployedFiles, names: list[str]) -> list[str]:
+    """Check that all specified files exist.
+
+    Names containing glob wildcards must match at least one file, unless a file
+    has that exact name, e.g. SNMPv2-TC[rfc2579].mib.
+    """
     errors = []
-    for f in files:
-        path = ioc_dir / f
-        if not path.exists():
-            errors.append(f"File not found: {path}")
+    for f in names:
+        if GLOB_CHARS.intersection(f) and not files.exists(f):
+            if next(files.ioc_dir.glob(f), None) is None:
+                errors.append(f"No files match: {files.ioc_dir / f}")
+        elif not files.exists(f):
+            errors.append(f"File not found: {files.ioc_dir / f}")
     return errors
 
 
-def verify_file_contains(
-    ioc_dir: Path, file_patterns: dict[str, list[str]]
+def verify_file_contents(
+    files: DeployedFiles,
+    must_contain: dict[str, list[str]],
+    must_not_contain: dict[str, list[str]],
 ) -> list[str]:
-    """Check that files contain required patterns."""
+    """Check that files contain required, and do NOT contain forbidden patterns.
+
+    The required and forbidden patterns of each file are matched together,
+    against its content read only once.
+    """
     errors = []
-    for filename, patterns in file_patterns.items():
-        path = ioc_dir / filename
+    for filename in dict.fromkeys([*must_contain, *must_not_contain]):
+        required = must_contain.get(filename) or []
+        forbidden = must_not_contain.get(filename) or []
         try:
-            content = path.read_text()
+            found = find_patterns(files.content(filename), [*required, *forbidden])
         except OSError as e:
             errors.append(f"Cannot read file {filename}: {e}")
             continue
-        for pattern in patterns:
-            if pattern not in content:
+        for pattern in required:
+            if pattern not in found:
                 errors.append(f"{filename}: missing required pattern '{pattern}'")
+        for pattern in forbidden:
+            if pattern in found:
+                errors.append(f"{filename}: contains forbidden pattern '{pattern}'")
     return errors
 
 
-def verify_file_not_contains(
-    ioc_dir: Path, file_patterns: dict[str, list[str]]
+def verify_file_regexes(
+    files: DeployedFiles,
+    must_match: dict[str, list[str]],
+    must_not_match: dict[str, list[str]],
 ) -> list[str]:
-    """Check that files do NOT contain forbidden patterns."""
+    """Check that files match required, and do NOT match forbidden regexes.
+
+    Regexes are matched in multiline mode, so ^ and $ match at line bounds.
+    """
     errors = []
-    for filename, patterns in file_patterns.items():
-        path = ioc_dir / filename
+    for filename in dict.fromkeys([*must_match, *must_not_match]):
         try:
-            content = path.read_text()
+            content = files.content(filename)
         except OSError as e:
             errors.append(f"Cannot read file {filename}: {e}")
             continue
-        for pattern in patterns:
-            if pattern in content:
-                errors.append(f"{filename}: contains forbidden pattern '{pattern}'")
+        for pattern in must_match.get(filename) or []:
+            try:
+                match = compile_regex(filename, pattern).search(content)
+            except ValueError as e:
+                errors.append(str(e))
+                continue
+            if match is None:
+                errors.append(f"{filename}: no match for required regex '{pattern}'")
+        for pattern in must_not_match.get(filename) or []:
+            try:
+                match = compile_regex(filename, pattern).search(content)
+            except ValueError as e:
+                errors.append(str(e))
+                continue
+            if match is not None:
+                line = count_newlines(content, match.start()) + 1
+                errors.append(f"{filename}:{line}: matches forbidden regex '{pattern}'")
     return errors
 
 
-def verify_permissions(ioc_dir: Path, perms: dict[str, str]) -> list[str]:
+def verify_pattern_counts(
+    files: DeployedFiles, pattern_counts: dict[str, dict[str, dict[str, int]]]
+) -> list[str]:
+    """Check that the number of matches of regexes in files is within bounds."""
+    errors = []
+    for filename, bounds_by_pattern in pattern_counts.items():
+        try:
+            content = files.content(filename)
+        except OSError as e:
+            errors.append(f"Cannot read file {filename}: {e}")
+            continue
+        for pattern, bounds in bounds_by_pattern.items():
+            try:
+                regex = compile_regex(filename, pattern)
+            except ValueError as e:
+                errors.append(str(e))
+                continue
+            count = sum(1 for _ in regex.finditer(content))
+            if "min" in bounds and count < bounds["min"]:
+                errors.append(
+                    f"{filename}: expected at least {bounds['min']} match(es) "
+                    f"of '{pattern}', got {count}"
+                )
+            if "max" in bounds and count > bounds["max"]:
+                errors.append(
+                    f"{filename}: expected at most {bounds['max']} match(es) "
+                    f"of '{pattern}', got {count}"
+                )
+    return errors
+
+
+def verify_file_bounds(
+    files: DeployedFiles, file_bounds: dict[str, dict[str, int]]
+) -> list[str]:
+    """Check that the line count and size in bytes of files are within bounds."""
+    errors = []
+    for filename, bounds in file_bounds.items():
+        try:
+            actual = {"size": files.stat(filename).st_size}
+            if "min_lines" in bounds or "max_lines" in bounds:
+                actual["lines"] = count_lines(files.content(filename))
+        except OSError as e:
+            errors.append(f"Cannot read file {filename}: {e}")
+            continue
+        for quantity, value in actual.items():
+            if f"min_{quantity}" in bounds and value < bounds[f"min_{quantity}"]:
+                errors.append(
+                    f"{filename}: expected {quantity} of at least "
+                    f"{bounds[f'min_{quantity}']}, got {value}"
+                )
+            if f"max_{quantity}" in bounds and value > bounds[f"max_{quantity}"]:
+                errors.append(
+                    f"{filename}: expected {quantity} of at most "
+                    f"{bounds[f'max_{quantity}']}, got {value}"
+                )
+    return errors
+
+
+def verify_permissions(files: DeployedFiles, perms: dict[str, str]) -> list[str]:
     """Check file/directory permissions."""
     errors = []
     for path_str, expected_mode in perms.items():
-        full_path = ioc_dir / path_str
         try:
-            actual_mode = oct(stat.S_IMODE(full_path.stat().st_mode))
+            actual_mode = oct(stat.S_IMODE(files.stat(path_str).st_mode))
         except OSError as e:
             errors.append(f"Cannot stat {path_str}: {e}")
             continue
@@ -84,16 +310,23 @@ def verify_permissions(ioc_dir: Path, perms: dict[str, str]) -> list[str]:
     return errors
 
 
-def verify_ownership(ioc_dir: Path, ownership: dict[str, str]) -> list[str]:
+@cache
+def user_name(uid: int) -> str:
+    return pwd.getpwuid(uid).pw_name
+
+
+@cache
+def group_name(gid: int) -> str:
+    return grp.getgrgid(gid).gr_name
+
+
+def verify_ownership(files: DeployedFiles, ownership: dict[str, str]) -> list[str]:
     """Check file/directory ownership."""
     errors = []
     for path_str, expected_owner in ownership.items():
-        full_path = ioc_dir / path_str
         try:
-            st = full_path.stat()
-            user = pwd.getpwuid(st.st_uid).pw_name
-            group = grp.getgrgid(st.st_gid).gr_name
-            actual_owner = f"{user}:{group}"
+            st = files.stat(path_str)
+            actual_owner = f"{user_name(st.st_uid)}:{group_name(st.st_gid)}"
         except (OSError, KeyError) as e:
             errors.append(f"Cannot get ownership of {path_str}: {e}")
             continue
@@ -104,82 +337,209 @@ def verify_ownership(ioc_dir: Path, ownership: dict[str, str]) -> list[str]:
     return errors
 
 
-def run_verification(verify_yml: Path, ioc_dir: Path) -> bool:
+def run_verification(
+    verify_yml: Path, ioc_dir: Path, out: TextIO | None = None
+) -> bool:
     """Run all verification checks and return True if all pass."""
+    out = out or sys.stdout
     with open(verify_yml) as f:
         schema = yaml.safe_load(f)
 
     verification = schema.get("verification", {})
-    all_errors = []
+    files = DeployedFiles(ioc_dir)
+    checks = []
 
     # files_must_exist
     if "files_must_exist" in verification:
-        print("Checking file existence...")
-        errors = verify_files_exist(ioc_dir, verification["files_must_exist"])
-        all_errors.extend(errors)
-
-    # file_must_contain
-    if "file_must_contain" in verification:
-        print("Checking file content (must contain)...")
-        errors = verify_file_contains(ioc_dir, verification["file_must_contain"])
-        all_errors.extend(errors)
-
-    # file_must_not_contain
-    if "file_must_not_contain" in verification:
-        print("Checking file content (must not contain)...")
-        errors = verify_file_not_contains(
-            ioc_dir, verification["file_must_not_contain"]
+        checks.append(
+            (
+                "file existence",
+                lambda: verify_files_exist(files, verification["files_must_exist"]),
+            )
+        )
+
+    # file_must_contain and file_must_not_contain
+    if "file_must_contain" in verification or "file_must_not_contain" in verification:
+        checks.append(
+            (
+                "file content",
+                lambda: verify_file_contents(
+                    files,
+                    verification.get("file_must_contain") or {},
+                    verification.get("file_must_not_contain") or {},
+                ),
+            )
+        )
+
+    # file_must_match and file_must_not_match
+    if "file_must_match" in verification or "file_must_not_match" in verification:
+        checks.append(
+            (
+                "file regexes",
+                lambda: verify_file_regexes(
+                    files,
+                    verification.get("file_must_match") or {},
+                    verification.get("file_must_not_match") or {},
+                ),
+            )
+        )
+
+    # pattern_counts
+    if "pattern_counts" in verification:
+        checks.append(
+            (
+                "pattern counts",
+                lambda: verify_pattern_counts(files, verification["pattern_counts"]),
+            )
+        )
+
+    # file_bounds
+    if "file_bounds" in verification:
+        checks.append(
+            (
+                "file bounds",
+                lambda: verify_file_bounds(files, verification["file_bounds"]),
+            )
         )
-        all_errors.extend(errors)
 
     # permissions
     if "permissions" in verification:
-        print("Checking permissions...")
-        errors = verify_permissions(ioc_dir, verification["permissions"])
-        all_errors.extend(errors)
+        checks.append(
+            (
+                "permissions",
+                lambda: verify_permissions(files, verification["permissions"]),
+            )
+        )
 
     # ownership
     if "ownership" in verification:
-        print("Checking ownership...")
-        errors = verify_ownership(ioc_dir, verification["ownership"])
-        all_errors.extend(errors)
+        checks.append(
+            ("ownership", lambda: verify_ownership(files, verification["ownership"]))
+        )
+
+    all_errors = []
+    try:
+        for name, check in checks:
+            start = time.perf_counter()
+            errors = check()
+            elapsed_ms = (time.perf_counter() - start) * 1000
+            print(
+                f"Checking {name}... {len(errors)} error(s) in {elapsed_ms:.1f} ms",
+                file=out,
+            )
+            all_errors.extend(errors)
+    finally:
+        files.close()
 
     # Report results
     if all_errors:
-        print(f"\nVerification FAILED with {len(all_errors)} error(s):")
+        print(f"\nVerification FAILED with {len(all_errors)} error(s):", file=out)
         for err in all_errors:
-            print(f"  - {err}")
+            print(f"  - {err}", file=out)
         return False
 
-    print("\nAll verification checks passed.")
+    print("\nAll verification checks passed.", file=out)
     return True
 
 
+def verify_deployment(
+    verify_yml: Path, ioc_dir: Path, out: TextIO | None = None
+) -> bool:
+    """Verify a deployed IOC, returning True if all checks pass."""
+    out = out or sys.stdout
+    print("Verifying deployment:", file=out)
+    print(f"  Schema: {verify_yml}", file=out)
+    print(f"  IOC Directory: {ioc_dir}\n", file=out)
+
+    if not verify_yml.exists():
+        print(f"Error: verify.yml not found: {verify_yml}", file=out)
+        return False
+
+    if not ioc_dir.exists():
+        print(f"Error: IOC directory not found: {ioc_dir}", file=out)
+        return False
+
+    return run_verification(verify_yml, ioc_dir, out=out)
+
+
+def load_manifest(manifest_path: Path) -> dict[str, tuple[Path, Path]]:
+    """Return the (verify.yml, IOC directory) pair of each IOC in a manifest."""
+    with open(manifest_path) as f:
+        manifest = yaml.safe_load(f) or {}
+    return {
+        ioc_name: (manifest_path.parent / entry["verify_yml"], Path(entry["ioc_dir"]))
+        for ioc_name, entry in manifest.items()
+    }
+
+
+def _verify_manifest_entry(entry: tuple[Path, Path]) -> dict:
+    out = io.StringIO()
+    start = time.perf_counter()
+    try:
+        passed = verify_deployment(*entry, out=out)
+    except Exception as e:
+        print(f"Error: {type(e).__name__}: {e}", file=out)
+        passed = False
+    return {
+        "passed": passed,
+        "elapsed": round(time.perf_counter() - start, 3),
+        "output": out.getvalue(),
+    }
+
+
+def verify_manifest(manifest: dict[str, tuple[Path, Path]], jobs: int) -> dict:
+    """Verify every IOC in a manifest in parallel, returning per-IOC results."""
+    if jobs <= 1 or len(manifest) <= 1:
+        results = map(_verify_manifest_entry, manifest.values())
+        return dict(zip(manifest, results, strict=True))
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        results = executor.map(_verify_manifest_entry, manifest.values())
+        return dict(zip(manifest, results, strict=True))
+
+
 def main():
     parser = argparse.ArgumentParser(
         description="Verify IOC deployment against verify.yml schema"
     )
-    parser.add_argument("verify_yml", help="Path to verify.yml schema file")
-    parser.add_argument("ioc_dir", help="Path to deployed IOC directory")
+    parser.add_argument("verify_yml", nargs="?", help="Path to verify.yml schema file")
+    parser.add_argument("ioc_dir", nargs="?", help="Path to deployed IOC directory")
+    parser.add_argument(
+        "-m",
+        "--manifest",
+        help="Path to a manifest of IOCs to verify, instead of a single IOC",
+    )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="Number of IOCs in the manifest to verify at once",
+    )
+    parser.add_argument(
+        "--json",
+        action="store_true",
+        help="Print the results of a manifest as JSON, including each IOC's output",
+    )
     args = parser.parse_args()
 
-    verify_yml = Path(args.verify_yml)
-    ioc_dir = Path(args.ioc_dir)
-
-    print("Verifying deployment:")
-    print(f"  Schema: {verify_yml}")
-    print(f"  IOC Directory: {ioc_dir}\n")
-
-    if not verify_yml.exists():
-        print(f"Error: verify.yml not found: {verify_yml}")
-        sys.exit(1)
-
-    if not ioc_dir.exists():
-        print(f"Error: IOC directory not found: {ioc_dir}")
-        sys.exit(1)
-
-    success = run_verification(verify_yml, ioc_dir)
-    sys.exit(0 if success else 1)
+    if args.manifest is None:
+        if args.verify_yml is None or args.ioc_dir is None:
+            parser.error("verify_yml and ioc_dir are required without --manifest")
+        success = verify_deployment(Path(args.verify_yml), Path(args.ioc_dir))
+        sys.exit(0 if success else 1)
+
+    results = verify_manifest(load_manifest(Path(args.manifest)), args.jobs)
+    if args.json:
+        json.dump(results, sys.stdout, indent=2)
+        print()
+    else:
+        for ioc_name, result in results.items():
+            print(f"===== {ioc_name} =====\n{result['output']}")
+        print("Verification summary:")
+        for ioc_name, result in results.items():
+            status = "passed" if result["passed"] else "FAILED"
+            print(f"  {ioc_name}: {status} ({result['elapsed']}s)")
+    sys.exit(0 if all(result["passed"] for result in results.values()) else 1)
 
 
 if __name__ == "__main__":
@@ -1,28 +1,90 @@
+import importlib.util
 import os
+import time
 from dataclasses import dataclass
 from pathlib import Path
+from types import ModuleType
+from typing import Any
 
+import config_validation
 import pytest
 import yamale
 import yaml
 
-INSTALL_MODULE_FILES = [
-    os.path.splitext(f)[0]
-    for f in os.listdir("roles/install_module/vars")
-    if f.endswith(".yml")
-]
 
-
-class ModuleNameValidator(yamale.validators.Validator):
-    tag = "module_name"
-
-    def _is_valid(self, value: str) -> bool:
-        return value in INSTALL_MODULE_FILES
-
-
-@pytest.fixture
-def module_name_validator():
-    return ModuleNameValidator
+class ParsedFileCache:
+    """Session-wide cache of parsed YAML files and compiled yamale schemas.
+
+    Every vars, example and schema file is parsed once per test session, and
+    every schema is compiled once, with the validators of config_validation,
+    no matter how many parametrized test cases use it.
+    """
+
+    def __init__(self):
+        self._yaml: dict[Path, Any] = {}
+        self._schemas: dict[Path, yamale.schema.Schema] = {}
+        self.yaml_hits = 0
+        self.schema_hits = 0
+        self.yaml_time = 0.0
+        self.schema_time = 0.0
+
+    def load_yaml(self, path: Path | str) -> Any:
+        path = Path(path)
+        if path in self._yaml:
+            self.yaml_hits += 1
+        else:
+            start = time.perf_counter()
+            with open(path) as fp:
+                self._yaml[path] = yaml.safe_load(fp)
+            self.yaml_time += time.perf_counter() - start
+        return self._yaml[path]
+
+    def schema(self, path: Path | str) -> yamale.schema.Schema:
+        path = Path(path)
+        if path in self._schemas:
+            self.schema_hits += 1
+        else:
+            start = time.perf_counter()
+            self._schemas[path] = config_validation.make_schema(path)
+            self.schema_time += time.perf_counter() - start
+        return self._schemas[path]
+
+    def summary(self) -> str:
+        def saved(hits: int, misses: int, elapsed: float) -> float:
+            return hits * elapsed / misses if misses else 0.0
+
+        yaml_saved = saved(self.yaml_hits, len(self._yaml), self.yaml_time)
+        schema_saved = saved(self.schema_hits, len(self._schemas), self.schema_time)
+        return (
+            f"parsed {len(self._yaml)} YAML files in {self.yaml_time:.2f}s "
+            f"({self.yaml_hits} cache hits, ~{yaml_saved:.2f}s saved); "
+            f"compiled {len(self._schemas)} yamale schemas in "
+            f"{self.schema_time:.2f}s ({self.schema_hits} cache hits, "
+            f"~{schema_saved:.2f}s saved)"
+        )
+
+
+PARSED_FILE_CACHE = ParsedFileCache()
+
+
+def load_plugin(path: Path | str) -> ModuleType:
+    """Import a plugin of the collection from its file, named after the file."""
+    path = Path(path)
+    spec = importlib.util.spec_from_file_location(path.stem, path)
+    plugin = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(plugin)
+    return plugin
+
+
+def pytest_terminal_summary(terminalreporter):
+    if PARSED_FILE_CACHE.yaml_hits or PARSED_FILE_CACHE.schema_hits:
+        terminalreporter.write_sep("-", "parsed file cache")
+        terminalreporter.write_line(PARSED_FILE_CACHE.summary())
+
+
+@pytest.fixture(scope="session")
+def parsed_file_cache() -> ParsedFileCache:
+    return PARSED_FILE_CACHE
 
 
 @dataclass
@@ -32,18 +94,24 @@ class VarFile:
     data: dict
 
 
-@pytest.fixture
-def var_file_reader_factory():
+@pytest.fixture(scope="session")
+def var_file_reader_factory(parsed_file_cache):
+    var_files_by_dir: dict[Path, dict[str, VarFile]] = {}
+
     def var_file_reader(var_file_path: Path) -> dict[str, VarFile]:
+        if var_file_path in var_files_by_dir:
+            parsed_file_cache.yaml_hits += len(var_files_by_dir[var_file_path])
+            return var_files_by_dir[var_file_path]
+
         var_file_paths = [f for f in var_file_path.glob("*.yml") if f.is_file()]
         var_files = {}
         for var_file in var_file_paths:
-            with open(var_file) as file:
-                var_files[os.path.splitext(var_file.name)[0]] = VarFile(
-                    name=os.path.splitext(var_file.name)[0],
-                    path=var_file,
-                    data=yaml.safe_load(file),
-                )
+            var_files[os.path.splitext(var_file.name)[0]] = VarFile(
+                name=os.path.splitext(var_file.name)[0],
+                path=var_file,
+                data=parsed_file_cache.load_yaml(var_file),
+            )
+        var_files_by_dir[var_file_path] = var_files
         return var_files
 
     return var_file_reader
@@ -57,3 +125,12 @@ def install_module_var_file(var_file_reader_factory, request) -> VarFile:
 @pytest.fixture
 def deploy_ioc_var_file(var_file_reader_factory, request) -> VarFile:
     return var_file_reader_factory(Path("roles/deploy_ioc/vars"))[request.param]
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--update-snapshots",
+        action="store_true",
+        help="Write the snapshots of test_render_snapshots.py from the rendered "
+        "examples, instead of comparing with them",
+    )
@@ -0,0 +1,19 @@
+dbLoadDatabase("/epics/modules/acmi2_6d0774e/dbd/acmi2.dbd")
+acmi2_registerRecordDeviceDriver(pdbbase)
+
+dbLoadRecords("/epics/modules/acmi2_6d0774e/db/ADC.db",         "P=$(IOCNAME), NO=$(UNIT)")
+dbLoadRecords("/epics/modules/acmi2_6d0774e/db/TP.db",          "P=$(IOCNAME), NO=$(UNIT), T=1")
+dbLoadRecords("/epics/modules/acmi2_6d0774e/db/TP.db",          "P=$(IOCNAME), NO=$(UNIT), T=2")
+dbLoadRecords("/epics/modules/acmi2_6d0774e/db/TP.db",          "P=$(IOCNAME), NO=$(UNIT), T=3")
+dbLoadRecords("/epics/modules/acmi2_6d0774e/db/Beam.db",        "P=$(IOCNAME), NO=$(UNIT)")
+dbLoadRecords("/epics/modules/acmi2_6d0774e/db/Tail2.db",       "P=$(IOCNAME), NO=$(UNIT)")
+dbLoadRecords("/epics/modules/acmi2_6d0774e/db/lstats.db",      "P=$(IOCNAME), NO=$(UNIT)")
+dbLoadRecords("/epics/modules/acmi2_6d0774e/db/control.db",     "P=$(IOCNAME), NO=$(UNIT)")
+dbLoadRecords("/epics/modules/acmi2_6d0774e/db/pulse_stats.db", "P=$(IOCNAME), NO=$(UNIT)")
+dbLoadRecords("/epics/modules/acmi2_6d0774e/db/eeprom.db",      "P=$(IOCNAME), NO=$(UNIT)")
+dbLoadRecords("/epics/modules/acmi2_6d0774e/db/adc_data.db",    "P=$(IOCNAME), NO=$(UNIT)")
+
+var(PSCDebug, 1)
+
+createPSC("PSCA", 10.0.142.128, 3000, 0)
+setPSCSendBlockSize("PSCA", 70000, 70000)
@@ -0,0 +1,29 @@
+
+< /epics/common/localhost-netsetup.cmd
+
+errlogInit(20000)
+
+epicsEnvSet("IOC", "acmi2")
+epicsEnvSet("IOC_DIR", "/epics/iocs")
+epicsEnvSet("TOP", "/epics/iocs/acmi2-ioc1")
+epicsEnvSet("TEMPLATE_TOP", "/epics/modules/acmi2_6d0774e")
+epicsEnvSet("HOSTNAME", "localhost")
+epicsEnvSet("IOCNAME", "lab")
+epicsEnvSet("ASYN", "/usr/lib/epics")
+epicsEnvSet("AUTOSAVE", "/usr/lib/epics")
+epicsEnvSet("BUSY", "/usr/lib/epics")
+epicsEnvSet("CALC", "/usr/lib/epics")
+epicsEnvSet("DEVIOCSTATS", "/usr/lib/epics")
+epicsEnvSet("SSCAN", "/usr/lib/epics")
+epicsEnvSet("STREAM", "/usr/lib/epics")
+epicsEnvSet("SNCSEQ", "/usr/lib/epics")
+epicsEnvSet("RECCASTER", "/usr/lib/epics")
+epicsEnvSet("EPICS_BASE", "/usr/lib/epics")
+epicsEnvSet("MOTOR", "/usr/lib/epics")
+epicsEnvSet("PSCDRV", "/epics/modules/pscdrv_1ed650d")
+epicsEnvSet("ACMI2", "/epics/modules/acmi2_6d0774e")
+epicsEnvSet("ENGINEER", "Y. Hu")
+epicsEnvSet("UNIT", "A")
+epicsEnvSet("PSC_IP", "10.0.142.128")
+epicsEnvSet("PSC_PORT", "3000")
+epicsEnvSet("EPICS_DB_INCLUDE_PATH", "/epics/iocs/acmi2-ioc1/db:/epics/modules/pscdrv_1ed650d/db:/epics/modules/acmi2_6d0774e/db:/usr/lib/epics/db")
@@ -0,0 +1,18 @@
+#!/epics/modules/acmi2_6d0774e/bin/linux-x86_64/acmi2
+
+# Perform base environment setup and configuration
+< ./epicsEnv.cmd
+
+# Load IOC specific startup configuration
+< ./base.cmd
+
+
+iocInit()
+
+# Perform standard IOC post-init actions
+< ./postInit.cmd
+
+dbl > $(TOP)/records.dbl
+date
+
+# IOC acmi2-ioc1 completed startup
@@ -0,0 +1,18 @@
+
+errlogInit(20000)
+
+dbLoadDatabase("/epics/modules/adandor3_1e33769/iocs/andor3IOC/dbd/andor3App.dbd")
+andor3App_registerRecordDeviceDriver(pdbbase)
+
+andor3Config("$(PORT)", 0, 0, 0, 0, 0, 1000)
+
+asynSetTraceIOMask("$(PORT)",0,2)
+#asynSetTraceMask("$(PORT)",0,255)
+
+dbLoadRecords("$(ADANDOR3)/db/andor3.template","P=$(PREFIX),R=cam1:,PORT=$(PORT),ADDR=0,TIMEOUT=1")
+
+NDStdArraysConfigure("Image1", 20, 0, "$(PORT)", 0, 0, 0, 0, 0, 5)
+
+dbLoadRecords("NDStdArrays.template", "P=$(PREFIX),R=image1:,PORT=Image1,ADDR=0,TIMEOUT=1,NDARRAY_PORT=$(PORT),TYPE=$(NDTYPE),FTVL=$(NDFTVL),NELEMENTS=$(NELMT)")
+
+set_requestfile_path("$(ADANDOR3)/andor3App/Db")
@@ -0,0 +1,43 @@
+
+< /epics/common/localhost-netsetup.cmd
+
+errlogInit(20000)
+
+epicsEnvSet("IOC", "adandor3")
+epicsEnvSet("IOC_DIR", "/epics/iocs")
+epicsEnvSet("TOP", "/epics/iocs/andor-marana-test")
+epicsEnvSet("TEMPLATE_TOP", "/epics/modules/adandor3_1e33769/iocs/andor3IOC")
+epicsEnvSet("HOSTNAME", "localhost")
+epicsEnvSet("IOCNAME", "andor-marana-test")
+epicsEnvSet("ASYN", "/usr/lib/epics")
+epicsEnvSet("AUTOSAVE", "/usr/lib/epics")
+epicsEnvSet("BUSY", "/usr/lib/epics")
+epicsEnvSet("CALC", "/usr/lib/epics")
+epicsEnvSet("DEVIOCSTATS", "/usr/lib/epics")
+epicsEnvSet("SSCAN", "/usr/lib/epics")
+epicsEnvSet("STREAM", "/usr/lib/epics")
+epicsEnvSet("SNCSEQ", "/usr/lib/epics")
+epicsEnvSet("RECCASTER", "/usr/lib/epics")
+epicsEnvSet("EPICS_BASE", "/usr/lib/epics")
+epicsEnvSet("PORT", "ANDOR")
+epicsEnvSet("XSIZE", "2048")
+epicsEnvSet("YSIZE", "2048")
+epicsEnvSet("HIST_SIZE", "4096")
+epicsEnvSet("QSIZE", "20")
+epicsEnvSet("NCHANS", "2048")
+epicsEnvSet("CBUFFS", "500")
+epicsEnvSet("NDTYPE", "Int8")
+epicsEnvSet("NDFTVL", "UCHAR")
+epicsEnvSet("NELMT", "12000000")
+epicsEnvSet("MAX_THREADS", "8")
+epicsEnvSet("EPICS_DB_INCLUDE_PATH", "/epics/modules/adcore_5860bd3/db:/epics/modules/ADAndor3/db")
+epicsEnvSet("NELEMENTS", "10000000")
+epicsEnvSet("MOTOR", "/usr/lib/epics")
+epicsEnvSet("ADSUPPORT", "/epics/modules/adsupport_fe23754")
+epicsEnvSet("ADCORE", "/epics/modules/adcore_5860bd3")
+epicsEnvSet("ADCOMPVISION", "/epics/modules/adcompvision_9750d13")
+epicsEnvSet("ADPLUGINBAR", "/epics/modules/adpluginbar_448d96b")
+epicsEnvSet("FFMPEGSERVER", "/epics/modules/ffmpeg_server_07c570f")
+epicsEnvSet("ADANDOR3", "/epics/modules/ADAndor3")
+epicsEnvSet("PREFIX", "XF:18IDB-ES{Det:Marana1}")
+epicsEnvSet("ENGINEER", "C. Engineer")
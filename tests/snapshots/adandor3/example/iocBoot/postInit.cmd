@@ -0,0 +1,7 @@
+
+cd $(TOP)/as/req
+
+create_monitor_set("auto_settings.req", 30, "P=$(PREFIX)")
+
+
+cd $(TOP)
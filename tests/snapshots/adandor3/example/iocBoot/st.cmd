@@ -0,0 +1,20 @@
+#!/epics/modules/adandor3_1e33769/iocs/andor3IOC/bin/linux-x86_64/andor3App
+
+# Perform base environment setup and configuration
+< ./epicsEnv.cmd
+
+# Load IOC specific startup configuration
+< ./base.cmd
+
+# Load any additional configured databases, prep autosave
+< ./common.cmd
+
+iocInit()
+
+# Perform standard IOC post-init actions
+< ./postInit.cmd
+
+dbl > $(TOP)/records.dbl
+date
+
+# IOC andor-marana-test completed startup
@@ -0,0 +1,40 @@
+
+< /epics/common/localhost-netsetup.cmd
+
+errlogInit(20000)
+
+epicsEnvSet("IOC", "adaravis")
+epicsEnvSet("IOC_DIR", "/epics/iocs")
+epicsEnvSet("TOP", "/epics/iocs/adaravis-01")
+epicsEnvSet("TEMPLATE_TOP", "/epics/modules/adaravis_a0aa4d6/iocs/aravisIOC")
+epicsEnvSet("HOSTNAME", "localhost")
+epicsEnvSet("IOCNAME", "adaravis-01")
+epicsEnvSet("ASYN", "/usr/lib/epics")
+epicsEnvSet("AUTOSAVE", "/usr/lib/epics")
+epicsEnvSet("BUSY", "/usr/lib/epics")
+epicsEnvSet("CALC", "/usr/lib/epics")
+epicsEnvSet("DEVIOCSTATS", "/usr/lib/epics")
+epicsEnvSet("SSCAN", "/usr/lib/epics")
+epicsEnvSet("STREAM", "/usr/lib/epics")
+epicsEnvSet("SNCSEQ", "/usr/lib/epics")
+epicsEnvSet("RECCASTER", "/usr/lib/epics")
+epicsEnvSet("EPICS_BASE", "/usr/lib/epics")
+epicsEnvSet("PORT", "ARV1")
+epicsEnvSet("QSIZE", "20")
+epicsEnvSet("NCHANS", "2048")
+epicsEnvSet("CBUFFS", "500")
+epicsEnvSet("MAX_THREADS", "8")
+epicsEnvSet("EPICS_DB_INCLUDE_PATH", "/epics/modules/adcore_5860bd3/db:/epics/modules/adgenicam_5d08a11/db:/epics/modules/adaravis_a0aa4d6/db")
+epicsEnvSet("NELEMENTS", "500000")
+epicsEnvSet("MOTOR", "/usr/lib/epics")
+epicsEnvSet("ADSUPPORT", "/epics/modules/adsupport_fe23754")
+epicsEnvSet("ADCORE", "/epics/modules/adcore_5860bd3")
+epicsEnvSet("ADCOMPVISION", "/epics/modules/adcompvision_9750d13")
+epicsEnvSet("ADPLUGINBAR", "/epics/modules/adpluginbar_448d96b")
+epicsEnvSet("FFMPEGSERVER", "/epics/modules/ffmpeg_server_07c570f")
+epicsEnvSet("ADGENICAM", "/epics/modules/adgenicam_5d08a11")
+epicsEnvSet("ADARAVIS", "/epics/modules/adaravis_a0aa4d6")
+epicsEnvSet("ENGINEER", "C. Engineer")
+epicsEnvSet("PREFIX", "XF:31ID1-ES{ADARAVIS:01}")
+epicsEnvSet("CAMERA_NAME", "Allied Vision Technologies-Manta G-040B (E0022660)-50-0503548886")
+epicsEnvSet("ENABLE_CACHING", "1")
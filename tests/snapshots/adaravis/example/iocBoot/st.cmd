@@ -0,0 +1,20 @@
+#!/epics/modules/adaravis_a0aa4d6/iocs/aravisIOC/bin/linux-x86_64/ADAravisApp
+
+# Perform base environment setup and configuration
+< ./epicsEnv.cmd
+
+# Load IOC specific startup configuration
+< ./base.cmd
+
+# Load any additional configured databases, prep autosave
+< ./common.cmd
+
+iocInit()
+
+# Perform standard IOC post-init actions
+< ./postInit.cmd
+
+dbl > $(TOP)/records.dbl
+date
+
+# IOC adaravis-01 completed startup
@@ -0,0 +1,13 @@
+
+dbLoadDatabase("/epics/modules/adeiger_a7b25dc/iocs/eigerIOC/dbd/eigerDetectorApp.dbd")
+eigerDetectorApp_registerRecordDeviceDriver(pdbbase)
+
+# adeiger specific commands
+errlogInit(20000)
+
+eigerDetectorConfig("$(PORT)", "$(DCU_IP)", 0, 0)
+dbLoadRecords("$(ADEIGER)/db/eiger1.template", "P=$(PREFIX),R=cam1:,PORT=$(PORT),ADDR=0,TIMEOUT=1")
+
+
+# Debug
+#asynSetTraceMask("$(PORT)", 0, 0x11)
@@ -0,0 +1,40 @@
+
+< /epics/common/localhost-netsetup.cmd
+
+errlogInit(20000)
+
+epicsEnvSet("IOC", "adeiger")
+epicsEnvSet("IOC_DIR", "/epics/iocs")
+epicsEnvSet("TOP", "/epics/iocs/adeiger-01")
+epicsEnvSet("TEMPLATE_TOP", "/epics/modules/adeiger_a7b25dc/iocs/eigerIOC")
+epicsEnvSet("HOSTNAME", "localhost")
+epicsEnvSet("IOCNAME", "adeiger-01")
+epicsEnvSet("ASYN", "/usr/lib/epics")
+epicsEnvSet("AUTOSAVE", "/usr/lib/epics")
+epicsEnvSet("BUSY", "/usr/lib/epics")
+epicsEnvSet("CALC", "/usr/lib/epics")
+epicsEnvSet("DEVIOCSTATS", "/usr/lib/epics")
+epicsEnvSet("SSCAN", "/usr/lib/epics")
+epicsEnvSet("STREAM", "/usr/lib/epics")
+epicsEnvSet("SNCSEQ", "/usr/lib/epics")
+epicsEnvSet("RECCASTER", "/usr/lib/epics")
+epicsEnvSet("EPICS_BASE", "/usr/lib/epics")
+epicsEnvSet("PORT", "EIG")
+epicsEnvSet("QSIZE", "2048")
+epicsEnvSet("XSIZE", "1030")
+epicsEnvSet("YSIZE", "1065")
+epicsEnvSet("NCHANS", "2048")
+epicsEnvSet("CBUFFS", "8192")
+epicsEnvSet("MAX_THREADS", "8")
+epicsEnvSet("EPICS_DB_INCLUDE_PATH", "/epics/modules/adcore_5860bd3/db:/epics/modules/adeiger_a7b25dc/db")
+epicsEnvSet("NELEMENTS", "1096950")
+epicsEnvSet("MOTOR", "/usr/lib/epics")
+epicsEnvSet("ADSUPPORT", "/epics/modules/adsupport_fe23754")
+epicsEnvSet("ADCORE", "/epics/modules/adcore_5860bd3")
+epicsEnvSet("ADCOMPVISION", "/epics/modules/adcompvision_9750d13")
+epicsEnvSet("ADPLUGINBAR", "/epics/modules/adpluginbar_448d96b")
+epicsEnvSet("FFMPEGSERVER", "/epics/modules/ffmpeg_server_07c570f")
+epicsEnvSet("ADEIGER", "/epics/modules/adeiger_a7b25dc")
+epicsEnvSet("ENGINEER", "C. Engineer")
+epicsEnvSet("PREFIX", "XF:31ID1-ES{ADEIGER:01}")
+epicsEnvSet("DCU_IP", "192.168.100.10")
@@ -0,0 +1,6 @@
+
+cd $(TOP)/autosave/req
+
+
+
+cd $(TOP)
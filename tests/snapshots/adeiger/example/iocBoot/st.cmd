@@ -0,0 +1,20 @@
+#!/epics/modules/adeiger_a7b25dc/iocs/eigerIOC/bin/linux-x86_64/eigerDetectorApp
+
+# Perform base environment setup and configuration
+< ./epicsEnv.cmd
+
+# Load IOC specific startup configuration
+< ./base.cmd
+
+# Load any additional configured databases, prep autosave
+< ./common.cmd
+
+iocInit()
+
+# Perform standard IOC post-init actions
+< ./postInit.cmd
+
+dbl > $(TOP)/records.dbl
+date
+
+# IOC adeiger-01 completed startup
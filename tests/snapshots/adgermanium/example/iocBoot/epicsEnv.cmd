@@ -0,0 +1,30 @@
+
+< /epics/common/localhost-netsetup.cmd
+
+errlogInit(20000)
+
+epicsEnvSet("IOC", "adgermanium")
+epicsEnvSet("IOC_DIR", "/epics/iocs")
+epicsEnvSet("TOP", "/epics/iocs/adgermanium-01")
+epicsEnvSet("TEMPLATE_TOP", "")
+epicsEnvSet("HOSTNAME", "localhost")
+epicsEnvSet("IOCNAME", "adgermanium-01")
+epicsEnvSet("ASYN", "/usr/lib/epics")
+epicsEnvSet("AUTOSAVE", "/usr/lib/epics")
+epicsEnvSet("BUSY", "/usr/lib/epics")
+epicsEnvSet("CALC", "/usr/lib/epics")
+epicsEnvSet("DEVIOCSTATS", "/usr/lib/epics")
+epicsEnvSet("SSCAN", "/usr/lib/epics")
+epicsEnvSet("STREAM", "/usr/lib/epics")
+epicsEnvSet("SNCSEQ", "/usr/lib/epics")
+epicsEnvSet("RECCASTER", "/usr/lib/epics")
+epicsEnvSet("EPICS_BASE", "/usr/lib/epics")
+epicsEnvSet("MOTOR", "/usr/lib/epics")
+epicsEnvSet("ADSUPPORT", "/epics/modules/adsupport_fe23754")
+epicsEnvSet("ADCORE", "/epics/modules/adcore_5860bd3")
+epicsEnvSet("ADGERMANIUM", "/epics/modules/adgermanium_0395fac")
+epicsEnvSet("ENGINEER", "Ji Li")
+epicsEnvSet("PREFIX", "XF:31ID1-ES{ADGERMANIUM:01}")
+epicsEnvSet("DETECTOR_IP", "172.16.0.1")
+epicsEnvSet("NELM", "384")
+epicsEnvSet("EPICS_DB_INCLUDE_PATH", "/epics/iocs/adgermanium-01/db:/epics/modules/adsupport_fe23754/db:/epics/modules/adcore_5860bd3/db:/epics/modules/adgermanium_0395fac/db:/usr/lib/epics/db")
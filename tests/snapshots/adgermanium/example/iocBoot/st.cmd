@@ -0,0 +1,20 @@
+#!/usr/lib64/epics/bin/linux-x86_64/germanium
+
+# Perform base environment setup and configuration
+< ./epicsEnv.cmd
+
+# Load IOC specific startup configuration
+< ./base.cmd
+
+# Load any additional configured databases, prep autosave
+< ./common.cmd
+
+iocInit()
+
+# Perform standard IOC post-init actions
+< ./postInit.cmd
+
+dbl > $(TOP)/records.dbl
+date
+
+# IOC adgermanium-01 completed startup
@@ -0,0 +1,15 @@
+errlogInit(20000)
+
+dbLoadDatabase("/epics/modules/adkinetix_aa87406/iocs/kinetixIOC/dbd/kinetixApp.dbd")
+kinetixApp_registerRecordDeviceDriver(pdbbase)
+
+ADKinetixConfig(0, "$(PORT)")
+
+# Wait two seconds for ensuring camera initialized correctly
+epicsThreadSleep(2)
+
+asynSetTraceIOMask($(PORT), 0, 2)
+
+# Main database
+dbLoadRecords("$(ADKINETIX)/db/ADKinetix.template", "P=$(PREFIX),R=cam1:,PORT=$(PORT)")
+set_requestfile_path("$(ADKINETIX)/db")
@@ -0,0 +1,38 @@
+
+< /epics/common/localhost-netsetup.cmd
+
+errlogInit(20000)
+
+epicsEnvSet("IOC", "adkinetix")
+epicsEnvSet("IOC_DIR", "/epics/iocs")
+epicsEnvSet("TOP", "/epics/iocs/kinetix-det1")
+epicsEnvSet("TEMPLATE_TOP", "/epics/modules/adkinetix_aa87406/iocs/kinetixIOC")
+epicsEnvSet("HOSTNAME", "localhost")
+epicsEnvSet("IOCNAME", "kinetix-det1")
+epicsEnvSet("ASYN", "/usr/lib/epics")
+epicsEnvSet("AUTOSAVE", "/usr/lib/epics")
+epicsEnvSet("BUSY", "/usr/lib/epics")
+epicsEnvSet("CALC", "/usr/lib/epics")
+epicsEnvSet("DEVIOCSTATS", "/usr/lib/epics")
+epicsEnvSet("SSCAN", "/usr/lib/epics")
+epicsEnvSet("STREAM", "/usr/lib/epics")
+epicsEnvSet("SNCSEQ", "/usr/lib/epics")
+epicsEnvSet("RECCASTER", "/usr/lib/epics")
+epicsEnvSet("EPICS_BASE", "/usr/lib/epics")
+epicsEnvSet("CBUFFS", "500")
+epicsEnvSet("MAX_THREADS", "8")
+epicsEnvSet("NCHANS", "2048")
+epicsEnvSet("PORT", "KTX")
+epicsEnvSet("QSIZE", "20")
+epicsEnvSet("XSIZE", "3200")
+epicsEnvSet("YSIZE", "3200")
+epicsEnvSet("NELEMENTS", "5000000")
+epicsEnvSet("EPICS_DB_INCLUDE_PATH", "/epics/modules/adcore_5860bd3/db")
+epicsEnvSet("MOTOR", "/usr/lib/epics")
+epicsEnvSet("ADSUPPORT", "/epics/modules/adsupport_fe23754")
+epicsEnvSet("ADCORE", "/epics/modules/adcore_5860bd3")
+epicsEnvSet("ADCOMPVISION", "/epics/modules/adcompvision_9750d13")
+epicsEnvSet("ADPLUGINBAR", "/epics/modules/adpluginbar_448d96b")
+epicsEnvSet("FFMPEGSERVER", "/epics/modules/ffmpeg_server_07c570f")
+epicsEnvSet("ADKINETIX", "/epics/modules/adkinetix_aa87406")
+epicsEnvSet("PREFIX", "XF:31ID1-ES{Kinetix-Det:1}")
@@ -0,0 +1,20 @@
+#!/epics/modules/adkinetix_aa87406/iocs/kinetixIOC/bin/linux-x86_64/kinetixApp
+
+# Perform base environment setup and configuration
+< ./epicsEnv.cmd
+
+# Load IOC specific startup configuration
+< ./base.cmd
+
+# Load any additional configured databases, prep autosave
+< ./common.cmd
+
+iocInit()
+
+# Perform standard IOC post-init actions
+< ./postInit.cmd
+
+dbl > $(TOP)/records.dbl
+date
+
+# IOC kinetix-det1 completed startup
@@ -0,0 +1,7 @@
+#!/bin/bash
+
+export PVCAM_VERSION="$(cat /opt/pvcam/pvcam.version)"
+export PVCAM_UMD_PATH="/opt/pvcam/drivers/user-mode"
+export PVCAM_SDK_PATH="/opt/pvcam/sdk"
+
+cd iocBoot && ./st.cmd
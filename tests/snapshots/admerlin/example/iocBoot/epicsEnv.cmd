@@ -0,0 +1,46 @@
+
+< /epics/common/localhost-netsetup.cmd
+
+errlogInit(20000)
+
+epicsEnvSet("IOC", "admerlin")
+epicsEnvSet("IOC_DIR", "/epics/iocs")
+epicsEnvSet("TOP", "/epics/iocs/admerlin-01")
+epicsEnvSet("TEMPLATE_TOP", "/epics/modules/admerlin_f9b6b1b/iocs/merlinIOC")
+epicsEnvSet("HOSTNAME", "localhost")
+epicsEnvSet("IOCNAME", "admerlin-01")
+epicsEnvSet("ASYN", "/usr/lib/epics")
+epicsEnvSet("AUTOSAVE", "/usr/lib/epics")
+epicsEnvSet("BUSY", "/usr/lib/epics")
+epicsEnvSet("CALC", "/usr/lib/epics")
+epicsEnvSet("DEVIOCSTATS", "/usr/lib/epics")
+epicsEnvSet("SSCAN", "/usr/lib/epics")
+epicsEnvSet("STREAM", "/usr/lib/epics")
+epicsEnvSet("SNCSEQ", "/usr/lib/epics")
+epicsEnvSet("RECCASTER", "/usr/lib/epics")
+epicsEnvSet("EPICS_BASE", "/usr/lib/epics")
+epicsEnvSet("ADMERLIN", "/epics/modules/admerlin_f9b6b1b")
+epicsEnvSet("PORT", "ML")
+epicsEnvSet("QSIZE", "2048")
+epicsEnvSet("XSIZE", "512")
+epicsEnvSet("YSIZE", "512")
+epicsEnvSet("NCHANS", "2048")
+epicsEnvSet("CBUFFS", "8192")
+epicsEnvSet("MAX_THREADS", "8")
+epicsEnvSet("EPICS_DB_INCLUDE_PATH", "/epics/modules/adcore_5860bd3/db:/epics/modules/admerlin_f9b6b1b/db")
+epicsEnvSet("NELEMENTS", "10000000000")
+epicsEnvSet("COMMAND_PORT", "MLcmd")
+epicsEnvSet("DATA_PORT", "MLdata")
+epicsEnvSet("MOTOR", "/usr/lib/epics")
+epicsEnvSet("ADSUPPORT", "/epics/modules/adsupport_fe23754")
+epicsEnvSet("ADCORE", "/epics/modules/adcore_5860bd3")
+epicsEnvSet("ADCOMPVISION", "/epics/modules/adcompvision_9750d13")
+epicsEnvSet("ADPLUGINBAR", "/epics/modules/adpluginbar_448d96b")
+epicsEnvSet("FFMPEGSERVER", "/epics/modules/ffmpeg_server_07c570f")
+epicsEnvSet("ENGINEER", "C. Engineer")
+epicsEnvSet("PREFIX", "XF:31ID1-ES{ADMERLIN:01}")
+epicsEnvSet("MERLIN_IP", "12.34.56.78")
+epicsEnvSet("COMMAND_IPPORT", "6341")
+epicsEnvSet("DATA_IPPORT", "6342")
+epicsEnvSet("MODEL", "3")
+epicsEnvSet("NELEM", "262144")
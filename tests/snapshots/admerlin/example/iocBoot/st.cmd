@@ -0,0 +1,20 @@
+#!/epics/modules/admerlin_f9b6b1b/iocs/merlinIOC/bin/linux-x86_64/merlinApp
+
+# Perform base environment setup and configuration
+< ./epicsEnv.cmd
+
+# Load IOC specific startup configuration
+< ./base.cmd
+
+# Load any additional configured databases, prep autosave
+< ./common.cmd
+
+iocInit()
+
+# Perform standard IOC post-init actions
+< ./postInit.cmd
+
+dbl > $(TOP)/records.dbl
+date
+
+# IOC admerlin-01 completed startup
@@ -0,0 +1,18 @@
+
+dbLoadDatabase("/epics/modules/admythen_bcf2947/iocs/mythenIOC/dbd/mythenApp.dbd")
+mythenApp_registerRecordDeviceDriver(pdbbase)
+
+# admythen specific commands
+drvAsynIPPortConfigure("$(IP_PORT_NAME)", "$(MYTHEN_IP):$(MYTHEN_IP_PORT)", 0, 0, 1)
+
+asynOctetSetInputEos("$(IP_PORT_NAME)",0,"\r\n")
+asynOctetSetOutputEos("$(IP_PORT_NAME)",0,"\r")
+
+mythenConfig("$(PORT)", "$(IP_PORT_NAME)", -1,-1)
+
+dbLoadRecords("$(ADMYTHEN)/mythenApp/Db/mythen.template", "P=$(PREFIX),R=cam1:,PORT=$(PORT),ADDR=0,TIMEOUT=1")
+
+# Load asynRecord records on Mythen communication
+dbLoadRecords("$(ASYN)/db/asynRecord.db", "P=$(PREFIX),R=asyn_1,PORT=$(IP_PORT_NAME),ADDR=0,OMAX=256,IMAX=256")
+
+set_requestfile_path("$(TOP)/mythenApp/Db")
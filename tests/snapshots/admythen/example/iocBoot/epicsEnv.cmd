@@ -0,0 +1,43 @@
+
+< /epics/common/localhost-netsetup.cmd
+
+errlogInit(20000)
+
+epicsEnvSet("IOC", "admythen")
+epicsEnvSet("IOC_DIR", "/epics/iocs")
+epicsEnvSet("TOP", "/epics/iocs/admythen-01")
+epicsEnvSet("TEMPLATE_TOP", "/epics/modules/admythen_bcf2947/iocs/mythenIOC")
+epicsEnvSet("HOSTNAME", "localhost")
+epicsEnvSet("IOCNAME", "admythen-01")
+epicsEnvSet("ASYN", "/usr/lib/epics")
+epicsEnvSet("AUTOSAVE", "/usr/lib/epics")
+epicsEnvSet("BUSY", "/usr/lib/epics")
+epicsEnvSet("CALC", "/usr/lib/epics")
+epicsEnvSet("DEVIOCSTATS", "/usr/lib/epics")
+epicsEnvSet("SSCAN", "/usr/lib/epics")
+epicsEnvSet("STREAM", "/usr/lib/epics")
+epicsEnvSet("SNCSEQ", "/usr/lib/epics")
+epicsEnvSet("RECCASTER", "/usr/lib/epics")
+epicsEnvSet("EPICS_BASE", "/usr/lib/epics")
+epicsEnvSet("ADMYTHEN", "/epics/modules/admythen_bcf2947")
+epicsEnvSet("MYTHEN_IP", "192.168.0.90")
+epicsEnvSet("MYTHEN_IP_PORT", "1031")
+epicsEnvSet("IP_PORT_NAME", "MDS1_IP")
+epicsEnvSet("PORT", "MSD1")
+epicsEnvSet("QSIZE", "20")
+epicsEnvSet("XSIZE", "1280")
+epicsEnvSet("YSIZE", "1")
+epicsEnvSet("NCHANS", "1280")
+epicsEnvSet("CBUFFS", "100")
+epicsEnvSet("MAX_THREADS", "8")
+epicsEnvSet("EPICS_DB_INCLUDE_PATH", "/epics/modules/adcore_5860bd3/db:/epics/modules/admythen_bcf2947/db")
+epicsEnvSet("NELEMENTS", "5000000")
+epicsEnvSet("MOTOR", "/usr/lib/epics")
+epicsEnvSet("ADSUPPORT", "/epics/modules/adsupport_fe23754")
+epicsEnvSet("ADCORE", "/epics/modules/adcore_5860bd3")
+epicsEnvSet("ADCOMPVISION", "/epics/modules/adcompvision_9750d13")
+epicsEnvSet("ADPLUGINBAR", "/epics/modules/adpluginbar_448d96b")
+epicsEnvSet("FFMPEGSERVER", "/epics/modules/ffmpeg_server_07c570f")
+epicsEnvSet("ENGINEER", "C. Engineer")
+epicsEnvSet("PREFIX", "XF:31ID1-ES{ADMYTHEN:01}")
+epicsEnvSet("IP_PORT", "MDS1_IP")
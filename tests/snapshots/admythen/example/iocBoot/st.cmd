@@ -0,0 +1,20 @@
+#!/epics/modules/admythen_bcf2947/iocs/mythenIOC/bin/linux-x86_64/mythenApp
+
+# Perform base environment setup and configuration
+< ./epicsEnv.cmd
+
+# Load IOC specific startup configuration
+< ./base.cmd
+
+# Load any additional configured databases, prep autosave
+< ./common.cmd
+
+iocInit()
+
+# Perform standard IOC post-init actions
+< ./postInit.cmd
+
+dbl > $(TOP)/records.dbl
+date
+
+# IOC admythen-01 completed startup
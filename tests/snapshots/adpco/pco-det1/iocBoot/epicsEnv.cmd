@@ -0,0 +1,37 @@
+
+< /epics/common/localhost-netsetup.cmd
+
+errlogInit(20000)
+
+epicsEnvSet("IOC", "adpco")
+epicsEnvSet("IOC_DIR", "/epics/iocs")
+epicsEnvSet("TOP", "/epics/iocs/adpco-01")
+epicsEnvSet("TEMPLATE_TOP", "/epics/modules/adpco_b17fe13/iocs/pcoIOC")
+epicsEnvSet("HOSTNAME", "localhost")
+epicsEnvSet("IOCNAME", "adpco-01")
+epicsEnvSet("ASYN", "/usr/lib/epics")
+epicsEnvSet("AUTOSAVE", "/usr/lib/epics")
+epicsEnvSet("BUSY", "/usr/lib/epics")
+epicsEnvSet("CALC", "/usr/lib/epics")
+epicsEnvSet("DEVIOCSTATS", "/usr/lib/epics")
+epicsEnvSet("SSCAN", "/usr/lib/epics")
+epicsEnvSet("STREAM", "/usr/lib/epics")
+epicsEnvSet("SNCSEQ", "/usr/lib/epics")
+epicsEnvSet("RECCASTER", "/usr/lib/epics")
+epicsEnvSet("EPICS_BASE", "/usr/lib/epics")
+epicsEnvSet("CBUFFS", "500")
+epicsEnvSet("MAX_THREADS", "8")
+epicsEnvSet("NCHANS", "2048")
+epicsEnvSet("PORT", "PCO1")
+epicsEnvSet("QSIZE", "20")
+epicsEnvSet("NELEMENTS", "5000000")
+epicsEnvSet("EPICS_DB_INCLUDE_PATH", "/epics/modules/adcore_5860bd3/db")
+epicsEnvSet("MOTOR", "/usr/lib/epics")
+epicsEnvSet("ADSUPPORT", "/epics/modules/adsupport_fe23754")
+epicsEnvSet("ADCORE", "/epics/modules/adcore_5860bd3")
+epicsEnvSet("ADPCO", "/epics/modules/adpco_b17fe13")
+epicsEnvSet("ENGINEER", "C. Engineer")
+epicsEnvSet("PREFIX", "XF:31ID1-ES{PCO-Det:1}")
+epicsEnvSet("XSIZE", "2560")
+epicsEnvSet("YSIZE", "2160")
+epicsEnvSet("CAM_ID", "0")
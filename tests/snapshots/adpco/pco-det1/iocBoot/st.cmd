@@ -0,0 +1,20 @@
+#!/epics/modules/adpco_b17fe13/iocs/pcoIOC/bin/linux-x86_64/pcoApp
+
+# Perform base environment setup and configuration
+< ./epicsEnv.cmd
+
+# Load IOC specific startup configuration
+< ./base.cmd
+
+# Load any additional configured databases, prep autosave
+< ./common.cmd
+
+iocInit()
+
+# Perform standard IOC post-init actions
+< ./postInit.cmd
+
+dbl > $(TOP)/records.dbl
+date
+
+# IOC adpco-01 completed startup
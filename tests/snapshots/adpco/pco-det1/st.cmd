@@ -0,0 +1,5 @@
+#!/bin/bash
+
+export LD_LIBRARY_PATH="/opt/pco/pco.sdk/lib:/opt/pco/pco.cpp/lib"
+
+cd iocBoot && ./st.cmd
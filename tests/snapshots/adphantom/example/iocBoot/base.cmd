@@ -0,0 +1,44 @@
+dbLoadDatabase("/epics/modules/adphantom_afefafc/iocs/phantomIOC/dbd/phantomApp.dbd")
+phantomApp_registerRecordDeviceDriver(pdbbase)
+
+set_requestfile_path("$(ADCORE)/db:$(ADPHANTOM)/db")
+
+# Configure control and data TCP/IP socket connections. Default ports should be 7115 and 7116 respectively.
+drvAsynIPPortConfigure("CTRL", "$(CAMERA_IP):$(CTRL_PORT)", 100, 0, 0)
+drvAsynIPPortConfigure("DATA", "$(CAMERA_IP):$(DATA_PORT)", 100, 0, 0)
+
+# Configure the camera
+ADPhantomConfig("$(PORT)", "CTRL", "DATA", "$(MAC_ADDR)", "$(INTF)", 0, 0, 0, 0)
+
+# Enable debugging for certain functions
+#ADPhantomDebug("$(PORT)", "readoutDataStream", 1);
+
+asynSetTraceIOMask($(PORT), 0, 2)
+#asynSetTraceMask($(PORT), 0, 0xff)
+
+# Load base camera records
+dbLoadRecords("$(ADPHANTOM)/db/phantomCamera.template", "P=$(PREFIX),R=cam1:,PORT=$(PORT),ADDR=0,TIMEOUT=1")
+
+dbLoadRecords("$(ADPHANTOM)/db/phantomCine.template", "P=$(PREFIX),R=cam1:, CINE=1, PORT=$(PORT),ADDR=0,TIMEOUT=1")
+dbLoadRecords("$(ADPHANTOM)/db/phantomCine.template", "P=$(PREFIX),R=cam1:, CINE=2, PORT=$(PORT),ADDR=0,TIMEOUT=1")
+dbLoadRecords("$(ADPHANTOM)/db/phantomCine.template", "P=$(PREFIX),R=cam1:, CINE=3, PORT=$(PORT),ADDR=0,TIMEOUT=1")
+dbLoadRecords("$(ADPHANTOM)/db/phantomCine.template", "P=$(PREFIX),R=cam1:, CINE=4, PORT=$(PORT),ADDR=0,TIMEOUT=1")
+dbLoadRecords("$(ADPHANTOM)/db/phantomCine.template", "P=$(PREFIX),R=cam1:, CINE=5, PORT=$(PORT),ADDR=0,TIMEOUT=1")
+dbLoadRecords("$(ADPHANTOM)/db/phantomCine.template", "P=$(PREFIX),R=cam1:, CINE=6, PORT=$(PORT),ADDR=0,TIMEOUT=1")
+dbLoadRecords("$(ADPHANTOM)/db/phantomCine.template", "P=$(PREFIX),R=cam1:, CINE=7, PORT=$(PORT),ADDR=0,TIMEOUT=1")
+dbLoadRecords("$(ADPHANTOM)/db/phantomCine.template", "P=$(PREFIX),R=cam1:, CINE=8, PORT=$(PORT),ADDR=0,TIMEOUT=1")
+dbLoadRecords("$(ADPHANTOM)/db/phantomCine.template", "P=$(PREFIX),R=cam1:, CINE=9, PORT=$(PORT),ADDR=0,TIMEOUT=1")
+dbLoadRecords("$(ADPHANTOM)/db/phantomCine.template", "P=$(PREFIX),R=cam1:, CINE=10, PORT=$(PORT),ADDR=0,TIMEOUT=1")
+dbLoadRecords("$(ADPHANTOM)/db/phantomCine.template", "P=$(PREFIX),R=cam1:, CINE=11, PORT=$(PORT),ADDR=0,TIMEOUT=1")
+dbLoadRecords("$(ADPHANTOM)/db/phantomCine.template", "P=$(PREFIX),R=cam1:, CINE=12, PORT=$(PORT),ADDR=0,TIMEOUT=1")
+dbLoadRecords("$(ADPHANTOM)/db/phantomCine.template", "P=$(PREFIX),R=cam1:, CINE=13, PORT=$(PORT),ADDR=0,TIMEOUT=1")
+dbLoadRecords("$(ADPHANTOM)/db/phantomCine.template", "P=$(PREFIX),R=cam1:, CINE=14, PORT=$(PORT),ADDR=0,TIMEOUT=1")
+dbLoadRecords("$(ADPHANTOM)/db/phantomCine.template", "P=$(PREFIX),R=cam1:, CINE=15, PORT=$(PORT),ADDR=0,TIMEOUT=1")
+dbLoadRecords("$(ADPHANTOM)/db/phantomCine.template", "P=$(PREFIX),R=cam1:, CINE=16, PORT=$(PORT),ADDR=0,TIMEOUT=1")
+
+#
+# Create a standard arrays plugin, set it to get data from Driver.
+# int NDStdArraysConfigure(const char *portName, int queueSize, int blockingCallbacks, const char *NDArrayPort, int NDArrayAddr, int maxBuffers, size_t maxMemory,
+#                          int priority, int stackSize, int maxThreads)
+NDStdArraysConfigure("Image1", 3, 0, "$(PORT)", 0)
+dbLoadRecords("$(ADCORE)/db/NDStdArrays.template", "P=$(PREFIX),R=image1:,PORT=Image1,ADDR=0,NDARRAY_PORT=$(PORT),TIMEOUT=1,TYPE=Int16,FTVL=SHORT,NELEMENTS=6000000")
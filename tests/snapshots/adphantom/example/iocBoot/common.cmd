@@ -0,0 +1,23 @@
+# common.cmd
+
+
+
+# Load base set of plugins using commonPlugins.cmd
+< $(ADCORE)/iocBoot/commonPlugins.cmd
+
+
+# Load additional records standard for each IOC
+dbLoadRecords("$(EPICS_BASE)/db/iocAdminSoft.db", "IOC=$(PREFIX)")
+
+dbLoadRecords("$(EPICS_BASE)/db/save_restoreStatus.db", "P=$(PREFIX)")
+dbLoadRecords("$(EPICS_BASE)/db/reccaster.db", "P=$(PREFIX)RecSync")
+
+save_restoreSet_Debug(0)
+save_restoreSet_IncompleteSetsOk(1)
+save_restoreSet_DatedBackupFiles(1)
+
+set_savefile_path("$(TOP)/as/save")
+set_requestfile_path("$(TOP)/as/req")
+set_requestfile_path("$(EPICS_BASE)/req")
+
+save_restoreSet_status_prefix("$(PREFIX)")
@@ -0,0 +1,42 @@
+
+< /epics/common/localhost-netsetup.cmd
+
+errlogInit(20000)
+
+epicsEnvSet("IOC", "adphantom")
+epicsEnvSet("IOC_DIR", "/epics/iocs")
+epicsEnvSet("TOP", "/epics/iocs/ADPhantom")
+epicsEnvSet("TEMPLATE_TOP", "/epics/modules/adphantom_afefafc/iocs/phantomIOC")
+epicsEnvSet("HOSTNAME", "localhost")
+epicsEnvSet("IOCNAME", "ADPhantom")
+epicsEnvSet("ASYN", "/usr/lib/epics")
+epicsEnvSet("AUTOSAVE", "/usr/lib/epics")
+epicsEnvSet("BUSY", "/usr/lib/epics")
+epicsEnvSet("CALC", "/usr/lib/epics")
+epicsEnvSet("DEVIOCSTATS", "/usr/lib/epics")
+epicsEnvSet("SSCAN", "/usr/lib/epics")
+epicsEnvSet("STREAM", "/usr/lib/epics")
+epicsEnvSet("SNCSEQ", "/usr/lib/epics")
+epicsEnvSet("RECCASTER", "/usr/lib/epics")
+epicsEnvSet("EPICS_BASE", "/usr/lib/epics")
+epicsEnvSet("QSIZE", "20")
+epicsEnvSet("XSIZE", "1280")
+epicsEnvSet("YSIZE", "960")
+epicsEnvSet("NCHANS", "1280")
+epicsEnvSet("CBUFFS", "100")
+epicsEnvSet("MAX_THREADS", "8")
+epicsEnvSet("EPICS_DB_INCLUDE_PATH", "/epics/modules/adcore_5860bd3/db")
+epicsEnvSet("NELEMENTS", "5000000")
+epicsEnvSet("PORT", "PH1")
+epicsEnvSet("CTRL_PORT", "7115")
+epicsEnvSet("DATA_PORT", "7116")
+epicsEnvSet("MOTOR", "/usr/lib/epics")
+epicsEnvSet("ADSUPPORT", "/epics/modules/adsupport_fe23754")
+epicsEnvSet("ADCORE", "/epics/modules/adcore_5860bd3")
+epicsEnvSet("ADPHANTOM", "/epics/modules/adphantom_afefafc")
+epicsEnvSet("PREFIX", "XF:31ID1-ES{VEO:Cam-1}")
+epicsEnvSet("ENGINEER", "J. Wlodek")
+epicsEnvSet("MAC_ADDR", "1423f21fdeb0")
+epicsEnvSet("INTF", "eno5")
+epicsEnvSet("CAMERA_IP", "100.100.214.107")
+epicsEnvSet("NUM_CINES", "16")
@@ -0,0 +1,10 @@
+dbLoadDatabase("/epics/modules/adpicam_0d86fae/iocs/PICamIOC/dbd/ADPICamApp.dbd")
+ADPICamApp_registerRecordDeviceDriver(pdbbase)
+
+# adpicam specific commands
+
+PICamConfig("$(PORT)", 0, 0, 0, 0)
+
+asynSetTraceIOMask($(PORT), 0, 2)
+
+dbLoadRecords("$(ADPICAM)/db/PICam.template","P=$(PREFIX),R=cam1:,PORT=$(PORT),ADDR=0,TIMEOUT=1")
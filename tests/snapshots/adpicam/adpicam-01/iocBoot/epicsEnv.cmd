@@ -0,0 +1,39 @@
+
+< /epics/common/localhost-netsetup.cmd
+
+errlogInit(20000)
+
+epicsEnvSet("IOC", "adpicam")
+epicsEnvSet("IOC_DIR", "/epics/iocs")
+epicsEnvSet("TOP", "/epics/iocs/adpicam-01")
+epicsEnvSet("TEMPLATE_TOP", "/epics/modules/adpicam_0d86fae/iocs/PICamIOC")
+epicsEnvSet("HOSTNAME", "localhost")
+epicsEnvSet("IOCNAME", "adpicam-01")
+epicsEnvSet("ASYN", "/usr/lib/epics")
+epicsEnvSet("AUTOSAVE", "/usr/lib/epics")
+epicsEnvSet("BUSY", "/usr/lib/epics")
+epicsEnvSet("CALC", "/usr/lib/epics")
+epicsEnvSet("DEVIOCSTATS", "/usr/lib/epics")
+epicsEnvSet("SSCAN", "/usr/lib/epics")
+epicsEnvSet("STREAM", "/usr/lib/epics")
+epicsEnvSet("SNCSEQ", "/usr/lib/epics")
+epicsEnvSet("RECCASTER", "/usr/lib/epics")
+epicsEnvSet("EPICS_BASE", "/usr/lib/epics")
+epicsEnvSet("PORT", "PIC1")
+epicsEnvSet("QSIZE", "2048")
+epicsEnvSet("NCHANS", "2048")
+epicsEnvSet("CBUFFS", "8192")
+epicsEnvSet("MAX_THREADS", "8")
+epicsEnvSet("XSIZE", "2048")
+epicsEnvSet("YSIZE", "2048")
+epicsEnvSet("MOTOR", "/usr/lib/epics")
+epicsEnvSet("ADSUPPORT", "/epics/modules/adsupport_fe23754")
+epicsEnvSet("ADCORE", "/epics/modules/adcore_5860bd3")
+epicsEnvSet("ADCOMPVISION", "/epics/modules/adcompvision_9750d13")
+epicsEnvSet("ADPLUGINBAR", "/epics/modules/adpluginbar_448d96b")
+epicsEnvSet("FFMPEGSERVER", "/epics/modules/ffmpeg_server_07c570f")
+epicsEnvSet("ADPICAM", "/epics/modules/adpicam_0d86fae")
+epicsEnvSet("ENGINEER", "C. Engineer")
+epicsEnvSet("PREFIX", "XF:31ID1-ES{ADPICAM:01}")
+epicsEnvSet("NELEMENTS", "10000000000")
+epicsEnvSet("EPICS_DB_INCLUDE_PATH", "/epics/iocs/adpicam-01/db:/epics/modules/adsupport_fe23754/db:/epics/modules/adcore_5860bd3/db:/epics/modules/adcompvision_9750d13/db:/epics/modules/adpluginbar_448d96b/db:/epics/modules/ffmpeg_server_07c570f/db:/epics/modules/adpicam_0d86fae/db:/usr/lib/epics/db")
@@ -0,0 +1,20 @@
+#!/epics/modules/adpilatus_72c7844/iocs/pilatusIOC/bin/linux-x86_64/pilatusDetectorApp
+
+# Perform base environment setup and configuration
+< ./epicsEnv.cmd
+
+# Load IOC specific startup configuration
+< ./base.cmd
+
+# Load any additional configured databases, prep autosave
+< ./common.cmd
+
+iocInit()
+
+# Perform standard IOC post-init actions
+< ./postInit.cmd
+
+dbl > $(TOP)/records.dbl
+date
+
+# IOC det-pilatus01 completed startup
@@ -0,0 +1,32 @@
+
+< /epics/common/localhost-netsetup.cmd
+
+errlogInit(20000)
+
+epicsEnvSet("IOC", "adprosilica")
+epicsEnvSet("IOC_DIR", "/epics/iocs")
+epicsEnvSet("TOP", "/epics/iocs/cam-sp1")
+epicsEnvSet("TEMPLATE_TOP", "")
+epicsEnvSet("HOSTNAME", "localhost")
+epicsEnvSet("IOCNAME", "cam-sp1")
+epicsEnvSet("ASYN", "/usr/lib/epics")
+epicsEnvSet("AUTOSAVE", "/usr/lib/epics")
+epicsEnvSet("BUSY", "/usr/lib/epics")
+epicsEnvSet("CALC", "/usr/lib/epics")
+epicsEnvSet("DEVIOCSTATS", "/usr/lib/epics")
+epicsEnvSet("SSCAN", "/usr/lib/epics")
+epicsEnvSet("STREAM", "/usr/lib/epics")
+epicsEnvSet("SNCSEQ", "/usr/lib/epics")
+epicsEnvSet("RECCASTER", "/usr/lib/epics")
+epicsEnvSet("EPICS_BASE", "/usr/lib/epics")
+epicsEnvSet("PORT", "PS1")
+epicsEnvSet("MOTOR", "/usr/lib/epics")
+epicsEnvSet("ADSUPPORT", "/epics/modules/adsupport_fe23754")
+epicsEnvSet("ADCORE", "/epics/modules/adcore_5860bd3")
+epicsEnvSet("ADPROSILICA", "/epics/modules/adprosilica_9abb772")
+epicsEnvSet("PREFIX", "XF:31ID1-ES{Sample-Cam:1}")
+epicsEnvSet("ENGINEER", "J. Wlodek")
+epicsEnvSet("XSIZE", "1280")
+epicsEnvSet("YSIZE", "720")
+epicsEnvSet("CAMERA_ID", "xf31id1-cam1.nsls2.bnl.local")
+epicsEnvSet("EPICS_DB_INCLUDE_PATH", "/epics/iocs/cam-sp1/db:/epics/modules/adsupport_fe23754/db:/epics/modules/adcore_5860bd3/db:/epics/modules/adprosilica_9abb772/db:/usr/lib/epics/db")
@@ -0,0 +1,31 @@
+
+< /epics/common/localhost-netsetup.cmd
+
+errlogInit(20000)
+
+epicsEnvSet("IOC", "adscanpb")
+epicsEnvSet("IOC_DIR", "/epics/iocs")
+epicsEnvSet("TOP", "/epics/iocs/adscanpb-01")
+epicsEnvSet("TEMPLATE_TOP", "/epics/modules/adscanpb_f54e2c1/iocs/scanPBIOC")
+epicsEnvSet("HOSTNAME", "localhost")
+epicsEnvSet("IOCNAME", "adscanpb-01")
+epicsEnvSet("ASYN", "/usr/lib/epics")
+epicsEnvSet("AUTOSAVE", "/usr/lib/epics")
+epicsEnvSet("BUSY", "/usr/lib/epics")
+epicsEnvSet("CALC", "/usr/lib/epics")
+epicsEnvSet("DEVIOCSTATS", "/usr/lib/epics")
+epicsEnvSet("SSCAN", "/usr/lib/epics")
+epicsEnvSet("STREAM", "/usr/lib/epics")
+epicsEnvSet("SNCSEQ", "/usr/lib/epics")
+epicsEnvSet("RECCASTER", "/usr/lib/epics")
+epicsEnvSet("EPICS_BASE", "/usr/lib/epics")
+epicsEnvSet("MOTOR", "/usr/lib/epics")
+epicsEnvSet("ADSUPPORT", "/epics/modules/adsupport_fe23754")
+epicsEnvSet("ADCORE", "/epics/modules/adcore_5860bd3")
+epicsEnvSet("ADSCANPB", "/epics/modules/adscanpb_f54e2c1")
+epicsEnvSet("ENGINEER", "C. Engineer")
+epicsEnvSet("PREFIX", "XF:31ID1-ES{ADSCANPB:01}")
+epicsEnvSet("TRIGGER_SIGNAL", "XF:31ID1-ES{PANDA:1}:LUT1:OUT")
+epicsEnvSet("TILED_METADATA_URL", "https://tiled.nsls2.bnl.gov/api/v1/node/metadata")
+epicsEnvSet("TILED_ARRAY_URL", "https://tiled.nsls2.bnl.gov/api/v1/array/full")
+epicsEnvSet("EPICS_DB_INCLUDE_PATH", "/epics/iocs/adscanpb-01/db:/epics/modules/adsupport_fe23754/db:/epics/modules/adcore_5860bd3/db:/epics/modules/adscanpb_f54e2c1/db:/usr/lib/epics/db")
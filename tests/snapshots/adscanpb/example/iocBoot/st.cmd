@@ -0,0 +1,20 @@
+#!/epics/modules/adscanpb_f54e2c1/iocs/scanPBIOC/bin/linux-x86_64/scanPBApp
+
+# Perform base environment setup and configuration
+< ./epicsEnv.cmd
+
+# Load IOC specific startup configuration
+< ./base.cmd
+
+# Load any additional configured databases, prep autosave
+< ./common.cmd
+
+iocInit()
+
+# Perform standard IOC post-init actions
+< ./postInit.cmd
+
+dbl > $(TOP)/records.dbl
+date
+
+# IOC adscanpb-01 completed startup
@@ -0,0 +1,10 @@
+errlogInit(20000)
+
+dbLoadDatabase("/epics/modules/adsimdetector_4b236f4/iocs/simDetectorIOC/dbd/simDetectorApp.dbd")
+simDetectorApp_registerRecordDeviceDriver(pdbbase)
+
+simDetectorConfig("$(PORT)", "$(XSIZE)", "$(YSIZE)", 1, 0, 0)
+asynSetTraceIOMask($(PORT), 0, 2)
+
+# Main database
+dbLoadRecords("$(ADSIMDETECTOR)/db/simDetector.template","P=$(PREFIX),R=cam1:,PORT=$(PORT),ADDR=0,TIMEOUT=1")
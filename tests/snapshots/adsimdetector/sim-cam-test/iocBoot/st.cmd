@@ -0,0 +1,20 @@
+#!/epics/modules/adsimdetector_4b236f4/iocs/simDetectorIOC/bin/linux-x86_64/simDetectorApp
+
+# Perform base environment setup and configuration
+< ./epicsEnv.cmd
+
+# Load IOC specific startup configuration
+< ./base.cmd
+
+# Load any additional configured databases, prep autosave
+< ./common.cmd
+
+iocInit()
+
+# Perform standard IOC post-init actions
+< ./postInit.cmd
+
+dbl > $(TOP)/records.dbl
+date
+
+# IOC cam-sim1 completed startup
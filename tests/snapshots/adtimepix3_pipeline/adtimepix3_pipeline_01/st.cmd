@@ -0,0 +1,10 @@
+#!/bin/bash
+
+# Configure EPICS network environment variables
+export EPICS_CA_AUTO_ADDR_LIST=NO
+export EPICS_CAS_AUTO_BEACON_ADDR_LIST=NO
+export EPICS_CA_ADDR_LIST="127.0.0.1"
+export EPICS_CAS_BEACON_ADDR_LIST="127.0.0.1"
+
+# Start IOC here.
+pixi run python -m tpx3_pipeline.ioc --path "/nsls2/data/chx/assets/timepix" --prefix 'XF:11ID1-ES:TPX:PIPE:1:'
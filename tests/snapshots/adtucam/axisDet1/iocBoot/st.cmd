@@ -0,0 +1,20 @@
+#!/epics/modules/adtucam_c8c1685/iocs/tucamIOC/bin/linux-x86_64/tucamApp
+
+# Perform base environment setup and configuration
+< ./epicsEnv.cmd
+
+# Load IOC specific startup configuration
+< ./base.cmd
+
+# Load any additional configured databases, prep autosave
+< ./common.cmd
+
+iocInit()
+
+# Perform standard IOC post-init actions
+< ./postInit.cmd
+
+dbl > $(TOP)/records.dbl
+date
+
+# IOC axisDet1 completed startup
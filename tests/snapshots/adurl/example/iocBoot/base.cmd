@@ -0,0 +1,10 @@
+
+dbLoadDatabase("/epics/modules/adurl_1c725ed/iocs/urlIOC/dbd/URLDriverApp.dbd")
+URLDriverApp_registerRecordDeviceDriver(pdbbase)
+
+# adurl specific commands
+
+URLDriverConfig("$(PORT)", 0, 0)
+dbLoadRecords("$(ADURL)/db/URLDriver.template","P=$(PREFIX),R=cam1:,PORT=$(PORT),ADDR=0,TIMEOUT=1")
+
+set_requestfile_path("$(ADURL)/urlApp/Db")
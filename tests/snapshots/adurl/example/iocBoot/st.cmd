@@ -0,0 +1,20 @@
+#!/epics/modules/adurl_1c725ed/iocs/urlIOC/bin/linux-x86_64/URLDriverApp
+
+# Perform base environment setup and configuration
+< ./epicsEnv.cmd
+
+# Load IOC specific startup configuration
+< ./base.cmd
+
+# Load any additional configured databases, prep autosave
+< ./common.cmd
+
+iocInit()
+
+# Perform standard IOC post-init actions
+< ./postInit.cmd
+
+dbl > $(TOP)/records.dbl
+date
+
+# IOC adurl-01 completed startup
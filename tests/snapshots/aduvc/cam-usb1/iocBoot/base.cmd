@@ -0,0 +1,14 @@
+errlogInit(20000)
+
+dbLoadDatabase("/epics/modules/aduvc_86918b6/dbd/uvcApp.dbd")
+uvcApp_registerRecordDeviceDriver(pdbbase)
+
+ADUVCConfig("$(PORT)", "$(SERIAL_NUM_OR_PRODUCT_ID)")
+
+# Wait two seconds for ensuring camera initialized correctly
+epicsThreadSleep(2)
+
+asynSetTraceIOMask($(PORT), 0, 2)
+
+# Main database
+dbLoadRecords("$(ADUVC)/db/ADUVC.template", "P=$(PREFIX),R=cam1:,PORT=$(PORT)")
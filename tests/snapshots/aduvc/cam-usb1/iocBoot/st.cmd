@@ -0,0 +1,20 @@
+#!/epics/modules/aduvc_86918b6iocs/uvcIOC/bin/linux-x86_64/uvcApp
+
+# Perform base environment setup and configuration
+< ./epicsEnv.cmd
+
+# Load IOC specific startup configuration
+< ./base.cmd
+
+# Load any additional configured databases, prep autosave
+< ./common.cmd
+
+iocInit()
+
+# Perform standard IOC post-init actions
+< ./postInit.cmd
+
+dbl > $(TOP)/records.dbl
+date
+
+# IOC cam-usb1 completed startup
@@ -0,0 +1,43 @@
+
+< /epics/common/localhost-netsetup.cmd
+
+errlogInit(20000)
+
+epicsEnvSet("IOC", "advimba")
+epicsEnvSet("IOC_DIR", "/epics/iocs")
+epicsEnvSet("TOP", "/epics/iocs/cam-av1")
+epicsEnvSet("TEMPLATE_TOP", "/epics/modules/advimba_34686fe/iocs/vimbaIOC")
+epicsEnvSet("HOSTNAME", "localhost")
+epicsEnvSet("IOCNAME", "cam-av1")
+epicsEnvSet("ASYN", "/usr/lib/epics")
+epicsEnvSet("AUTOSAVE", "/usr/lib/epics")
+epicsEnvSet("BUSY", "/usr/lib/epics")
+epicsEnvSet("CALC", "/usr/lib/epics")
+epicsEnvSet("DEVIOCSTATS", "/usr/lib/epics")
+epicsEnvSet("SSCAN", "/usr/lib/epics")
+epicsEnvSet("STREAM", "/usr/lib/epics")
+epicsEnvSet("SNCSEQ", "/usr/lib/epics")
+epicsEnvSet("RECCASTER", "/usr/lib/epics")
+epicsEnvSet("EPICS_BASE", "/usr/lib/epics")
+epicsEnvSet("PORT", "VMB1")
+epicsEnvSet("QSIZE", "20")
+epicsEnvSet("NCHANS", "2048")
+epicsEnvSet("CBUFFS", "500")
+epicsEnvSet("MAX_THREADS", "8")
+epicsEnvSet("XSIZE", "1024")
+epicsEnvSet("YSIZE", "1024")
+epicsEnvSet("NELEMENTS", "500000")
+epicsEnvSet("GENICAM_GENTL64_PATH", "/epics/modules/advimba_34686fe/bin/linux-x86_64")
+epicsEnvSet("EPICS_DB_INCLUDE_PATH", "/epics/modules/adcore_5860bd3/db:/epics/modules/adgenicam_5d08a11/db")
+epicsEnvSet("MOTOR", "/usr/lib/epics")
+epicsEnvSet("ADSUPPORT", "/epics/modules/adsupport_fe23754")
+epicsEnvSet("ADCORE", "/epics/modules/adcore_5860bd3")
+epicsEnvSet("ADCOMPVISION", "/epics/modules/adcompvision_9750d13")
+epicsEnvSet("ADPLUGINBAR", "/epics/modules/adpluginbar_448d96b")
+epicsEnvSet("FFMPEGSERVER", "/epics/modules/ffmpeg_server_07c570f")
+epicsEnvSet("ADGENICAM", "/epics/modules/adgenicam_5d08a11")
+epicsEnvSet("ADVIMBA", "/epics/modules/advimba_34686fe")
+epicsEnvSet("PREFIX", "XF:31ID1-ES{GigE-Cam:1}")
+epicsEnvSet("ENGINEER", "J. Wlodek")
+epicsEnvSet("CAMERA_ID", "DEV_000F315DFEB9")
+epicsEnvSet("FFMSTREAM_PORT", "8080")
@@ -0,0 +1,11 @@
+
+dbLoadDatabase("/epics/modules/adxspd_986de77/iocs/xspdIOC/dbd/xspdApp.dbd")
+xspdApp_registerRecordDeviceDriver(pdbbase)
+
+# adxspd specific commands
+ADXSPDConfig("$(PORT)", "$(IP)", "$(PORT_NUM)", "$(DEVICE_ID)")
+
+dbLoadRecords("$(ADXSPD)/db/ADXSPD.template","P=$(PREFIX),R=cam1:,PORT=$(PORT),ADDR=0,TIMEOUT=1")
+dbLoadRecords("$(ADXSPD)/db/ADXSPDModule.template", "P=$(PREFIX), R=mod1:,PORT=$(PORT)_MOD1,ADDR=0,TIMEOUT=1")
+
+set_requestfile_path("$(ADXSPD)/xspdApp/Db")
@@ -0,0 +1,20 @@
+#!/epics/modules/adxspd_986de77/iocs/xspdIOC/bin/linux-x86_64/xspdApp
+
+# Perform base environment setup and configuration
+< ./epicsEnv.cmd
+
+# Load IOC specific startup configuration
+< ./base.cmd
+
+# Load any additional configured databases, prep autosave
+< ./common.cmd
+
+iocInit()
+
+# Perform standard IOC post-init actions
+< ./postInit.cmd
+
+dbl > $(TOP)/records.dbl
+date
+
+# IOC adxspd-01 completed startup
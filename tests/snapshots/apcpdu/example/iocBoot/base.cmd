@@ -0,0 +1,12 @@
+
+epicsEnvSet("MIBDIRS", "+$(BASESNMPIOC)/mibs:/var/lib/mibs/ietf/:/usr/share/mibs/ietf/:/usr/share/mibs/iana/")
+
+SNMP_DRV_DEBUG(0)
+
+dbLoadDatabase("/epics/modules/base_snmp_ioc_6548d01/dbd/snmp.dbd")
+snmp_registerRecordDeviceDriver(pdbbase)
+
+# apcpdu specific commands
+## Load record instances
+dbLoadRecords("$(BASESNMPIOC)/db/AP7900.db", "SYS=XF:31ID1-ES,DEV={PDU:1},IP=lab3-pdu1.nsls2.bnl.local")
+dbLoadRecords("$(BASESNMPIOC)/db/AP7900.db", "SYS=XF:31ID1-ES,DEV={PDU:2},IP=10.69.58.151")
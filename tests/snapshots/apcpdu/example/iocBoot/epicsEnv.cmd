@@ -0,0 +1,26 @@
+
+< /epics/common/localhost-netsetup.cmd
+
+errlogInit(20000)
+
+epicsEnvSet("IOC", "apcpdu")
+epicsEnvSet("IOC_DIR", "/epics/iocs")
+epicsEnvSet("TOP", "/epics/iocs/apcpdu-01")
+epicsEnvSet("TEMPLATE_TOP", "/epics/modules/base_snmp_ioc_6548d01")
+epicsEnvSet("HOSTNAME", "localhost")
+epicsEnvSet("IOCNAME", "apcpdu-01")
+epicsEnvSet("ASYN", "/usr/lib/epics")
+epicsEnvSet("AUTOSAVE", "/usr/lib/epics")
+epicsEnvSet("BUSY", "/usr/lib/epics")
+epicsEnvSet("CALC", "/usr/lib/epics")
+epicsEnvSet("DEVIOCSTATS", "/usr/lib/epics")
+epicsEnvSet("SSCAN", "/usr/lib/epics")
+epicsEnvSet("STREAM", "/usr/lib/epics")
+epicsEnvSet("SNCSEQ", "/usr/lib/epics")
+epicsEnvSet("RECCASTER", "/usr/lib/epics")
+epicsEnvSet("EPICS_BASE", "/usr/lib/epics")
+epicsEnvSet("MOTOR", "/usr/lib/epics")
+epicsEnvSet("BASESNMPIOC", "/epics/modules/base_snmp_ioc_6548d01")
+epicsEnvSet("ENGINEER", "C. Engineer")
+epicsEnvSet("PREFIX", "XF:31ID1-ES{APCPDU-IOC:01}")
+epicsEnvSet("EPICS_DB_INCLUDE_PATH", "/epics/iocs/apcpdu-01/db:/epics/modules/base_snmp_ioc_6548d01/db:/usr/lib/epics/db")
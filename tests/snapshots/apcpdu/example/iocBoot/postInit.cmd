@@ -0,0 +1,12 @@
+
+cd $(TOP)/as/req
+
+makeAutosaveFiles()
+create_monitor_set("info_settings.req", 30, "")
+create_monitor_set("info_positions.req", 10, "")
+
+create_monitor_set("info_settings.req", 30, "")
+create_monitor_set("info_positions.req", 30, "")
+
+
+cd $(TOP)
@@ -0,0 +1,2 @@
+dbLoadDatabase("/epics/modules/base_soft_ioc_f4c87af/dbd/baseSoftIOC.dbd")
+baseSoftIOC_registerRecordDeviceDriver(pdbbase)
@@ -0,0 +1,28 @@
+# common.cmd
+
+# Load any additional specified databases.
+dbLoadTemplate("$(TOP)/db/test-gen-fixed-params.substitutions")
+dbLoadTemplate("$(TOP)/db/test-gen-variable-params.substitutions", "P=$(SYS),DEV=$(DEV)")
+
+dbLoadTemplate("$(TOP)/db/test.substitutions")
+
+
+# Load additional records standard for each IOC
+dbLoadRecords("$(EPICS_BASE)/db/iocAdminSoft.db", "IOC=$(CT_PREFIX)")
+
+dbLoadRecords("$(EPICS_BASE)/db/save_restoreStatus.db", "P=$(CT_PREFIX)")
+dbLoadRecords("$(EPICS_BASE)/db/reccaster.db", "P=$(CT_PREFIX)RecSync")
+
+save_restoreSet_Debug(0)
+save_restoreSet_IncompleteSetsOk(1)
+save_restoreSet_DatedBackupFiles(1)
+
+set_savefile_path("$(TOP)/as/save")
+set_requestfile_path("$(TOP)/as/req")
+set_requestfile_path("$(EPICS_BASE)/req")
+
+set_pass0_restoreFile("info_positions.sav")
+set_pass0_restoreFile("info_settings.sav")
+set_pass1_restoreFile("info_settings.sav")
+
+save_restoreSet_status_prefix("$(CT_PREFIX)")
@@ -0,0 +1,29 @@
+
+< /epics/common/localhost-netsetup.cmd
+
+errlogInit(20000)
+
+epicsEnvSet("IOC", "base_soft_ioc")
+epicsEnvSet("IOC_DIR", "/epics/iocs")
+epicsEnvSet("TOP", "/epics/iocs/base-soft-ioc-01")
+epicsEnvSet("TEMPLATE_TOP", "/epics/modules/base_soft_ioc_f4c87af")
+epicsEnvSet("HOSTNAME", "localhost")
+epicsEnvSet("IOCNAME", "base-soft-ioc-01")
+epicsEnvSet("ASYN", "/usr/lib/epics")
+epicsEnvSet("AUTOSAVE", "/usr/lib/epics")
+epicsEnvSet("BUSY", "/usr/lib/epics")
+epicsEnvSet("CALC", "/usr/lib/epics")
+epicsEnvSet("DEVIOCSTATS", "/usr/lib/epics")
+epicsEnvSet("SSCAN", "/usr/lib/epics")
+epicsEnvSet("STREAM", "/usr/lib/epics")
+epicsEnvSet("SNCSEQ", "/usr/lib/epics")
+epicsEnvSet("RECCASTER", "/usr/lib/epics")
+epicsEnvSet("EPICS_BASE", "/usr/lib/epics")
+epicsEnvSet("MOTOR", "/usr/lib/epics")
+epicsEnvSet("BASESOFTIOC", "/epics/modules/base_soft_ioc_f4c87af")
+epicsEnvSet("ENGINEER", "C. Engineer")
+epicsEnvSet("SYS", "TEST")
+epicsEnvSet("DEV", "{PRM:VAR}")
+epicsEnvSet("PREFIX", "TEST{PRM:VAR}")
+epicsEnvSet("CT_PREFIX", "TEST{IOC:1}")
+epicsEnvSet("EPICS_DB_INCLUDE_PATH", "/epics/iocs/base-soft-ioc-01/db:/epics/modules/base_soft_ioc_f4c87af/db:/usr/lib/epics/db")
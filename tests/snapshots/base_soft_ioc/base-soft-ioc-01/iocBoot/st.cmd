@@ -0,0 +1,20 @@
+#!/epics/modules/base_soft_ioc_f4c87af/bin/linux-x86_64/baseSoftIOC
+
+# Perform base environment setup and configuration
+< ./epicsEnv.cmd
+
+# Load IOC specific startup configuration
+< ./base.cmd
+
+# Load any additional configured databases, prep autosave
+< ./common.cmd
+
+iocInit()
+
+# Perform standard IOC post-init actions
+< ./postInit.cmd
+
+dbl > $(TOP)/records.dbl
+date
+
+# IOC base-soft-ioc-01 completed startup
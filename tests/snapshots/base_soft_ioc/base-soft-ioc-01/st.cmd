@@ -0,0 +1,4 @@
+#!/bin/bash
+
+
+cd iocBoot && ./st.cmd
@@ -0,0 +1,43 @@
+< /epics/common/localhost-netsetup.cmd
+
+errlogInit(20000)
+
+epicsEnvSet("IOC", "bltiming")
+epicsEnvSet("IOC_DIR", "/epics/iocs")
+epicsEnvSet("TOP", "/epics/iocs/bltiming-01")
+epicsEnvSet("TEMPLATE_TOP", "/epics/iocs/epics-mrf-master")
+epicsEnvSet("HOSTNAME", "localhost")
+epicsEnvSet("IOCNAME", "bltiming-01")
+epicsEnvSet("ASYN", "/usr/lib/epics")
+epicsEnvSet("AUTOSAVE", "/usr/lib/epics")
+epicsEnvSet("BUSY", "/usr/lib/epics")
+epicsEnvSet("CALC", "/usr/lib/epics")
+epicsEnvSet("DEVIOCSTATS", "/usr/lib/epics")
+epicsEnvSet("SSCAN", "/usr/lib/epics")
+epicsEnvSet("STREAM", "/usr/lib/epics")
+epicsEnvSet("SNCSEQ", "/usr/lib/epics")
+epicsEnvSet("RECCASTER", "/usr/lib/epics")
+epicsEnvSet("EPICS_BASE", "/usr/lib/epics")
+epicsEnvSet("MOTOR", "/usr/lib/epics")
+epicsEnvSet("ELAUNCHER", "/epics/modules/elauncher_21dede8")
+epicsEnvSet("ENGINEER", "R. Rainer")
+epicsEnvSet("CELL", "XF31")
+epicsEnvSet("AC", "#")
+epicsEnvSet("AS", "#")
+epicsEnvSet("AS0", "#")
+epicsEnvSet("AS1", "#")
+epicsEnvSet("ASR", "#")
+epicsEnvSet("caputLog", "#")
+epicsEnvSet("dbl", "")
+epicsEnvSet("MAC", "00:0e:b2:00:08:e3")
+epicsEnvSet("IP", "10.69.58.27")
+epicsEnvSet("NET", "LOB1-LAB3")
+epicsEnvSet("PORT", "26")
+epicsEnvSet("LOC", "Controls Lab 03")
+epicsEnvSet("RACK", "DET POOL")
+epicsEnvSet("TYPE", "EVG")
+epicsEnvSet("P", "XF:XF31")
+epicsEnvSet("R", "{EVG}")
+epicsEnvSet("D", "EVG")
+epicsEnvSet("PREFIX", "XF:XF31{EVG}")
+epicsEnvSet("EPICS_DB_INCLUDE_PATH", "/epics/iocs/bltiming-01/db:/epics/modules/elauncher_21dede8/db:/usr/lib/epics/db")
@@ -0,0 +1,33 @@
+#!/epics/iocs/epics-mrf-master/bin/linux-x86_64/top
+
+< ./epicsEnv.cmd
+
+# EVG Mode
+epicsEnvSet("EVG-Mode", "")
+epicsEnvSet("EVR-Mode", "# NO EVR!!! ")
+epicsEnvSet("TYPE", "EVG")
+
+epicsEnvSet("HAS_REAR_TRANSITION_BOARD", "0")
+
+epicsEnvSet("UO_01", "$(HAS_REAR_TRANSITION_BOARD)")		#
+epicsEnvSet("UO_23", "$(HAS_REAR_TRANSITION_BOARD)")		#
+epicsEnvSet("UO_01FD", "$(HAS_REAR_TRANSITION_BOARD)")		#
+epicsEnvSet("UO_23FD", "$(HAS_REAR_TRANSITION_BOARD)")		#
+epicsEnvSet("UI_01", "$(HAS_REAR_TRANSITION_BOARD)")		#
+epicsEnvSet("UI_23", "$(HAS_REAR_TRANSITION_BOARD)")		#
+epicsEnvSet("UI_01FD", "$(HAS_REAR_TRANSITION_BOARD)")		#
+epicsEnvSet("UI_23FD", "$(HAS_REAR_TRANSITION_BOARD)")		#
+epicsEnvSet("TB_01", "$(HAS_REAR_TRANSITION_BOARD)")		# Rear Transition Board
+epicsEnvSet("TB_23", "$(HAS_REAR_TRANSITION_BOARD)")		# is NOT installed. Therefore,
+epicsEnvSet("TB_45", "$(HAS_REAR_TRANSITION_BOARD)")		# these are all 0.
+epicsEnvSet("TB_67", "$(HAS_REAR_TRANSITION_BOARD)")		#
+epicsEnvSet("TB_89", "$(HAS_REAR_TRANSITION_BOARD)")		#
+epicsEnvSet("TB_1011", "$(HAS_REAR_TRANSITION_BOARD)")		#
+epicsEnvSet("TB_1213", "$(HAS_REAR_TRANSITION_BOARD)")		#
+epicsEnvSet("TB_1415", "$(HAS_REAR_TRANSITION_BOARD)")		#
+
+# Load the commonSt.cmd file
+< /epics/iocs/epics-mrf-master/commonSt.cmd
+
+# Load the commonInit.cmd file
+< /epics/iocs/epics-mrf-master/commonInitWithAutoSave.cmd
@@ -0,0 +1,164 @@
+## Register all support components
+dbLoadDatabase("/epics/modules/caparoc_c426a13/dbd/caparoc.dbd")
+caparoc_registerRecordDeviceDriver(pdbbase)
+
+# Configure the low level communication port
+drvAsynIPPortConfigure("$(CB_ASYNPORT)","$(HOST):502", 0, 0, 1)
+modbusInterposeConfig("$(CB_ASYNPORT)", 0, 2000, 0)
+
+# Configure circuit breakers
+
+epicsEnvSet("PORT_NAME","${CB_ASYNPORT}_ERR_RST")
+epicsEnvSet("MODBUS_FUNC", "16")
+epicsEnvSet("START_ADDR", "272")
+epicsEnvSet("MODBUS_LEN", "4")
+epicsEnvSet("DATA_TYPE", "UINT16")
+
+drvModbusAsynConfigure("$(PORT_NAME)", "$(CB_ASYNPORT)", 0, $(MODBUS_FUNC), $(START_ADDR), $(MODBUS_LEN), "$(DATA_TYPE)", 100, "caparoc")
+
+
+epicsEnvSet("PORT_NAME","${CB_ASYNPORT}_ERR_CNT_RST")
+epicsEnvSet("MODBUS_FUNC", "16")
+epicsEnvSet("START_ADDR", "288")
+epicsEnvSet("MODBUS_LEN", "13")
+epicsEnvSet("DATA_TYPE", "UINT16")
+
+drvModbusAsynConfigure("$(PORT_NAME)", "$(CB_ASYNPORT)", 0, $(MODBUS_FUNC), $(START_ADDR), $(MODBUS_LEN), "$(DATA_TYPE)", 100, "caparoc")
+
+
+epicsEnvSet("PORT_NAME","${CB_ASYNPORT}_MOD_NUM")
+epicsEnvSet("MODBUS_FUNC", "3")
+epicsEnvSet("START_ADDR", "8192")
+epicsEnvSet("MODBUS_LEN", "1")
+epicsEnvSet("DATA_TYPE", "UINT16")
+
+drvModbusAsynConfigure("$(PORT_NAME)", "$(CB_ASYNPORT)", 0, $(MODBUS_FUNC), $(START_ADDR), $(MODBUS_LEN), "$(DATA_TYPE)", 100, "caparoc")
+
+
+epicsEnvSet("PORT_NAME","${CB_ASYNPORT}_CHAN_NUM")
+epicsEnvSet("MODBUS_FUNC", "3")
+epicsEnvSet("START_ADDR", "8193")
+epicsEnvSet("MODBUS_LEN", "4")
+epicsEnvSet("DATA_TYPE", "UINT16")
+
+drvModbusAsynConfigure("$(PORT_NAME)", "$(CB_ASYNPORT)", 0, $(MODBUS_FUNC), $(START_ADDR), $(MODBUS_LEN), "$(DATA_TYPE)", 100, "caparoc")
+
+
+epicsEnvSet("PORT_NAME","${CB_ASYNPORT}_MIN_NOM_I")
+epicsEnvSet("MODBUS_FUNC", "3")
+epicsEnvSet("START_ADDR", "8224")
+epicsEnvSet("MODBUS_LEN", "13")
+epicsEnvSet("DATA_TYPE", "UINT16")
+
+drvModbusAsynConfigure("$(PORT_NAME)", "$(CB_ASYNPORT)", 0, $(MODBUS_FUNC), $(START_ADDR), $(MODBUS_LEN), "$(DATA_TYPE)", 100, "caparoc")
+
+
+epicsEnvSet("PORT_NAME","${CB_ASYNPORT}_MAX_NOM_I")
+epicsEnvSet("MODBUS_FUNC", "3")
+epicsEnvSet("START_ADDR", "8288")
+epicsEnvSet("MODBUS_LEN", "13")
+epicsEnvSet("DATA_TYPE", "UINT16")
+
+drvModbusAsynConfigure("$(PORT_NAME)", "$(CB_ASYNPORT)", 0, $(MODBUS_FUNC), $(START_ADDR), $(MODBUS_LEN), "$(DATA_TYPE)", 100, "caparoc")
+
+
+epicsEnvSet("PORT_NAME","${CB_ASYNPORT}_GLB_STS")
+epicsEnvSet("MODBUS_FUNC", "3")
+epicsEnvSet("START_ADDR", "24576")
+epicsEnvSet("MODBUS_LEN", "1")
+epicsEnvSet("DATA_TYPE", "UINT16")
+
+drvModbusAsynConfigure("$(PORT_NAME)", "$(CB_ASYNPORT)", 0, $(MODBUS_FUNC), $(START_ADDR), $(MODBUS_LEN), "$(DATA_TYPE)", 100, "caparoc")
+
+
+epicsEnvSet("PORT_NAME","${CB_ASYNPORT}_SYS_INP1")
+epicsEnvSet("MODBUS_FUNC", "3")
+epicsEnvSet("START_ADDR", "24577")
+epicsEnvSet("MODBUS_LEN", "2")
+epicsEnvSet("DATA_TYPE", "UINT16")
+
+drvModbusAsynConfigure("$(PORT_NAME)", "$(CB_ASYNPORT)", 0, $(MODBUS_FUNC), $(START_ADDR), $(MODBUS_LEN), "$(DATA_TYPE)", 100, "caparoc")
+
+
+epicsEnvSet("PORT_NAME","${CB_ASYNPORT}_SYS_INP2")
+epicsEnvSet("MODBUS_FUNC", "3")
+epicsEnvSet("START_ADDR", "24581")
+epicsEnvSet("MODBUS_LEN", "5")
+epicsEnvSet("DATA_TYPE", "UINT16")
+
+drvModbusAsynConfigure("$(PORT_NAME)", "$(CB_ASYNPORT)", 0, $(MODBUS_FUNC), $(START_ADDR), $(MODBUS_LEN), "$(DATA_TYPE)", 100, "caparoc")
+
+
+epicsEnvSet("PORT_NAME","${CB_ASYNPORT}_CHAN_STS")
+epicsEnvSet("MODBUS_FUNC", "3")
+epicsEnvSet("START_ADDR", "24592")
+epicsEnvSet("MODBUS_LEN", "13")
+epicsEnvSet("DATA_TYPE", "UINT16")
+
+drvModbusAsynConfigure("$(PORT_NAME)", "$(CB_ASYNPORT)", 0, $(MODBUS_FUNC), $(START_ADDR), $(MODBUS_LEN), "$(DATA_TYPE)", 100, "caparoc")
+
+
+epicsEnvSet("PORT_NAME","${CB_ASYNPORT}_I_LOAD")
+epicsEnvSet("MODBUS_FUNC", "3")
+epicsEnvSet("START_ADDR", "24656")
+epicsEnvSet("MODBUS_LEN", "13")
+epicsEnvSet("DATA_TYPE", "UINT16")
+
+drvModbusAsynConfigure("$(PORT_NAME)", "$(CB_ASYNPORT)", 0, $(MODBUS_FUNC), $(START_ADDR), $(MODBUS_LEN), "$(DATA_TYPE)", 100, "caparoc")
+
+
+epicsEnvSet("PORT_NAME","${CB_ASYNPORT}_ERR_CNT")
+epicsEnvSet("MODBUS_FUNC", "3")
+epicsEnvSet("START_ADDR", "24720")
+epicsEnvSet("MODBUS_LEN", "13")
+epicsEnvSet("DATA_TYPE", "UINT16")
+
+drvModbusAsynConfigure("$(PORT_NAME)", "$(CB_ASYNPORT)", 0, $(MODBUS_FUNC), $(START_ADDR), $(MODBUS_LEN), "$(DATA_TYPE)", 100, "caparoc")
+
+
+epicsEnvSet("PORT_NAME","${CB_ASYNPORT}_CTRL_CHAN_STS")
+epicsEnvSet("MODBUS_FUNC", "3")
+epicsEnvSet("START_ADDR", "49168")
+epicsEnvSet("MODBUS_LEN", "13")
+epicsEnvSet("DATA_TYPE", "UINT16")
+
+drvModbusAsynConfigure("$(PORT_NAME)", "$(CB_ASYNPORT)", 0, $(MODBUS_FUNC), $(START_ADDR), $(MODBUS_LEN), "$(DATA_TYPE)", 100, "caparoc")
+
+
+epicsEnvSet("PORT_NAME","${CB_ASYNPORT}_CTRL_CHAN_CMD")
+epicsEnvSet("MODBUS_FUNC", "16")
+epicsEnvSet("START_ADDR", "49168")
+epicsEnvSet("MODBUS_LEN", "13")
+epicsEnvSet("DATA_TYPE", "UINT16")
+
+drvModbusAsynConfigure("$(PORT_NAME)", "$(CB_ASYNPORT)", 0, $(MODBUS_FUNC), $(START_ADDR), $(MODBUS_LEN), "$(DATA_TYPE)", 100, "caparoc")
+
+
+epicsEnvSet("PORT_NAME","${CB_ASYNPORT}_NOM_I_RB")
+epicsEnvSet("MODBUS_FUNC", "3")
+epicsEnvSet("START_ADDR", "49232")
+epicsEnvSet("MODBUS_LEN", "13")
+epicsEnvSet("DATA_TYPE", "UINT16")
+
+drvModbusAsynConfigure("$(PORT_NAME)", "$(CB_ASYNPORT)", 0, $(MODBUS_FUNC), $(START_ADDR), $(MODBUS_LEN), "$(DATA_TYPE)", 100, "caparoc")
+
+
+epicsEnvSet("PORT_NAME","${CB_ASYNPORT}_NOM_I_SP")
+epicsEnvSet("MODBUS_FUNC", "16")
+epicsEnvSet("START_ADDR", "49232")
+epicsEnvSet("MODBUS_LEN", "13")
+epicsEnvSet("DATA_TYPE", "UINT16")
+
+drvModbusAsynConfigure("$(PORT_NAME)", "$(CB_ASYNPORT)", 0, $(MODBUS_FUNC), $(START_ADDR), $(MODBUS_LEN), "$(DATA_TYPE)", 100, "caparoc")
+
+
+epicsEnvSet("PORT_NAME","${CB_ASYNPORT}_MOD_NAME")
+epicsEnvSet("MODBUS_FUNC", "3")
+epicsEnvSet("START_ADDR", "4096")
+epicsEnvSet("MODBUS_LEN", "80")
+epicsEnvSet("DATA_TYPE", "STRING_HIGH_LOW")
+
+drvModbusAsynConfigure("$(PORT_NAME)", "$(CB_ASYNPORT)", 0, $(MODBUS_FUNC), $(START_ADDR), $(MODBUS_LEN), "$(DATA_TYPE)", 100, "caparoc")
+
+
+dbLoadRecords("$(CAPAROC)/db/caparoc_cb.db","Sys=$(SYS), Dev=$(DEV), ASYNPORT=$(CB_ASYNPORT)")
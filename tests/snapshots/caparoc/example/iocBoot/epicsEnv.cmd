@@ -0,0 +1,31 @@
+
+< /epics/common/localhost-netsetup.cmd
+
+errlogInit(20000)
+
+epicsEnvSet("IOC", "caparoc")
+epicsEnvSet("IOC_DIR", "/epics/iocs")
+epicsEnvSet("TOP", "/epics/iocs/caparoc-01")
+epicsEnvSet("TEMPLATE_TOP", "/epics/modules/caparoc_c426a13")
+epicsEnvSet("HOSTNAME", "localhost")
+epicsEnvSet("IOCNAME", "caparoc-01")
+epicsEnvSet("ASYN", "/usr/lib/epics")
+epicsEnvSet("AUTOSAVE", "/usr/lib/epics")
+epicsEnvSet("BUSY", "/usr/lib/epics")
+epicsEnvSet("CALC", "/usr/lib/epics")
+epicsEnvSet("DEVIOCSTATS", "/usr/lib/epics")
+epicsEnvSet("SSCAN", "/usr/lib/epics")
+epicsEnvSet("STREAM", "/usr/lib/epics")
+epicsEnvSet("SNCSEQ", "/usr/lib/epics")
+epicsEnvSet("RECCASTER", "/usr/lib/epics")
+epicsEnvSet("EPICS_BASE", "/usr/lib/epics")
+epicsEnvSet("EPICS_DB_INCLUDE_PATH", "/epics/modules/caparoc_c426a13/db")
+epicsEnvSet("MOTOR", "/usr/lib/epics")
+epicsEnvSet("MODBUS", "/epics/modules/modbus_bb9fa05")
+epicsEnvSet("CAPAROC", "/epics/modules/caparoc_c426a13")
+epicsEnvSet("SYS", "XF:31ID1-ES")
+epicsEnvSet("DEV", "{CAPAROC:1}")
+epicsEnvSet("HOST", "10.69.58.102")
+epicsEnvSet("CB_ASYNPORT", "CAPAROC1")
+epicsEnvSet("PREFIX", "XF:31ID1-CT{IOC:CAPAROC1}")
+epicsEnvSet("ENGINEER", "Engineer Name")
@@ -0,0 +1,12 @@
+#!/bin/linux-x86_64/
+
+epicsEnvSet("CT_PREFIX", "XF:31ID1-CT")
+epicsEnvSet("BEAMLINE", "31id1")
+
+< /epics/common/localhost-netsetup.cmd
+
+dbLoadRecords("cas-switch.db", "CT_PREFIX=$(CT_PREFIX)")
+
+asSetFilename("/epics/common/bl-cas/bl-cas/$(BEAMLINE)/cas-switch.acf")
+
+iocInit()
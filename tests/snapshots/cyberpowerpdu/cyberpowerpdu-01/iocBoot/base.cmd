@@ -0,0 +1,10 @@
+epicsEnvSet("MIBDIRS", "$(TOP)/mibs:/var/lib/snmp/mibs/ietf:/var/lib/snmp/mibs/iana:/usr/share/snmp/mibs")
+
+SNMP_DRV_DEBUG(0)
+
+dbLoadDatabase("/epics/modules/snmp-bnl/dbd/snmp.dbd")
+snmp_registerRecordDeviceDriver(pdbbase)
+
+# cyberpowerpdu specific commands
+dbLoadTemplate("$(TOP)/db/cyberpdu.substitutions")
+dbLoadTemplate("$(TOP)/db/cyberpdu_outlet.substitutions")
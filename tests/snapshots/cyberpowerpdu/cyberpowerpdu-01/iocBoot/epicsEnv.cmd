@@ -0,0 +1,31 @@
+
+< /epics/common/localhost-netsetup.cmd
+
+errlogInit(20000)
+
+epicsEnvSet("IOC", "cyberpowerpdu")
+epicsEnvSet("IOC_DIR", "/epics/iocs")
+epicsEnvSet("TOP", "/epics/iocs/cyberpowerpdu-01")
+epicsEnvSet("TEMPLATE_TOP", "/epics/modules/snmp-bnl")
+epicsEnvSet("HOSTNAME", "localhost")
+epicsEnvSet("IOCNAME", "cyberpowerpdu-01")
+epicsEnvSet("ASYN", "/usr/lib/epics")
+epicsEnvSet("AUTOSAVE", "/usr/lib/epics")
+epicsEnvSet("BUSY", "/usr/lib/epics")
+epicsEnvSet("CALC", "/usr/lib/epics")
+epicsEnvSet("DEVIOCSTATS", "/usr/lib/epics")
+epicsEnvSet("SSCAN", "/usr/lib/epics")
+epicsEnvSet("STREAM", "/usr/lib/epics")
+epicsEnvSet("SNCSEQ", "/usr/lib/epics")
+epicsEnvSet("RECCASTER", "/usr/lib/epics")
+epicsEnvSet("EPICS_BASE", "/usr/lib/epics")
+epicsEnvSet("SNMP", "/epics/modules/snmp-bnl")
+epicsEnvSet("MOTOR", "/usr/lib/epics")
+epicsEnvSet("SNMP_BNL", "/epics/modules/snmp_bnl_ba2b0ef")
+epicsEnvSet("SYS", "XF:31ID-CT")
+epicsEnvSet("DEV", "{PDU:3}")
+epicsEnvSet("IP", "127.0.0.1")
+epicsEnvSet("PREFIX", "XF:31ID1-ES{PDU:3}")
+epicsEnvSet("CT_PREFIX", "XF:31ID-CT{PDU:3}")
+epicsEnvSet("ENGINEER", "J. Wlodek")
+epicsEnvSet("EPICS_DB_INCLUDE_PATH", "/epics/iocs/cyberpowerpdu-01/db:/epics/modules/snmp_bnl_ba2b0ef/db:/usr/lib/epics/db")
@@ -0,0 +1,10 @@
+
+dbLoadDatabase("/epics/modules/egunplc_4d595bf/dbd/eguns7.dbd")
+eguns7_registerRecordDeviceDriver(pdbbase)
+
+# eguns7 specific commands
+#s7plcConfigure("PLCname", "IPaddr", port, inSize, outSize, bigEndian, recvTimeout, sendInterval)
+s7plcConfigure("$(PLC_NAME)","$(IP_ADDR)", 2000, 176, 88, 1, 5000, 100)
+
+## Load PLC record instances
+dbLoadRecords("$(EGUNPLC)/db/es.db" ,"P=Egun-Test:")
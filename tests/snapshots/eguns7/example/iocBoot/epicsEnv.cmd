@@ -0,0 +1,28 @@
+
+< /epics/common/localhost-netsetup.cmd
+
+errlogInit(20000)
+
+epicsEnvSet("IOC", "eguns7")
+epicsEnvSet("IOC_DIR", "/epics/iocs")
+epicsEnvSet("TOP", "/epics/iocs/egun-s7plc-01")
+epicsEnvSet("TEMPLATE_TOP", "/epics/modules/egunplc_4d595bf")
+epicsEnvSet("HOSTNAME", "localhost")
+epicsEnvSet("IOCNAME", "egun-s7plc-01")
+epicsEnvSet("ASYN", "/usr/lib/epics")
+epicsEnvSet("AUTOSAVE", "/usr/lib/epics")
+epicsEnvSet("BUSY", "/usr/lib/epics")
+epicsEnvSet("CALC", "/usr/lib/epics")
+epicsEnvSet("DEVIOCSTATS", "/usr/lib/epics")
+epicsEnvSet("SSCAN", "/usr/lib/epics")
+epicsEnvSet("STREAM", "/usr/lib/epics")
+epicsEnvSet("SNCSEQ", "/usr/lib/epics")
+epicsEnvSet("RECCASTER", "/usr/lib/epics")
+epicsEnvSet("EPICS_BASE", "/usr/lib/epics")
+epicsEnvSet("MOTOR", "/usr/lib/epics")
+epicsEnvSet("EGUNPLC", "/epics/modules/egunplc_4d595bf")
+epicsEnvSet("ENGINEER", "C. Engineer")
+epicsEnvSet("PREFIX", "Egun-Test:")
+epicsEnvSet("IP_ADDR", "XX.XX.XX.XX")
+epicsEnvSet("PLC_NAME", "ES")
+epicsEnvSet("EPICS_DB_INCLUDE_PATH", "/epics/iocs/egun-s7plc-01/db:/epics/modules/egunplc_4d595bf/db:/usr/lib/epics/db")
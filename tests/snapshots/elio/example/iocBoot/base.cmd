@@ -0,0 +1,88 @@
+## Register all support components
+dbLoadDatabase("/epics/modules/elio_89ae76d/dbd/elio.dbd")
+elio_registerRecordDeviceDriver(pdbbase)
+
+# Configure the low level communication port
+ek9000Configure("${EK9K}", "${HOST}", 502, 9)
+dbLoadRecords("/epics/modules/elio_89ae76d/db/ek9000_status.db","P=$(SYS){$(DEV)},EK9K=$(EK9K)")
+
+# Configure terminal
+############  Config for elio #1 - 1 - EL3068  ############
+
+epicsEnvSet("POS",1)
+epicsEnvSet("MODEL","EL3068")
+epicsEnvSet("Dev","{$(DEV)_$(POS)}")
+ek9000ConfigureTerminal("$(EK9K)", "$(Dev)", "$(MODEL)", "$(POS)")
+dbLoadTemplate("/epics/modules/elio_89ae76d/db/$(MODEL).substitutions","DEVICE=$(EK9K), Sys=$(SYS), Dev=$(Dev), POS=$(POS)")
+
+############  Config for elio #2 - 2 - EL4008  ############
+
+epicsEnvSet("POS",2)
+epicsEnvSet("MODEL","EL4008")
+epicsEnvSet("Dev","{$(DEV)_$(POS)}")
+ek9000ConfigureTerminal("$(EK9K)", "$(Dev)", "$(MODEL)", "$(POS)")
+dbLoadTemplate("/epics/modules/elio_89ae76d/db/$(MODEL).substitutions","DEVICE=$(EK9K), Sys=$(SYS), Dev=$(Dev), POS=$(POS)")
+
+############  Config for elio #3 - 3 - EL1808  ############
+
+epicsEnvSet("POS",3)
+epicsEnvSet("MODEL","EL1808")
+epicsEnvSet("Dev","{$(DEV)_$(POS)}")
+ek9000ConfigureTerminal("$(EK9K)", "$(Dev)", "$(MODEL)", "$(POS)")
+dbLoadTemplate("/epics/modules/elio_89ae76d/db/$(MODEL).substitutions","DEVICE=$(EK9K), Sys=$(SYS), Dev=$(Dev), POS=$(POS)")
+
+############  Config for elio #4 - 4 - EL1808  ############
+
+epicsEnvSet("POS",4)
+epicsEnvSet("MODEL","EL1808")
+epicsEnvSet("Dev","{$(DEV)_$(POS)}")
+ek9000ConfigureTerminal("$(EK9K)", "$(Dev)", "$(MODEL)", "$(POS)")
+dbLoadTemplate("/epics/modules/elio_89ae76d/db/$(MODEL).substitutions","DEVICE=$(EK9K), Sys=$(SYS), Dev=$(Dev), POS=$(POS)")
+
+############  Config for elio #5 - 5 - EL2808  ############
+
+epicsEnvSet("POS",5)
+epicsEnvSet("MODEL","EL2808")
+epicsEnvSet("Dev","{$(DEV)_$(POS)}")
+ek9000ConfigureTerminal("$(EK9K)", "$(Dev)", "$(MODEL)", "$(POS)")
+dbLoadTemplate("/epics/modules/elio_89ae76d/db/$(MODEL).substitutions","DEVICE=$(EK9K), Sys=$(SYS), Dev=$(Dev), POS=$(POS)")
+
+############  Config for elio #6 - 6 - EL2808  ############
+
+epicsEnvSet("POS",6)
+epicsEnvSet("MODEL","EL2808")
+epicsEnvSet("Dev","{$(DEV)_$(POS)}")
+ek9000ConfigureTerminal("$(EK9K)", "$(Dev)", "$(MODEL)", "$(POS)")
+dbLoadTemplate("/epics/modules/elio_89ae76d/db/$(MODEL).substitutions","DEVICE=$(EK9K), Sys=$(SYS), Dev=$(Dev), POS=$(POS)")
+
+############  Config for elio #7 - 7 - EL3068  ############
+
+epicsEnvSet("POS",7)
+epicsEnvSet("MODEL","EL3068")
+epicsEnvSet("Dev","{$(DEV)_$(POS)}")
+ek9000ConfigureTerminal("$(EK9K)", "$(Dev)", "$(MODEL)", "$(POS)")
+dbLoadTemplate("/epics/modules/elio_89ae76d/db/$(MODEL).substitutions","DEVICE=$(EK9K), Sys=$(SYS), Dev=$(Dev), POS=$(POS)")
+
+############  Config for elio #8 - 8 - EL1124  ############
+
+epicsEnvSet("POS",8)
+epicsEnvSet("MODEL","EL1124")
+epicsEnvSet("Dev","{$(DEV)_$(POS)}")
+ek9000ConfigureTerminal("$(EK9K)", "$(Dev)", "$(MODEL)", "$(POS)")
+dbLoadTemplate("/epics/modules/elio_89ae76d/db/$(MODEL).substitutions","DEVICE=$(EK9K), Sys=$(SYS), Dev=$(Dev), POS=$(POS)")
+
+############  Config for elio #9 - 9 - EL3008  ############
+
+epicsEnvSet("POS",9)
+epicsEnvSet("MODEL","EL3008")
+epicsEnvSet("Dev","{$(DEV)_$(POS)}")
+ek9000ConfigureTerminal("$(EK9K)", "$(Dev)", "$(MODEL)", "$(POS)")
+dbLoadRecords("/epics/modules/elio_89ae76d/db/$(MODEL).template","DEVICE=$(EK9K), Sys=$(SYS), Dev=$(Dev), POS=$(POS), CHAN=1, LINR=SLOPE, EGU=V")
+dbLoadRecords("/epics/modules/elio_89ae76d/db/$(MODEL).template","DEVICE=$(EK9K), Sys=$(SYS), Dev=$(Dev), POS=$(POS), CHAN=2, LINR=SLOPE, EGU=mA")
+dbLoadRecords("/epics/modules/elio_89ae76d/db/$(MODEL).template","DEVICE=$(EK9K), Sys=$(SYS), Dev=$(Dev), POS=$(POS), CHAN=3")
+dbLoadRecords("/epics/modules/elio_89ae76d/db/$(MODEL).template","DEVICE=$(EK9K), Sys=$(SYS), Dev=$(Dev), POS=$(POS), CHAN=4")
+dbLoadRecords("/epics/modules/elio_89ae76d/db/$(MODEL).template","DEVICE=$(EK9K), Sys=$(SYS), Dev=$(Dev), POS=$(POS), CHAN=5")
+dbLoadRecords("/epics/modules/elio_89ae76d/db/$(MODEL).template","DEVICE=$(EK9K), Sys=$(SYS), Dev=$(Dev), POS=$(POS), CHAN=6")
+dbLoadRecords("/epics/modules/elio_89ae76d/db/$(MODEL).template","DEVICE=$(EK9K), Sys=$(SYS), Dev=$(Dev), POS=$(POS), CHAN=7")
+dbLoadRecords("/epics/modules/elio_89ae76d/db/$(MODEL).template","DEVICE=$(EK9K), Sys=$(SYS), Dev=$(Dev), POS=$(POS), CHAN=8")
+
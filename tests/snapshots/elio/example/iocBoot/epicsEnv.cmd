@@ -0,0 +1,32 @@
+
+< /epics/common/localhost-netsetup.cmd
+
+errlogInit(20000)
+
+epicsEnvSet("IOC", "elio")
+epicsEnvSet("IOC_DIR", "/epics/iocs")
+epicsEnvSet("TOP", "/epics/iocs/gpio_ex1")
+epicsEnvSet("TEMPLATE_TOP", "/epics/modules/elio_89ae76d")
+epicsEnvSet("HOSTNAME", "localhost")
+epicsEnvSet("IOCNAME", "gpio_ex1")
+epicsEnvSet("ASYN", "/usr/lib/epics")
+epicsEnvSet("AUTOSAVE", "/usr/lib/epics")
+epicsEnvSet("BUSY", "/usr/lib/epics")
+epicsEnvSet("CALC", "/usr/lib/epics")
+epicsEnvSet("DEVIOCSTATS", "/usr/lib/epics")
+epicsEnvSet("SSCAN", "/usr/lib/epics")
+epicsEnvSet("STREAM", "/usr/lib/epics")
+epicsEnvSet("SNCSEQ", "/usr/lib/epics")
+epicsEnvSet("RECCASTER", "/usr/lib/epics")
+epicsEnvSet("EPICS_BASE", "/usr/lib/epics")
+epicsEnvSet("EPICS_DB_INCLUDE_PATH", "/epics/modules/elio_89ae76d/db")
+epicsEnvSet("MOTOR", "/usr/lib/epics")
+epicsEnvSet("MODBUS", "/epics/modules/modbus_bb9fa05")
+epicsEnvSet("EK9000", "/epics/modules/ek9000_60e62b5")
+epicsEnvSet("ELIO", "/epics/modules/elio_89ae76d")
+epicsEnvSet("SYS", "XF:31ID1-ES")
+epicsEnvSet("DEV", "GPIO:1")
+epicsEnvSet("EK9K", "EK9K1")
+epicsEnvSet("HOST", "10.69.58.101")
+epicsEnvSet("PREFIX", "XF:31ID1-CT{IOC:GPIO1}")
+epicsEnvSet("ENGINEER", "H. Xu")
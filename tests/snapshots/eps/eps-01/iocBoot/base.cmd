@@ -0,0 +1,14 @@
+
+dbLoadDatabase("/epics/modules/eps_afbfea3/dbd/eps.dbd")
+eps_registerRecordDeviceDriver(pdbbase)
+
+# eps specific commands
+
+## Load PLC driver
+EIP_buffer_limit(492)
+drvEtherIP_init()
+drvEtherIP_define_PLC("$(PLC)","$(PLC_IP)",0)
+EIP_verbosity(6)
+
+## Restricted access for PV changes
+asSetFilename("$(ACF)")
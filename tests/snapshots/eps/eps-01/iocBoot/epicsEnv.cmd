@@ -0,0 +1,30 @@
+
+< /epics/common/localhost-netsetup.cmd
+
+errlogInit(20000)
+
+epicsEnvSet("IOC", "eps")
+epicsEnvSet("IOC_DIR", "/epics/iocs")
+epicsEnvSet("TOP", "/epics/iocs/eps-01")
+epicsEnvSet("TEMPLATE_TOP", "/epics/modules/eps_afbfea3")
+epicsEnvSet("HOSTNAME", "localhost")
+epicsEnvSet("IOCNAME", "eps-01")
+epicsEnvSet("ASYN", "/usr/lib/epics")
+epicsEnvSet("AUTOSAVE", "/usr/lib/epics")
+epicsEnvSet("BUSY", "/usr/lib/epics")
+epicsEnvSet("CALC", "/usr/lib/epics")
+epicsEnvSet("DEVIOCSTATS", "/usr/lib/epics")
+epicsEnvSet("SSCAN", "/usr/lib/epics")
+epicsEnvSet("STREAM", "/usr/lib/epics")
+epicsEnvSet("SNCSEQ", "/usr/lib/epics")
+epicsEnvSet("RECCASTER", "/usr/lib/epics")
+epicsEnvSet("EPICS_BASE", "/usr/lib/epics")
+epicsEnvSet("MOTOR", "/usr/lib/epics")
+epicsEnvSet("ETHER_IP", "/epics/modules/ether_ip_b27350b")
+epicsEnvSet("EPS", "/epics/modules/eps_afbfea3")
+epicsEnvSet("ENGINEER", "C. Engineer")
+epicsEnvSet("PREFIX", "XF:31ID1-ES{EPS:01}")
+epicsEnvSet("PLC", "XF31ID1_EPS")
+epicsEnvSet("PLC_IP", "xf31id1-plc1.nsls2.bnl.gov")
+epicsEnvSet("ACF", "/epics/common/bl-cas/31id/eps.acf")
+epicsEnvSet("EPICS_DB_INCLUDE_PATH", "/epics/iocs/eps-01/db:/epics/modules/ether_ip_b27350b/db:/epics/modules/eps_afbfea3/db:/usr/lib/epics/db")
@@ -0,0 +1,10 @@
+
+cd $(TOP)/as/req
+
+makeAutosaveFiles()
+create_monitor_set("info_settings.req", 30, "")
+create_monitor_set("info_positions.req", 10, "")
+
+
+
+cd $(TOP)
@@ -0,0 +1,13 @@
+
+dbLoadDatabase("/epics/modules/dcpses150_80ff267/dbd/es150.dbd")
+es150_registerRecordDeviceDriver(pdbbase)
+
+# es150 specific commands
+epicsEnvSet("STREAM_PROTOCOL_PATH", "$(DCPSES150)/protocol")
+
+
+#Configure serial port for DC power supplies
+
+drvAsynIPPortConfigure("ES150-1", "XX.XX.XX.XX:4001", 0, 0, 0)
+drvAsynIPPortConfigure("ES150-2", "XX.XX.XX.XX:4002", 0, 0, 0)
+drvAsynIPPortConfigure("ES150-3", "XX.XX.XX.XX:4003", 0, 0, 0)
@@ -0,0 +1,27 @@
+
+< /epics/common/localhost-netsetup.cmd
+
+errlogInit(20000)
+
+epicsEnvSet("IOC", "es150")
+epicsEnvSet("IOC_DIR", "/epics/iocs")
+epicsEnvSet("TOP", "/epics/iocs/es150-01")
+epicsEnvSet("TEMPLATE_TOP", "/epics/modules/dcpses150_80ff267")
+epicsEnvSet("HOSTNAME", "localhost")
+epicsEnvSet("IOCNAME", "es150-01")
+epicsEnvSet("ASYN", "/usr/lib/epics")
+epicsEnvSet("AUTOSAVE", "/usr/lib/epics")
+epicsEnvSet("BUSY", "/usr/lib/epics")
+epicsEnvSet("CALC", "/usr/lib/epics")
+epicsEnvSet("DEVIOCSTATS", "/usr/lib/epics")
+epicsEnvSet("SSCAN", "/usr/lib/epics")
+epicsEnvSet("STREAM", "/usr/lib/epics")
+epicsEnvSet("SNCSEQ", "/usr/lib/epics")
+epicsEnvSet("RECCASTER", "/usr/lib/epics")
+epicsEnvSet("EPICS_BASE", "/usr/lib/epics")
+epicsEnvSet("MOTOR", "/usr/lib/epics")
+epicsEnvSet("DCPSES150", "/epics/modules/dcpses150_80ff267")
+epicsEnvSet("ENGINEER", "C. Engineer")
+epicsEnvSet("PREFIX", "Egun-Test:")
+epicsEnvSet("SYS", "Egun-Test:")
+epicsEnvSet("EPICS_DB_INCLUDE_PATH", "/epics/iocs/es150-01/db:/epics/modules/dcpses150_80ff267/db:/usr/lib/epics/db")
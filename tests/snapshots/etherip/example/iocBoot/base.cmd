@@ -0,0 +1,10 @@
+
+dbLoadDatabase("/dbd/ether_ipApp.dbd")
+ether_ipApp_registerRecordDeviceDriver(pdbbase)
+
+# etherip specific commands
+## Load PLC driver
+EIP_buffer_limit(492)
+drvEtherIP_init()
+drvEtherIP_define_PLC("$(PLC)","$(PLC_IP)",0)
+EIP_verbosity(6)
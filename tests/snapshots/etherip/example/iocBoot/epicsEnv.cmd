@@ -0,0 +1,28 @@
+
+< /epics/common/localhost-netsetup.cmd
+
+errlogInit(20000)
+
+epicsEnvSet("IOC", "etherip")
+epicsEnvSet("IOC_DIR", "/epics/iocs")
+epicsEnvSet("TOP", "/epics/iocs/etherip-01")
+epicsEnvSet("TEMPLATE_TOP", "")
+epicsEnvSet("HOSTNAME", "localhost")
+epicsEnvSet("IOCNAME", "etherip-01")
+epicsEnvSet("ASYN", "/usr/lib/epics")
+epicsEnvSet("AUTOSAVE", "/usr/lib/epics")
+epicsEnvSet("BUSY", "/usr/lib/epics")
+epicsEnvSet("CALC", "/usr/lib/epics")
+epicsEnvSet("DEVIOCSTATS", "/usr/lib/epics")
+epicsEnvSet("SSCAN", "/usr/lib/epics")
+epicsEnvSet("STREAM", "/usr/lib/epics")
+epicsEnvSet("SNCSEQ", "/usr/lib/epics")
+epicsEnvSet("RECCASTER", "/usr/lib/epics")
+epicsEnvSet("EPICS_BASE", "/usr/lib/epics")
+epicsEnvSet("MOTOR", "/usr/lib/epics")
+epicsEnvSet("ETHER_IP", "/epics/modules/ether_ip_b27350b")
+epicsEnvSet("ENGINEER", "C. Engineer")
+epicsEnvSet("PREFIX", "XF:31ID1-ES{ETHERIP:01}")
+epicsEnvSet("PLC_IP", "xf31id1-plc1.nsls2.bnl.local")
+epicsEnvSet("PLC", "XF31ID1_TST_EPS")
+epicsEnvSet("EPICS_DB_INCLUDE_PATH", "/epics/iocs/etherip-01/db:/epics/modules/ether_ip_b27350b/db:/usr/lib/epics/db")
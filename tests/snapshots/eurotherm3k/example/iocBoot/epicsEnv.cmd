@@ -0,0 +1,34 @@
+
+< /epics/common/localhost-netsetup.cmd
+
+errlogInit(20000)
+
+epicsEnvSet("IOC", "eurotherm3k")
+epicsEnvSet("IOC_DIR", "/epics/iocs")
+epicsEnvSet("TOP", "/epics/iocs/eurotherm3504")
+epicsEnvSet("TEMPLATE_TOP", "/epics/modules/modbus_bb9fa05")
+epicsEnvSet("HOSTNAME", "localhost")
+epicsEnvSet("IOCNAME", "eurotherm3504")
+epicsEnvSet("ASYN", "/usr/lib/epics")
+epicsEnvSet("AUTOSAVE", "/usr/lib/epics")
+epicsEnvSet("BUSY", "/usr/lib/epics")
+epicsEnvSet("CALC", "/usr/lib/epics")
+epicsEnvSet("DEVIOCSTATS", "/usr/lib/epics")
+epicsEnvSet("SSCAN", "/usr/lib/epics")
+epicsEnvSet("STREAM", "/usr/lib/epics")
+epicsEnvSet("SNCSEQ", "/usr/lib/epics")
+epicsEnvSet("RECCASTER", "/usr/lib/epics")
+epicsEnvSet("EPICS_BASE", "/usr/lib/epics")
+epicsEnvSet("PORT", "E3K")
+epicsEnvSet("MODBUS_PREFIX", "EURTHM3K")
+epicsEnvSet("RX_PORT", "EURTHM3K_MASTER_RX")
+epicsEnvSet("TX_PORT", "EURTHM3K_MASTER_TX")
+epicsEnvSet("IP_PORT", "10.69.58.150:502")
+epicsEnvSet("PREFIX", "XF:31ID1-ES{E3K:01}")
+epicsEnvSet("MOTOR", "/usr/lib/epics")
+epicsEnvSet("MODBUS", "/epics/modules/modbus_bb9fa05")
+epicsEnvSet("ENGINEER", "C. Engineer")
+epicsEnvSet("DEVICE_IP", "10.69.58.150")
+epicsEnvSet("SYS", "XF:31ID1-ES")
+epicsEnvSet("DEV", "{E3K:01}")
+epicsEnvSet("EPICS_DB_INCLUDE_PATH", "/epics/iocs/eurotherm3504/db:/epics/modules/modbus_bb9fa05/db:/usr/lib/epics/db")
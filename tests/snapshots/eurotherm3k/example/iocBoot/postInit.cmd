@@ -0,0 +1,8 @@
+
+cd $(TOP)/as/req
+
+
+dbpf "$(SYS)$(DEV).TMSK", "0x1"
+dbpf "$(SYS)$(DEV).TIOM", "0x0"
+
+cd $(TOP)
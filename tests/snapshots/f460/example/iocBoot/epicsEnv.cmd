@@ -0,0 +1,32 @@
+
+< /epics/common/localhost-netsetup.cmd
+
+errlogInit(20000)
+
+epicsEnvSet("IOC", "f460")
+epicsEnvSet("IOC_DIR", "/epics/iocs")
+epicsEnvSet("TOP", "/epics/iocs/f460-01")
+epicsEnvSet("TEMPLATE_TOP", "/epics/modules/F460")
+epicsEnvSet("HOSTNAME", "localhost")
+epicsEnvSet("IOCNAME", "f460-01")
+epicsEnvSet("ASYN", "/usr/lib/epics")
+epicsEnvSet("AUTOSAVE", "/usr/lib/epics")
+epicsEnvSet("BUSY", "/usr/lib/epics")
+epicsEnvSet("CALC", "/usr/lib/epics")
+epicsEnvSet("DEVIOCSTATS", "/usr/lib/epics")
+epicsEnvSet("SSCAN", "/usr/lib/epics")
+epicsEnvSet("STREAM", "/usr/lib/epics")
+epicsEnvSet("SNCSEQ", "/usr/lib/epics")
+epicsEnvSet("RECCASTER", "/usr/lib/epics")
+epicsEnvSet("EPICS_BASE", "/usr/lib/epics")
+epicsEnvSet("MOTOR", "/usr/lib/epics")
+epicsEnvSet("F460", "/epics/modules/f460_e24199e")
+epicsEnvSet("ENGINEER", "K. Barry")
+epicsEnvSet("SYS", "XF:31ID-ES")
+epicsEnvSet("DEV", "{F460:1}")
+epicsEnvSet("IOC_SYS", "XF:31ID-CT")
+epicsEnvSet("IOC_DEV", "{IOC:F460}")
+epicsEnvSet("PORT", "E1")
+epicsEnvSet("IP", "xf31id1-lab3-tsrv1.nsls2.bnl.local")
+epicsEnvSet("IP_PORT", "4008")
+epicsEnvSet("EPICS_DB_INCLUDE_PATH", "/epics/iocs/f460-01/db:/epics/modules/f460_e24199e/db:/usr/lib/epics/db")
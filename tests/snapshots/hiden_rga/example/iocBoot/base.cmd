@@ -0,0 +1,13 @@
+
+dbLoadDatabase("/epics/modules/hiden_rga_0744058/dbd/HidenRGA.dbd")
+HidenRGA_registerRecordDeviceDriver(pdbbase)
+
+# hiden_rga specific commands
+epicsEnvSet("STREAM_PROTOCOL_PATH", "$(HIDEN_RGA)/protocol")
+drvAsynIPPortConfigure("$(PORT)", "$(HOST):$(IP_PORT)")
+dbLoadRecords("$(HIDEN_RGA)/db/reccaster.db", "P=$(PREFIX)RecSync")
+dbLoadRecords("$(HIDEN_RGA)/db/hiden_rga_global.template", "Sys=$(Sys),Dev=$(Dev),PORT=$(PORT)")
+dbLoadRecords("$(HIDEN_RGA)/db/hiden_rga_bar.template", "Sys=$(Sys),Dev=$(Dev),PORT=$(PORT)")
+dbLoadRecords("$(HIDEN_RGA)/db/hiden_rga_prfl.template", "Sys=$(Sys),Dev=$(Dev),PORT=$(PORT)")
+dbLoadRecords("$(HIDEN_RGA)/db/hiden_rga_mid.template", "Sys=$(Sys),Dev=$(Dev),PORT=$(PORT)")
+dbLoadRecords("$(HIDEN_RGA)/db/hiden_rga_degas.template", "Sys=$(Sys),Dev=$(Dev),PORT=$(PORT)")
@@ -0,0 +1,32 @@
+
+< /epics/common/localhost-netsetup.cmd
+
+errlogInit(20000)
+
+epicsEnvSet("IOC", "hiden_rga")
+epicsEnvSet("IOC_DIR", "/epics/iocs")
+epicsEnvSet("TOP", "/epics/iocs/hiden_rga-01")
+epicsEnvSet("TEMPLATE_TOP", "/epics/modules/hiden_rga_0744058")
+epicsEnvSet("HOSTNAME", "localhost")
+epicsEnvSet("IOCNAME", "hiden_rga-01")
+epicsEnvSet("ASYN", "/usr/lib/epics")
+epicsEnvSet("AUTOSAVE", "/usr/lib/epics")
+epicsEnvSet("BUSY", "/usr/lib/epics")
+epicsEnvSet("CALC", "/usr/lib/epics")
+epicsEnvSet("DEVIOCSTATS", "/usr/lib/epics")
+epicsEnvSet("SSCAN", "/usr/lib/epics")
+epicsEnvSet("STREAM", "/usr/lib/epics")
+epicsEnvSet("SNCSEQ", "/usr/lib/epics")
+epicsEnvSet("RECCASTER", "/usr/lib/epics")
+epicsEnvSet("EPICS_BASE", "/usr/lib/epics")
+epicsEnvSet("MOTOR", "/usr/lib/epics")
+epicsEnvSet("HIDEN_RGA", "/epics/modules/hiden_rga_0744058")
+epicsEnvSet("ENGINEER", "C. Engineer")
+epicsEnvSet("PREFIX", "XF:31ID1-VA{HIDEN_RGA:01}")
+epicsEnvSet("PORT", "RGA1")
+epicsEnvSet("HOST", "127.0.0.1")
+epicsEnvSet("IP_PORT", "5025")
+epicsEnvSet("Sys", "XF:31ID1-VA")
+epicsEnvSet("Dev", "{HIDEN_RGA:01}")
+epicsEnvSet("CntlSys", "XF:31ID1-CT")
+epicsEnvSet("EPICS_DB_INCLUDE_PATH", "/epics/iocs/hiden_rga-01/db:/epics/modules/hiden_rga_0744058/db:/usr/lib/epics/db")
@@ -0,0 +1,14 @@
+#!/bin/bash
+
+# Configure EPICS network environment variables
+export EPICS_CA_AUTO_ADDR_LIST=NO
+export EPICS_CAS_AUTO_BEACON_ADDR_LIST=NO
+export EPICS_CA_ADDR_LIST=127.0.0.1
+export EPICS_CAS_BEACON_ADDR_LIST=127.0.0.1
+
+# Start IOC here
+pixi run python -m hiden.cap2 --list-pvs --prefix='XF:31ID1-ES{HIDEN:Dev-1}'
+
+# Start IOC here
+# Caproto requires curly braces to be escaped, i.e. doubled up.
+pixi run python -m hiden.cap2 --list-pvs --prefix='XF:31ID1-ES{{HIDEN:Dev-1}}'
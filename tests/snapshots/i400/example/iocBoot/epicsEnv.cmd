@@ -0,0 +1,32 @@
+
+< /epics/common/localhost-netsetup.cmd
+
+errlogInit(20000)
+
+epicsEnvSet("IOC", "i400")
+epicsEnvSet("IOC_DIR", "/epics/iocs")
+epicsEnvSet("TOP", "/epics/iocs/i400-01")
+epicsEnvSet("TEMPLATE_TOP", "")
+epicsEnvSet("HOSTNAME", "localhost")
+epicsEnvSet("IOCNAME", "i400-01")
+epicsEnvSet("ASYN", "/usr/lib/epics")
+epicsEnvSet("AUTOSAVE", "/usr/lib/epics")
+epicsEnvSet("BUSY", "/usr/lib/epics")
+epicsEnvSet("CALC", "/usr/lib/epics")
+epicsEnvSet("DEVIOCSTATS", "/usr/lib/epics")
+epicsEnvSet("SSCAN", "/usr/lib/epics")
+epicsEnvSet("STREAM", "/usr/lib/epics")
+epicsEnvSet("SNCSEQ", "/usr/lib/epics")
+epicsEnvSet("RECCASTER", "/usr/lib/epics")
+epicsEnvSet("EPICS_BASE", "/usr/lib/epics")
+epicsEnvSet("MOTOR", "/usr/lib/epics")
+epicsEnvSet("I400", "/epics/modules/i400_0d69784")
+epicsEnvSet("ENGINEER", "C. Engineer")
+epicsEnvSet("SYS", "XF:09IDA-BI")
+epicsEnvSet("DEV", "{i400:01}")
+epicsEnvSet("IOC_SYS", "XF:09IDA-CT")
+epicsEnvSet("IOC_DEV", "{IOC:i400}")
+epicsEnvSet("PORT", "E1")
+epicsEnvSet("IP", "127.0.0.1")
+epicsEnvSet("IP_PORT", "4001")
+epicsEnvSet("EPICS_DB_INCLUDE_PATH", "/epics/iocs/i400-01/db:/epics/modules/i400_0d69784/db:/usr/lib/epics/db")
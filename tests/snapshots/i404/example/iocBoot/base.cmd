@@ -0,0 +1,18 @@
+
+dbLoadDatabase("/dbd/i404.dbd")
+i404_registerRecordDeviceDriver(pdbbase)
+
+# i404 specific commands
+
+## User defined ENV variables
+epicsEnvSet("STREAM_PROTOCOL_PATH", "$(I404)/i404App/Db")
+epicsEnvSet("PORT", "COM1")  # The port MUST be COM1 (it is hard coded in the IOC)
+
+drvAsynIPPortConfigure("$(PORT)", "$(IP):$(IP_PORT)")
+
+## Load records
+dbLoadRecords("$(I404)/db/I404.db")
+dbLoadRecords("$(I404)/db/asyn.db", "Sys=$(SYS),Dev=$(DEV),PORT=$(PORT),ADDR=0")
+
+# PREFIX is used for autosave and devIoStat
+epicsEnvSet("PREFIX", "$(IOC_SYS)$(IOC_DEV)")
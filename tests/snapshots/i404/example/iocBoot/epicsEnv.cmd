@@ -0,0 +1,31 @@
+
+< /epics/common/localhost-netsetup.cmd
+
+errlogInit(20000)
+
+epicsEnvSet("IOC", "i404")
+epicsEnvSet("IOC_DIR", "/epics/iocs")
+epicsEnvSet("TOP", "/epics/iocs/i404-01")
+epicsEnvSet("TEMPLATE_TOP", "")
+epicsEnvSet("HOSTNAME", "localhost")
+epicsEnvSet("IOCNAME", "i404-01")
+epicsEnvSet("ASYN", "/usr/lib/epics")
+epicsEnvSet("AUTOSAVE", "/usr/lib/epics")
+epicsEnvSet("BUSY", "/usr/lib/epics")
+epicsEnvSet("CALC", "/usr/lib/epics")
+epicsEnvSet("DEVIOCSTATS", "/usr/lib/epics")
+epicsEnvSet("SSCAN", "/usr/lib/epics")
+epicsEnvSet("STREAM", "/usr/lib/epics")
+epicsEnvSet("SNCSEQ", "/usr/lib/epics")
+epicsEnvSet("RECCASTER", "/usr/lib/epics")
+epicsEnvSet("EPICS_BASE", "/usr/lib/epics")
+epicsEnvSet("MOTOR", "/usr/lib/epics")
+epicsEnvSet("I404", "/epics/modules/i404_4ea37d0")
+epicsEnvSet("ENGINEER", "C. Engineer")
+epicsEnvSet("SYS", "XF:09IDB-BI")
+epicsEnvSet("DEV", "{i404:1}")
+epicsEnvSet("IOC_SYS", "XF:09IDB-CT")
+epicsEnvSet("IOC_DEV", "{IOC:i404}")
+epicsEnvSet("IP", "127.0.0.1")
+epicsEnvSet("IP_PORT", "4001")
+epicsEnvSet("EPICS_DB_INCLUDE_PATH", "/epics/iocs/i404-01/db:/epics/modules/i404_4ea37d0/db:/usr/lib/epics/db")
@@ -0,0 +1,180 @@
+## Register all support components
+dbLoadDatabase("/epics/modules/modbus_bb9fa05/dbd/modbusApp.dbd")
+modbusApp_registerRecordDeviceDriver pdbbase
+
+# Configure modbus connections for each unit
+
+############  Config for ioLogik #1 -  E1210  ############
+
+epicsEnvSet("IOLOGIK_ID", "IOL1")
+
+drvAsynIPPortConfigure("$(IOLOGIK_ID)", "192.168.127.254:502", 0, 0, 1)
+modbusInterposeConfig("$(IOLOGIK_ID)", 0, 2000, 0)
+
+# MOXA E1210 DIs (if NOT counter mode) : function 2 (Read Discrete Inputs), address 0, length 16, data_type = UINT16, # pollMsec = for read func, waits XXX msecs
+drvModbusAsynConfigure("$(IOLOGIK_ID)_DI", "$(IOLOGIK_ID)", 0, 2, 0, 16, "UINT16", 100, "ioLogik")
+
+dbLoadTemplate("$(TOP)/db/ioLogik_1_E1210.substitutions")
+
+#######################################################################################
+
+############  Config for ioLogik #2 -  E1211  ############
+
+epicsEnvSet("IOLOGIK_ID", "IOL2")
+
+drvAsynIPPortConfigure("$(IOLOGIK_ID)", "192.168.127.254:502", 0, 0, 1)
+modbusInterposeConfig("$(IOLOGIK_ID)", 0, 2000, 0)
+
+# MOXA E1211 DOs (if NOT pulse mode) : function 5 (Write Single Coil), address 0, length 16, data_type = UINT16, # pollMsec = for write func (4,..) any non-zero val to read first
+drvModbusAsynConfigure("$(IOLOGIK_ID)_DO", "$(IOLOGIK_ID)", 0, 5, 0, 16, "UINT16",   1, "ioLogik")
+
+# MOXA E1211 DOs (if NOT pulse mode) : function 1 (Read Coils), address 0, length 16, data_type = UINT16, # pollMsec = for read func, waits XXX msecs
+drvModbusAsynConfigure("$(IOLOGIK_ID)_DO_RBV", "$(IOLOGIK_ID)", 0, 1, 0, 16, "UINT16", 100, "ioLogik")
+
+dbLoadTemplate("$(TOP)/db/ioLogik_2_E1211.substitutions")
+
+#######################################################################################
+
+############  Config for ioLogik #3 -  E1212  ############
+
+epicsEnvSet("IOLOGIK_ID", "IOL3")
+
+drvAsynIPPortConfigure("$(IOLOGIK_ID)", "192.168.127.254:502", 0, 0, 1)
+modbusInterposeConfig("$(IOLOGIK_ID)", 0, 2000, 0)
+
+# MOXA E1212 DIs (if NOT counter mode) : function 2 (Read Discrete Inputs), address 0, length 16, data_type = UINT16, # pollMsec = for read func, waits XXX msecs
+drvModbusAsynConfigure("$(IOLOGIK_ID)_DI", "$(IOLOGIK_ID)", 0, 2, 0, 16, "UINT16", 100, "ioLogik")
+
+# MOXA E1212 DOs (if NOT pulse mode) : function 5 (Write Single Coil), address 0, length 8, data_type = UINT16, # pollMsec = for write func (4,..) any non-zero val to read first
+drvModbusAsynConfigure("$(IOLOGIK_ID)_DO", "$(IOLOGIK_ID)", 0, 5, 0, 8, "UINT16",   1, "ioLogik")
+
+# MOXA E1212 DOs (if NOT pulse mode) : function 1 (Read Coils), address 0, length 8, data_type = UINT16, # pollMsec = for read func, waits XXX msecs
+drvModbusAsynConfigure("$(IOLOGIK_ID)_DO_RBV", "$(IOLOGIK_ID)", 0, 1, 0, 8, "UINT16", 100, "ioLogik")
+
+dbLoadTemplate("$(TOP)/db/ioLogik_3_E1212.substitutions")
+
+#######################################################################################
+
+############  Config for ioLogik #4 -  E1213  ############
+
+epicsEnvSet("IOLOGIK_ID", "IOL4")
+
+drvAsynIPPortConfigure("$(IOLOGIK_ID)", "192.168.127.254:502", 0, 0, 1)
+modbusInterposeConfig("$(IOLOGIK_ID)", 0, 2000, 0)
+
+# MOXA E1213 DIs: function 2 (Read Discrete Inputs), address 0, length 12, data_type = UINT16, # pollMsec = for read func, waits XXX msecs
+drvModbusAsynConfigure("$(IOLOGIK_ID)_DI", "$(IOLOGIK_ID)", 0, 2, 0, 12, "UINT16", 100, "ioLogik")
+
+# MOXA E1213 DOs: function 5 (Write Single Coil), address 0, length 8, data_type = UINT16, # pollMsec = for write func (4,..) any non-zero val to read first
+drvModbusAsynConfigure("$(IOLOGIK_ID)_DO", "$(IOLOGIK_ID)", 0, 5, 0, 8, "UINT16",   1, "ioLogik")
+
+# MOXA E1213 DOs: function 1 (Read Coils), address 0, length 8, data_type = UINT16, # pollMsec = for read func, waits XXX msecs
+drvModbusAsynConfigure("$(IOLOGIK_ID)_DO_RBV", "$(IOLOGIK_ID)", 0, 1, 0, 8, "UINT16", 100, "ioLogik")
+
+dbLoadTemplate("$(TOP)/db/ioLogik_4_E1213.substitutions")
+
+#######################################################################################
+
+############  Config for ioLogik #5 -  E1214  ############
+
+epicsEnvSet("IOLOGIK_ID", "IOL5")
+
+drvAsynIPPortConfigure("$(IOLOGIK_ID)", "192.168.127.254:502", 0, 0, 1)
+modbusInterposeConfig("$(IOLOGIK_ID)", 0, 2000, 0)
+
+# MOXA E1214 DIs (if NOT counter mode) : function 2 (Read Discrete Inputs), address 0, length 6, data_type = UINT16, # pollMsec = for read func, waits XXX msecs
+drvModbusAsynConfigure("$(IOLOGIK_ID)_DI", "$(IOLOGIK_ID)", 0, 2, 0, 6, "UINT16", 100, "ioLogik")
+
+# MOXA E1214 Relay DOs (if NOT pulse mode) : function 5 (Write Single Coil), address 0, length 6, data_type = UINT16, # pollMsec = for write func (4,..) any non-zero val to read first
+drvModbusAsynConfigure("$(IOLOGIK_ID)_REL", "$(IOLOGIK_ID)", 0, 5, 0, 6, "UINT16",   1, "ioLogik")
+
+# MOXA E1214 Relay DOs (if NOT pulse mode) : function 1 (Read Coils), address 0, length 6, data_type = UINT16, # pollMsec = for read func, waits XXX msecs
+drvModbusAsynConfigure("$(IOLOGIK_ID)_REL_RBV", "$(IOLOGIK_ID)", 0, 1, 0, 6, "UINT16", 100, "ioLogik")
+
+dbLoadTemplate("$(TOP)/db/ioLogik_5_E1214.substitutions")
+
+#######################################################################################
+
+############  Config for ioLogik #6 -  E1240  ############
+
+epicsEnvSet("IOLOGIK_ID", "IOL6")
+
+drvAsynIPPortConfigure("$(IOLOGIK_ID)", "192.168.127.254:502", 0, 0, 1)
+modbusInterposeConfig("$(IOLOGIK_ID)", 0, 2000, 0)
+
+# MOXA E1240 AIs : function 4 (Read Input Registers), address 0, length 8, data_type = UINT16, # pollMsec = for read func, waits XXX msecs
+drvModbusAsynConfigure("$(IOLOGIK_ID)_AI", "$(IOLOGIK_ID)", 0, 4, 0, 8, "UINT16", 100, "ioLogik")
+
+dbLoadTemplate("$(TOP)/db/ioLogik_6_E1240.substitutions")
+
+#######################################################################################
+
+############  Config for ioLogik #7 -  E1241  ############
+
+epicsEnvSet("IOLOGIK_ID", "IOL7")
+
+drvAsynIPPortConfigure("$(IOLOGIK_ID)", "192.168.127.254:502", 0, 0, 1)
+modbusInterposeConfig("$(IOLOGIK_ID)", 0, 2000, 0)
+
+
+# MOXA E1241 AOs: function 6 (Write Single Register), address 1024, length 4 , data_type = UINT16, # pollMsec = for write func (4,..) any non-zero val to read first
+drvModbusAsynConfigure("$(IOLOGIK_ID)_AO", "$(IOLOGIK_ID)", 0, 6, 1024, 4, "UINT16", 1, "ioLogik")
+
+# MOXA E1241 AOs: function 3 (Read Holding Registers), address 1024, length 4 , data_type = UINT16, # pollMsec = for read func, waits XXX msecs
+drvModbusAsynConfigure("$(IOLOGIK_ID)_AO_RBV", "$(IOLOGIK_ID)", 0, 3, 1024, 4, "UINT16", 100, "ioLogik")
+
+dbLoadTemplate("$(TOP)/db/ioLogik_7_E1241.substitutions")
+
+#######################################################################################
+
+############  Config for ioLogik #8 -  E1242  ############
+
+epicsEnvSet("IOLOGIK_ID", "IOL8")
+
+drvAsynIPPortConfigure("$(IOLOGIK_ID)", "192.168.127.254:502", 0, 0, 1)
+modbusInterposeConfig("$(IOLOGIK_ID)", 0, 2000, 0)
+
+# MOXA E1242 AIs : function 4 (Read Input Registers), address 512, length 4, data_type = UINT16, # pollMsec = for read func, waits XXX msecs
+drvModbusAsynConfigure("$(IOLOGIK_ID)_AI", "$(IOLOGIK_ID)", 0, 4, 512, 4, "UINT16", 100, "ioLogik")
+
+# MOXA E1242 DIs (if NOT counter mode): function 2 (Read Discrete Inputs), address 0, length 8, data_type = UINT16, # pollMsec = for read func, waits XXX msecs
+drvModbusAsynConfigure("$(IOLOGIK_ID)_DI", "$(IOLOGIK_ID)", 0, 2, 0, 8, "UINT16", 100, "ioLogik")
+
+# MOXA E1242 DOs: function 5 (Write Single Coil), address 0, length 4, data_type = UINT16, # pollMsec = for write func (4,..) any non-zero val to read first
+drvModbusAsynConfigure("$(IOLOGIK_ID)_DO", "$(IOLOGIK_ID)", 0, 5, 0, 4, "UINT16", 1, "ioLogik")
+
+# MOXA E1242 DOs: function 1 (Read Coils), address 0, length 4, data_type = UINT16, # pollMsec = for read func, waits XXX msecs
+drvModbusAsynConfigure("$(IOLOGIK_ID)_DO_RBV", "$(IOLOGIK_ID)", 0, 1, 0, 4, "UINT16", 100, "ioLogik")
+
+dbLoadTemplate("$(TOP)/db/ioLogik_8_E1242.substitutions")
+
+#######################################################################################
+
+############  Config for ioLogik #9 -  E1260  ############
+
+epicsEnvSet("IOLOGIK_ID", "IOL9")
+
+drvAsynIPPortConfigure("$(IOLOGIK_ID)", "192.168.127.254:502", 0, 0, 1)
+modbusInterposeConfig("$(IOLOGIK_ID)", 0, 2000, 0)
+
+# MOXA E1260 RTDs: function 4 (Read Input Registers), address 1536, length 6 , data_type = INT16 (its 2's complement)
+drvModbusAsynConfigure("$(IOLOGIK_ID)_RTD", "$(IOLOGIK_ID)", 0, 4, 1536, 6, "INT16", 500, "ioLogik")
+
+dbLoadTemplate("$(TOP)/db/ioLogik_9_E1260.substitutions")
+
+#######################################################################################
+
+############  Config for ioLogik #10 -  E1262  ############
+
+epicsEnvSet("IOLOGIK_ID", "IOL10")
+
+drvAsynIPPortConfigure("$(IOLOGIK_ID)", "192.168.127.254:502", 0, 0, 1)
+modbusInterposeConfig("$(IOLOGIK_ID)", 0, 2000, 0)
+
+# MOXA E1262 TCs: function 4 (Read Input Registers), address 2048, length 16 , data_type = INT32_BE
+drvModbusAsynConfigure("$(IOLOGIK_ID)_TC", "$(IOLOGIK_ID)", 0, 4, 2048, 16, "INT32_BE", 500, "ioLogik")
+
+dbLoadTemplate("$(TOP)/db/ioLogik_10_E1262.substitutions")
+
+#######################################################################################
+
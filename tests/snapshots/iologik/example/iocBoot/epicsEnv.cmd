@@ -0,0 +1,27 @@
+
+< /epics/common/localhost-netsetup.cmd
+
+errlogInit(20000)
+
+epicsEnvSet("IOC", "iologik")
+epicsEnvSet("IOC_DIR", "/epics/iocs")
+epicsEnvSet("TOP", "/epics/iocs/iologik")
+epicsEnvSet("TEMPLATE_TOP", "/epics/modules/modbus_bb9fa05")
+epicsEnvSet("HOSTNAME", "localhost")
+epicsEnvSet("IOCNAME", "iologik")
+epicsEnvSet("ASYN", "/usr/lib/epics")
+epicsEnvSet("AUTOSAVE", "/usr/lib/epics")
+epicsEnvSet("BUSY", "/usr/lib/epics")
+epicsEnvSet("CALC", "/usr/lib/epics")
+epicsEnvSet("DEVIOCSTATS", "/usr/lib/epics")
+epicsEnvSet("SSCAN", "/usr/lib/epics")
+epicsEnvSet("STREAM", "/usr/lib/epics")
+epicsEnvSet("SNCSEQ", "/usr/lib/epics")
+epicsEnvSet("RECCASTER", "/usr/lib/epics")
+epicsEnvSet("EPICS_BASE", "/usr/lib/epics")
+epicsEnvSet("MOTOR", "/usr/lib/epics")
+epicsEnvSet("MODBUS", "/epics/modules/modbus_bb9fa05")
+epicsEnvSet("SYS", "XF:31ID1-ES")
+epicsEnvSet("DEV", "MFC1")
+epicsEnvSet("ENGINEER", "C. Engineer")
+epicsEnvSet("EPICS_DB_INCLUDE_PATH", "/epics/iocs/iologik/db:/epics/modules/modbus_bb9fa05/db:/usr/lib/epics/db")
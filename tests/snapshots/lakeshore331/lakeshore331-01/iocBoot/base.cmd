@@ -0,0 +1,15 @@
+epicsEnvSet("STREAM_PROTOCOL_PATH", "$(EPICS_BASE)/protocol:$(TOP):$(TOP)/protocol:$(TEMPLATE_TOP)/protocol")
+
+dbLoadDatabase("/dbd/BaseStreamApp.dbd")
+BaseStreamApp_registerRecordDeviceDriver(pdbbase)
+
+# lakeshore331 specific commands
+
+# ============================ BASE STREAM DEVICE CONFIGURATION ============================
+# Configure all asyn port connections
+drvAsynIPPortConfigure("LS331", "127.0.0.1:8000")
+asynOctetSetOutputEos("LS331", 0, "\r\n")
+asynOctetSetInputEos("LS331", 0, "\r\n")
+
+# ============================ LAKESHORE 331 CONFIGURATION ============================
+dbLoadTemplate("$(TOP)/db/lakeshore331.substitutions")
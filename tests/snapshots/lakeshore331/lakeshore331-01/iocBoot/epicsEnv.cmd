@@ -0,0 +1,30 @@
+
+< /epics/common/localhost-netsetup.cmd
+
+errlogInit(20000)
+
+epicsEnvSet("IOC", "lakeshore331")
+epicsEnvSet("IOC_DIR", "/epics/iocs")
+epicsEnvSet("TOP", "/epics/iocs/lakeshore331-01")
+epicsEnvSet("TEMPLATE_TOP", "")
+epicsEnvSet("HOSTNAME", "localhost")
+epicsEnvSet("IOCNAME", "lakeshore331-01")
+epicsEnvSet("ASYN", "/usr/lib/epics")
+epicsEnvSet("AUTOSAVE", "/usr/lib/epics")
+epicsEnvSet("BUSY", "/usr/lib/epics")
+epicsEnvSet("CALC", "/usr/lib/epics")
+epicsEnvSet("DEVIOCSTATS", "/usr/lib/epics")
+epicsEnvSet("SSCAN", "/usr/lib/epics")
+epicsEnvSet("STREAM", "/usr/lib/epics")
+epicsEnvSet("SNCSEQ", "/usr/lib/epics")
+epicsEnvSet("RECCASTER", "/usr/lib/epics")
+epicsEnvSet("EPICS_BASE", "/usr/lib/epics")
+epicsEnvSet("MOTOR", "/usr/lib/epics")
+epicsEnvSet("BASESTREAMIOC", "/epics/modules/base_stream_ioc_093e6cf")
+epicsEnvSet("ENGINEER", "C. Engineer")
+epicsEnvSet("PORT", "LS331")
+epicsEnvSet("P", "XF:31ID1-ES")
+epicsEnvSet("R", "{LS331:1}")
+epicsEnvSet("PREFIX", "XF:31ID1-ES{LS331:1}")
+epicsEnvSet("CT_PREFIX", "XF:31ID1-CT{LS331:1}")
+epicsEnvSet("EPICS_DB_INCLUDE_PATH", "/epics/iocs/lakeshore331-01/db:/epics/modules/base_stream_ioc_093e6cf/db:/usr/lib/epics/db")
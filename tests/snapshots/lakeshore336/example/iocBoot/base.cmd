@@ -0,0 +1,23 @@
+epicsEnvSet("STREAM_PROTOCOL_PATH", "$(EPICS_BASE)/protocol:$(TOP):$(TOP)/protocol:$(TEMPLATE_TOP)/protocol")
+
+dbLoadDatabase("/dbd/BaseStreamApp.dbd")
+BaseStreamApp_registerRecordDeviceDriver(pdbbase)
+
+# lakeshore331 specific commands
+
+# ============================ BASE STREAM DEVICE CONFIGURATION ============================
+# Configure all asyn port connections
+drvAsynIPPortConfigure("LS336", "127.0.0.1:7777")
+asynOctetSetOutputEos("LS336", 0, "\r\n")
+asynOctetSetInputEos("LS336", 0, "\r\n")
+
+# ============================ LAKESHORE 336 CONFIGURATION ============================
+dbLoadTemplate("$(TOP)/db/lakeshore336.substitutions")
+dbLoadTemplate("$(TOP)/db/lakeshore336_chan.substitutions")
+dbLoadTemplate("$(TOP)/db/lakeshore336_loop.substitutions")
+# BEGIN LAKESHORE336 CONFIGURATION
+# lakeshore336 specific commands
+dbLoadTemplate("$(TOP)/db/lakeshore336.substitutions")
+dbLoadTemplate("$(TOP)/db/lakeshore336_chan.substitutions")
+dbLoadTemplate("$(TOP)/db/lakeshore336_loop.substitutions")
+# END LAKESHORE336 CONFIGURATION
@@ -0,0 +1,31 @@
+
+< /epics/common/localhost-netsetup.cmd
+
+errlogInit(20000)
+
+epicsEnvSet("IOC", "linkamt96")
+epicsEnvSet("IOC_DIR", "/epics/iocs")
+epicsEnvSet("TOP", "/epics/iocs/linkamt96-moxa")
+epicsEnvSet("TEMPLATE_TOP", "/epics/modules/linkam3_1093365/iocs/linkamIOC")
+epicsEnvSet("HOSTNAME", "localhost")
+epicsEnvSet("IOCNAME", "linkamt96-moxa")
+epicsEnvSet("ASYN", "/usr/lib/epics")
+epicsEnvSet("AUTOSAVE", "/usr/lib/epics")
+epicsEnvSet("BUSY", "/usr/lib/epics")
+epicsEnvSet("CALC", "/usr/lib/epics")
+epicsEnvSet("DEVIOCSTATS", "/usr/lib/epics")
+epicsEnvSet("SSCAN", "/usr/lib/epics")
+epicsEnvSet("STREAM", "/usr/lib/epics")
+epicsEnvSet("SNCSEQ", "/usr/lib/epics")
+epicsEnvSet("RECCASTER", "/usr/lib/epics")
+epicsEnvSet("EPICS_BASE", "/usr/lib/epics")
+epicsEnvSet("LINKAM3_LICENSE_PATH", "/path/to/linkamt96_license.txt")
+epicsEnvSet("MOTOR", "/usr/lib/epics")
+epicsEnvSet("LINKAM3", "/epics/modules/linkam3_1093365")
+epicsEnvSet("ENGINEER", "C. Engineer")
+epicsEnvSet("PREFIX", "XF:31ID1-ES{LINKAMT96:01}")
+epicsEnvSet("PORT", "LINK3")
+epicsEnvSet("MOXA_HOST", "10.68.42.77")
+epicsEnvSet("MOXA_PORT", "4001")
+epicsEnvSet("LINKAM3_LOG_PATH", "/path/to/linkamt96_log.txt")
+epicsEnvSet("EPICS_DB_INCLUDE_PATH", "/epics/iocs/linkamt96-moxa/db:/epics/modules/linkam3_1093365/db:/usr/lib/epics/db")
@@ -0,0 +1,6 @@
+
+cd $(TOP)/as/req
+
+
+
+cd $(TOP)
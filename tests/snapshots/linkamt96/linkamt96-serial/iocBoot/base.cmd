@@ -0,0 +1,13 @@
+
+dbLoadDatabase("/epics/modules/linkam3_1093365/iocs/linkamIOC/dbd/linkamT96App.dbd")
+linkamT96App_registerRecordDeviceDriver(pdbbase)
+
+# linkamt96 specific commands
+
+Linkam3ConnectSerial("$(PORT)", "$(SERIAL_PORT)", "$(LINKAM3_LICENSE_PATH)", "$(LINKAM3_LOG_PATH)")
+
+# Pause to see connection status message
+epicsThreadSleep(2)
+
+# Load linkam records
+dbLoadRecords("$(LINKAM3)/db/Linkam.template", "P=$(PREFIX), PORT=$(PORT), ADDR=0, TIMEOUT=1")
@@ -0,0 +1,20 @@
+#!/epics/modules/linkam3_1093365/iocs/linkamIOC/bin/linux-x86_64/linkamT96App
+
+# Perform base environment setup and configuration
+< ./epicsEnv.cmd
+
+# Load IOC specific startup configuration
+< ./base.cmd
+
+# Load any additional configured databases, prep autosave
+< ./common.cmd
+
+iocInit()
+
+# Perform standard IOC post-init actions
+< ./postInit.cmd
+
+dbl > $(TOP)/records.dbl
+date
+
+# IOC linkamt96-usb completed startup
@@ -0,0 +1,10 @@
+
+dbLoadDatabase("/epics/modules/mcs_49f0f2b/dbd/mcs.dbd")
+mcs_registerRecordDeviceDriver(pdbbase)
+
+# mcs specific commands
+# Configure the low level communication port
+drvAsynIPPortConfigure("$(PORT)_ETH", "$(CTRL_IP):$(CTRL_PORT_NUM=55551)", 0, 0, 0)
+MCS2CreateController("$(PORT)", "$(PORT)_ETH", 6, $(MOVING_POLL_PERIOD), $(IDLE_POLL_PERIOD), $(AXES_MASK))
+
+dbLoadTemplate("$(TOP)/db/mcs2.substitutions")
@@ -0,0 +1,36 @@
+
+< /epics/common/localhost-netsetup.cmd
+
+errlogInit(20000)
+
+epicsEnvSet("IOC", "mcs")
+epicsEnvSet("IOC_DIR", "/epics/iocs")
+epicsEnvSet("TOP", "/epics/iocs/mcs2-01")
+epicsEnvSet("TEMPLATE_TOP", "/epics/modules/mcs_49f0f2b")
+epicsEnvSet("HOSTNAME", "localhost")
+epicsEnvSet("IOCNAME", "mcs2-01")
+epicsEnvSet("ASYN", "/usr/lib/epics")
+epicsEnvSet("AUTOSAVE", "/usr/lib/epics")
+epicsEnvSet("BUSY", "/usr/lib/epics")
+epicsEnvSet("CALC", "/usr/lib/epics")
+epicsEnvSet("DEVIOCSTATS", "/usr/lib/epics")
+epicsEnvSet("SSCAN", "/usr/lib/epics")
+epicsEnvSet("STREAM", "/usr/lib/epics")
+epicsEnvSet("SNCSEQ", "/usr/lib/epics")
+epicsEnvSet("RECCASTER", "/usr/lib/epics")
+epicsEnvSet("EPICS_BASE", "/usr/lib/epics")
+epicsEnvSet("PORT", "MCS2")
+epicsEnvSet("PREFIX", "XF31ID1-ES{MCS2:01}")
+epicsEnvSet("MOVING_POLL_PERIOD", "50")
+epicsEnvSet("IDLE_POLL_PERIOD", "1000")
+epicsEnvSet("DISABLE_SPEED", "0")
+epicsEnvSet("MOTOR", "/usr/lib/epics")
+epicsEnvSet("MCS", "/epics/modules/mcs_49f0f2b")
+epicsEnvSet("CTRL_NAME", "MCS2:01")
+epicsEnvSet("CTRL_IP", "127.0.0.1")
+epicsEnvSet("P", "XF31ID1-ES")
+epicsEnvSet("R", "{MCS2:01}")
+epicsEnvSet("NUM_AXES", "6")
+epicsEnvSet("AXES_MASK", "55")
+epicsEnvSet("ENGINEER", "C. Engineer")
+epicsEnvSet("EPICS_DB_INCLUDE_PATH", "/epics/iocs/mcs2-01/db:/epics/modules/mcs_49f0f2b/db:/usr/lib/epics/db")
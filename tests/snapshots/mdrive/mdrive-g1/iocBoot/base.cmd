@@ -0,0 +1,20 @@
+
+dbLoadDatabase("/epics/modules/mdrive_8bc9a09/dbd/mdrive.dbd")
+mdrive_registerRecordDeviceDriver(pdbbase)
+
+# mdrive specific commands
+drvAsynIPPortConfigure("P1", "127.0.0.1:503")
+ImsMDrivePlusCreateController("P1_Mtr", "P1", "", "100", "1000")
+drvAsynIPPortConfigure("P2", "127.0.0.1:503")
+ImsMDrivePlusCreateController("P2_Mtr", "P2", "", "100", "1000")
+drvAsynIPPortConfigure("P3", "127.0.0.1:503")
+ImsMDrivePlusCreateController("P3_Mtr", "P3", "", "100", "1000")
+drvAsynIPPortConfigure("P4", "127.0.0.1:503")
+ImsMDrivePlusCreateController("P4_Mtr", "P4", "", "100", "1000")
+drvAsynIPPortConfigure("P5", "127.0.0.1:503")
+ImsMDrivePlusCreateController("P5_Mtr", "P5", "", "100", "1000")
+drvAsynIPPortConfigure("P6", "127.0.0.1:503")
+ImsMDrivePlusCreateController("P6_Mtr", "P6", "", "100", "1000")
+
+dbLoadTemplate("$(TOP)/db/motor.substitutions")
+dbLoadTemplate("$(TOP)/db/asynRecord.substitutions")
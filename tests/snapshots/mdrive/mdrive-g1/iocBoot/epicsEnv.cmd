@@ -0,0 +1,36 @@
+
+< /epics/common/localhost-netsetup.cmd
+
+errlogInit(20000)
+
+epicsEnvSet("IOC", "mdrive")
+epicsEnvSet("IOC_DIR", "/epics/iocs")
+epicsEnvSet("TOP", "/epics/iocs/mdrive-g1")
+epicsEnvSet("TEMPLATE_TOP", "/epics/modules/mdrive_8bc9a09")
+epicsEnvSet("HOSTNAME", "localhost")
+epicsEnvSet("IOCNAME", "mdrive-g1")
+epicsEnvSet("ASYN", "/usr/lib/epics")
+epicsEnvSet("AUTOSAVE", "/usr/lib/epics")
+epicsEnvSet("BUSY", "/usr/lib/epics")
+epicsEnvSet("CALC", "/usr/lib/epics")
+epicsEnvSet("DEVIOCSTATS", "/usr/lib/epics")
+epicsEnvSet("SSCAN", "/usr/lib/epics")
+epicsEnvSet("STREAM", "/usr/lib/epics")
+epicsEnvSet("SNCSEQ", "/usr/lib/epics")
+epicsEnvSet("RECCASTER", "/usr/lib/epics")
+epicsEnvSet("EPICS_BASE", "/usr/lib/epics")
+epicsEnvSet("MOTOR", "/usr/lib/epics")
+epicsEnvSet("IMS", "/epics/modules/ims_58d492d")
+epicsEnvSet("MDRIVE", "/epics/modules/mdrive_8bc9a09")
+epicsEnvSet("ENGINEER", "C. Engineer")
+epicsEnvSet("PREFIX", "XF:31ID1-CT{IOC:MDrvG1}")
+epicsEnvSet("SYS_IOC", "XF:31ID1-CT")
+epicsEnvSet("IP_PORT", "503")
+epicsEnvSet("SYS", "XF:31ID1-OP")
+epicsEnvSet("MRES", "4.9609375e-05")
+epicsEnvSet("VBAS", "1.0")
+epicsEnvSet("VELO", "2")
+epicsEnvSet("VMAX", "5")
+epicsEnvSet("ACCL", "0.2")
+epicsEnvSet("EGU", "mm")
+epicsEnvSet("EPICS_DB_INCLUDE_PATH", "/epics/iocs/mdrive-g1/db:/epics/modules/ims_58d492d/db:/epics/modules/mdrive_8bc9a09/db:/usr/lib/epics/db")
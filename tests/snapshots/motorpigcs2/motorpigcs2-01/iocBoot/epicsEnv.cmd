@@ -0,0 +1,34 @@
+
+< /epics/common/localhost-netsetup.cmd
+
+errlogInit(20000)
+
+epicsEnvSet("IOC", "motorpigcs2")
+epicsEnvSet("IOC_DIR", "/epics/iocs")
+epicsEnvSet("TOP", "/epics/iocs/motorpigcs2-01")
+epicsEnvSet("TEMPLATE_TOP", "/epics/modules/motorpigcs2_a0bdeae")
+epicsEnvSet("HOSTNAME", "localhost")
+epicsEnvSet("IOCNAME", "motorpigcs2-01")
+epicsEnvSet("ASYN", "/usr/lib/epics")
+epicsEnvSet("AUTOSAVE", "/usr/lib/epics")
+epicsEnvSet("BUSY", "/usr/lib/epics")
+epicsEnvSet("CALC", "/usr/lib/epics")
+epicsEnvSet("DEVIOCSTATS", "/usr/lib/epics")
+epicsEnvSet("SSCAN", "/usr/lib/epics")
+epicsEnvSet("STREAM", "/usr/lib/epics")
+epicsEnvSet("SNCSEQ", "/usr/lib/epics")
+epicsEnvSet("RECCASTER", "/usr/lib/epics")
+epicsEnvSet("EPICS_BASE", "/usr/lib/epics")
+epicsEnvSet("MOTOR_PIGCS2", "/epics/modules/motorPIGCS2")
+epicsEnvSet("MOTOR", "/usr/lib/epics")
+epicsEnvSet("MOTORPIGCS2", "/epics/modules/motorpigcs2_a0bdeae")
+epicsEnvSet("ENGINEER", "J. MA")
+epicsEnvSet("PORT", "GCS2")
+epicsEnvSet("ASYN_PORT", "GCS2_ETH")
+epicsEnvSet("P", "XF:31ID-ES")
+epicsEnvSet("R", "{GCS2:1}")
+epicsEnvSet("PREFIX", "XF:31ID-ES{GCS2:1}")
+epicsEnvSet("CT_PREFIX", "XF:31ID-CT{GCS2:1}")
+epicsEnvSet("CONTROLLER_IP", "10.66.xx.xx")
+epicsEnvSet("CONTROLLER_PORT", "50000")
+epicsEnvSet("EPICS_DB_INCLUDE_PATH", "/epics/iocs/motorpigcs2-01/db:/epics/modules/motorpigcs2_a0bdeae/db:/usr/lib/epics/db")
@@ -0,0 +1,20 @@
+#!/epics/modules/motorpigcs2_a0bdeae/bin/linux-x86_64/pigcs2
+
+# Perform base environment setup and configuration
+< ./epicsEnv.cmd
+
+# Load IOC specific startup configuration
+< ./base.cmd
+
+# Load any additional configured databases, prep autosave
+< ./common.cmd
+
+iocInit()
+
+# Perform standard IOC post-init actions
+< ./postInit.cmd
+
+dbl > $(TOP)/records.dbl
+date
+
+# IOC motorpigcs2-01 completed startup
@@ -0,0 +1,12 @@
+errLogInit(2000)
+
+dbLoadDatabase("/epics/modules/motorsim_ioc_683afc0/dbd/motorSim.dbd")
+motorSim_registerRecordDeviceDriver(pdbbase)
+
+motorSimCreateController("$(PORT)", 4)
+
+# Create axes as defined in the IOC configuration
+motorSimConfigAxis("$(PORT)", 0, 11000.0, -11000.0, 0, 0)
+motorSimConfigAxis("$(PORT)", 1, 11000.0, -11000.0, 0, 0)
+motorSimConfigAxis("$(PORT)", 2, 11000.0, -11000.0, 0, 0)
+motorSimConfigAxis("$(PORT)", 3, 19000.0, -19000.0, 0, 0)
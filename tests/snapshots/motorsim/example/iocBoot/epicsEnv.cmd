@@ -0,0 +1,28 @@
+
+< /epics/common/localhost-netsetup.cmd
+
+errlogInit(20000)
+
+epicsEnvSet("IOC", "motorsim")
+epicsEnvSet("IOC_DIR", "/epics/iocs")
+epicsEnvSet("TOP", "/epics/iocs/mc01")
+epicsEnvSet("TEMPLATE_TOP", "/epics/modules/motorsim_ioc_683afc0")
+epicsEnvSet("HOSTNAME", "localhost")
+epicsEnvSet("IOCNAME", "mc01")
+epicsEnvSet("ASYN", "/usr/lib/epics")
+epicsEnvSet("AUTOSAVE", "/usr/lib/epics")
+epicsEnvSet("BUSY", "/usr/lib/epics")
+epicsEnvSet("CALC", "/usr/lib/epics")
+epicsEnvSet("DEVIOCSTATS", "/usr/lib/epics")
+epicsEnvSet("SSCAN", "/usr/lib/epics")
+epicsEnvSet("STREAM", "/usr/lib/epics")
+epicsEnvSet("SNCSEQ", "/usr/lib/epics")
+epicsEnvSet("RECCASTER", "/usr/lib/epics")
+epicsEnvSet("EPICS_BASE", "/usr/lib/epics")
+epicsEnvSet("PORT", "MTRSIM1")
+epicsEnvSet("MOTOR", "/usr/lib/epics")
+epicsEnvSet("MOTORSIM", "/epics/modules/motorsim_d1d0eb8")
+epicsEnvSet("MOTORSIMIOC", "/epics/modules/motorsim_ioc_683afc0")
+epicsEnvSet("PREFIX", "XF:31ID1-ES{MC:01}")
+epicsEnvSet("ENGINEER", "J. Wlodek")
+epicsEnvSet("EPICS_DB_INCLUDE_PATH", "/epics/iocs/mc01/db:/epics/modules/motorsim_d1d0eb8/db:/epics/modules/motorsim_ioc_683afc0/db:/usr/lib/epics/db")
@@ -0,0 +1,7 @@
+
+cd $(TOP)/as/req
+
+create_monitor_set("motorSim_settings.req", 30, "")
+
+
+cd $(TOP)
@@ -0,0 +1,11 @@
+
+cd $(TOP)/as/req
+
+makeAutosaveFiles()
+create_monitor_set("info_settings.req", 30, "")
+create_monitor_set("info_positions.req", 10, "")
+
+create_monitor_set("auto_settings.req", 30, "P=$(PREFIX), R=""")
+
+
+cd $(TOP)
@@ -0,0 +1,43 @@
+
+< /epics/common/localhost-netsetup.cmd
+
+errlogInit(20000)
+
+epicsEnvSet("IOC", "nsls2em")
+epicsEnvSet("IOC_DIR", "/epics/iocs")
+epicsEnvSet("TOP", "/epics/iocs/nsls2em-01")
+epicsEnvSet("TEMPLATE_TOP", "/epics/modules/nsls2em_23437dc")
+epicsEnvSet("HOSTNAME", "localhost")
+epicsEnvSet("IOCNAME", "nsls2em-01")
+epicsEnvSet("ASYN", "/usr/lib/epics")
+epicsEnvSet("AUTOSAVE", "/usr/lib/epics")
+epicsEnvSet("BUSY", "/usr/lib/epics")
+epicsEnvSet("CALC", "/usr/lib/epics")
+epicsEnvSet("DEVIOCSTATS", "/usr/lib/epics")
+epicsEnvSet("SSCAN", "/usr/lib/epics")
+epicsEnvSet("STREAM", "/usr/lib/epics")
+epicsEnvSet("SNCSEQ", "/usr/lib/epics")
+epicsEnvSet("RECCASTER", "/usr/lib/epics")
+epicsEnvSet("EPICS_BASE", "/usr/lib/epics")
+epicsEnvSet("PORT", "NSLS2_EM")
+epicsEnvSet("QSIZE", "20")
+epicsEnvSet("RING_SIZE", "10000")
+epicsEnvSet("TSPOINTS", "10000")
+epicsEnvSet("EPICS_CA_MAX_ARRAY_BYTES", "10000000")
+epicsEnvSet("EPICS_DB_INCLUDE_PATH", "/epics/modules/nsls2em_23437dc/db:/epics/modules/pscdrv_1ed650d/db:/epics/modules/adcore_5860bd3/db:/usr/lib/epics/db")
+epicsEnvSet("MOTOR", "/usr/lib/epics")
+epicsEnvSet("STD", "/epics/modules/std_1b416db")
+epicsEnvSet("PSCDRV", "/epics/modules/pscdrv_1ed650d")
+epicsEnvSet("ADSUPPORT", "/epics/modules/adsupport_fe23754")
+epicsEnvSet("ADCORE", "/epics/modules/adcore_5860bd3")
+epicsEnvSet("QUADEM", "/epics/modules/quadem_f5ab1e9")
+epicsEnvSet("NSLS2EM", "/epics/modules/nsls2em_23437dc")
+epicsEnvSet("DEVICE_IP", "10.69.58.68")
+epicsEnvSet("SYS", "XF:31ID1-BI")
+epicsEnvSet("DEV", "EM:1")
+epicsEnvSet("DEVICE_SN", "EC0019")
+epicsEnvSet("PREFIX", "XF:31ID1-BI{EM:1}")
+epicsEnvSet("ENGINEER", "C. Engineer")
+epicsEnvSet("FB_ON_CALC", "A&&B&&C&&D&&E&&F&&J&&K&&L")
+epicsEnvSet("PID_PERMIT1", "XF:31ID1-OP{A}")
+epicsEnvSet("PID_PERMIT2", "XF:31ID1-OP{B}")
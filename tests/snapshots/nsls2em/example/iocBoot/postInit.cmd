@@ -0,0 +1,20 @@
+
+cd $(TOP)/as/req
+
+makeAutosaveFiles()
+create_monitor_set("info_settings.req", 30, "")
+create_monitor_set("info_positions.req", 10, "")
+
+# Load calibration for the device (based on the serial number)
+< $(NSLS2EM)/calibration/$(DEVICE_SN).cmd
+epicsThreadSleep(1)
+
+
+dbpf "$(PREFIX)Reg31-Sp", "255"
+epicsThreadSleep(0.2)
+dbpf "$(PREFIX)Reg31-Sp", "0"
+epicsThreadSleep(1)
+dbpf "$(PREFIX)Reg49-I.FLNK", "$(PREFIX)$(PID_X):Inp-Sts"
+dbpf "$(PREFIX)Reg50-I.FLNK", "$(PREFIX)$(PID_Y):Inp-Sts"
+
+cd $(TOP)
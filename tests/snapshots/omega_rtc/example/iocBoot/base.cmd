@@ -0,0 +1,31 @@
+
+dbLoadDatabase("/epics/modules/omega_rtc_a828c22/dbd/omegaCNi32.dbd")
+omegaCNi32_registerRecordDeviceDriver(pdbbase)
+
+# omega_rtc specific commands
+# streamdevice protocol file path
+epicsEnvSet("STREAM_PROTOCOL_PATH", "/epics/modules/omega_rtc_a828c22/protocols")
+
+# load record instances
+        
+drvAsynIPPortConfigure("tsrv1-p1", "xf31id1-tsrv3.nsls2.bnl.local:4001")
+dbLoadRecords("/epics/modules/omega_rtc_a828c22/db/omegaCNi32_temp.db", "Sys=XF:31ID1-CT,Dev={RG:A1-RTC:1},Chan=,PORT=tsrv1-p1")
+dbLoadRecords("/epics/modules/omega_rtc_a828c22/db/asynRecord.db", "P=XF:31ID1-CT,R={RG:A1-RTC:1}Asyn,PORT=tsrv1-p1,ADDR=0,IMAX=256,OMAX=256")
+        
+drvAsynIPPortConfigure("tsrv1-p2", "xf31id1-tsrv3.nsls2.bnl.local:4002")
+dbLoadRecords("/epics/modules/omega_rtc_a828c22/db/omegaCNi32_temp.db", "Sys=XF:31ID1-CT,Dev={RG:A2-RTC:1},Chan=,PORT=tsrv1-p2")
+dbLoadRecords("/epics/modules/omega_rtc_a828c22/db/asynRecord.db", "P=XF:31ID1-CT,R={RG:A2-RTC:1}Asyn,PORT=tsrv1-p2,ADDR=0,IMAX=256,OMAX=256")
+                  
+drvAsynIPPortConfigure("tsrv1-p3", "xf31id1-tsrv3.nsls2.bnl.local:4003")
+dbLoadRecords("/epics/modules/omega_rtc_a828c22/db/omegaCNi32_temp.db", "Sys=XF:31ID1-CT,Dev={RG:A3-RTC:1},Chan=01,PORT=tsrv1-p3")
+dbLoadRecords("/epics/modules/omega_rtc_a828c22/db/asynRecord.db", "P=XF:31ID1-CT,R={RG:A3-RTC:1}Asyn,PORT=tsrv1-p3,ADDR=0,IMAX=256,OMAX=256")
+                  
+drvAsynIPPortConfigure("tsrv1-p4", "xf31id1-tsrv3.nsls2.bnl.local:4004")
+dbLoadRecords("/epics/modules/omega_rtc_a828c22/db/omegaCNi32_temp.db", "Sys=XF:31ID1-CT,Dev={RG:A4-RTC:1},Chan=01,PORT=tsrv1-p4")
+dbLoadRecords("/epics/modules/omega_rtc_a828c22/db/asynRecord.db", "P=XF:31ID1-CT,R={RG:A4-RTC:1}Asyn,PORT=tsrv1-p4,ADDR=0,IMAX=256,OMAX=256")
+                  
+drvAsynIPPortConfigure("tsrv1-p5", "xf31id1-tsrv3.nsls2.bnl.local:4005")
+dbLoadRecords("/epics/modules/omega_rtc_a828c22/db/omegaCNi32_temp.db", "Sys=XF:31ID1-CT,Dev={RG:A5-RTC:1},Chan=02,PORT=tsrv1-p5")
+dbLoadRecords("/epics/modules/omega_rtc_a828c22/db/asynRecord.db", "P=XF:31ID1-CT,R={RG:A5-RTC:1}Asyn,PORT=tsrv1-p5,ADDR=0,IMAX=256,OMAX=256")
+
+dbLoadRecords("$(TOP)/db/alarm.db", "SYS=XF:31ID1-CT")
@@ -0,0 +1,27 @@
+
+< /epics/common/localhost-netsetup.cmd
+
+errlogInit(20000)
+
+epicsEnvSet("IOC", "omega_rtc")
+epicsEnvSet("IOC_DIR", "/epics/iocs")
+epicsEnvSet("TOP", "/epics/iocs/omega_rtc")
+epicsEnvSet("TEMPLATE_TOP", "/epics/modules/omega_rtc_a828c22")
+epicsEnvSet("HOSTNAME", "localhost")
+epicsEnvSet("IOCNAME", "omega_rtc")
+epicsEnvSet("ASYN", "/usr/lib/epics")
+epicsEnvSet("AUTOSAVE", "/usr/lib/epics")
+epicsEnvSet("BUSY", "/usr/lib/epics")
+epicsEnvSet("CALC", "/usr/lib/epics")
+epicsEnvSet("DEVIOCSTATS", "/usr/lib/epics")
+epicsEnvSet("SSCAN", "/usr/lib/epics")
+epicsEnvSet("STREAM", "/usr/lib/epics")
+epicsEnvSet("SNCSEQ", "/usr/lib/epics")
+epicsEnvSet("RECCASTER", "/usr/lib/epics")
+epicsEnvSet("EPICS_BASE", "/usr/lib/epics")
+epicsEnvSet("MOTOR", "/usr/lib/epics")
+epicsEnvSet("OMEGA_RTC", "/epics/modules/omega_rtc_a828c22")
+epicsEnvSet("PREFIX", "XF:31ID1-CT{IOC:RTC}")
+epicsEnvSet("ENGINEER", "")
+epicsEnvSet("SYS", "XF:31ID1-CT")
+epicsEnvSet("EPICS_DB_INCLUDE_PATH", "/epics/iocs/omega_rtc/db:/epics/modules/omega_rtc_a828c22/db:/usr/lib/epics/db")
@@ -0,0 +1,23 @@
+#!/bin/bash
+
+OPI_DIR=/epics/iocs/panda1/bobfiles
+
+# Create the directory if it does not exist
+if [ ! -d "$OPI_DIR" ]; then
+  mkdir -p "$OPI_DIR"
+fi
+
+export EPICS_CA_AUTO_ADDR_LIST=NO
+export EPICS_CAS_AUTO_BEACON_ADDR_LIST=NO
+export EPICS_CA_ADDR_LIST=127.0.0.1
+export EPICS_CAS_BEACON_ADDR_LIST=127.0.0.1
+export EPICS_CAS_INTF_ADDR_LIST=127.0.0.1
+
+export EPICS_PVA_AUTO_ADDR_LIST=NO
+export EPICS_PVAS_AUTO_BEACON_ADDR_LIST=NO
+export EPICS_PVA_ADDR_LIST=127.0.0.1
+export EPICS_PVAS_BEACON_ADDR_LIST=127.0.0.1
+export EPICS_PVAS_INTF_ADDR_LIST=127.0.0.1
+
+
+/epics/iocs/panda1/venv/bin/pandablocks-ioc softioc --screens-dir="$OPI_DIR" --clear-bobfiles 'xf31id1-lab3-panda1.nsls2.bnl.local' 'XF:31ID1-ES{PANDA:1}'
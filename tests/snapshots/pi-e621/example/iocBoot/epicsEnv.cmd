@@ -0,0 +1,47 @@
+
+< /epics/common/localhost-netsetup.cmd
+
+errlogInit(20000)
+
+epicsEnvSet("IOC", "pi-e621")
+epicsEnvSet("IOC_DIR", "/epics/iocs")
+epicsEnvSet("TOP", "/epics/iocs/pi-e621")
+epicsEnvSet("TEMPLATE_TOP", "")
+epicsEnvSet("HOSTNAME", "localhost")
+epicsEnvSet("IOCNAME", "pi-e621")
+epicsEnvSet("ASYN", "/usr/lib/epics")
+epicsEnvSet("AUTOSAVE", "/usr/lib/epics")
+epicsEnvSet("BUSY", "/usr/lib/epics")
+epicsEnvSet("CALC", "/usr/lib/epics")
+epicsEnvSet("DEVIOCSTATS", "/usr/lib/epics")
+epicsEnvSet("SSCAN", "/usr/lib/epics")
+epicsEnvSet("STREAM", "/usr/lib/epics")
+epicsEnvSet("SNCSEQ", "/usr/lib/epics")
+epicsEnvSet("RECCASTER", "/usr/lib/epics")
+epicsEnvSet("EPICS_BASE", "/usr/lib/epics")
+epicsEnvSet("MOTOR", "/usr/lib/epics")
+epicsEnvSet("PI3", "/epics/modules/pi3_2778ce0")
+epicsEnvSet("PIE621", "/epics/modules/pie621_043ec8f")
+epicsEnvSet("HOST", "xf09id1-tsrv6.nsls2.bnl.gov:4001")
+epicsEnvSet("PI_PORT", "PI_VMS")
+epicsEnvSet("SYS", "XF:09IDA-OP:1")
+epicsEnvSet("IOC_SYS", "XF:09IDA-CT")
+epicsEnvSet("IOC_DEV", "IOC:PZT3")
+epicsEnvSet("ASYN_DEV", "MC:PZT3")
+epicsEnvSet("IOC_PREFIX", "XF:09IDA-CT{IOC:PZT3}")
+epicsEnvSet("ASYN_PREFIX", "XF:09IDA-CT{MC:PZT3}")
+epicsEnvSet("ENGINEER", "C. Engineer")
+epicsEnvSet("EGU", "urad")
+epicsEnvSet("TWV", "1")
+epicsEnvSet("VELO", "5.")
+epicsEnvSet("VBAS", "2.0")
+epicsEnvSet("ACCL", "0.1")
+epicsEnvSet("BDST", "0")
+epicsEnvSet("BVEL", "1")
+epicsEnvSet("BACC", ".2")
+epicsEnvSet("MRES", "0.000001")
+epicsEnvSet("PREC", "3")
+epicsEnvSet("DHLM", "0")
+epicsEnvSet("DLLM", "0")
+epicsEnvSet("INIT", "")
+epicsEnvSet("EPICS_DB_INCLUDE_PATH", "/epics/iocs/pi-e621/db:/epics/modules/pi3_2778ce0/db:/epics/modules/pie621_043ec8f/db:/usr/lib/epics/db")
@@ -0,0 +1,36 @@
+
+dbLoadDatabase("/epics/modules/ppmac_91b4edc/dbd/ppmac.dbd")
+ppmac_registerRecordDeviceDriver(pdbbase)
+
+# powerpmac specific commands
+
+# Configure the low level communication port
+drvAsynPowerPMACPortConfigure("$(SSH_PORT)", "$(CONTROLLER_IP)", "root", "deltatau", "0", "0", "0")
+
+# Configure Model 3 Controller Driver (ControllerPort, LowLevelDriverPort, Address, Axes, MovingPoll, IdlePoll)
+pmacCreateController("$(CTRL_PORT)", "$(SSH_PORT)", 0, $(NUM_AXES), 100, 1000)
+
+# Configure Model 3 Axes Driver (Controler Port, Axis Count)
+pmacCreateAxes("$(CTRL_PORT)", $(NUM_AXES))
+
+pmacDisableLimitsCheck("$(CTRL_PORT)", 1, 0)
+
+# Set up for running coordinate system
+#pmacCreateCS(coordinate_system_port, controller_port_name, coordinate_system_number, motion_program_number)
+pmacCreateCS("CS2", "$(CTRL_PORT)", 2, 10)
+
+# Create the coordinate system axes
+#pmacCreateCSAxes(coordinate_system_port, num_coordinate_system_axes)
+pmacCreateCSAxes("CS2", 9)
+
+# Define coordinate step resolution
+#pmacSetCoordStepsPerUnit(coordinate_system_port, cs_axis, counts_per_egu)
+pmacSetCoordStepsPerUnit("CS2", 7, 100000)
+
+# Load database templates
+dbLoadTemplate("$(TOP)/db/motor.substitutions")
+dbLoadTemplate("$(TOP)/db/motorstatus.substitutions")
+dbLoadTemplate("$(TOP)/db/pmacStatus.substitutions")
+dbLoadTemplate("$(TOP)/db/autohome.substitutions")
+dbLoadTemplate("$(TOP)/db/cs.substitutions")
+dbLoadRecords("$(PPMAC)/db/asynComm.db", "P=$(CT_SYS)$(DEV), PORT=$(SSH_PORT), ADDR=0")
@@ -0,0 +1,38 @@
+
+< /epics/common/localhost-netsetup.cmd
+
+errlogInit(20000)
+
+epicsEnvSet("IOC", "powerpmac")
+epicsEnvSet("IOC_DIR", "/epics/iocs")
+epicsEnvSet("TOP", "/epics/iocs/mc91")
+epicsEnvSet("TEMPLATE_TOP", "/epics/modules/ppmac_91b4edc")
+epicsEnvSet("HOSTNAME", "localhost")
+epicsEnvSet("IOCNAME", "mc91")
+epicsEnvSet("ASYN", "/usr/lib/epics")
+epicsEnvSet("AUTOSAVE", "/usr/lib/epics")
+epicsEnvSet("BUSY", "/usr/lib/epics")
+epicsEnvSet("CALC", "/usr/lib/epics")
+epicsEnvSet("DEVIOCSTATS", "/usr/lib/epics")
+epicsEnvSet("SSCAN", "/usr/lib/epics")
+epicsEnvSet("STREAM", "/usr/lib/epics")
+epicsEnvSet("SNCSEQ", "/usr/lib/epics")
+epicsEnvSet("RECCASTER", "/usr/lib/epics")
+epicsEnvSet("EPICS_BASE", "/usr/lib/epics")
+epicsEnvSet("CTRL_PORT", "M0")
+epicsEnvSet("SSH_PORT", "P0")
+epicsEnvSet("CT_PREFIX", "XF:31ID1-CT{MC:01}")
+epicsEnvSet("IOC_PREFIX", "XF:31ID1-CT{IOC-MC:01}")
+epicsEnvSet("MOVING_POLL_PERIOD", "100")
+epicsEnvSet("IDLE_POLL_PERIOD", "1000")
+epicsEnvSet("MOTOR", "/usr/lib/epics")
+epicsEnvSet("PMAC", "/epics/modules/pmac_f811ee1")
+epicsEnvSet("PPMAC", "/epics/modules/ppmac_91b4edc")
+epicsEnvSet("SYS", "XF:31ID1-OP:1")
+epicsEnvSet("CONTROLLER", "MC:01")
+epicsEnvSet("DEV", "{MC:01}")
+epicsEnvSet("CT_SYS", "XF:31ID1-CT")
+epicsEnvSet("NUM_AXES", "8")
+epicsEnvSet("ENGINEER", "J. Wlodek")
+epicsEnvSet("CONTROLLER_IP", "xf31id1-lab3-mc1.nsls2.bnl.local")
+epicsEnvSet("EPICS_DB_INCLUDE_PATH", "/epics/iocs/mc91/db:/epics/modules/pmac_f811ee1/db:/epics/modules/ppmac_91b4edc/db:/usr/lib/epics/db")
@@ -0,0 +1,25 @@
+
+dbLoadDatabase("/epics/modules/ppmac_91b4edc/dbd/ppmac.dbd")
+ppmac_registerRecordDeviceDriver(pdbbase)
+
+# powerpmac specific commands
+
+# Configure the low level communication port
+drvAsynPowerPMACPortConfigure("$(SSH_PORT)", "$(CONTROLLER_IP)", "root", "deltatau", "0", "0", "0")
+
+# Configure Model 3 Controller Driver (ControllerPort, LowLevelDriverPort, Address, Axes, MovingPoll, IdlePoll)
+pmacCreateController("$(CTRL_PORT)", "$(SSH_PORT)", 0, $(NUM_AXES), 100, 1000)
+
+# Configure Model 3 Axes Driver (Controler Port, Axis Count)
+pmacCreateAxes("$(CTRL_PORT)", $(NUM_AXES))
+
+# Disable limits check for all axes
+pmacDisableLimitsCheck("$(CTRL_PORT)", 0, 1)
+
+
+# Load database templates
+dbLoadTemplate("$(TOP)/db/motor.substitutions")
+dbLoadTemplate("$(TOP)/db/motorstatus.substitutions")
+dbLoadTemplate("$(TOP)/db/pmacStatus.substitutions")
+dbLoadTemplate("$(TOP)/db/autohome.substitutions")
+dbLoadRecords("$(PPMAC)/db/asynComm.db", "P=$(CT_SYS)$(DEV), PORT=$(SSH_PORT), ADDR=0")
@@ -0,0 +1,12 @@
+dbLoadDatabase("/epics/modules/qepro_734fbdd/dbd/QEProApp.dbd")
+
+QEProApp_registerRecordDeviceDriver(pdbbase)
+
+QEProConfig("$(PORT)", 0)
+
+asynSetTraceMask("$(PORT)", -1, 0x9)
+
+dbLoadRecords("$(QEPRO)/db/QEPro.template", "PREFIX=$(PREFIX), PORT=$(PORT), ADDR=0, TIMEOUT=1")
+dbLoadRecords("$(QEPRO)/db/QEProCollect.template", "PREFIX=$(PREFIX), PORT=$(PORT), ADDR=0, TIMEOUT=1")
+dbLoadRecords("$(QEPRO)/db/QEProSpectra.template", "PREFIX=$(PREFIX), PORT=$(PORT), ADDR=0, TIMEOUT=1")
+dbLoadRecords("$(ASYN)/db/asynRecord.db", "PORT=$(PORT), P=$(PREFIX), R=:ASYNIO, ADDR=0, OMAX=0, IMAX=0")
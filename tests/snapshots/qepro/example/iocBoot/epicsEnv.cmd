@@ -0,0 +1,26 @@
+
+< /epics/common/localhost-netsetup.cmd
+
+errlogInit(20000)
+
+epicsEnvSet("IOC", "qepro")
+epicsEnvSet("IOC_DIR", "/epics/iocs")
+epicsEnvSet("TOP", "/epics/iocs/qepro-01")
+epicsEnvSet("TEMPLATE_TOP", "")
+epicsEnvSet("HOSTNAME", "localhost")
+epicsEnvSet("IOCNAME", "qepro-01")
+epicsEnvSet("ASYN", "/usr/lib/epics")
+epicsEnvSet("AUTOSAVE", "/usr/lib/epics")
+epicsEnvSet("BUSY", "/usr/lib/epics")
+epicsEnvSet("CALC", "/usr/lib/epics")
+epicsEnvSet("DEVIOCSTATS", "/usr/lib/epics")
+epicsEnvSet("SSCAN", "/usr/lib/epics")
+epicsEnvSet("STREAM", "/usr/lib/epics")
+epicsEnvSet("SNCSEQ", "/usr/lib/epics")
+epicsEnvSet("RECCASTER", "/usr/lib/epics")
+epicsEnvSet("EPICS_BASE", "/usr/lib/epics")
+epicsEnvSet("PORT", "QEPRO")
+epicsEnvSet("MOTOR", "/usr/lib/epics")
+epicsEnvSet("QEPRO", "/epics/modules/qepro_734fbdd")
+epicsEnvSet("PREFIX", "XF:31ID1-ES{QEPro:Spec-1}")
+epicsEnvSet("EPICS_DB_INCLUDE_PATH", "/epics/iocs/qepro-01/db:/epics/modules/qepro_734fbdd/db:/usr/lib/epics/db")
@@ -0,0 +1,20 @@
+
+dbLoadDatabase("/epics/modules/rbd9103_a835e1c/iocs/rbd9103IOC/dbd/rbd9103App.dbd")
+rbd9103App_registerRecordDeviceDriver(pdbbase)
+
+# Configure low level serial port
+drvAsynSerialPortConfigure("$(SERIAL_PORT)", "/dev/rbd9103_AQ01SDRE", 0, 0, 0)
+
+# For serial options, see the `Communications and Command Reference` section
+# of the RBD9103 manual. These are the settings for low-speed comms.
+asynSetOption("$(SERIAL_PORT)", 0, "baud", 57600)
+asynSetOption("$(SERIAL_PORT)", 0, "bits", 8)
+asynSetOption("$(SERIAL_PORT)", 0, "parity", "none")
+asynSetOption("$(SERIAL_PORT)", 0, "stop", 1)
+
+# CRLF terminators for commands and responses
+asynOctetSetOutputEos("$(SERIAL_PORT)", 0, "\r\n")
+asynOctetSetInputEos("$(SERIAL_PORT)", 0, "\r\n")
+
+# Instantiate the RBD9103 driver
+RBD9103Config("$(PORT)", "$(SERIAL_PORT)")
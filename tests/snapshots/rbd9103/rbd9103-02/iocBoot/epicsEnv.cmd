@@ -0,0 +1,29 @@
+
+< /epics/common/localhost-netsetup.cmd
+
+errlogInit(20000)
+
+epicsEnvSet("IOC", "rbd9103")
+epicsEnvSet("IOC_DIR", "/epics/iocs")
+epicsEnvSet("TOP", "/epics/iocs/rbd9103-02")
+epicsEnvSet("TEMPLATE_TOP", "/epics/modules/rbd9103_a835e1c/iocs/rbd9103IOC")
+epicsEnvSet("HOSTNAME", "localhost")
+epicsEnvSet("IOCNAME", "rbd9103-02")
+epicsEnvSet("ASYN", "/usr/lib/epics")
+epicsEnvSet("AUTOSAVE", "/usr/lib/epics")
+epicsEnvSet("BUSY", "/usr/lib/epics")
+epicsEnvSet("CALC", "/usr/lib/epics")
+epicsEnvSet("DEVIOCSTATS", "/usr/lib/epics")
+epicsEnvSet("SSCAN", "/usr/lib/epics")
+epicsEnvSet("STREAM", "/usr/lib/epics")
+epicsEnvSet("SNCSEQ", "/usr/lib/epics")
+epicsEnvSet("RECCASTER", "/usr/lib/epics")
+epicsEnvSet("EPICS_BASE", "/usr/lib/epics")
+epicsEnvSet("SERIAL_PORT", "RBD_TTY")
+epicsEnvSet("PORT", "RBD")
+epicsEnvSet("MOTOR", "/usr/lib/epics")
+epicsEnvSet("RBD9103", "/epics/modules/rbd9103_a835e1c")
+epicsEnvSet("PREFIX", "XF:31ID1-ES{RBD9103-AMM:2}")
+epicsEnvSet("ENGINEER", "J. Wlodek")
+epicsEnvSet("SERIAL_NUMBER", "AQ01SDRF")
+epicsEnvSet("EPICS_DB_INCLUDE_PATH", "/epics/iocs/rbd9103-02/db:/epics/modules/rbd9103_a835e1c/db:/usr/lib/epics/db")
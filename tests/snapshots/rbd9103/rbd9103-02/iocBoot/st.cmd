@@ -0,0 +1,20 @@
+#!/epics/modules/rbd9103_a835e1c/iocs/rbd9103IOC/bin/linux-x86_64/rbd9103App
+
+# Perform base environment setup and configuration
+< ./epicsEnv.cmd
+
+# Load IOC specific startup configuration
+< ./base.cmd
+
+# Load any additional configured databases, prep autosave
+< ./common.cmd
+
+iocInit()
+
+# Perform standard IOC post-init actions
+< ./postInit.cmd
+
+dbl > $(TOP)/records.dbl
+date
+
+# IOC rbd9103-02 completed startup
@@ -0,0 +1,12 @@
+
+dbLoadDatabase("/epics/modules/base_stream_ioc_093e6cf/dbd/baseStreamApp.dbd")
+baseStreamApp_registerRecordDeviceDriver(pdbbase)
+
+drvAsynIPPortConfigure("$(PORT)", "$(DEVICE_IP):$(DEVICE_PORT)", 0, 0, 0)
+asynOctetSetInputEos("$(PORT)", -1, "\r\n")
+asynOctetSetOutputEos("$(PORT)", -1, "\r\n")
+asynSetTraceIOMask("$(PORT)", -1, 0)
+asynSetTraceMask("$(PORT)", -1, 0)
+
+set_pass0_restoreFile("SR570preamp_settings.sav")
+set_pass1_restoreFile("SR570preamp_settings.sav")
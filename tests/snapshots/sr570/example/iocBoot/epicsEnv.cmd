@@ -0,0 +1,30 @@
+
+< /epics/common/localhost-netsetup.cmd
+
+errlogInit(20000)
+
+epicsEnvSet("IOC", "sr570")
+epicsEnvSet("IOC_DIR", "/epics/iocs")
+epicsEnvSet("TOP", "/epics/iocs/sr570-01")
+epicsEnvSet("TEMPLATE_TOP", "/epics/modules/base_stream_ioc_093e6cf")
+epicsEnvSet("HOSTNAME", "localhost")
+epicsEnvSet("IOCNAME", "sr570-01")
+epicsEnvSet("ASYN", "/usr/lib/epics")
+epicsEnvSet("AUTOSAVE", "/usr/lib/epics")
+epicsEnvSet("BUSY", "/usr/lib/epics")
+epicsEnvSet("CALC", "/usr/lib/epics")
+epicsEnvSet("DEVIOCSTATS", "/usr/lib/epics")
+epicsEnvSet("SSCAN", "/usr/lib/epics")
+epicsEnvSet("STREAM", "/usr/lib/epics")
+epicsEnvSet("SNCSEQ", "/usr/lib/epics")
+epicsEnvSet("RECCASTER", "/usr/lib/epics")
+epicsEnvSet("EPICS_BASE", "/usr/lib/epics")
+epicsEnvSet("PORT", "SR570")
+epicsEnvSet("MOTOR", "/usr/lib/epics")
+epicsEnvSet("BASESTREAMIOC", "/epics/modules/base_stream_ioc_093e6cf")
+epicsEnvSet("DEVICE_IP", "192.168.1.1")
+epicsEnvSet("DEVICE_PORT", "5000")
+epicsEnvSet("SYS", "XF:31ID1-ES")
+epicsEnvSet("DEV", "{SR570:1}")
+epicsEnvSet("ENGINEER", "J. Wlodek")
+epicsEnvSet("EPICS_DB_INCLUDE_PATH", "/epics/iocs/sr570-01/db:/epics/modules/base_stream_ioc_093e6cf/db:/usr/lib/epics/db")
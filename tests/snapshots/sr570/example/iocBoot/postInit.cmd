@@ -0,0 +1,7 @@
+
+cd $(TOP)/as/req
+
+create_monitor_set("SR570preamp_settings.req", 30, "P=$(SYS), A=$(DEV)")
+
+
+cd $(TOP)
@@ -0,0 +1,7 @@
+
+dbLoadDatabase("/epics/modules/base_stream_ioc_093e6cf/dbd/baseStreamApp.dbd")
+baseStreamApp_registerRecordDeviceDriver(pdbbase)
+
+drvAsynIPPortConfigure("$(PORT)", "$(IP):$(IP_PORT)", 0, 0, 0)
+asynOctetSetInputEos("$(PORT)", 0, "\r\n")
+asynOctetSetOutputEos("$(PORT)", 0, "\r\n")
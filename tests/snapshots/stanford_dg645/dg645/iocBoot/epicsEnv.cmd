@@ -0,0 +1,31 @@
+
+< /epics/common/localhost-netsetup.cmd
+
+errlogInit(20000)
+
+epicsEnvSet("IOC", "stanford_dg645")
+epicsEnvSet("IOC_DIR", "/epics/iocs")
+epicsEnvSet("TOP", "/epics/iocs/dg645")
+epicsEnvSet("TEMPLATE_TOP", "/epics/modules/base_stream_ioc_093e6cf")
+epicsEnvSet("HOSTNAME", "localhost")
+epicsEnvSet("IOCNAME", "dg645")
+epicsEnvSet("ASYN", "/usr/lib/epics")
+epicsEnvSet("AUTOSAVE", "/usr/lib/epics")
+epicsEnvSet("BUSY", "/usr/lib/epics")
+epicsEnvSet("CALC", "/usr/lib/epics")
+epicsEnvSet("DEVIOCSTATS", "/usr/lib/epics")
+epicsEnvSet("SSCAN", "/usr/lib/epics")
+epicsEnvSet("STREAM", "/usr/lib/epics")
+epicsEnvSet("SNCSEQ", "/usr/lib/epics")
+epicsEnvSet("RECCASTER", "/usr/lib/epics")
+epicsEnvSet("EPICS_BASE", "/usr/lib/epics")
+epicsEnvSet("PORT", "DG645")
+epicsEnvSet("PREFIX", "XF:31ID1-ES{Dly:1}")
+epicsEnvSet("MOTOR", "/usr/lib/epics")
+epicsEnvSet("BASESTREAMIOC", "/epics/modules/base_stream_ioc_093e6cf")
+epicsEnvSet("ENGINEER", "A. Haque")
+epicsEnvSet("DEVICE_IP", "192.168.150.10")
+epicsEnvSet("DEVICE_PORT", "5025")
+epicsEnvSet("P", "XF:31ID1-ES")
+epicsEnvSet("R", "{Dly:1}")
+epicsEnvSet("EPICS_DB_INCLUDE_PATH", "/epics/iocs/dg645/db:/epics/modules/base_stream_ioc_093e6cf/db:/usr/lib/epics/db")
@@ -0,0 +1,6 @@
+
+dbLoadDatabase("/epics/modules/base_stream_ioc_093e6cf/dbd/baseStreamApp.dbd")
+baseStreamApp_registerRecordDeviceDriver(pdbbase)
+
+vxi11Configure("$(PORT)", "$(DEVICE_IP)", 0, "0.0", "inst0", 0, 0)
+asynOctetSetInputEos("$(PORT)", 0, "\n")
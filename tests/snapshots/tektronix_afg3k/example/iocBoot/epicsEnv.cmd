@@ -0,0 +1,29 @@
+
+< /epics/common/localhost-netsetup.cmd
+
+errlogInit(20000)
+
+epicsEnvSet("IOC", "tektronix_afg3k")
+epicsEnvSet("IOC_DIR", "/epics/iocs")
+epicsEnvSet("TOP", "/epics/iocs/afg3k")
+epicsEnvSet("TEMPLATE_TOP", "/epics/modules/base_stream_ioc_093e6cf")
+epicsEnvSet("HOSTNAME", "localhost")
+epicsEnvSet("IOCNAME", "afg3k")
+epicsEnvSet("ASYN", "/usr/lib/epics")
+epicsEnvSet("AUTOSAVE", "/usr/lib/epics")
+epicsEnvSet("BUSY", "/usr/lib/epics")
+epicsEnvSet("CALC", "/usr/lib/epics")
+epicsEnvSet("DEVIOCSTATS", "/usr/lib/epics")
+epicsEnvSet("SSCAN", "/usr/lib/epics")
+epicsEnvSet("STREAM", "/usr/lib/epics")
+epicsEnvSet("SNCSEQ", "/usr/lib/epics")
+epicsEnvSet("RECCASTER", "/usr/lib/epics")
+epicsEnvSet("EPICS_BASE", "/usr/lib/epics")
+epicsEnvSet("PORT", "AFG3K")
+epicsEnvSet("PREFIX", "XF:31ID1-ES{Tektronix-AFG3K:01}")
+epicsEnvSet("MOTOR", "/usr/lib/epics")
+epicsEnvSet("BASESTREAMIOC", "/epics/modules/base_stream_ioc_093e6cf")
+epicsEnvSet("P", "XF:31ID1-ES")
+epicsEnvSet("R", "{Tektronix-AFG3K:01}")
+epicsEnvSet("DEVICE_IP", "192.168.1.1")
+epicsEnvSet("EPICS_DB_INCLUDE_PATH", "/epics/iocs/afg3k/db:/epics/modules/base_stream_ioc_093e6cf/db:/usr/lib/epics/db")
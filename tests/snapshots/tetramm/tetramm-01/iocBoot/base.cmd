@@ -0,0 +1,28 @@
+
+errlogInit(20000)
+
+epicsEnvSet("PREFIX", "$(IOC_PREFIX)")
+epicsEnvSet("RECORD", "")
+
+dbLoadDatabase("$(QUADEM)/dbd/quadEMTestApp.dbd")
+quadEMTestApp_registerRecordDeviceDriver(pdbbase)
+
+drvAsynIPPortConfigure("IP_$(PORT)", "$(DEVICE_IP):$(DEVICE_IP_PORT)", 0, 0, 0)
+asynOctetSetInputEos("IP_$(PORT)",  0, "\r\n")
+asynOctetSetOutputEos("IP_$(PORT)", 0, "\r")
+
+# Set both TRACE_IO_ESCAPE (for ASCII command/response) and TRACE_IO_HEX (for binary data)
+asynSetTraceIOMask("IP_$(PORT)", 0, 6)
+asynSetTraceIOTruncateSize("IP_$(PORT)", 0, 4000)
+
+# Load asynRecord record
+dbLoadRecords("$(ASYN)/db/asynRecord.db", "P=$(PREFIX), R=asyn1, PORT=IP_$(PORT), ADDR=0, OMAX=256, IMAX=256")
+drvTetrAMMConfigure("$(PORT)", "IP_$(PORT)", $(RING_SIZE))
+dbLoadRecords("$(QUADEM)/db/$(TEMPLATE).template", "P=$(SYS), R=$(DEV), PORT=$(PORT), ADDR=0, TIMEOUT=1")
+
+asynSetTraceIOMask("$(PORT)", 0, 2)
+
+< $(QUADEM)/iocBoot/commonPlugins.cmd
+< $(QUADEM)/iocBoot/saveRestore.cmd
+
+< ./AutoSave.cmd
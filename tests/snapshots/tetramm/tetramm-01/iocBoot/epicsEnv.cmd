@@ -0,0 +1,39 @@
+
+< /epics/common/localhost-netsetup.cmd
+
+errlogInit(20000)
+
+epicsEnvSet("IOC", "tetramm")
+epicsEnvSet("IOC_DIR", "/epics/iocs")
+epicsEnvSet("TOP", "/epics/iocs/tetramm")
+epicsEnvSet("TEMPLATE_TOP", "/epics/modules/quadem_f5ab1e9")
+epicsEnvSet("HOSTNAME", "localhost")
+epicsEnvSet("IOCNAME", "tetramm")
+epicsEnvSet("ASYN", "/usr/lib/epics")
+epicsEnvSet("AUTOSAVE", "/usr/lib/epics")
+epicsEnvSet("BUSY", "/usr/lib/epics")
+epicsEnvSet("CALC", "/usr/lib/epics")
+epicsEnvSet("DEVIOCSTATS", "/usr/lib/epics")
+epicsEnvSet("SSCAN", "/usr/lib/epics")
+epicsEnvSet("STREAM", "/usr/lib/epics")
+epicsEnvSet("SNCSEQ", "/usr/lib/epics")
+epicsEnvSet("RECCASTER", "/usr/lib/epics")
+epicsEnvSet("EPICS_BASE", "/usr/lib/epics")
+epicsEnvSet("TEMPLATE", "TetrAMM")
+epicsEnvSet("PORT", "TetrAMM")
+epicsEnvSet("QSIZE", "20")
+epicsEnvSet("RING_SIZE", "10000")
+epicsEnvSet("TSPOINTS", "10000")
+epicsEnvSet("MAX_THREADS", "8")
+epicsEnvSet("EPICS_CA_MAX_ARRAY_BYTES", "5000000")
+epicsEnvSet("MOTOR", "/usr/lib/epics")
+epicsEnvSet("ADSUPPORT", "/epics/modules/adsupport_fe23754")
+epicsEnvSet("ADCORE", "/epics/modules/adcore_5860bd3")
+epicsEnvSet("QUADEM", "/epics/modules/quadem_f5ab1e9")
+epicsEnvSet("SYS", "XF:09IDC-BI")
+epicsEnvSet("DEV", "{BPM:1}")
+epicsEnvSet("IOC_PREFIX", "XF:09IDC-BI{BPM:1}")
+epicsEnvSet("ENGINEER", "C. Engineer")
+epicsEnvSet("DEVICE_IP", "127.0.0.1")
+epicsEnvSet("DEVICE_IP_PORT", "10001")
+epicsEnvSet("EPICS_DB_INCLUDE_PATH", "/epics/iocs/tetramm/db:/epics/modules/adsupport_fe23754/db:/epics/modules/adcore_5860bd3/db:/epics/modules/quadem_f5ab1e9/db:/usr/lib/epics/db")
@@ -0,0 +1,59 @@
+dbLoadDatabase("/epics/modules/tpmac_44274d1/dbd/tpmac.dbd")
+tpmac_registerRecordDeviceDriver(pdbbase)
+
+# turbopmac specific commands
+
+# ============================ CONFIGURATION ===================================
+# pmacAsynIPConfigure() is a wrapper for drvAsynIPPort::drvAsynIPPortConfigure() and
+# pmacAsynIPPort::pmacAsynIPPortConfigureEos().
+# See pmacAsynIPPort.c
+pmacAsynIPConfigure("$(ASYN_PORT)", "$(CONTROLLER_IP):1025")
+
+# WARNING: a trace-mask of containing 0x10 will TRACE_FLOW (v. noisy!!)
+#asynSetTraceMask("$(ASYN_PORT)",-1,0x9)
+#asynSetTraceIOMask("$(ASYN_PORT)",-1,0x2)
+
+# Configure Model 3 Controller Driver
+# (motor record port name, low level port, low level port address, num axes,
+#  moving polling period (ms), idle polling period (ms))
+pmacCreateController("$(CONTROLLER_PORT)","$(ASYN_PORT)", 0, $(NUM_AXES), 100, 1000)
+
+# Configure axes for the model 3 driver
+pmacCreateAxes("$(CONTROLLER_PORT)", $(NUM_AXES))
+
+# ============================ DISABLE LIMITS =================================
+# Disable the limits disabled check for some axes (normally this should be left enabled)
+# pmacDisableLimitsCheck(string portname, int axis, int allAxes)
+pmacDisableLimitsCheck("$(CONTROLLER_PORT)", 0, 1)
+
+# ============================ SET OPEN LOOP AXES =============================
+# Set the encoder axis for an open loop axis.
+# pmacSetOpenLoopEncoderAxis(const char *controller, int axis, int encoder_axis)
+pmacSetOpenLoopEncoderAxis("$(CONTROLLER_PORT)", 1, 1)
+pmacSetOpenLoopEncoderAxis("$(CONTROLLER_PORT)", 2, 5)
+
+# ============================ SET COORDINATE SYSTEMS =========================
+# Initialize the coord-system(port, addr, cs, ref, prog#)
+pmacAsynCoordCreate("$(ASYN_PORT)", 0, 2, 2, 10)
+
+# setup the coord-sys(portName, drvel-name, ref#(from create), nAxes+1)
+drvAsynMotorConfigure("CS2","pmacAsynCoord", 2, 9)
+
+
+# ============================ SET SCALE FACTOR ===============================
+
+# ============================ SET POLL RATES =================================
+# change poll rates (card, poll-period in ms)
+pmacSetMovingPollPeriod(1, 100)
+pmacSetIdlePollPeriod(1, 1000)
+pmacSetCoordMovingPollPeriod(1, 200)
+pmacSetCoordIdlePollPeriod(1, 2000)
+
+# ============================ SUBSTITUTIONS ==================================
+dbLoadTemplate("$(TOP)/db/motor.substitutions")
+dbLoadTemplate("$(TOP)/db/motorstatus.substitutions")
+dbLoadTemplate("$(TOP)/db/pmac_asyn_motor.substitutions")
+
+# ============================ LOAD ASYN COMM.DB ==============================
+# Load asynComm.db
+dbLoadRecords("$(TPMAC)/db/asynComm.db", "P=$(IOC_ASYN), PORT=$(ASYN_PORT), ADDR=0")
@@ -0,0 +1,35 @@
+
+< /epics/common/localhost-netsetup.cmd
+
+errlogInit(20000)
+
+epicsEnvSet("IOC", "turbopmac")
+epicsEnvSet("IOC_DIR", "/epics/iocs")
+epicsEnvSet("TOP", "/epics/iocs/mc01")
+epicsEnvSet("TEMPLATE_TOP", "/epics/modules/tpmac_44274d1")
+epicsEnvSet("HOSTNAME", "localhost")
+epicsEnvSet("IOCNAME", "mc01")
+epicsEnvSet("ASYN", "/usr/lib/epics")
+epicsEnvSet("AUTOSAVE", "/usr/lib/epics")
+epicsEnvSet("BUSY", "/usr/lib/epics")
+epicsEnvSet("CALC", "/usr/lib/epics")
+epicsEnvSet("DEVIOCSTATS", "/usr/lib/epics")
+epicsEnvSet("SSCAN", "/usr/lib/epics")
+epicsEnvSet("STREAM", "/usr/lib/epics")
+epicsEnvSet("SNCSEQ", "/usr/lib/epics")
+epicsEnvSet("RECCASTER", "/usr/lib/epics")
+epicsEnvSet("EPICS_BASE", "/usr/lib/epics")
+epicsEnvSet("STREAM_PROTOCOL_PATH", "/usr/lib/epics/protocol:/epics/modules/tpmac_44274d1/protocol:/epics/iocs/mc01/protocol:.")
+epicsEnvSet("MOTOR", "/usr/lib/epics")
+epicsEnvSet("PMAC", "MC:01")
+epicsEnvSet("TPMAC", "/epics/modules/tpmac_44274d1")
+epicsEnvSet("ENGINEER", "J. Wlodek")
+epicsEnvSet("SYS", "XF:31ID1-ES")
+epicsEnvSet("DEV", "{MC:01}")
+epicsEnvSet("CT_SYS", "XF:31ID1-CT")
+epicsEnvSet("IOC_ASYN", "XF:31ID1-CT{MC:01}Asyn")
+epicsEnvSet("ASYN_PORT", "P0")
+epicsEnvSet("CONTROLLER_PORT", "M0")
+epicsEnvSet("NUM_AXES", "8")
+epicsEnvSet("CONTROLLER_IP", "10.10.10.10")
+epicsEnvSet("EPICS_DB_INCLUDE_PATH", "/epics/iocs/mc01/db:MC:01/db:/epics/modules/tpmac_44274d1/db:/usr/lib/epics/db")
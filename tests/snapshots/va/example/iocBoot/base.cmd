@@ -0,0 +1,22 @@
+
+dbLoadDatabase("/epics/modules/va_c2bcccd/dbd/va.dbd")
+va_registerRecordDeviceDriver(pdbbase)
+
+# va specific commands
+
+## User defined ENV variables
+epicsEnvSet("STREAM_PROTOCOL_PATH", "$(VA)/protocol")
+
+drvAsynIPPortConfigure("tsrv1-P1", "10.66.66.71:4001")
+drvAsynIPPortConfigure("tsrv1-P2", "10.66.66.71:4002")
+drvAsynIPPortConfigure("tsrv1-P3", "10.66.66.71:4003")
+drvAsynIPPortConfigure("tsrv1-P4", "10.66.66.71:4004")
+drvAsynIPPortConfigure("tsrv10-P1", "10.66.66.80:4001")
+drvAsynIPPortConfigure("tsrv10-P2", "10.66.66.80:4002")
+drvAsynIPPortConfigure("tsrv10-P3", "10.66.66.80:4003")
+drvAsynIPPortConfigure("tsrv12-P1", "10.66.66.82:4001")
+drvAsynIPPortConfigure("tsrv12-P2", "10.66.66.82:4002")
+drvAsynIPPortConfigure("xf09id1-ipc1", "10.66.66.141:23")
+drvAsynIPPortConfigure("xf09id1-ipc2", "10.66.66.142:23")
+drvAsynIPPortConfigure("xf09id1-ipc3", "10.66.66.143:23")
+drvAsynIPPortConfigure("xf09id1-ipc4", "10.66.66.144:23")
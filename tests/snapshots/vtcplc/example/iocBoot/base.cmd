@@ -0,0 +1,11 @@
+
+dbLoadDatabase("/epics/modules/vtcplc_7c69152/dbd/vacuum_plc.dbd")
+vacuum_plc_registerRecordDeviceDriver(pdbbase)
+
+# vtcplc specific commands
+EIP_buffer_limit(492)
+drvEtherIP_init()
+drvEtherIP_define_PLC("$(SYSPORT)_PLC","$(PLCADR)",0)
+EIP_verbosity(6)
+
+dbLoadRecords("$(VTCPLC)/db/$(Template)","Sys=$(SYS),Dev={PLC},PLC=$(SYSPORT)_PLC")
@@ -0,0 +1,30 @@
+
+< /epics/common/localhost-netsetup.cmd
+
+errlogInit(20000)
+
+epicsEnvSet("IOC", "vtcplc")
+epicsEnvSet("IOC_DIR", "/epics/iocs")
+epicsEnvSet("TOP", "/epics/iocs/vtcplc-01")
+epicsEnvSet("TEMPLATE_TOP", "/epics/modules/vtcplc_7c69152")
+epicsEnvSet("HOSTNAME", "localhost")
+epicsEnvSet("IOCNAME", "vtcplc-01")
+epicsEnvSet("ASYN", "/usr/lib/epics")
+epicsEnvSet("AUTOSAVE", "/usr/lib/epics")
+epicsEnvSet("BUSY", "/usr/lib/epics")
+epicsEnvSet("CALC", "/usr/lib/epics")
+epicsEnvSet("DEVIOCSTATS", "/usr/lib/epics")
+epicsEnvSet("SSCAN", "/usr/lib/epics")
+epicsEnvSet("STREAM", "/usr/lib/epics")
+epicsEnvSet("SNCSEQ", "/usr/lib/epics")
+epicsEnvSet("RECCASTER", "/usr/lib/epics")
+epicsEnvSet("EPICS_BASE", "/usr/lib/epics")
+epicsEnvSet("MOTOR", "/usr/lib/epics")
+epicsEnvSet("VTCPLC", "/epics/modules/vtcplc_7c69152")
+epicsEnvSet("ENGINEER", "C. Engineer")
+epicsEnvSet("PREFIX", "XF:31ID1-ES{VTCPLC:01}")
+epicsEnvSet("PLCADR", "10.69.34.74")
+epicsEnvSet("SYS", "Vactest-FEA:")
+epicsEnvSet("SYSPORT", "vactest")
+epicsEnvSet("Template", "fea-plc.template")
+epicsEnvSet("EPICS_DB_INCLUDE_PATH", "/epics/iocs/vtcplc-01/db:/epics/modules/vtcplc_7c69152/db:/usr/lib/epics/db")
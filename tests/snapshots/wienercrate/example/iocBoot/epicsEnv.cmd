@@ -0,0 +1,29 @@
+
+< /epics/common/localhost-netsetup.cmd
+
+errlogInit(20000)
+
+epicsEnvSet("IOC", "wienercrate")
+epicsEnvSet("IOC_DIR", "/epics/iocs")
+epicsEnvSet("TOP", "/epics/iocs/wps1")
+epicsEnvSet("TEMPLATE_TOP", "/epics/modules/snmp_nscl_3cd2804")
+epicsEnvSet("HOSTNAME", "localhost")
+epicsEnvSet("IOCNAME", "wps1")
+epicsEnvSet("ASYN", "/usr/lib/epics")
+epicsEnvSet("AUTOSAVE", "/usr/lib/epics")
+epicsEnvSet("BUSY", "/usr/lib/epics")
+epicsEnvSet("CALC", "/usr/lib/epics")
+epicsEnvSet("DEVIOCSTATS", "/usr/lib/epics")
+epicsEnvSet("SSCAN", "/usr/lib/epics")
+epicsEnvSet("STREAM", "/usr/lib/epics")
+epicsEnvSet("SNCSEQ", "/usr/lib/epics")
+epicsEnvSet("RECCASTER", "/usr/lib/epics")
+epicsEnvSet("EPICS_BASE", "/usr/lib/epics")
+epicsEnvSet("MOTOR", "/usr/lib/epics")
+epicsEnvSet("SNMP-NSCL", "/epics/modules/snmp_nscl_3cd2804")
+epicsEnvSet("SYS", "XF:18IDB-OP")
+epicsEnvSet("DEV", "WPS:01")
+epicsEnvSet("WIENER_IP", "10.66.138.60")
+epicsEnvSet("PREFIX", "XF:18IDB-OP{IOC:SNMP}")
+epicsEnvSet("ENGINEER", "D. Gavrilov")
+epicsEnvSet("EPICS_DB_INCLUDE_PATH", "/epics/iocs/wps1/db:$(SNMP-NSCL)/db:/usr/lib/epics/db")
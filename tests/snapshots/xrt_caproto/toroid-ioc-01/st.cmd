@@ -0,0 +1,13 @@
+#!/bin/bash
+
+# Configure EPICS network environment variables
+export EPICS_CA_AUTO_ADDR_LIST=NO
+export EPICS_CAS_AUTO_BEACON_ADDR_LIST=NO
+export EPICS_CA_ADDR_LIST=127.0.0.1
+export EPICS_CAS_BEACON_ADDR_LIST=127.0.0.1
+
+# Start IOC here
+pixi run python -m caproto.ioc_examples.xrt_xml_ioc \
+  --list-pvs \
+  --xml='db/toroid_focus.xml' \
+  --prefix='XF:31ID1-ES{SIM:01}'
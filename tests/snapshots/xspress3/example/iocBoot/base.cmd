@@ -0,0 +1,94 @@
+
+# xspress3 specific commands
+# Device initialization
+# ---------------------
+
+dbLoadDatabase("/epics/modules/xspress3_5f459a1/iocs/xspress3IOC/dbd/xspress3App.dbd")
+xspress3App_registerRecordDeviceDriver(pdbbase)
+
+# suppress "callbackRequest: cbLow ring buffer full"
+callbackSetQueueSize(32768)
+
+
+##################################################
+# Start Xspress3 driver
+
+# Parameters
+# portName: The Asyn port name to use
+# numChannels: The max number of channels (eg. 8)
+# numCards: The number of Xspress3 systems (normally 1)
+# baseIP: The base address used by the Xspress3  1Gig and 10Gig interfaces (eg. "192.168.0.1")
+# Max Frames: Used for XSPRESS3 API Configuration   (depends on Xspress3 firmware config).
+# Max Driver Frames: Used to limit how big EPICS driver arrays are. Needs to match database MAX_FRAMES_DRIVER_RBV.
+# maxSpectra The maximum size of each spectra (eg. 4096)
+# maxBuffers Used by asynPortDriver (set to 0 for unlimited)
+# maxMemory Used by asynPortDriver (set to 0 for unlimited)
+# debug This debug flag is passed to xsp3_config in the Xspress API (0 or 1)
+# simTest 0 or 1. Set to 1 to run up this driver in simulation mode.
+# circBuffer 0 or 1. set to 1 if more than 12216 frames required
+epicsEnvSet("XS3_SIM", 0)
+xspress3Config("$(PORT)", "$(NUM_CHANNELS)", "$(NUM_CARDS)", "$(XSPRESS3_IP)", "$(MAX_FRAMES)", "$(MAX_DRV_FRAMES)", "$(NUM_BINS)", 0, 0, 0, "$(XS3_SIM)", "$(CIRC_BUFFER)")
+
+#
+# Create a processing plugin
+
+NDProcessConfigure("PROC1", $(QSIZE), 0, "$(PORT)", 0, 0, 0)
+dbLoadRecords("$(ADCORE)/db/NDProcess.template",   "P=$(PREFIX),R=Proc1:,  PORT=PROC1,ADDR=0,TIMEOUT=1,NDARRAY_PORT=$(PORT)")
+
+# Create an HDF5 file saving plugin
+NDFileHDF5Configure("FileHDF1", $(QSIZE), 0, "$(PORT)", 0)
+dbLoadRecords("$(ADCORE)/db/NDFileHDF5.template",  "P=$(PREFIX),R=HDF1:,PORT=FileHDF1,ADDR=0,TIMEOUT=1,NDARRAY_PORT=$(PORT)")
+
+# load main template
+dbLoadRecords("$(XSPRESS3)/db/xspress3.template","P=$(PREFIX),R=det1:,PORT=$(PORT), ADDR=0, TIMEOUT=5, MAX_SPECTRA=$(NUM_BINS), MAX_FRAMES=$(MAX_FRAMES), HDF=$(PREFIX)HDF1:, PROC=$(PREFIX)Proc1:")
+
+# Optional: load devIocStats records (default config includes DEVIOCSTATS module), must define IOC_PREFIX in st.cmd
+dbLoadRecords("$(DEVIOCSTATS)/db/iocAdminSoft.db", "IOC=$(IOC_PREFIX)")
+
+###############################
+# DEFINE CHANNELS
+
+# Channel 1
+epicsEnvSet("CHAN",   "1")
+epicsEnvSet("CHM1",   "0")
+< ./DefineSCAROI.cmd
+# Channel 2
+epicsEnvSet("CHAN",   "2")
+epicsEnvSet("CHM1",   "1")
+< ./DefineSCAROI.cmd
+# Channel 3
+epicsEnvSet("CHAN",   "3")
+epicsEnvSet("CHM1",   "2")
+< ./DefineSCAROI.cmd
+# Channel 4
+epicsEnvSet("CHAN",   "4")
+epicsEnvSet("CHM1",   "3")
+< ./DefineSCAROI.cmd
+# Channel 5
+epicsEnvSet("CHAN",   "5")
+epicsEnvSet("CHM1",   "4")
+< ./DefineSCAROI.cmd
+# Channel 6
+epicsEnvSet("CHAN",   "6")
+epicsEnvSet("CHM1",   "5")
+< ./DefineSCAROI.cmd
+# Channel 7
+epicsEnvSet("CHAN",   "7")
+epicsEnvSet("CHM1",   "6")
+< ./DefineSCAROI.cmd
+# Channel 8
+epicsEnvSet("CHAN",   "8")
+epicsEnvSet("CHM1",   "7")
+< ./DefineSCAROI.cmd
+
+###############################
+
+dbLoadRecords("$(XSPRESS3)/db/xspress3Deadtime_8Channel.template",   "P=$(PREFIX)")
+
+set_requestfile_path("$(TOP)/as/req")
+set_requestfile_path("$(ADCORE)", "db")
+set_requestfile_path("$(AUTOSAVE)", "db")
+set_requestfile_path("$(BUSY)", "db")
+set_requestfile_path("$(CALC)", "db")
+set_requestfile_path("$(XSPRESS3)","db")
+set_requestfile_path("$(SSCAN)", "db")
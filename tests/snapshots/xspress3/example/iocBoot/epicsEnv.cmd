@@ -0,0 +1,39 @@
+
+< /epics/common/localhost-netsetup.cmd
+
+errlogInit(20000)
+
+epicsEnvSet("IOC", "xspress3")
+epicsEnvSet("IOC_DIR", "/epics/iocs")
+epicsEnvSet("TOP", "/epics/iocs/xspress3-01")
+epicsEnvSet("TEMPLATE_TOP", "/epics/modules/xspress3_5f459a1/iocs/xspress3IOC")
+epicsEnvSet("HOSTNAME", "localhost")
+epicsEnvSet("IOCNAME", "xspress3-01")
+epicsEnvSet("ASYN", "/usr/lib/epics")
+epicsEnvSet("AUTOSAVE", "/usr/lib/epics")
+epicsEnvSet("BUSY", "/usr/lib/epics")
+epicsEnvSet("CALC", "/usr/lib/epics")
+epicsEnvSet("DEVIOCSTATS", "/usr/lib/epics")
+epicsEnvSet("SSCAN", "/usr/lib/epics")
+epicsEnvSet("STREAM", "/usr/lib/epics")
+epicsEnvSet("SNCSEQ", "/usr/lib/epics")
+epicsEnvSet("RECCASTER", "/usr/lib/epics")
+epicsEnvSet("EPICS_BASE", "/usr/lib/epics")
+epicsEnvSet("MAX_FRAMES", "16834")
+epicsEnvSet("MAX_DRV_FRAMES", "16834")
+epicsEnvSet("QSIZE", "512")
+epicsEnvSet("CBUFFS", "8192")
+epicsEnvSet("NUM_BINS", "4096")
+epicsEnvSet("PORT", "XSP3")
+epicsEnvSet("CIRC_BUFFER", "1")
+epicsEnvSet("EPICS_DB_INCLUDE_PATH", "/epics/modules/adcore_5860bd3/db:/epics/modules/xspress3_5f459a1/db")
+epicsEnvSet("MOTOR", "/usr/lib/epics")
+epicsEnvSet("ADSUPPORT", "/epics/modules/adsupport_fe23754")
+epicsEnvSet("ADCORE", "/epics/modules/adcore_5860bd3")
+epicsEnvSet("XSPRESS3", "/epics/modules/xspress3_5f459a1")
+epicsEnvSet("ENGINEER", "C. Engineer")
+epicsEnvSet("PREFIX", "XF:31ID1-ES{XSP3:01}:")
+epicsEnvSet("NUM_CHANNELS", "8")
+epicsEnvSet("NUM_CARDS", "4")
+epicsEnvSet("XSPRESS3_IP", "192.168.0.1")
+epicsEnvSet("CALIBRATION_DIR", "/etc/xspress3/calibration/initial/settings")
@@ -0,0 +1,70 @@
+
+cd $(TOP)/as/req
+
+create_monitor_set("auto_settings.req", 30, "P=$(PREFIX)")
+
+dbpf "$(PREFIX)det1:RUN_FLAGS", "0"
+dbpf "$(PREFIX)det1:NUM_CHANNELS", "$(NUM_CHANNELS)"
+dbpf "$(PREFIX)det1:NumImages", "16000"
+dbpf "$(PREFIX)det1:AcquireTime", "0.25"
+dbpf "$(PREFIX)det1:CONNECT", "1"
+dbpf "$(PREFIX)det1:CTRL_DTC", "Disable"
+dbpf "$(PREFIX)det1:TriggerMode", "Internal"
+dbpf "$(PREFIX)det1:EraseOnStart", "Yes"
+dbpf "$(PREFIX)det1:FrameAdvance", "0"
+dbpf "$(PREFIX)det1:ArrayCallbacks", "Enable"
+dbpf "$(PREFIX)HDF1:FileTemplate", "%s%s%d.hdf5"
+dbpf "$(PREFIX)HDF1:FileWriteMode", "Stream"
+dbpf "$(PREFIX)HDF1:EnableCallbacks", "Enable"
+dbpf "$(PREFIX)HDF1:Compression", "zlib"
+dbpf "$(PREFIX)HDF1:ZLevel", "1"
+dbpf "$(PREFIX)HDF1:AutoIncrement", "Yes"
+dbpf "$(PREFIX)Proc1:EnableFilter", "Enable"
+dbpf "$(PREFIX)Proc1:FilterType", "Sum"
+dbpf "$(PREFIX)Proc1:EnableCallbacks", "Enable"
+dbpf "$(PREFIX)det1:EraseOnStart", "No"
+dbpf "$(PREFIX)det1:CONFIG_PATH", "$(CALIBRATION_DIR)"
+epicsThreadSleep(2)
+
+
+cd $(TOP)/iocBoot
+
+###############################
+# SET UP CHANNELS
+
+# Channel 1
+epicsEnvSet("CHAN",   "1")
+epicsEnvSet("CHM1",   "0")
+< ./SetChannelValues.cmd
+# Channel 2
+epicsEnvSet("CHAN",   "2")
+epicsEnvSet("CHM1",   "1")
+< ./SetChannelValues.cmd
+# Channel 3
+epicsEnvSet("CHAN",   "3")
+epicsEnvSet("CHM1",   "2")
+< ./SetChannelValues.cmd
+# Channel 4
+epicsEnvSet("CHAN",   "4")
+epicsEnvSet("CHM1",   "3")
+< ./SetChannelValues.cmd
+# Channel 5
+epicsEnvSet("CHAN",   "5")
+epicsEnvSet("CHM1",   "4")
+< ./SetChannelValues.cmd
+# Channel 6
+epicsEnvSet("CHAN",   "6")
+epicsEnvSet("CHM1",   "5")
+< ./SetChannelValues.cmd
+# Channel 7
+epicsEnvSet("CHAN",   "7")
+epicsEnvSet("CHM1",   "6")
+< ./SetChannelValues.cmd
+# Channel 8
+epicsEnvSet("CHAN",   "8")
+epicsEnvSet("CHM1",   "7")
+< ./SetChannelValues.cmd
+
+###############################
+
+cd $(TOP)
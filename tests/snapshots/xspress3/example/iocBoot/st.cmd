@@ -0,0 +1,20 @@
+#!/epics/modules/xspress3_5f459a1/iocs/xspress3IOC/bin/linux-x86_64/xspress3App
+
+# Perform base environment setup and configuration
+< ./epicsEnv.cmd
+
+# Load IOC specific startup configuration
+< ./base.cmd
+
+# Load any additional configured databases, prep autosave
+< ./common.cmd
+
+iocInit()
+
+# Perform standard IOC post-init actions
+< ./postInit.cmd
+
+dbl > $(TOP)/records.dbl
+date
+
+# IOC xspress3-01 completed startup
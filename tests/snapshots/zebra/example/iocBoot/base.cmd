@@ -0,0 +1,7 @@
+## Register all support components
+dbLoadDatabase("/dbd/zebra.dbd")
+zebra_registerRecordDeviceDriver(pdbbase)
+
+# zebra specific commands
+drvAsynIPPortConfigure("SERIAL_PORT","$(HOSTNAME):$(PORT)")
+zebraConfig("ZEBRA", "SERIAL_PORT", 100000)
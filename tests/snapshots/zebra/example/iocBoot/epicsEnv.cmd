@@ -0,0 +1,40 @@
+
+< /epics/common/localhost-netsetup.cmd
+
+errlogInit(20000)
+
+epicsEnvSet("IOC", "zebra")
+epicsEnvSet("IOC_DIR", "/epics/iocs")
+epicsEnvSet("TOP", "/epics/iocs/zebra")
+epicsEnvSet("TEMPLATE_TOP", "")
+epicsEnvSet("HOSTNAME", "xf31id1-lab3-tsrv1.nsls2.bnl.local")
+epicsEnvSet("IOCNAME", "zebra")
+epicsEnvSet("ASYN", "/usr/lib/epics")
+epicsEnvSet("AUTOSAVE", "/usr/lib/epics")
+epicsEnvSet("BUSY", "/usr/lib/epics")
+epicsEnvSet("CALC", "/usr/lib/epics")
+epicsEnvSet("DEVIOCSTATS", "/usr/lib/epics")
+epicsEnvSet("SSCAN", "/usr/lib/epics")
+epicsEnvSet("STREAM", "/usr/lib/epics")
+epicsEnvSet("SNCSEQ", "/usr/lib/epics")
+epicsEnvSet("RECCASTER", "/usr/lib/epics")
+epicsEnvSet("EPICS_BASE", "/usr/lib/epics")
+epicsEnvSet("EPICS_DB_INCLUDE_PATH", "/epics/modules/zebra_8e70cda/db")
+epicsEnvSet("MOTOR", "/usr/lib/epics")
+epicsEnvSet("ZEBRA", "/epics/modules/zebra_8e70cda")
+epicsEnvSet("SYS", "XF:05IDD-ES:1")
+epicsEnvSet("DEV", "{Dev:Zebra2}")
+epicsEnvSet("PORT", "4004")
+epicsEnvSet("PREFIX", "XF:05IDD-CT{IOC:Zebra2}")
+epicsEnvSet("ENGINEER", "C. Engineer")
+epicsEnvSet("CONFIG_FILE", "/nsls2/data/srx/shared/config/equipment/zebra2/zebra2_latest")
+epicsEnvSet("M1", "XF:05IDD-ES:1{nKB:Smpl-Ax:ssx}Mtr")
+epicsEnvSet("M1DIR", "+")
+epicsEnvSet("M2", "XF:05IDD-ES:1{nKB:Smpl-Ax:ssy}Mtr")
+epicsEnvSet("M2DIR", "+")
+epicsEnvSet("M3", "XF:05IDD-ES:1{nKB:Smpl-Ax:ssz}Mtr")
+epicsEnvSet("M3DIR", "+")
+epicsEnvSet("M4", "XF:05IDD-ES:1{nKB:Smpl-Ax:ssx}Mtr")
+epicsEnvSet("M4DIR", "+")
+epicsEnvSet("NELM", "100000")
+epicsEnvSet("PREC", "4")
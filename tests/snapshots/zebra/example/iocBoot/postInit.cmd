@@ -0,0 +1,15 @@
+
+## Restore the configuration from file
+dbpf("$(SYS)$(DEV):CONFIG_FILE", "/nsls2/data/srx/shared/config/equipment/zebra2/zebra2_latest")
+dbpf("$(SYS)$(DEV):CONFIG_READ.PROC", 1)
+
+# Restore encoder resolutions
+dbpf("$(SYS)$(DEV):M1:MRES", -9.5368e-05)
+dbpf("$(SYS)$(DEV):M2:MRES", 9.5368e-05)
+dbpf("$(SYS)$(DEV):M3:MRES", 9.5368e-05)
+dbpf("$(SYS)$(DEV):M4:MRES", 0)
+
+dbpf("$(SYS)$(DEV):M1:SETPOS.PROC", 1)
+dbpf("$(SYS)$(DEV):M2:SETPOS.PROC", 1)
+dbpf("$(SYS)$(DEV):M3:SETPOS.PROC", 1)
+dbpf("$(SYS)$(DEV):M4:SETPOS.PROC", 1)
@@ -0,0 +1,11 @@
+#!/bin/bash
+
+# Configure EPICS network environment variables
+export EPICS_CA_AUTO_ADDR_LIST=NO
+export EPICS_CAS_AUTO_BEACON_ADDR_LIST=NO
+export EPICS_CA_ADDR_LIST="127.0.0.1"
+export EPICS_CAS_BEACON_ADDR_LIST="127.0.0.1"
+
+# Start IOC here.
+# Caproto requires curly braces to be escaped, i.e. doubled up.
+pixi run python -m srx_caproto_iocs.zebra.caproto_ioc --list-pvs --prefix='XF:09IDA-ES{{ZEBRA_SAVER:01}}'
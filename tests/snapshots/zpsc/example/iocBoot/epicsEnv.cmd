@@ -0,0 +1,32 @@
+
+< /epics/common/localhost-netsetup.cmd
+
+errlogInit(20000)
+
+epicsEnvSet("IOC", "zpsc")
+epicsEnvSet("IOC_DIR", "/epics/iocs")
+epicsEnvSet("TOP", "/epics/iocs/zpsc-01")
+epicsEnvSet("TEMPLATE_TOP", "/epics/modules/zpsc_ce70f0d")
+epicsEnvSet("HOSTNAME", "localhost")
+epicsEnvSet("IOCNAME", "zpsc-01")
+epicsEnvSet("ASYN", "/usr/lib/epics")
+epicsEnvSet("AUTOSAVE", "/usr/lib/epics")
+epicsEnvSet("BUSY", "/usr/lib/epics")
+epicsEnvSet("CALC", "/usr/lib/epics")
+epicsEnvSet("DEVIOCSTATS", "/usr/lib/epics")
+epicsEnvSet("SSCAN", "/usr/lib/epics")
+epicsEnvSet("STREAM", "/usr/lib/epics")
+epicsEnvSet("SNCSEQ", "/usr/lib/epics")
+epicsEnvSet("RECCASTER", "/usr/lib/epics")
+epicsEnvSet("EPICS_BASE", "/usr/lib/epics")
+epicsEnvSet("MOTOR", "/usr/lib/epics")
+epicsEnvSet("PSCDRV", "/epics/modules/pscdrv_1ed650d")
+epicsEnvSet("ZPSC", "/epics/modules/zpsc_ce70f0d")
+epicsEnvSet("ENGINEER", "Y. Tian")
+epicsEnvSet("SYSTEMS", "SR:C12-MG")
+epicsEnvSet("DEVICE", "PS:SKQ")
+epicsEnvSet("NUM", "1")
+epicsEnvSet("BLEN", "100000")
+epicsEnvSet("PSC1_IP", "10.0.140.201")
+epicsEnvSet("PREFIX", "SR:C12-MG{PS:SKQ1}")
+epicsEnvSet("EPICS_DB_INCLUDE_PATH", "/epics/iocs/zpsc-01/db:/epics/modules/pscdrv_1ed650d/db:/epics/modules/zpsc_ce70f0d/db:/usr/lib/epics/db")
@@ -0,0 +1,35 @@
+
+< /epics/common/localhost-netsetup.cmd
+
+errlogInit(20000)
+
+epicsEnvSet("IOC", "zubpm")
+epicsEnvSet("IOC_DIR", "/epics/iocs")
+epicsEnvSet("TOP", "/epics/iocs/zubpm-c28-test")
+epicsEnvSet("TEMPLATE_TOP", "/epics/modules/zubpm_cedd09e")
+epicsEnvSet("HOSTNAME", "localhost")
+epicsEnvSet("IOCNAME", "C28test")
+epicsEnvSet("ASYN", "/usr/lib/epics")
+epicsEnvSet("AUTOSAVE", "/usr/lib/epics")
+epicsEnvSet("BUSY", "/usr/lib/epics")
+epicsEnvSet("CALC", "/usr/lib/epics")
+epicsEnvSet("DEVIOCSTATS", "/usr/lib/epics")
+epicsEnvSet("SSCAN", "/usr/lib/epics")
+epicsEnvSet("STREAM", "/usr/lib/epics")
+epicsEnvSet("SNCSEQ", "/usr/lib/epics")
+epicsEnvSet("RECCASTER", "/usr/lib/epics")
+epicsEnvSet("EPICS_BASE", "/usr/lib/epics")
+epicsEnvSet("MOTOR", "/usr/lib/epics")
+epicsEnvSet("PSCDRV", "/epics/modules/pscdrv_1ed650d")
+epicsEnvSet("ZUBPM", "/epics/modules/zubpm_cedd09e")
+epicsEnvSet("ENGINEER", "Y. Hu")
+epicsEnvSet("NO", "2")
+epicsEnvSet("PSC", "psc2")
+epicsEnvSet("ZBPM_IP", "10.0.142.100")
+epicsEnvSet("PX", "C28test{BPM:2}")
+epicsEnvSet("ALIVELEN", "8000")
+epicsEnvSet("TLIVELEN", "8000")
+epicsEnvSet("ALEN", "500000")
+epicsEnvSet("TLEN", "500000")
+epicsEnvSet("FLEN", "500000")
+epicsEnvSet("EPICS_DB_INCLUDE_PATH", "/epics/iocs/zubpm-c28-test/db:/epics/modules/pscdrv_1ed650d/db:/epics/modules/zubpm_cedd09e/db:/usr/lib/epics/db")
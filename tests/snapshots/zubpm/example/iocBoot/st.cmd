@@ -0,0 +1,18 @@
+#!/epics/modules/zubpm_cedd09e/bin/linux-x86_64/zbpm
+
+# Perform base environment setup and configuration
+< ./epicsEnv.cmd
+
+# Load IOC specific startup configuration
+< ./base.cmd
+
+
+iocInit()
+
+# Perform standard IOC post-init actions
+< ./postInit.cmd
+
+dbl > $(TOP)/records.dbl
+date
+
+# IOC zubpm-c28-test completed startup
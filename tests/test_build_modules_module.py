@@ -0,0 +1,83 @@
+import shutil
+import time
+from pathlib import Path
+
+import pytest
+from conftest import load_plugin
+
+build_modules = load_plugin("plugins/modules/build_modules.py")
+
+PARALLEL_MAKEFILE = "all: t1 t2 t3 t4\nt1 t2 t3 t4:\n\t@sleep 0.5\n"
+
+
+@pytest.mark.parametrize(
+    "command, passes_jobs",
+    [
+        ("make -s", False),
+        ("make -sj1", False),
+        ("make -j1", False),
+        ("make -sj", True),
+        ("make -j8", True),
+        ("cp a b && make -s -C sub -j4", True),
+        ("bash install.sh", False),
+    ],
+)
+def test_make_jobs_regex(command, passes_jobs):
+    assert bool(build_modules.MAKE_JOBS_REGEX.search(command)) == passes_jobs
+
+
+def test_default_jobs_limited_by_memory(monkeypatch):
+    monkeypatch.setattr(build_modules, "usable_cores", lambda: 16)
+    monkeypatch.setattr(build_modules, "available_memory_mb", lambda: 6000)
+    assert build_modules.default_jobs(1024) == 5
+    assert build_modules.default_jobs(512) == 11
+    assert build_modules.default_jobs(8192) == 1
+
+
+def test_default_jobs_limited_by_cores(monkeypatch):
+    monkeypatch.setattr(build_modules, "usable_cores", lambda: 4)
+    monkeypatch.setattr(build_modules, "available_memory_mb", lambda: 64000)
+    assert build_modules.default_jobs(1024) == 4
+
+
+@pytest.mark.skipif(shutil.which("make") is None, reason="make not installed")
+@pytest.mark.parametrize("jobs, max_wall_time", [(1, None), (4, 1.5)])
+def test_run_build_uses_jobserver(tmp_path, jobs, max_wall_time):
+    (tmp_path / "Makefile").write_text(PARALLEL_MAKEFILE)
+    build = {"name": "mod", "dir": str(tmp_path), "compilation_command": "make -s"}
+    jobserver = build_modules.JobServer(jobs)
+    result = {}
+    try:
+        build_modules.run_build(
+            build, jobserver, jobserver.acquire(1), ".build.log", result
+        )
+        # All tokens are returned once the build finished
+        assert jobserver.acquire(jobs) == b"+" * jobs
+    finally:
+        jobserver.close()
+
+    assert result["rc"] == 0
+    assert result["peak_rss_mb"] > 0
+    assert Path(result["log"]).exists()
+    if max_wall_time is None:
+        assert result["wall_time"] >= 2
+    else:
+        assert result["wall_time"] < max_wall_time
+
+
+@pytest.mark.skipif(shutil.which("make") is None, reason="make not installed")
+def test_run_build_failure(tmp_path):
+    build = {"name": "mod", "dir": str(tmp_path), "compilation_command": "make -s"}
+    jobserver = build_modules.JobServer(1)
+    result = {}
+    start = time.monotonic()
+    try:
+        build_modules.run_build(
+            build, jobserver, jobserver.acquire(1), ".build.log", result
+        )
+    finally:
+        jobserver.close()
+
+    assert result["rc"] != 0
+    assert result["wall_time"] <= time.monotonic() - start + 0.1
+    assert "No targets" in build_modules.read_log_tail(result["log"])
@@ -0,0 +1,54 @@
+from pathlib import Path
+
+import config_validation
+import pytest
+import yamale
+
+EXAMPLE_CONFIG = Path("roles/device_roles/adpco/examples/pco-det1/config.yml")
+
+
+@pytest.mark.parametrize(
+    "tag, value, valid",
+    [
+        ("hostname", "xf31id1-ioc1.nsls2.bnl.local", True),
+        ("hostname", "bad_host.bnl.local", False),
+        ("ioc_type", "adpco", True),
+        ("ioc_type", "not_a_device_role", False),
+        ("module_name", "adcore_5860bd3", True),
+        ("module_name", "not_a_module", False),
+        ("git_commit_hash", "d1d0eb8", True),
+        ("git_commit_hash", "R3-12-1", False),
+        ("url", "https://github.com/epics-modules/asyn", True),
+        ("url", "git@github.com:epics-modules/asyn", False),
+    ],
+)
+def test_custom_validators(tag, value, valid):
+    assert config_validation.VALIDATORS[tag]().is_valid(value) == valid
+
+
+def test_make_schema_compiles_once():
+    schema = config_validation.make_schema("schemas/verify.yml")
+    assert config_validation.make_schema(Path("schemas/verify.yml")) is schema
+
+
+def test_validate_ioc_config_example(parsed_file_cache):
+    ioc_config = parsed_file_cache.load_yaml(EXAMPLE_CONFIG)["adpco-01"]
+    assert config_validation.validate_ioc_config(ioc_config, EXAMPLE_CONFIG) == []
+
+
+def test_validate_ioc_config_errors(parsed_file_cache):
+    ioc_config = dict(parsed_file_cache.load_yaml(EXAMPLE_CONFIG)["adpco-01"])
+    del ioc_config["environment"]
+    errors = config_validation.validate_ioc_config(ioc_config, EXAMPLE_CONFIG)
+    assert "environment: Required field missing" in errors
+
+    ioc_config["type"] = "not_a_device_role"
+    errors = config_validation.validate_ioc_config(ioc_config, EXAMPLE_CONFIG)
+    assert "type: 'not_a_device_role' is not a ioc_type." in errors
+
+
+def test_validate_raises(parsed_file_cache):
+    with pytest.raises(yamale.YamaleError, match="pco-det1"):
+        config_validation.validate(
+            "roles/deploy_ioc/schema.yml", {"type": "adpco"}, EXAMPLE_CONFIG
+        )
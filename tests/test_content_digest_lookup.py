@@ -0,0 +1,38 @@
+from pathlib import Path
+
+from conftest import load_plugin
+
+content_digest_plugin = load_plugin("plugins/lookup/content_digest.py")
+content_digest = content_digest_plugin.content_digest
+
+
+def make_role(path: Path) -> Path:
+    (path / "templates").mkdir(parents=True)
+    (path / "templates" / "base.cmd.j2").write_text("dbLoadRecords({{ db }})\n")
+    (path / "vars.yml").write_text("---\nfoo: bar\n")
+    return path
+
+
+def test_content_digest_is_independent_of_location(tmp_path):
+    first = make_role(tmp_path / "first")
+    second = make_role(tmp_path / "elsewhere" / "second")
+    assert content_digest([str(first / "templates"), str(first / "vars.yml")]) == (
+        content_digest([str(second / "templates"), str(second / "vars.yml")])
+    )
+
+
+def test_content_digest_changes_with_contents(tmp_path):
+    role = make_role(tmp_path / "role")
+    terms = [str(role / "templates"), str(role / "vars.yml"), str(role / "files")]
+    digest = content_digest(terms)
+
+    (role / "files").mkdir()
+    assert content_digest(terms) != digest
+    digest = content_digest(terms)
+
+    (role / "templates" / "base.cmd.j2").write_text("dbLoadRecords(other.db)\n")
+    assert content_digest(terms) != digest
+    digest = content_digest(terms)
+
+    (role / "templates" / "base.cmd.j2").rename(role / "templates" / "st.cmd.j2")
+    assert content_digest(terms) != digest
@@ -0,0 +1,38 @@
+import render_ioc
+from ansible.parsing.dataloader import DataLoader
+from ansible.template import Templar
+
+
+def load_task(tasks_file: str, name: str) -> dict:
+    tasks = render_ioc.load_yaml(render_ioc.DEPLOY_IOC_PATH / "tasks" / tasks_file)
+    return next(task for task in tasks if task.get("name") == name)
+
+
+def test_acl_facts_are_read_from_each_ioc_directory():
+    set_acls = load_task("deploy-ioc.yml", "Get IOC directory ACL users and groups")
+    facts = {}
+    acls = {}
+    # Two IOCs deployed one after the other in the same run keep their facts
+    for ioc_name, acl in (
+        (
+            "ioc-a",
+            [
+                "user::rwx",
+                "user:alice:rwx",
+                "group::rwx",
+                "group:operators:rwx",
+                "default:group:operators:rwx",
+            ],
+        ),
+        ("ioc-b", ["user::rwx", "group::rwx", "default:user:bob:rwx"]),
+    ):
+        facts["deploy_ioc_ioc_directory_acl_query"] = {"acl": acl}
+        templar = Templar(loader=DataLoader(), variables=facts)
+        facts |= templar.template(set_acls["ansible.builtin.set_fact"])
+        acls[ioc_name] = (
+            facts["deploy_ioc_group_acls"],
+            facts["deploy_ioc_user_acls"],
+        )
+
+    assert acls["ioc-a"] == (["operators"], ["alice"])
+    assert acls["ioc-b"] == ([], ["bob"])
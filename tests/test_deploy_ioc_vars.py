@@ -1,8 +1,7 @@
 import os
 
+import config_validation
 import pytest
-import yamale
-import yaml
 
 DEPLOY_IOC_VARS_FILES = [
     os.path.splitext(f)[0]
@@ -26,16 +25,13 @@ def test_deploy_ioc_var_file_has_matching_role(deploy_ioc_var_file):
     assert os.path.exists(os.path.join("roles/device_roles", deploy_ioc_var_file.name))
 
 
-def test_deploy_ioc_var_files_valid(deploy_ioc_var_file, module_name_validator):
+def test_deploy_ioc_var_files_valid(deploy_ioc_var_file, parsed_file_cache):
     if deploy_ioc_var_file.data:
-        data = yamale.make_data(content=yaml.dump(deploy_ioc_var_file.data))
-        validators = yamale.validators.DefaultValidators.copy()
-        validators["module_name"] = module_name_validator
-        schema = yamale.make_schema(
-            "schemas/device_specific_vars.yml", validators=validators
-        )
+        schema = parsed_file_cache.schema("schemas/device_specific_vars.yml")
         try:
-            yamale.validate(schema, data)
+            config_validation.validate(
+                schema, deploy_ioc_var_file.data, deploy_ioc_var_file.path, strict=True
+            )
         except Exception as e:
             pytest.fail(f"YAML validation failed: {e}")
 
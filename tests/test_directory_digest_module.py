@@ -0,0 +1,52 @@
+import os
+from pathlib import Path
+
+from conftest import load_plugin
+
+directory_digest_module = load_plugin("plugins/modules/directory_digest.py")
+directory_digest = directory_digest_module.directory_digest
+
+EXCLUDES = ["as/save", ".deploy_stamp.json"]
+
+
+def make_ioc(path: Path) -> Path:
+    (path / "iocBoot").mkdir(parents=True)
+    (path / "iocBoot" / "st.cmd").write_text("iocInit()\n")
+    (path / "as" / "save").mkdir(parents=True)
+    (path / "as" / "save" / "info_settings.sav").write_text("# saved\n")
+    (path / ".deploy_stamp.json").write_text("{}\n")
+    return path
+
+
+def test_directory_digest_missing_directory(tmp_path):
+    assert directory_digest(str(tmp_path / "missing")) == (None, 0)
+
+
+def test_directory_digest_ignores_excluded_files_and_metadata(tmp_path):
+    ioc = make_ioc(tmp_path / "ioc")
+    digest, count = directory_digest(str(ioc), EXCLUDES)
+    assert count == 1
+
+    (ioc / "as" / "save" / "info_settings.sav").write_text("# saved again\n")
+    (ioc / ".deploy_stamp.json").write_text('{"config": "c1"}\n')
+    (ioc / "iocBoot" / "st.cmd").chmod(0o775)
+    os.utime(ioc / "iocBoot" / "st.cmd", (0, 0))
+    assert directory_digest(str(ioc), EXCLUDES) == (digest, 1)
+
+    # Moving the IOC elsewhere doesn't change the digest either
+    moved = make_ioc(tmp_path / "elsewhere" / "ioc")
+    assert directory_digest(str(moved), EXCLUDES) == (digest, 1)
+
+
+def test_directory_digest_changes_with_files(tmp_path):
+    ioc = make_ioc(tmp_path / "ioc")
+    digest, _ = directory_digest(str(ioc), EXCLUDES)
+
+    (ioc / "iocBoot" / "st.cmd").write_text("iocInit()\ndbl()\n")
+    changed, _ = directory_digest(str(ioc), EXCLUDES)
+    assert changed != digest
+
+    (ioc / "db").symlink_to(tmp_path)
+    linked, count = directory_digest(str(ioc), EXCLUDES)
+    assert linked != changed
+    assert count == 2
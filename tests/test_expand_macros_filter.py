@@ -0,0 +1,75 @@
+import re
+
+import pytest
+from ansible.errors import AnsibleFilterError
+from conftest import load_plugin
+
+expand_macros_plugin = load_plugin("plugins/filter/expand_macros.py")
+expand_macros = expand_macros_plugin.expand_macros
+
+
+def expand_macros_iteratively(env: dict) -> dict:
+    """Reference implementation mirroring the old process-env.yml task loop."""
+    env = dict(env)
+    while True:
+        with_macros = [k for k, v in env.items() if isinstance(v, str) and "$(" in v]
+        if not with_macros:
+            return env
+        for key in with_macros:
+            for macro in re.findall(r"\$\(([A-Za-z_][A-Za-z0-9_]*)\)", env[key]):
+                env[key] = env[key].replace(f"$({macro})", str(env[macro]))
+
+
+def test_expand_macros_resolves_nested_references():
+    env = {
+        "IOC_DIR": "/epics/iocs",
+        "TOP": "$(IOC_DIR)/cam-01",
+        "EPICS_DB_INCLUDE_PATH": "$(TOP)/db:$(EPICS_BASE)/db",
+        "EPICS_BASE": "/usr/lib/epics",
+        "QSIZE": 20,
+        "PORT": "CAM$(QSIZE)",
+    }
+    assert expand_macros(env) == {
+        "IOC_DIR": "/epics/iocs",
+        "TOP": "/epics/iocs/cam-01",
+        "EPICS_DB_INCLUDE_PATH": "/epics/iocs/cam-01/db:/usr/lib/epics/db",
+        "EPICS_BASE": "/usr/lib/epics",
+        "QSIZE": 20,
+        "PORT": "CAM20",
+    }
+
+
+def test_expand_macros_preserves_key_order():
+    env = {"B": "$(A)/b", "C": "$(B)/c", "A": "/a"}
+    assert list(expand_macros(env)) == ["B", "C", "A"]
+
+
+def test_expand_macros_matches_task_loop():
+    env = {"PREFIX": "XF:31ID1-ES{Cam:1}", "TOP": "/epics/iocs/cam"}
+    for i in range(20):
+        env[f"P{i}"] = f"$(PREFIX)Plg{i}:"
+        env[f"FULL{i}"] = f"$(P{i})$(TOP):$(P{max(i - 1, 0)})"
+    assert expand_macros(env) == expand_macros_iteratively(env)
+
+
+def test_expand_macros_leaves_non_macro_syntax_untouched():
+    env = {"A": "$(B=default)", "B": r"C:\path\1"}
+    assert expand_macros(env) == env
+
+
+def test_expand_macros_undefined_macro():
+    with pytest.raises(AnsibleFilterError, match=r"undefined macro \$\(MISSING\)"):
+        expand_macros({"A": "$(MISSING)/db"})
+
+
+@pytest.mark.parametrize(
+    "env, cycle",
+    [
+        ({"A": "$(A)"}, "A -> A"),
+        ({"A": "$(B)", "B": "$(C)", "C": "$(A)"}, "A -> B -> C -> A"),
+        ({"X": "$(A)", "A": "$(B)", "B": "$(A)"}, "A -> B -> A"),
+    ],
+)
+def test_expand_macros_detects_cycles(env, cycle):
+    with pytest.raises(AnsibleFilterError, match=re.escape(cycle)):
+        expand_macros(env)
@@ -0,0 +1,66 @@
+import subprocess
+from pathlib import Path
+
+import pytest
+from conftest import load_plugin
+
+git_mirror = load_plugin("plugins/modules/git_mirror.py")
+
+
+def git(*args) -> str:
+    return subprocess.run(
+        ["git", "-c", "user.name=test", "-c", "user.email=test@localhost", *args],
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout.strip()
+
+
+def commit(work: Path, content: str, tag: str) -> None:
+    (work / "README").write_text(content)
+    git("-C", str(work), "add", "README")
+    git("-C", str(work), "commit", "-q", "-m", content)
+    git("-C", str(work), "tag", tag)
+    git("-C", str(work), "push", "-q", "origin", "HEAD", tag)
+
+
+@pytest.fixture
+def upstream(tmp_path):
+    """Return a working copy and the file:// URL of its bare upstream."""
+    git("init", "-q", "--bare", str(tmp_path / "upstream.git"))
+    work = tmp_path / "work"
+    git("clone", "-q", str(tmp_path / "upstream.git"), str(work))
+    commit(work, "R1-0", "R1-0")
+    return work, f"file://{tmp_path}/upstream.git"
+
+
+def test_update_mirror_only_fetches_missing_versions(tmp_path, upstream):
+    work, url = upstream
+    mirror = str(tmp_path / "mirror.git")
+
+    assert git_mirror.update_mirror(url, mirror, "R1-0") == (True, False)
+    assert git_mirror.has_version(mirror, "R1-0")
+
+    # The mirror has the version, so upstream isn't contacted, even if it's gone
+    (tmp_path / "upstream.git").rename(tmp_path / "moved.git")
+    assert git_mirror.update_mirror(url, mirror, "R1-0") == (False, False)
+
+    # Modules are cloned from the mirror, without access to upstream
+    module_dir = tmp_path / "module"
+    git("clone", "-q", "--branch", "R1-0", mirror, str(module_dir))
+    assert (module_dir / "README").read_text() == "R1-0"
+
+    (tmp_path / "moved.git").rename(tmp_path / "upstream.git")
+    commit(work, "R1-1", "R1-1")
+    assert not git_mirror.has_version(mirror, "R1-1")
+    assert git_mirror.update_mirror(url, mirror, "R1-1") == (False, True)
+    assert git_mirror.has_version(mirror, "R1-1")
+    assert git_mirror.has_version(mirror, git("-C", str(work), "rev-parse", "HEAD"))
+
+
+def test_update_mirror_fails_if_upstream_is_missing(tmp_path):
+    with pytest.raises(subprocess.CalledProcessError):
+        git_mirror.update_mirror(
+            f"file://{tmp_path}/missing.git", str(tmp_path / "mirror.git"), "R1-0"
+        )
+    assert not (tmp_path / "mirror.git" / "HEAD").exists()
@@ -1,9 +1,7 @@
 import os
-import re
 
+import config_validation
 import pytest
-import yamale
-import yaml
 
 REQUIRED_KEYS: dict[str, type] = {
     "name": str,
@@ -17,6 +15,7 @@ OPTIONAL_KEYS: dict[str, type] = {
     "pkg_deps": list,
     "epics_deps": list,
     "compilation_command": str,
+    "build_memory_weight": int,
     "config": dict,
     "overwrite_release": bool,
     "overwrite_config_site": bool,
@@ -35,30 +34,7 @@ pytestmark = pytest.mark.parametrize(
 )
 
 
-class URLValidator(yamale.validators.Validator):
-    tag = "url"
-
-    def _is_valid(self, value: str) -> bool:
-        return value.startswith("http://") or value.startswith("https://")
-
-
-class GitCommitHashValidator(yamale.validators.Validator):
-    """
-    A Git commit hash typically consists of 7 hexadecimal characters.
-    Git can extend this length for uniqueness, but 7 is the common default.
-    This regex checks for 7 to 40 hexadecimal characters.
-    The 're.IGNORECASE' flag makes the match case-insensitive for hex characters.
-    """
-
-    tag = "git_commit_hash"
-
-    def _is_valid(self, value: str) -> bool:
-        return bool(re.fullmatch(r"^[0-9a-fA-F]{7,40}$", value))
-
-
-def test_install_module_vars_files_valid(
-    install_module_var_file, module_name_validator
-):
+def test_install_module_vars_files_valid(install_module_var_file, parsed_file_cache):
     assert len(list(install_module_var_file.data.keys())) == 1
     assert list(install_module_var_file.data.keys())[0] == install_module_var_file.name
 
@@ -66,23 +42,15 @@ def test_install_module_vars_files_valid(
         install_module_var_file.name
     ]
 
-    validators = yamale.validators.DefaultValidators.copy()
-    validators["url"] = URLValidator
-    validators["module_name"] = module_name_validator
-    validators["git_commit_hash"] = GitCommitHashValidator
-
-    data = yamale.make_data(content=yaml.dump(install_module_config_data))
-    default_schema = yamale.make_schema(
-        "schemas/install_module.yml", validators=validators
-    )
-    latest_schema = yamale.make_schema(
-        "schemas/install_module_latest.yml", validators=validators
-    )
+    if install_module_var_file.name.endswith("_latest"):
+        schema_path = "schemas/install_module_latest.yml"
+    else:
+        schema_path = "schemas/install_module.yml"
+    schema = parsed_file_cache.schema(schema_path)
     try:
-        if install_module_var_file.name.endswith("_latest"):
-            yamale.validate(latest_schema, data, strict=False)
-        else:
-            yamale.validate(default_schema, data, strict=False)
+        config_validation.validate(
+            schema, install_module_config_data, install_module_var_file.path
+        )
     except Exception as e:
         pytest.fail(
             f"roles/install_module/vars/{install_module_var_file.name}.yml "
@@ -0,0 +1,71 @@
+import json
+from pathlib import Path
+
+from conftest import load_plugin
+
+ioc_deploy_plan = load_plugin("plugins/modules/ioc_deploy_plan.py")
+
+STAMP = {"config": "c1", "roles": "r1", "module": "motorsim_d1d0eb8", "modules": "m1"}
+
+
+def deploy(iocs_dir: Path, name: str, stamp: dict | None = STAMP) -> None:
+    (iocs_dir / name).mkdir()
+    if stamp is not None:
+        (iocs_dir / name / ioc_deploy_plan.STAMP_FILE_NAME).write_text(
+            json.dumps(stamp)
+        )
+
+
+def test_classify():
+    classify = ioc_deploy_plan.classify
+    assert classify(STAMP, None, False) == ("new", ["not deployed"])
+    assert classify(STAMP, None, True) == ("rebuild", ["deployed without a stamp"])
+    assert classify(STAMP, STAMP, True) == ("unchanged", [])
+    assert classify(STAMP, STAMP, True, built=False) == (
+        "rebuild",
+        ["required module not built"],
+    )
+    assert classify(STAMP, STAMP | {"module": "motorsim_0000000"}, True) == (
+        "rebuild",
+        ["required module changed"],
+    )
+    assert classify(STAMP, STAMP | {"modules": "m0"}, True) == (
+        "rebuild",
+        ["module configuration changed"],
+    )
+    assert classify(STAMP, STAMP | {"config": "c0", "roles": "r0"}, True) == (
+        "re-render",
+        ["config changed", "roles changed"],
+    )
+
+
+def test_plan_iocs(tmp_path):
+    iocs_dir = tmp_path / "iocs"
+    modules_dir = tmp_path / "modules"
+    iocs_dir.mkdir()
+    (modules_dir / "motorsim_d1d0eb8").mkdir(parents=True)
+    (modules_dir / "motorsim_d1d0eb8" / ".build_stamp").write_text("abc\n")
+    deploy(iocs_dir, "unchanged")
+    deploy(iocs_dir, "edited", STAMP | {"config": "c0"})
+    deploy(iocs_dir, "unstamped", None)
+    soft_stamp = STAMP | {"module": "", "modules": "m0"}
+    deploy(iocs_dir, "soft", soft_stamp)
+
+    plan = ioc_deploy_plan.plan_iocs(
+        str(iocs_dir),
+        {
+            "unchanged": STAMP,
+            "edited": STAMP,
+            "unstamped": STAMP,
+            "soft": soft_stamp,
+            "added": STAMP,
+        },
+        str(modules_dir),
+    )
+    assert {name: entry["action"] for name, entry in plan.items()} == {
+        "added": "new",
+        "edited": "re-render",
+        "soft": "unchanged",
+        "unchanged": "unchanged",
+        "unstamped": "rebuild",
+    }
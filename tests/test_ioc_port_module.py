@@ -0,0 +1,138 @@
+import multiprocessing
+import os
+from pathlib import Path
+
+from conftest import load_plugin
+
+ioc_port = load_plugin("plugins/modules/ioc_port.py")
+
+
+def write_config(iocs_dir: Path, name: str, host: str, port: int) -> None:
+    (iocs_dir / name).mkdir()
+    (iocs_dir / name / "config").write_text(
+        f"NAME={name}\nPORT={port}\nHOST={host}\nUSER=softioc\n"
+    )
+
+
+def test_assign_port_reuses_and_increments():
+    registry = ioc_port.new_registry()
+    assert ioc_port.assign_port(registry, "a", "host1", 4000) == 4000
+    assert ioc_port.assign_port(registry, "b", "host1", 4000) == 4001
+    assert ioc_port.assign_port(registry, "a", "host1", 4000) == 4000
+    # Ports only need to be unique per host
+    assert ioc_port.assign_port(registry, "c", "host2", 4000) == 4000
+
+
+def test_assign_port_skips_ports_in_use():
+    registry = ioc_port.new_registry()
+    ioc_port.register_port(registry, "a", "host1", 4000)
+    ioc_port.release_port(registry, "a")
+    ioc_port.register_port(registry, "b", "host1", 4001)
+    # Released ports are not handed out again, to avoid clashing with a stale
+    # procServ still holding them
+    assert ioc_port.assign_port(registry, "c", "host1", 4000) == 4002
+
+
+def test_release_port():
+    registry = ioc_port.new_registry()
+    ioc_port.assign_port(registry, "a", "host1", 4000)
+    assert ioc_port.release_port(registry, "a")
+    assert not ioc_port.release_port(registry, "a")
+    assert registry["iocs"] == {}
+    assert registry["hosts"]["host1"]["ports"] == {}
+
+
+def test_rebuild_registry_from_configs(tmp_path):
+    write_config(tmp_path, "a", "host1", 4000)
+    write_config(tmp_path, "b", "host1", 4003)
+    write_config(tmp_path, "c", "host1", 4003)
+    write_config(tmp_path, "d", "host2", 4000)
+    (tmp_path / "not-an-ioc").mkdir()
+
+    registry = ioc_port.rebuild_registry(str(tmp_path))
+    assert registry["iocs"]["b"] == {"host": "host1", "port": 4003}
+    assert ioc_port.port_conflicts(registry, "b") == ["c"]
+    assert ioc_port.port_conflicts(registry, "a") == []
+    assert ioc_port.port_conflicts(registry, "d") == []
+    assert ioc_port.assign_port(registry, "e", "host1", 4000) == 4004
+
+
+def test_query_port_syncs_edited_configs(tmp_path):
+    write_config(tmp_path, "a", "host1", 4000)
+    write_config(tmp_path, "b", "host1", 4001)
+    write_config(tmp_path, "c", "host1", 4002)
+    registry = ioc_port.rebuild_registry(str(tmp_path))
+
+    # Configs edited after the registry was written
+    (tmp_path / "b" / "config").write_text("NAME=b\nPORT=4000\nHOST=host1\n")
+    (tmp_path / "c" / "config").write_text("NAME=c\nPORT=4005\nHOST=host1\n")
+    assert ioc_port.query_port(registry, str(tmp_path), "b", "host1") == (4000, True)
+    assert ioc_port.port_conflicts(registry, "b") == ["a"]
+
+    # An IOC registered on the port of another is checked against its config
+    ioc_port.register_port(registry, "c", "host1", 4000)
+    assert ioc_port.query_port(registry, str(tmp_path), "a", "host1") == (4000, True)
+    assert ioc_port.port_conflicts(registry, "a") == ["b"]
+    assert registry["iocs"]["c"]["port"] == 4005
+
+    # An IOC that is not registered yet is registered from its config
+    write_config(tmp_path, "d", "host1", 4005)
+    assert ioc_port.query_port(registry, str(tmp_path), "d", "host1") == (4005, True)
+    assert ioc_port.port_conflicts(registry, "d") == ["c"]
+
+
+def test_sync_changed_configs_registers_configs_written_outside(tmp_path):
+    write_config(tmp_path, "a", "host1", 4000)
+    write_config(tmp_path, "b", "host1", 4001)
+    ioc_port.save_registry(str(tmp_path), ioc_port.rebuild_registry(str(tmp_path)))
+    registry = ioc_port.load_registry(str(tmp_path))
+    assert not ioc_port.sync_changed_configs(registry, str(tmp_path))
+
+    # A config created by hand, and one edited to the same size, with a port
+    # that is taken
+    write_config(tmp_path, "c", "host1", 4000)
+    (tmp_path / "b" / "config").write_text(
+        "NAME=b\nPORT=4000\nHOST=host1\nUSER=softioc\n"
+    )
+    os.utime(tmp_path / "b" / "config", ns=(0, 10**9))
+    assert ioc_port.sync_changed_configs(registry, str(tmp_path))
+    assert ioc_port.port_conflicts(registry, "a") == ["b", "c"]
+    assert ioc_port.assign_port(registry, "d", "host1", 4000) == 4002
+
+    # IOCs whose config is removed keep their port until it is released
+    (tmp_path / "c" / "config").unlink()
+    assert ioc_port.sync_changed_configs(registry, str(tmp_path))
+    assert "c" not in registry["configs"]
+    assert registry["iocs"]["c"] == {"host": "host1", "port": 4000}
+    assert not ioc_port.sync_changed_configs(registry, str(tmp_path))
+
+
+def test_read_config_port_missing(tmp_path):
+    assert ioc_port.read_config_port(str(tmp_path), "a") is None
+    write_config(tmp_path, "a", "host1", 4005)
+    assert ioc_port.read_config_port(str(tmp_path), "a") == 4005
+
+
+def test_save_and_load_registry(tmp_path):
+    registry = ioc_port.new_registry()
+    ioc_port.assign_port(registry, "a", "host1", 4000)
+    ioc_port.save_registry(str(tmp_path), registry)
+    assert ioc_port.load_registry(str(tmp_path)) == registry
+    assert [p.name for p in tmp_path.iterdir()] == [ioc_port.REGISTRY_FILE_NAME]
+
+
+def _assign_locked(args):
+    path, name = args
+    with ioc_port.locked(path):
+        registry = ioc_port.load_registry(path) or ioc_port.new_registry()
+        port = ioc_port.assign_port(registry, name, "host1", 4000)
+        ioc_port.save_registry(path, registry)
+    return port
+
+
+def test_concurrent_assignment_is_unique(tmp_path):
+    names = [f"ioc{i}" for i in range(16)]
+    with multiprocessing.Pool(4) as pool:
+        ports = pool.map(_assign_locked, [(str(tmp_path), name) for name in names])
+    assert sorted(ports) == list(range(4000, 4016))
+    assert len(ioc_port.load_registry(str(tmp_path))["iocs"]) == 16
@@ -0,0 +1,69 @@
+import re
+from pathlib import Path
+
+import pytest
+import yaml
+from ansible.errors import AnsibleFilterError
+from conftest import load_plugin
+
+module_build_levels_plugin = load_plugin("plugins/filter/module_build_levels.py")
+module_build_levels = module_build_levels_plugin.module_build_levels
+
+
+@pytest.fixture(scope="module")
+def install_module_configs() -> dict:
+    configs = {}
+    for var_file in Path("roles/install_module/vars").glob("*.yml"):
+        with open(var_file) as fp:
+            configs.update(yaml.safe_load(fp))
+    return configs
+
+
+def test_module_build_levels_area_detector(install_module_configs):
+    assert module_build_levels(install_module_configs, "advimba_34686fe") == [
+        ["adsupport_fe23754"],
+        ["adcore_5860bd3"],
+        ["adcompvision_9750d13", "adpluginbar_448d96b", "ffmpeg_server_07c570f"],
+        ["adgenicam_5d08a11"],
+        ["advimba_34686fe"],
+    ]
+
+
+def test_module_build_levels_independent_branches(install_module_configs):
+    assert module_build_levels(install_module_configs, "nsls2em_23437dc") == [
+        ["std_1b416db", "pscdrv_1ed650d", "adsupport_fe23754"],
+        ["adcore_5860bd3"],
+        ["quadem_f5ab1e9"],
+        ["nsls2em_23437dc"],
+    ]
+
+
+def test_module_build_levels_no_deps(install_module_configs):
+    assert module_build_levels(install_module_configs, "motorsim_d1d0eb8") == [
+        ["motorsim_d1d0eb8"]
+    ]
+
+
+def test_module_build_levels_all_modules(install_module_configs):
+    for module in install_module_configs:
+        built = set()
+        for level in module_build_levels(install_module_configs, module):
+            for name in level:
+                deps = install_module_configs[name].get("module_deps", [])
+                assert set(deps) <= built
+            built.update(level)
+
+
+def test_module_build_levels_missing_module():
+    with pytest.raises(AnsibleFilterError, match=r"for b \(required by a\)"):
+        module_build_levels({"a": {"module_deps": ["b"]}}, "a")
+
+
+def test_module_build_levels_cycle():
+    configs = {
+        "a": {"module_deps": ["b"]},
+        "b": {"module_deps": ["c"]},
+        "c": {"module_deps": ["a"]},
+    }
+    with pytest.raises(AnsibleFilterError, match=re.escape("a -> b -> c -> a")):
+        module_build_levels(configs, "a")
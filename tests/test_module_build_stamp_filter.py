@@ -0,0 +1,84 @@
+import pytest
+from ansible.errors import AnsibleFilterError
+from ansible.plugins.filter import core as core_filters
+from conftest import load_plugin
+
+module_build_stamp = load_plugin(
+    "plugins/filter/module_build_stamp.py"
+).module_build_stamp
+
+CONFIG = {"name": "quadEM", "version": "R9-5", "module_deps": ["adcore", "std"]}
+BUILD_STAMPS = {"adcore": "a" * 64, "std": "b" * 64, "unrelated": "c" * 64}
+CONFIGURE_FILES = {
+    "config": {"CHECK_RELEASE": "NO"},
+    "release": "ADCORE=/epics/modules/adcore\n",
+    "config_site": "CHECK_RELEASE = NO\n",
+}
+
+
+def stamp(**changes) -> str:
+    args = {
+        "config": CONFIG,
+        "commit": "0123abc",
+        "compilation_command": "make -s",
+        "build_stamps": BUILD_STAMPS,
+        "configure_files": CONFIGURE_FILES,
+    } | changes
+    return module_build_stamp(**args)
+
+
+def test_build_stamp_is_unchanged_for_same_inputs():
+    assert stamp() == stamp(
+        config=dict(CONFIG),
+        configure_files=dict(CONFIGURE_FILES),
+        build_stamps=BUILD_STAMPS | {"unrelated": "d" * 64},
+    )
+
+
+@pytest.mark.parametrize(
+    "changes",
+    [
+        {"config": CONFIG | {"version": "R9-6"}},
+        {"commit": "4567def"},
+        {"compilation_command": "make -s -j1"},
+        {"build_stamps": BUILD_STAMPS | {"std": "e" * 64}},
+        {"config": CONFIG | {"module_deps": ["adcore"]}},
+        {"configure_files": CONFIGURE_FILES | {"config": {"CHECK_RELEASE": "YES"}}},
+        {"configure_files": CONFIGURE_FILES | {"release": "ADCORE=/opt/adcore\n"}},
+        {"configure_files": CONFIGURE_FILES | {"config_site": "STATIC_BUILD = YES\n"}},
+        {"configure_files": {}},
+    ],
+    ids=[
+        "version",
+        "commit",
+        "compilation_command",
+        "module_dep_stamp",
+        "module_deps",
+        "config_dict",
+        "release",
+        "config_site",
+        "no_configure_files",
+    ],
+)
+def test_build_stamp_changes_with_each_input(changes):
+    assert stamp(**changes) != stamp()
+
+
+def test_build_stamp_matches_stamps_of_earlier_deployments():
+    # Stamps were hashed in the task with to_json(sort_keys=true) | hash('sha256')
+    filters = core_filters.FilterModule().filters()
+    inputs = {
+        "version": "R9-5",
+        "commit": "0123abc",
+        "compilation_command": "make -s",
+        "module_deps": ["a" * 64, "b" * 64],
+        **CONFIGURE_FILES,
+    }
+    assert stamp() == filters["hash"](
+        filters["to_json"](inputs, sort_keys=True), "sha256"
+    )
+
+
+def test_build_stamp_requires_stamps_of_module_deps():
+    with pytest.raises(AnsibleFilterError, match="std"):
+        stamp(build_stamps={"adcore": "a" * 64})
@@ -0,0 +1,112 @@
+import render_ioc
+from config_validation import DEVICE_ROLES_PATH
+
+
+def test_template_vars_are_templated_when_looked_up():
+    tvars = render_ioc.TemplateVars(
+        {"base": "/epics", "iocs": "{{ base }}/iocs", "dirs": "{{ [iocs] }}"},
+        extra_vars={"base": "/opt/epics"},
+    )
+    assert tvars["iocs"] == "/opt/epics/iocs"
+    assert tvars["dirs"] == ["/opt/epics/iocs"]
+    assert tvars.evaluate(["iocs is defined", "'opt' in iocs"])
+    assert not tvars.evaluate("missing is defined")
+
+    tvars.set_fact(ioc_dir="{{ iocs }}/ioc1")
+    tvars.variables["base"] = "/srv"
+    assert tvars.with_vars(item=1)["ioc_dir"] == "/opt/epics/iocs/ioc1"
+
+
+def test_module_facts():
+    facts = render_ioc.module_facts(
+        "adsimdetector_4b236f4", "/epics/modules", {"ASYN": "/usr/lib/epics"}
+    )
+    assert facts["install_module_leaf_module_path"] == (
+        "/epics/modules/adsimdetector_4b236f4"
+    )
+    assert facts["install_module_leaf_executable"] == "simDetectorApp"
+    assert (
+        facts["install_module_installed"]["ADCORE"] == "/epics/modules/adcore_5860bd3"
+    )
+    assert facts["install_module_epics_deps"]["ASYN"] == "/usr/lib/epics"
+    assert list(facts["install_module_installed"])[-1] == "ADSIMDETECTOR"
+
+
+def test_ioc_variables_executable_precedence():
+    host_config = render_ioc.DEFAULT_HOST_CONFIG | {
+        "soft1": {"type": "base_soft_ioc"},
+        "soft2": {"type": "base_soft_ioc", "executable": "customApp"},
+        "switch1": {"type": "cas_switch"},
+    }
+    soft1 = render_ioc.ioc_variables("soft1", host_config)
+    assert soft1["deploy_ioc_executable"] == "baseSoftIOC"
+    assert (
+        soft1["deploy_ioc_template_root_path"]
+        == (soft1["deploy_ioc_required_module_path"])
+    )
+    soft2 = render_ioc.ioc_variables("soft2", host_config)
+    assert soft2["deploy_ioc_executable"] == "customApp"
+    # Without a required module, both are set empty instead of left undefined
+    switch1 = render_ioc.ioc_variables("switch1", host_config)
+    assert switch1["deploy_ioc_required_module"] == ""
+    assert switch1["deploy_ioc_executable"] == ""
+    assert switch1["deploy_ioc_template_root_path"] == ""
+    assert switch1["substitutions"] == {}
+
+
+def test_render_config_file():
+    config_path = DEVICE_ROLES_PATH / "adsimdetector/examples/sim-cam-test/config.yml"
+    rendered = render_ioc.render_config_file(config_path, hostname="xf31id1-ioc1.nsls2")
+    assert rendered.directory == "/epics/iocs/cam-sim1"
+    assert list(rendered.tree()) == [
+        "README.md",
+        "as/req/auto_settings.req",
+        "cam-sim1.yml",
+        "config",
+        "iocBoot/base.cmd",
+        "iocBoot/common.cmd",
+        "iocBoot/epicsEnv.cmd",
+        "iocBoot/postInit.cmd",
+        "iocBoot/st.cmd",
+        "st.cmd",
+    ]
+    assert rendered.files["iocBoot/st.cmd"].mode == "0775"
+    assert rendered.files["iocBoot/st.cmd"].content.startswith(
+        "#!/epics/modules/adsimdetector_4b236f4/iocs/simDetectorIOC"
+        "/bin/linux-x86_64/simDetectorApp\n"
+    )
+
+    epics_env = rendered.files["iocBoot/epicsEnv.cmd"].content
+    assert "< /epics/common/xf31id1-ioc1-netsetup.cmd\n" in epics_env
+    assert 'epicsEnvSet("PREFIX", "XF:31ID1-ES{Sim-Cam:1}")\n' in epics_env
+    assert (
+        'epicsEnvSet("EPICS_DB_INCLUDE_PATH", "/epics/modules/adcore_5860bd3/db")'
+        in (epics_env)
+    )
+    assert "PORT=4000\n" in rendered.files["config"].content
+    assert "{{" not in "".join(rendered.tree().values())
+
+
+def test_render_ioc_substitutions_and_port():
+    host_config = render_ioc.DEFAULT_HOST_CONFIG | {
+        "ioc1": {
+            "type": "base_soft_ioc",
+            "environment": {"PREFIX": "XF:31ID1{IOC:1}"},
+            "substitutions": {
+                "calc": [
+                    {
+                        "filepath": "$(CALC)/db/userCalcs10.db",
+                        "pattern": ["P", "N"],
+                        "instances": [["$(PREFIX)", "1"]],
+                    }
+                ]
+            },
+        }
+    }
+    rendered = render_ioc.render_ioc("ioc1", host_config, port=4012)
+    assert "PORT=4012\n" in rendered.files["config"].content
+    substitutions = rendered.files["db/calc.substitutions"].content
+    assert "# Ansible managed\n" in substitutions
+    assert 'dbLoadTemplate("$(TOP)/db/calc.substitutions")' in (
+        rendered.files["iocBoot/common.cmd"].content
+    )
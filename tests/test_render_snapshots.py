@@ -0,0 +1,124 @@
+"""Compare the offline rendering of every device role example with golden outputs.
+
+Besides the rendered files, the snapshot of an example lists the tasks that were
+skipped in _skipped.txt, so that a task starting to fail to render, e.g. on an
+undefined variable, shows up as a change too.
+
+Run pytest with --update-snapshots to write the snapshots of all examples again,
+e.g. after an intended change to a template, and review the change with git diff.
+"""
+
+import difflib
+import shutil
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import pytest
+import render_ioc
+from config_validation import DEVICE_ROLES_PATH, get_device_roles, get_example_configs
+
+SNAPSHOTS_PATH = Path(__file__).parent / "snapshots"
+SKIPPED_TASKS_FILE_NAME = "_skipped.txt"
+
+
+def example_id(config_path: Path) -> str:
+    """Return role/name of examples/name/config.yml, role/example of example.yml."""
+    relative = config_path.relative_to(DEVICE_ROLES_PATH)
+    if config_path.name == "example.yml":
+        return f"{relative.parts[0]}/example"
+    return f"{relative.parts[0]}/{relative.parts[2]}"
+
+
+EXAMPLES = {
+    example_id(config_path): config_path
+    for role in sorted(get_device_roles())
+    for config_path in get_example_configs(role)
+}
+
+
+def render_example(config_path: Path) -> dict[str, str] | str:
+    """Render the tree of an example, or return why it couldn't be rendered."""
+    try:
+        rendered = render_ioc.render_config_file(config_path)
+    except Exception as e:
+        return f"{type(e).__name__}: {e}"
+    tree = rendered.tree()
+    if rendered.skipped_tasks:
+        tree[SKIPPED_TASKS_FILE_NAME] = "".join(
+            f"{task}\n" for task in rendered.skipped_tasks
+        )
+    return tree
+
+
+def read_snapshot(snapshot_path: Path) -> dict[str, str]:
+    return {
+        path.relative_to(snapshot_path).as_posix(): path.read_text(
+            errors="surrogateescape"
+        )
+        for path in sorted(snapshot_path.rglob("*"))
+        if path.is_file()
+    }
+
+
+def write_snapshot(snapshot_path: Path, tree: dict[str, str]):
+    shutil.rmtree(snapshot_path, ignore_errors=True)
+    for path, content in tree.items():
+        file_path = snapshot_path / path
+        file_path.parent.mkdir(parents=True, exist_ok=True)
+        file_path.write_text(content, errors="surrogateescape")
+
+
+def snapshot_ids() -> set[str]:
+    return {
+        path.relative_to(SNAPSHOTS_PATH).as_posix()
+        for path in SNAPSHOTS_PATH.glob("*/*")
+        if path.is_dir()
+    }
+
+
+@pytest.fixture(scope="session")
+def rendered_examples(request) -> dict[str, dict[str, str] | str]:
+    with ProcessPoolExecutor() as executor:
+        rendered = dict(
+            zip(EXAMPLES, executor.map(render_example, EXAMPLES.values()), strict=True)
+        )
+
+    if request.config.getoption("update_snapshots"):
+        for name, tree in rendered.items():
+            if isinstance(tree, dict):
+                write_snapshot(SNAPSHOTS_PATH / name, tree)
+        for name in snapshot_ids() - set(EXAMPLES):
+            shutil.rmtree(SNAPSHOTS_PATH / name)
+    return rendered
+
+
+@pytest.mark.parametrize("name", EXAMPLES)
+def test_rendered_example_matches_snapshot(rendered_examples, name):
+    tree = rendered_examples[name]
+    assert isinstance(tree, dict), f"Failed to render {EXAMPLES[name]}: {tree}"
+
+    snapshot_path = SNAPSHOTS_PATH / name
+    assert snapshot_path.is_dir(), (
+        f"No snapshot for {name}, run pytest with --update-snapshots to create it"
+    )
+    snapshot = read_snapshot(snapshot_path)
+
+    assert sorted(tree) == sorted(snapshot), f"Rendered files of {name} changed"
+    diffs = [
+        "".join(
+            difflib.unified_diff(
+                snapshot[path].splitlines(keepends=True),
+                content.splitlines(keepends=True),
+                f"snapshot/{path}",
+                f"rendered/{path}",
+            )
+        )
+        for path, content in tree.items()
+        if content != snapshot[path]
+    ]
+    assert not diffs, f"Rendered files of {name} changed:\n" + "\n".join(diffs)
+
+
+def test_no_stale_snapshots(rendered_examples):
+    stale = snapshot_ids() - set(EXAMPLES)
+    assert not stale, f"Snapshots without an example: {sorted(stale)}"
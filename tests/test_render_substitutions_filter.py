@@ -0,0 +1,101 @@
+import pytest
+from ansible.errors import AnsibleFilterError
+from conftest import load_plugin
+
+render_substitutions_plugin = load_plugin("plugins/filter/render_substitutions.py")
+render_substitutions = render_substitutions_plugin.render_substitutions
+
+MOTOR_TEMPLATE = {
+    "filepath": "$(TOP)/db/motorSim.template",
+    "pattern": ["P", "M", "PORT", "ADDR", "DHLM"],
+    "instances": [
+        ["XF:31ID1-ES", "{MC:01-Ax:X}Mtr", "$(PORT)", 0, 100],
+        ["$(P)", "{MC:01-Ax:Y}Mtr", "$(PORT)", 1, 1.5],
+    ],
+}
+
+
+def test_render_substitutions_list_form():
+    rendered = render_substitutions(
+        {"motorSim": [MOTOR_TEMPLATE]}, {"PORT": "MC1", "P": "XF:31ID1-ES"}
+    )
+    assert rendered == {
+        "motorSim": (
+            "#\n"
+            "# motorSim.substitutions\n"
+            "# Ansible managed\n"
+            "#\n"
+            "\n"
+            'file "$(TOP)/db/motorSim.template"\n'
+            "{\n"
+            "pattern\n"
+            "{P, M, PORT, ADDR, DHLM}\n"
+            '{"XF:31ID1-ES", "{MC:01-Ax:X}Mtr", "MC1", "0", "100"}\n'
+            '{"XF:31ID1-ES", "{MC:01-Ax:Y}Mtr", "MC1", "1", "1.5"}\n'
+            "}\n"
+            "\n"
+        )
+    }
+
+
+def test_render_substitutions_dict_form_and_multiple_templates():
+    substitutions = {
+        "first": {
+            "templates": [
+                {"filepath": "a.db", "pattern": ["A"], "instances": [["1"], [2]]},
+                {"filepath": "b.db", "pattern": ["B"], "instances": []},
+            ],
+            "template_macros": "X=1",
+        },
+        "second": [{"filepath": "c.db", "pattern": ["C"], "instances": [["c"]]}],
+    }
+    rendered = render_substitutions(substitutions, {}, ansible_managed="Managed")
+    assert list(rendered) == ["first", "second"]
+    assert rendered["first"] == (
+        "#\n# first.substitutions\n# Managed\n#\n\n"
+        'file "a.db"\n{\npattern\n{A}\n{"1"}\n{"2"}\n}\n\n'
+        'file "b.db"\n{\npattern\n{B}\n}\n\n'
+    )
+
+
+def test_render_substitutions_only_expands_own_macro():
+    template = {
+        "filepath": "x.db",
+        "pattern": ["P", "R"],
+        "instances": [["$(P)$(R)", "$(P)$(R)"]],
+    }
+    rendered = render_substitutions({"x": [template]}, {"P": "p:", "R": "r"})
+    assert '{"p:$(R)", "$(P)r"}\n' in rendered["x"]
+
+
+def test_render_substitutions_none_value_is_empty():
+    template = {
+        "filepath": "x.db",
+        "pattern": ["P", "DESC"],
+        "instances": [["$(P)", None], [None, "d"]],
+    }
+    rendered = render_substitutions({"x": [template]}, {"P": "p:"})
+    assert '{"p:", ""}\n{"", "d"}\n' in rendered["x"]
+
+
+def test_render_substitutions_large_table():
+    template = {
+        "filepath": "x.db",
+        "pattern": ["P", "N"],
+        "instances": [["$(P)", i] for i in range(10000)],
+    }
+    rendered = render_substitutions({"x": [template]}, {"P": "XF:31ID1"})["x"]
+    assert rendered.count('{"XF:31ID1", "') == 10000
+    assert rendered.endswith('{"XF:31ID1", "9999"}\n}\n\n')
+
+
+def test_render_substitutions_undefined_macro():
+    template = {"filepath": "x.db", "pattern": ["P"], "instances": [["$(P)"]]}
+    with pytest.raises(AnsibleFilterError, match=r"\$\(P\) in x.db is not defined"):
+        render_substitutions({"x": [template]}, {})
+
+
+def test_render_substitutions_short_instance():
+    template = {"filepath": "x.db", "pattern": ["P", "R"], "instances": [["p"]]}
+    with pytest.raises(AnsibleFilterError, match="has 1 value"):
+        render_substitutions({"x": [template]}, {})
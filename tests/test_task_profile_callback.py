@@ -0,0 +1,68 @@
+import json
+
+import pytest
+from conftest import load_plugin
+
+task_profile = load_plugin("plugins/callback/task_profile.py")
+
+
+class FakeTask:
+    def __init__(self, name, path, action="ansible.builtin.command"):
+        self.name = name
+        self.path = path
+        self.action = action
+
+    def get_name(self):
+        return self.name
+
+    def get_path(self):
+        return self.path
+
+
+@pytest.mark.parametrize(
+    "task_file, role",
+    [
+        ("/c/nsls2/ioc_deploy/roles/install_module/tasks/main.yml", "install_module"),
+        ("/c/nsls2/ioc_deploy/roles/device_roles/adpco/tasks/main.yml", "adpco"),
+        ("/c/nsls2/ioc_deploy/roles/deploy_ioc/handlers/main.yml", "deploy_ioc"),
+        ("/c/nsls2/ioc_deploy/scripts/deploy_local_ioc_config.yml", "(playbook)"),
+    ],
+)
+def test_role_of(task_file, role):
+    assert task_profile.role_of(task_file) == role
+
+
+def test_profile_rolls_up_task_runs(tmp_path, monkeypatch):
+    now = [0.0]
+    monkeypatch.setattr(task_profile.time, "monotonic", lambda: now[0])
+    callback = task_profile.CallbackModule()
+    options = {"output_path": str(tmp_path / "profile.json"), "top": 20}
+    monkeypatch.setattr(callback, "get_option", options.get)
+
+    install = "/c/roles/install_module/tasks/install-module.yml"
+    clone = FakeTask("Clone module", f"{install}:10")
+    compile_ = FakeTask("Compile module", f"{install}:20")
+    deploy = FakeTask("Deploy IOC", "/c/roles/deploy_ioc/tasks/main.yml:5")
+
+    # Two iterations of a dynamically included task file, then another role
+    for task, duration in [(clone, 1), (compile_, 5), (clone, 2), (compile_, 3)]:
+        callback.v2_playbook_on_task_start(task, False)
+        now[0] += duration
+    callback.v2_playbook_on_task_start(deploy, False)
+    now[0] += 4
+    callback.v2_playbook_on_stats(None)
+
+    profile = json.loads((tmp_path / "profile.json").read_text())
+    assert profile["total"] == 15
+    assert [
+        (t["name"], t["count"], t["total"], t["max"]) for t in profile["tasks"]
+    ] == [
+        ("Compile module", 2, 8, 5),
+        ("Deploy IOC", 1, 4, 4),
+        ("Clone module", 2, 3, 2),
+    ]
+    assert profile["files"][0] == {"file": install, "count": 4, "total": 11}
+    assert [(r["role"], r["total"]) for r in profile["roles"]] == [
+        ("install_module", 11),
+        ("deploy_ioc", 4),
+    ]
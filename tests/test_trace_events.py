@@ -0,0 +1,55 @@
+import json
+import threading
+
+import pytest
+from trace_events import Tracer
+
+
+def test_disabled_tracer_records_nothing(tmp_path):
+    tracer = Tracer()
+    with tracer.span("phase"):
+        pass
+    tracer.write(tmp_path / "trace.json")
+    assert json.loads((tmp_path / "trace.json").read_text())["traceEvents"] == []
+
+
+def test_spans_are_recorded_on_lanes(tmp_path):
+    tracer = Tracer()
+    tracer.enable()
+    with tracer.span("setup"):
+        pass
+
+    def deploy(ioc_name):
+        with tracer.lane(ioc_name), tracer.span("deploy", cat="ioc", path="x.yml"):
+            pass
+
+    threads = [threading.Thread(target=deploy, args=(f"ioc{i}",)) for i in range(2)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert tracer.current_lane == "main"
+
+    tracer.write(tmp_path / "trace.json")
+    events = json.loads((tmp_path / "trace.json").read_text())["traceEvents"]
+    lanes = {
+        event["args"]["name"]: event["tid"]
+        for event in events
+        if event["ph"] == "M" and event["name"] == "thread_name"
+    }
+    assert set(lanes) == {"main", "ioc0", "ioc1"}
+
+    spans = {event["tid"]: event for event in events if event["ph"] == "X"}
+    assert spans[lanes["main"]]["name"] == "setup"
+    assert spans[lanes["ioc0"]]["cat"] == "ioc"
+    assert spans[lanes["ioc1"]]["args"] == {"path": "x.yml"}
+    assert all(span["dur"] >= 0 for span in spans.values())
+
+
+def test_span_records_errors():
+    tracer = Tracer()
+    tracer.enable()
+    with pytest.raises(RuntimeError), tracer.span("deploy"):
+        raise RuntimeError("container not running")
+    (span,) = [event for event in tracer._events if event["ph"] == "X"]
+    assert span["args"]["error"] == "RuntimeError: container not running"
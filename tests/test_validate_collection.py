@@ -0,0 +1,85 @@
+import validate_collection
+
+
+def test_all_targets_pass():
+    targets = validate_collection.all_targets()
+    assert {kind for kind, _ in targets} == set(validate_collection.TARGET_KINDS)
+
+    results = validate_collection.validate_targets(targets, jobs=2)
+    assert [(result.kind, result.name) for result in results] == targets
+    assert [result for result in results if not result.passed] == []
+
+
+def test_check_module_reports_errors(tmp_path, monkeypatch):
+    monkeypatch.setattr(validate_collection, "INSTALL_MODULE_VARS_PATH", tmp_path)
+    (tmp_path / "asyn_R4-45.yml").write_text(
+        "asyn_R4-45:\n"
+        "  name: asyn\n"
+        "  url: git@github.com:epics-modules/asyn\n"
+        "  version: R4-44\n"
+        "  module_deps:\n"
+        "    - not_a_module\n"
+    )
+    errors = validate_collection.check_module("asyn_R4-45")
+    assert any("url" in error for error in errors)
+    assert "Module dependency not_a_module has no vars file" in errors
+    assert "Name is not suffixed with version R4-44" in errors
+
+
+def test_run_target_reports_exceptions():
+    result = validate_collection.run_target(("module", "not_a_module"))
+    assert not result.passed
+    assert result.errors[0].startswith("FileNotFoundError")
+
+
+def test_affected_targets_follow_module_graph():
+    graph = validate_collection.DependencyGraph(
+        {
+            "roles/install_module/vars/adcore_1.yml": {
+                "kind": "module",
+                "module_deps": ["asyn_1"],
+            },
+            "roles/install_module/vars/asyn_1.yml": {
+                "kind": "module",
+                "module_deps": [],
+            },
+            "roles/install_module/vars/adsim_1.yml": {
+                "kind": "module",
+                "module_deps": ["adcore_1"],
+            },
+            "roles/deploy_ioc/vars/adsim.yml": {
+                "kind": "ioc_type",
+                "required_module": "adsim_1",
+            },
+            "roles/deploy_ioc/vars/motorsim.yml": {
+                "kind": "ioc_type",
+                "required_module": None,
+            },
+        }
+    )
+    targets = [
+        ("role", "adsim"),
+        ("role", "motorsim"),
+        ("deploy_ioc_vars", "adsim"),
+        ("deploy_ioc_vars", "motorsim"),
+        ("module", "adcore_1"),
+        ("module", "adsim_1"),
+        ("module", "asyn_1"),
+    ]
+
+    assert validate_collection.affected_targets(
+        ["roles/install_module/vars/adcore_1.yml"], graph, targets
+    ) == [
+        ("role", "adsim"),
+        ("deploy_ioc_vars", "adsim"),
+        ("module", "adcore_1"),
+        ("module", "adsim_1"),
+    ]
+    assert validate_collection.affected_targets(
+        ["roles/device_roles/motorsim/examples/motorsim-01/config.yml", "README.md"],
+        graph,
+        targets,
+    ) == [("role", "motorsim"), ("deploy_ioc_vars", "motorsim")]
+    assert validate_collection.affected_targets(
+        ["schemas/install_module.yml"], graph, targets
+    ) == [("module", "adcore_1"), ("module", "adsim_1"), ("module", "asyn_1")]
@@ -0,0 +1,196 @@
+import os
+
+import pytest
+import verify_deployment
+import yaml
+
+
+@pytest.fixture
+def ioc_dir(tmp_path):
+    (tmp_path / "iocBoot").mkdir()
+    (tmp_path / "iocBoot" / "st.cmd").write_text(
+        'dbLoadRecords("$(ADCORE)/db/NDStdArrays.template")\niocInit\n'
+    )
+    (tmp_path / "iocBoot" / "empty.cmd").write_text("")
+    os.chmod(tmp_path / "iocBoot" / "st.cmd", 0o775)
+    return tmp_path
+
+
+@pytest.mark.parametrize(
+    "content, patterns, found",
+    [
+        (b"iocInit\n", ["iocInit", "ioc", "Init", "{{"], {"iocInit", "ioc", "Init"}),
+        (b"abcabd", ["abc", "abd", "ab", "bd", "c"], {"abc", "abd", "ab", "bd", "c"}),
+        (b"a.b", ["a.b", "a+b", ".", ""], {"a.b", ".", ""}),
+        (b"", ["x", ""], {""}),
+        ("µs".encode(), ["µ"], {"µ"}),
+    ],
+)
+@pytest.mark.parametrize("min_patterns", [1, 100])
+def test_find_patterns(content, patterns, found, min_patterns, monkeypatch):
+    monkeypatch.setattr(
+        verify_deployment, "MULTI_PATTERN_SCAN_MIN_PATTERNS", min_patterns
+    )
+    assert verify_deployment.find_patterns(content, patterns) == found
+
+
+def test_verify_file_contents_reads_each_file_once(ioc_dir, monkeypatch):
+    files = verify_deployment.DeployedFiles(ioc_dir)
+    opened = []
+    real_open = open
+
+    def counting_open(path, *args, **kwargs):
+        opened.append(path)
+        return real_open(path, *args, **kwargs)
+
+    monkeypatch.setattr("builtins.open", counting_open)
+    errors = verify_deployment.verify_file_contents(
+        files,
+        {"iocBoot/st.cmd": ["iocInit", "NDStdArrays"], "iocBoot/empty.cmd": ["x"]},
+        {"iocBoot/st.cmd": ["{{", "iocInit"], "iocBoot/missing.cmd": ["{{"]},
+    )
+    files.close()
+
+    assert errors == [
+        "iocBoot/st.cmd: contains forbidden pattern 'iocInit'",
+        "iocBoot/empty.cmd: missing required pattern 'x'",
+        errors[2],
+    ]
+    assert errors[2].startswith("Cannot read file iocBoot/missing.cmd")
+    assert len(opened) == 3
+
+
+def test_run_verification(ioc_dir, tmp_path_factory, capsys):
+    verify_yml = tmp_path_factory.mktemp("verify") / "verify.yml"
+    verify_yml.write_text(
+        yaml.dump(
+            {
+                "skip_compilation": False,
+                "verification": {
+                    "files_must_exist": ["iocBoot/st.cmd"],
+                    "file_must_contain": {"iocBoot/st.cmd": ["iocInit"]},
+                    "file_must_not_contain": {"iocBoot/st.cmd": ["{{", "}}"]},
+                    "permissions": {"iocBoot/st.cmd": "0775"},
+                },
+            }
+        )
+    )
+    assert verify_deployment.run_verification(verify_yml, ioc_dir)
+    output = capsys.readouterr().out
+    assert "Checking file content... 0 error(s) in" in output
+
+    (ioc_dir / "iocBoot" / "st.cmd").write_text("{{ unrendered }}\n")
+    assert not verify_deployment.run_verification(verify_yml, ioc_dir)
+    output = capsys.readouterr().out
+    assert "iocBoot/st.cmd: missing required pattern 'iocInit'" in output
+    assert "iocBoot/st.cmd: contains forbidden pattern '{{'" in output
+
+
+def test_count_lines(monkeypatch):
+    monkeypatch.setattr(verify_deployment, "LINE_COUNT_CHUNK_SIZE", 4)
+    assert verify_deployment.count_lines(b"") == 0
+    assert verify_deployment.count_lines(b"a\nbb\nccc\n") == 3
+    assert verify_deployment.count_lines(b"a\nbb\nccc") == 3
+    assert verify_deployment.count_newlines(b"a\nbb\nccc\n", end=5) == 2
+
+
+def test_verify_files_exist_glob(ioc_dir):
+    files = verify_deployment.DeployedFiles(ioc_dir)
+    assert verify_deployment.verify_files_exist(files, ["iocBoot/*.cmd"]) == []
+    assert verify_deployment.verify_files_exist(files, ["iocBoot/*.db"]) == [
+        f"No files match: {ioc_dir / 'iocBoot/*.db'}"
+    ]
+
+
+def test_verify_files_exist_literal_brackets(ioc_dir):
+    (ioc_dir / "SNMPv2-TC[rfc2579].mib").write_text("")
+    files = verify_deployment.DeployedFiles(ioc_dir)
+    assert verify_deployment.verify_files_exist(files, ["SNMPv2-TC[rfc2579].mib"]) == []
+
+
+def test_verify_file_regexes(ioc_dir):
+    files = verify_deployment.DeployedFiles(ioc_dir)
+    errors = verify_deployment.verify_file_regexes(
+        files,
+        {"iocBoot/st.cmd": [r"^iocInit$", r"^dbLoadRecords\(.*NDStd", "^NDStd"]},
+        {"iocBoot/st.cmd": [r"^iocInit", r"\{\{"], "iocBoot/empty.cmd": ["("]},
+    )
+    files.close()
+    assert errors == [
+        "iocBoot/st.cmd: no match for required regex '^NDStd'",
+        "iocBoot/st.cmd:2: matches forbidden regex '^iocInit'",
+        errors[2],
+    ]
+    assert errors[2].startswith("iocBoot/empty.cmd: invalid regex '('")
+
+
+def test_verify_pattern_counts_and_file_bounds(ioc_dir):
+    (ioc_dir / "records.dbl").write_text(
+        "".join(f"record(ai, XF:31ID{{AI:{i}}})\n" for i in range(100))
+    )
+    files = verify_deployment.DeployedFiles(ioc_dir)
+    assert (
+        verify_deployment.verify_pattern_counts(
+            files, {"records.dbl": {r"^record\(ai,": {"min": 100, "max": 100}}}
+        )
+        == []
+    )
+    assert verify_deployment.verify_pattern_counts(
+        files, {"records.dbl": {r"^record\(ao,": {"min": 1}, "AI:": {"max": 10}}}
+    ) == [
+        "records.dbl: expected at least 1 match(es) of '^record\\(ao,', got 0",
+        "records.dbl: expected at most 10 match(es) of 'AI:', got 100",
+    ]
+    assert (
+        verify_deployment.verify_file_bounds(
+            files, {"records.dbl": {"min_lines": 100, "max_lines": 100, "min_size": 1}}
+        )
+        == []
+    )
+    size = (ioc_dir / "records.dbl").stat().st_size
+    errors = verify_deployment.verify_file_bounds(
+        files,
+        {
+            "records.dbl": {"max_lines": 50, "max_size": 100},
+            "missing.dbl": {"min_size": 1},
+        },
+    )
+    files.close()
+    assert errors[:2] == [
+        f"records.dbl: expected size of at most 100, got {size}",
+        "records.dbl: expected lines of at most 50, got 100",
+    ]
+    assert errors[2].startswith("Cannot read file missing.dbl")
+
+
+def test_verify_manifest(ioc_dir, tmp_path_factory):
+    manifest_dir = tmp_path_factory.mktemp("manifest")
+    (manifest_dir / "good.yml").write_text(
+        yaml.dump({"verification": {"files_must_exist": ["iocBoot/st.cmd"]}})
+    )
+    (manifest_dir / "bad.yml").write_text(
+        yaml.dump({"verification": {"files_must_exist": ["iocBoot/missing.cmd"]}})
+    )
+    (manifest_dir / "manifest.yml").write_text(
+        yaml.dump(
+            {
+                "good-ioc": {"verify_yml": "good.yml", "ioc_dir": str(ioc_dir)},
+                "bad-ioc": {"verify_yml": "bad.yml", "ioc_dir": str(ioc_dir)},
+                "no-ioc": {"verify_yml": "good.yml", "ioc_dir": "/nonexistent"},
+            },
+            sort_keys=False,
+        )
+    )
+    manifest = verify_deployment.load_manifest(manifest_dir / "manifest.yml")
+    assert manifest["good-ioc"] == (manifest_dir / "good.yml", ioc_dir)
+
+    for jobs in (1, 3):
+        results = verify_deployment.verify_manifest(manifest, jobs)
+        assert list(results) == ["good-ioc", "bad-ioc", "no-ioc"]
+        assert [result["passed"] for result in results.values()] == [
+            True,
+            False,
+            False,
+        ]
+        assert "File not found" in results["bad-ioc"]["output"]
+        assert "IOC directory not found" in results["no-ioc"]["output"]